@@ -0,0 +1,169 @@
+// Search box for the API reference, backed by the per-group index shards that
+// scripts/generate_docs.py writes to search-index/. A query loads one shard
+// only: that of the group it names ("hub", "hub.set", "note.add payload"),
+// or else that of the group page being viewed.
+(function () {
+  "use strict";
+
+  var MAX_RESULTS = 20;
+  var script = document.currentScript;
+  var root = script ? script.src.replace(/js\/api-search\.js(\?.*)?$/, "") : "/";
+  var groups = null;
+  var shards = {};
+
+  function fetchJSON(url) {
+    return fetch(url).then(function (response) {
+      if (!response.ok) {
+        throw new Error(url + ": " + response.status);
+      }
+      return response.json();
+    });
+  }
+
+  function loadGroups() {
+    if (!groups) {
+      groups = fetchJSON(root + "search-index/groups.json").then(function (index) {
+        return index.shards;
+      });
+    }
+    return groups;
+  }
+
+  function loadShard(names, group) {
+    if (!shards[group]) {
+      shards[group] = fetchJSON(root + "search-index/" + names[group]);
+    }
+    return shards[group];
+  }
+
+  // mkdocs serves docs/<group>.md at <group>/ (use_directory_urls).
+  function pageUrl(page) {
+    return root + page.replace(/\.md$/, "/");
+  }
+
+  function currentGroup(names) {
+    var group = window.location.href.slice(root.length).split(/[\/?#]/)[0];
+    return names.hasOwnProperty(group) ? group : null;
+  }
+
+  function queryGroup(names, words) {
+    for (var i = 0; i < words.length; i++) {
+      var group = words[i].split(".")[0];
+      if (names.hasOwnProperty(group)) {
+        return group;
+      }
+    }
+    return currentGroup(names);
+  }
+
+  // Returns the APIs whose terms start with every word, each with the parameters that matched.
+  function search(shard, words) {
+    var matches = null;
+    words.forEach(function (word) {
+      var found = {};
+      Object.keys(shard.terms).forEach(function (term) {
+        if (term.lastIndexOf(word, 0) === 0) {
+          shard.terms[term].forEach(function (posting) {
+            (found[posting[0]] = found[posting[0]] || []).push(posting[1]);
+          });
+        }
+      });
+      if (matches === null) {
+        matches = found;
+        return;
+      }
+      Object.keys(matches).forEach(function (api) {
+        if (found.hasOwnProperty(api)) {
+          matches[api] = matches[api].concat(found[api]);
+        } else {
+          delete matches[api];
+        }
+      });
+    });
+    return matches || {};
+  }
+
+  function show(results, items, message) {
+    results.innerHTML = "";
+    if (message) {
+      var note = document.createElement("li");
+      note.textContent = message;
+      results.appendChild(note);
+    }
+    items.slice(0, MAX_RESULTS).forEach(function (item) {
+      var entry = document.createElement("li");
+      var link = document.createElement("a");
+      link.href = item.href;
+      link.textContent = item.api;
+      entry.appendChild(link);
+      if (item.parameters.length) {
+        entry.appendChild(document.createTextNode(" " + item.parameters.join(", ")));
+      }
+      results.appendChild(entry);
+    });
+  }
+
+  function run(query, results) {
+    var words = query.toLowerCase().split(/\s+/).filter(Boolean);
+    if (!words.length) {
+      show(results, []);
+      return;
+    }
+    loadGroups().then(function (names) {
+      var group = queryGroup(names, words);
+      if (!group) {
+        show(results, [], "Search a group: " + Object.keys(names).join(", ") + " (e.g. card.attn)");
+        return null;
+      }
+      return loadShard(names, group).then(function (shard) {
+        var matches = search(shard, words);
+        var items = Object.keys(matches).sort(function (a, b) { return a - b; }).map(function (index) {
+          var api = shard.apis[index];
+          var parameters = matches[index].filter(function (parameter, i, all) {
+            return parameter && all.indexOf(parameter) === i;
+          });
+          return {api: api[0], href: pageUrl(shard.page) + "#" + api[1], parameters: parameters};
+        });
+        show(results, items, items.length ? null : "No " + group + ".* API matches");
+      });
+    }).catch(function (error) {
+      show(results, [], "Search index unavailable (" + error.message + ")");
+    });
+  }
+
+  function install() {
+    var container = document.querySelector(".wy-side-nav-search") || document.body;
+    var form = document.createElement("form");
+    form.setAttribute("role", "search");
+    form.className = "wy-form api-search";
+    var input = document.createElement("input");
+    input.type = "text";
+    input.placeholder = "Search APIs (e.g. hub.set mode)";
+    input.setAttribute("aria-label", "Search APIs");
+    var results = document.createElement("ul");
+    results.className = "api-search-results";
+    results.style.textAlign = "left";
+    form.appendChild(input);
+    form.appendChild(results);
+    container.appendChild(form);
+
+    var timer = null;
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () { run(input.value, results); }, 100);
+    });
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var first = results.querySelector("a");
+      if (first) {
+        window.location.href = first.href;
+      }
+    });
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", install);
+  } else {
+    install();
+  }
+})();
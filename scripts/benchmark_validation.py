@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Validation throughput benchmark for every Notecard API schema.
+
+For every request schema referenced by notecard.api.json and every response
+schema, valid instances are taken from the schema `samples` (or a minimal
+instance when there are none) and invalid instances are derived from them.
+Throughput is measured in validations per second with time.perf_counter,
+taking the best of several repeats to reduce noise.
+
+Results can be written as a JSON baseline and later compared against it,
+failing when any schema regresses beyond a threshold.
+
+Usage: python scripts/benchmark_validation.py [--write-baseline | --check] [options]
+Example: python scripts/benchmark_validation.py --pattern "card.attn*" --check --threshold 20
+"""
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import platform
+import argparse
+from typing import Any, Callable, Dict, List
+
+from notecard_validator import (
+    API_SCHEMA_FILE,
+    SCHEMA_SUFFIX,
+    NotecardValidator,
+    api_name_from_filename,
+    get_project_root,
+    load_schema_files,
+)
+
+
+ENGINES = ("jsonschema", "compiled")
+DEFAULT_BASELINE = os.path.join(get_project_root(), "build", "validation_baseline.json")
+UNEXPECTED_PROPERTY = "__benchmark__"
+
+
+def _wrong_type_value(details: Dict[str, Any]) -> Any:
+    """Return a value that cannot satisfy a property's declared type."""
+    types_ = details.get("type")
+    types_ = [types_] if isinstance(types_, str) else list(types_ or [])
+    return [] if "string" in types_ or "object" in types_ else "__benchmark__"
+
+
+def valid_instances(filename: str, schema: Dict[str, Any]) -> List[Any]:
+    """Return the sample instances of a schema, or a minimal instance when it has none."""
+    instances = [json.loads(sample["json"]) for sample in schema.get("samples", []) if "json" in sample]
+    if instances:
+        return instances
+    if ".req." in filename:
+        return [{"req": api_name_from_filename(filename)}]
+    return [{}]
+
+
+def invalid_instances(schema: Dict[str, Any], valid: List[Any]) -> List[Any]:
+    """Derive one invalid instance from each valid one.
+
+    An unexpected property is added where `additionalProperties` is false;
+    otherwise the first typed property is given a value of the wrong type,
+    and as a last resort the instance is wrapped in a list.
+    """
+    typed = [(name, details) for name, details in schema.get("properties", {}).items()
+             if isinstance(details, dict) and "type" in details and name not in ("req", "cmd")]
+    invalid = []
+    for instance in valid:
+        if not isinstance(instance, dict):
+            continue
+        if schema.get("additionalProperties") is False:
+            invalid.append(dict(instance, **{UNEXPECTED_PROPERTY: True}))
+        elif typed:
+            name, details = typed[0]
+            invalid.append(dict(instance, **{name: _wrong_type_value(details)}))
+        elif schema.get("type") == "object":
+            invalid.append([instance])
+    return invalid
+
+
+def _checker(engine: str, schemas: Dict[str, Dict[str, Any]]) -> Callable[[str], Callable[[Any], bool]]:
+    """Return a factory mapping a schema filename to an is-valid function."""
+    if engine == "compiled":
+        from compile_validators import function_name, load_compiled_module
+        module = load_compiled_module(schemas)
+        return lambda filename: (lambda instance, fn=getattr(module, function_name(filename)): fn(instance) is None)
+    validator = NotecardValidator(schemas)
+    return lambda filename: validator.validator_for(filename).is_valid
+
+
+def measure(is_valid: Callable[[Any], bool], instances: List[Any], min_time: float, repeat: int) -> float:
+    """Return the best observed validations per second over `repeat` timed runs."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            for instance in instances:
+                is_valid(instance)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            for instance in instances:
+                is_valid(instance)
+        best = min(best, time.perf_counter() - start)
+    return loops * len(instances) / best
+
+
+def benchmark_schemas(schemas: Dict[str, Dict[str, Any]], engine: str = "jsonschema", pattern: str = "*",
+                      min_time: float = 0.02, repeat: int = 3) -> Dict[str, Any]:
+    """Benchmark every request schema in notecard.api.json and every response schema."""
+    checker = _checker(engine, schemas)
+    filenames = [ref["$ref"].split('/')[-1] for ref in schemas[API_SCHEMA_FILE].get("oneOf", [])]
+    filenames += sorted(f for f in schemas if f.endswith(f".rsp{SCHEMA_SUFFIX}"))
+
+    results = {}
+    for filename in filenames:
+        key = filename[:-len(SCHEMA_SUFFIX)]
+        if filename not in schemas or not fnmatch.fnmatch(key, pattern):
+            continue
+        schema = schemas[filename]
+        is_valid = checker(filename)
+        valid = [i for i in valid_instances(filename, schema) if is_valid(i)]
+        invalid = [i for i in invalid_instances(schema, valid) if not is_valid(i)]
+        entry = {}
+        for kind, instances in (("valid", valid), ("invalid", invalid)):
+            if instances:
+                entry[kind] = {"ops": round(measure(is_valid, instances, min_time, repeat), 1),
+                               "instances": len(instances)}
+        results[key] = entry
+
+    return {
+        "engine": engine,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def find_regressions(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a description of each schema/kind whose ops/s dropped more than threshold percent."""
+    regressions = []
+    for key, entry in sorted(current["results"].items()):
+        for kind, measured in entry.items():
+            previous = baseline.get("results", {}).get(key, {}).get(kind)
+            if not previous or not previous.get("ops"):
+                continue
+            change = (measured["ops"] - previous["ops"]) / previous["ops"] * 100
+            if change < -threshold:
+                regressions.append(f"{key} ({kind}): {previous['ops']:.0f} -> {measured['ops']:.0f} ops/s ({change:+.1f}%)")
+    return regressions
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark validation throughput for every Notecard API schema",
+        epilog="Example: python scripts/benchmark_validation.py --write-baseline"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("--engine", choices=ENGINES, default="jsonschema", help="Validation engine to benchmark. Defaults to 'jsonschema'.")
+    parser.add_argument("--pattern", default="*", help="Glob over schema names (e.g. 'card.attn*', '*.rsp'). Defaults to all.")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Minimum seconds per timed run. Defaults to 0.02.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement; the best is kept. Defaults to 3.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path. Defaults to build/validation_baseline.json.")
+    parser.add_argument("--write-baseline", action="store_true", help="Write the results to the baseline file.")
+    parser.add_argument("--check", action="store_true", help="Compare against the baseline and fail on regressions.")
+    parser.add_argument("--threshold", type=float, default=25.0, help="Allowed throughput drop in percent for --check. Defaults to 25.")
+    parser.add_argument("-o", "--output", help="Also write the results to this JSON file.")
+
+    args = parser.parse_args()
+
+    current = benchmark_schemas(load_schema_files(args.schema_dir), args.engine, args.pattern, args.min_time, args.repeat)
+
+    print(f"{'Schema':<32} {'valid ops/s':>14} {'invalid ops/s':>14}")
+    for key, entry in current["results"].items():
+        valid = f"{entry['valid']['ops']:,.0f}" if "valid" in entry else "-"
+        invalid = f"{entry['invalid']['ops']:,.0f}" if "invalid" in entry else "-"
+        print(f"{key:<32} {valid:>14} {invalid:>14}")
+
+    for path in filter(None, [args.output, args.baseline if args.write_baseline else None]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(current, f, indent=4)
+            f.write("\n")
+        print(f"\n✓ Wrote results to {path}")
+
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"\nError: Baseline not found at {args.baseline}; run with --write-baseline first.")
+            sys.exit(2)
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get("engine") != current["engine"]:
+            print(f"\nError: Baseline was measured with the '{baseline.get('engine')}' engine, not '{current['engine']}'.")
+            sys.exit(2)
+        regressions = find_regressions(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} throughput regression(s) beyond {args.threshold}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\n✓ No throughput regressions beyond {args.threshold}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Bundle all Notecard API schemas into a single self-contained file.
+
+Every request and response schema is embedded under `$defs` (keyed by its
+filename without `.notecard.api.json`, e.g. `card.attn.req`), and every
+`$ref` to one of them is rewritten to a local `#/$defs/...` reference. The
+resulting document is a valid Draft 2020-12 schema equivalent to
+notecard.api.json, and can be loaded with a single file read and no
+network access.
+
+Usage: python scripts/bundle_schemas.py [-o OUTPUT] [--minify]
+Example: python scripts/bundle_schemas.py -o build/notecard.bundle.json
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Any, Dict, Optional, Tuple
+
+from referencing import Registry, Resource
+
+from notecard_validator import (
+    API_SCHEMA_FILE,
+    SCHEMA_BASE_URL,
+    SCHEMA_SUFFIX,
+    get_project_root,
+    load_schema_files,
+)
+
+
+BUNDLE_FILE = "notecard.bundle.json"
+BUNDLE_ID = SCHEMA_BASE_URL + BUNDLE_FILE
+
+# Keywords whose value is a single subschema, a list of subschemas, or a
+# map of name -> subschema; everything else is left as-is while walking.
+SUBSCHEMA_KEYWORDS = ("items", "additionalProperties", "not", "if", "then", "else", "contains",
+                      "propertyNames", "unevaluatedItems", "unevaluatedProperties")
+SUBSCHEMA_LIST_KEYWORDS = ("allOf", "anyOf", "oneOf", "prefixItems")
+SUBSCHEMA_MAP_KEYWORDS = ("properties", "patternProperties", "$defs", "dependentSchemas")
+
+# Documentation-only keywords removed by --minify.
+DOCUMENTATION_KEYWORDS = ("title", "description", "samples", "annotations", "sub-descriptions",
+                          "skus", "examples", "$comment")
+
+
+def def_key(filename: str) -> str:
+    """Return the `$defs` key for a schema filename, e.g. `card.attn.req`."""
+    return filename[:-len(SCHEMA_SUFFIX)] if filename.endswith(SCHEMA_SUFFIX) else filename
+
+
+def map_subschemas(schema: Any, fn) -> Any:
+    """Return a copy of schema with fn applied to each schema object, bottom-up.
+
+    Only schema positions are visited, so a property named e.g.
+    `description` is never mistaken for the `description` keyword.
+    """
+    if not isinstance(schema, dict):
+        return schema
+    result = dict(schema)
+    for keyword in SUBSCHEMA_KEYWORDS:
+        if keyword in result:
+            result[keyword] = map_subschemas(result[keyword], fn)
+    for keyword in SUBSCHEMA_LIST_KEYWORDS:
+        if isinstance(result.get(keyword), list):
+            result[keyword] = [map_subschemas(s, fn) for s in result[keyword]]
+    for keyword in SUBSCHEMA_MAP_KEYWORDS:
+        if isinstance(result.get(keyword), dict):
+            result[keyword] = {k: map_subschemas(s, fn) for k, s in result[keyword].items()}
+    return fn(result)
+
+
+def _rewrite_ref(ref: str, key: str, locations: Dict[str, str]) -> str:
+    """Rewrite a `$ref` found in the schema stored at `$defs/<key>`."""
+    uri, _, fragment = ref.partition("#")
+    if not uri:
+        # Local to the embedded schema; rebase onto its $defs location.
+        return f"#/$defs/{key}{fragment}" if key else ref
+    if uri not in locations:
+        raise ValueError(f"{key}: $ref to a schema outside the bundle: {ref}")
+    return f"#/$defs/{locations[uri]}{fragment}"
+
+
+def bundle_schemas(schemas: Dict[str, Dict[str, Any]], minify: bool = False) -> Dict[str, Any]:
+    """Bundle notecard.api.json and its per-API schemas into one document."""
+    api_schema = schemas[API_SCHEMA_FILE]
+    locations = {}
+    for filename, schema in schemas.items():
+        if filename != API_SCHEMA_FILE:
+            locations[schema.get("$id", SCHEMA_BASE_URL + filename)] = def_key(filename)
+
+    def embed(key: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        def rewrite(node: Dict[str, Any]) -> Dict[str, Any]:
+            if "$ref" in node:
+                node["$ref"] = _rewrite_ref(node["$ref"], key, locations)
+            if minify:
+                for keyword in DOCUMENTATION_KEYWORDS:
+                    node.pop(keyword, None)
+            return node
+        embedded = map_subschemas(schema, rewrite)
+        embedded.pop("$id", None)
+        embedded.pop("$schema", None)
+        return embedded
+
+    defs = {}
+    for filename in sorted(schemas):
+        if filename != API_SCHEMA_FILE:
+            defs[def_key(filename)] = embed(def_key(filename), schemas[filename])
+
+    bundle = {
+        "$schema": api_schema.get("$schema", "https://json-schema.org/draft/2020-12/schema"),
+        "$id": BUNDLE_ID,
+        "title": "Notecard API Schema Bundle",
+        "description": "Self-contained bundle of notecard.api.json and every request and response schema it describes.",
+        "version": api_schema.get("version"),
+        "apiVersion": api_schema.get("apiVersion"),
+    }
+    root = embed("", {k: v for k, v in api_schema.items() if k not in bundle})
+    if "oneOf" in root:
+        bundle["oneOf"] = root.pop("oneOf")
+    bundle.update(root)
+    bundle["$defs"] = defs
+    return bundle
+
+
+def load_bundle(path: Optional[str] = None) -> Tuple[Dict[str, Any], Registry]:
+    """Load a bundle with a single file read and build its registry in one shot.
+
+    The registry contains only the bundle and has no retriever, so no `$ref`
+    can trigger a network fetch.
+    """
+    path = path or os.path.join(get_project_root(), "build", BUNDLE_FILE)
+    with open(path, 'r') as f:
+        bundle = json.load(f)
+    registry = Registry().with_resource(bundle.get("$id", BUNDLE_ID), Resource.from_contents(bundle))
+    return bundle, registry
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Bundle all Notecard API schemas into a single self-contained schema file",
+        epilog="Example: python scripts/bundle_schemas.py -o build/notecard.bundle.json"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("-o", "--output", default=os.path.join(get_project_root(), "build", BUNDLE_FILE),
+                        help=f"Path of the bundle. Defaults to build/{BUNDLE_FILE}.")
+    parser.add_argument("--minify", action="store_true",
+                        help="Drop documentation-only keywords and write compact JSON for production use.")
+
+    args = parser.parse_args()
+
+    try:
+        bundle = bundle_schemas(load_schema_files(args.schema_dir), minify=args.minify)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        if args.minify:
+            json.dump(bundle, f, separators=(",", ":"))
+        else:
+            json.dump(bundle, f, indent=4)
+        f.write("\n")
+    print(f"✓ Bundled {len(bundle['$defs'])} schemas into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Wire-minimizing canonical form for Notecard requests.
+
+A request is canonicalized by removing every per-request parameter whose
+value equals the `default` its `.req` schema declares, ordering the remaining keys
+as `req`/`cmd` first and then in schema order (with unknown keys sorted at
+the end), and encoding it with compact separators. The result is
+byte-for-byte stable, and shorter whenever a host sends defaults.
+
+Only the parameters in PER_REQUEST_DEFAULTS are stripped: those that apply
+to the one request, so that leaving them out really means the default. Many
+APIs (card.power, card.transport, card.wireless.penalty, ...) persist their
+settings, and there leaving a field out means "leave it unchanged" or turns
+a set into a query, so their requests are never changed beyond key order.
+
+A property is never stripped if the schema's conditionals refer to it (in
+`required`, `if`, `dependentRequired`, ...), since its presence can then
+change which rules apply. Each API's transform is built once, as a table of
+defaults and a key rank, so canonicalizing costs a few microseconds.
+
+Canonicalizing relies on the schemas' defaults matching the Notecard's.
+
+Usage: python scripts/canonicalize.py [options] <input.jsonl>
+Example: python scripts/canonicalize.py traffic.jsonl -o canonical.jsonl
+"""
+
+import sys
+import json
+import time
+import argparse
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from notecard_validator import api_name_from_filename, load_schema_files
+
+
+COMPACT = (",", ":")
+TERMINATOR = b"\n"
+COMMAND_KEYS = ("req", "cmd")
+
+# Per API, the parameters whose omission means their schema default for that
+# request alone. Parameters of APIs that persist settings are not listed:
+# omitting them leaves the stored setting unchanged.
+PER_REQUEST_DEFAULTS = {
+    "card.usage.get": ("mode",),
+    "card.usage.test": ("megabytes",),
+    "web.delete": ("content", "seconds"),
+    "web.post": ("content", "seconds"),
+    "web.put": ("content", "seconds", "max"),
+}
+
+# Keywords whose subschemas select or constrain properties by name.
+CONDITIONAL_KEYWORDS = ("allOf", "anyOf", "oneOf", "if", "then", "else", "not", "dependentSchemas")
+
+
+def referenced_properties(schema: Dict[str, Any]) -> Set[str]:
+    """Return the property names the schema's conditionals refer to."""
+    names: Set[str] = set()
+
+    def visit(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+            return
+        if not isinstance(node, dict):
+            return
+        names.update(node.get("required", ()))
+        names.update(node.get("properties", {}))
+        for name, required in node.get("dependentRequired", {}).items():
+            names.add(name)
+            names.update(required)
+        names.update(node.get("dependentSchemas", {}))
+        for keyword in CONDITIONAL_KEYWORDS:
+            value = node.get(keyword)
+            visit(list(value.values()) if keyword == "dependentSchemas" and value else value)
+
+    # The top-level properties declare names; everything else constrains them.
+    visit({keyword: value for keyword, value in schema.items() if keyword != "properties"})
+    return names
+
+
+def schema_api_name(schema: Dict[str, Any]) -> Optional[str]:
+    """Return the `req` (or `cmd`) constant of a `.req` schema, or None."""
+    properties = schema.get("properties", {})
+    for key in COMMAND_KEYS:
+        if isinstance(properties.get(key), dict) and "const" in properties[key]:
+            return properties[key]["const"]
+    return None
+
+
+def strippable_defaults(schema: Dict[str, Any], allowed: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Return the properties that can be omitted when equal to their default, with the defaults.
+
+    Only the parameters in allowed are considered, which defaults to the
+    API's PER_REQUEST_DEFAULTS entry.
+    """
+    if allowed is None:
+        allowed = PER_REQUEST_DEFAULTS.get(schema_api_name(schema), ())
+    allowed = set(allowed)
+    referenced = referenced_properties(schema)
+    return {name: details["default"] for name, details in schema.get("properties", {}).items()
+            if name in allowed and isinstance(details, dict) and "default" in details
+            and name not in referenced and name not in COMMAND_KEYS}
+
+
+def _same(value: Any, default: Any) -> bool:
+    # JSON true is not the number 1, however Python compares them.
+    return value == default and isinstance(value, bool) == isinstance(default, bool)
+
+
+def compile_transform(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build the canonicalizing transform for one `.req` schema."""
+    defaults = strippable_defaults(schema)
+    order = list(COMMAND_KEYS) + [name for name in schema.get("properties", {}) if name not in COMMAND_KEYS]
+    rank = {name: index for index, name in enumerate(order)}
+    unknown = len(rank)
+    missing = object()
+
+    def key(item):
+        return (rank.get(item[0], unknown), item[0])
+
+    def transform(request: Dict[str, Any]) -> Dict[str, Any]:
+        items = [item for item in request.items()
+                 if not _same(item[1], defaults.get(item[0], missing))]
+        items.sort(key=key)
+        return dict(items)
+
+    return transform
+
+
+def _sorted_keys(request: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: request[name] for name in sorted(request, key=lambda name: (name not in COMMAND_KEYS, name))}
+
+
+class Canonicalizer:
+    """Canonicalizes requests with a precompiled transform per API."""
+
+    def __init__(self, schema_dir: Optional[str] = None):
+        self.transforms: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        for filename, schema in load_schema_files(schema_dir).items():
+            if ".req." in filename:
+                self.transforms[api_name_from_filename(filename)] = compile_transform(schema)
+        self.requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def canonicalize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the canonical form of a request; unknown APIs only have their keys sorted."""
+        api = request.get("req", request.get("cmd"))
+        transform = self.transforms.get(api) if isinstance(api, str) else None
+        return transform(request) if transform is not None else _sorted_keys(request)
+
+    def encode(self, request: Dict[str, Any]) -> bytes:
+        """Return the canonical, compact, newline-terminated encoding of a request."""
+        return json.dumps(self.canonicalize(request), separators=COMPACT).encode() + TERMINATOR
+
+    def canonicalize_line(self, line: bytes) -> bytes:
+        """Canonicalize one JSON request line, counting the bytes saved."""
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request is not a JSON object")
+        encoded = self.encode(request)
+        self.requests += 1
+        self.bytes_in += len(line.rstrip(b"\r\n")) + len(TERMINATOR)
+        self.bytes_out += len(encoded)
+        return encoded
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the requests canonicalized and the bytes saved."""
+        saved = self.bytes_in - self.bytes_out
+        return {
+            "requests": self.requests,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": saved,
+            "percent_saved": round(saved / self.bytes_in * 100, 2) if self.bytes_in else 0,
+        }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Canonicalize a JSONL file of Notecard requests, stripping schema defaults",
+        epilog="Example: python scripts/canonicalize.py traffic.jsonl -o canonical.jsonl"
+    )
+    parser.add_argument("input", help="JSONL file of requests ('-' for stdin).")
+    parser.add_argument("-o", "--output", help="Write the canonical requests to this file. Defaults to stdout.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    canonicalizer = Canonicalizer(args.schema_dir)
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, 'rb')
+    output = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    start = time.perf_counter()
+    try:
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                output.write(canonicalizer.canonicalize_line(line))
+            except ValueError as e:
+                print(f"Error: line {number}: {e}", file=sys.stderr)
+                sys.exit(1)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if output is not sys.stdout.buffer:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    summary = canonicalizer.summary()
+    print(json.dumps(summary, indent=4), file=sys.stderr)
+    if summary["requests"]:
+        print(f"\n{summary['requests']} requests, {elapsed / summary['requests'] * 1e6:.1f} µs each", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
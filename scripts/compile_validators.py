@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compiler from Notecard API schemas to Python validator code.
+
+Every `*.req`/`*.rsp.notecard.api.json` schema (and notecard.api.json itself)
+is compiled into a specialized Python function that returns None when an
+instance is valid, or a short error message describing the first failure.
+Constants are inlined, `additionalProperties: false` becomes a frozenset
+check and `if`/`then`/`else` chains become straight-line branches.
+
+Usage: python scripts/compile_validators.py [-o OUTPUT]
+Example: python scripts/compile_validators.py -o build/notecard_validators.py
+"""
+
+import os
+import sys
+import json
+import types
+import argparse
+import itertools
+from typing import Any, Dict, List, Optional
+
+from notecard_validator import (
+    API_SCHEMA_FILE,
+    SCHEMA_BASE_URL,
+    SCHEMA_SUFFIX,
+    api_name_from_filename,
+    get_project_root,
+    load_schema_files,
+)
+
+
+# Keywords that carry documentation or annotations only, and never affect
+# whether an instance is valid under Draft 2020-12 (format is an annotation
+# unless a format checker is enabled).
+ANNOTATION_KEYWORDS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "version", "apiVersion",
+    "skus", "samples", "annotations", "sub-descriptions", "default", "examples",
+    "format", "contentEncoding", "contentMediaType", "deprecated", "readOnly", "writeOnly",
+})
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool) or isinstance({v}, float) and {v}.is_integer())",
+}
+
+OBJECT_KEYWORDS = ("required", "properties", "additionalProperties", "minProperties", "maxProperties")
+STRING_KEYWORDS = ("pattern", "minLength", "maxLength")
+NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+ARRAY_KEYWORDS = ("items", "minItems", "maxItems")
+
+NUMBER_COMPARISONS = {
+    "minimum": ("<", "is less than the minimum of"),
+    "maximum": (">", "is greater than the maximum of"),
+    "exclusiveMinimum": ("<=", "is less than or equal to the minimum of"),
+    "exclusiveMaximum": (">=", "is greater than or equal to the maximum of"),
+}
+
+MODULE_HEADER = '''"""
+Compiled Notecard API validators.
+
+Generated by scripts/compile_validators.py from the Notecard API schemas.
+Do not edit by hand; re-run the compiler instead.
+
+Each function returns None when the instance is valid, or a short message
+describing the first failure.
+"""
+
+import re
+
+
+def _equal(a, b):
+    """JSON equality: booleans never equal numbers, containers compare deeply."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, str) or isinstance(b, str):
+        return isinstance(a, str) and isinstance(b, str) and a == b
+    return a == b
+
+
+def _unexpected(instance, allowed):
+    extras = ", ".join(repr(k) for k in instance if k not in allowed)
+    return f"Additional properties are not allowed ({extras} {'was' if ',' not in extras else 'were'} unexpected)"
+'''
+
+MODULE_FOOTER = '''
+
+def request_name(instance):
+    """Return the API name a request dispatches to, or None if it is not recognizable."""
+    if not isinstance(instance, dict):
+        return None
+    req = instance.get("req")
+    cmd = instance.get("cmd")
+    name = req if isinstance(req, str) else cmd
+    if not isinstance(name, str) or name not in REQUESTS:
+        return None
+    if "req" in instance and "cmd" in instance and req != cmd:
+        return None
+    return name
+
+
+def validate_request(instance):
+    """Validate a request by dispatching on its req/cmd name, falling back to notecard.api.json."""
+    name = request_name(instance)
+    if name is None:
+        return notecard_api(instance)
+    return REQUESTS[name](instance)
+
+
+def validate_response(api_name, instance):
+    """Validate a response to the named API."""
+    return RESPONSES[api_name](instance)
+'''
+
+
+class CompileError(Exception):
+    """Raised when a schema uses a keyword the compiler does not support."""
+
+
+def function_name(filename: str) -> str:
+    """Return the generated function name for a schema file."""
+    if filename == API_SCHEMA_FILE:
+        return "notecard_api"
+    base = filename[:-len(SCHEMA_SUFFIX)] if filename.endswith(SCHEMA_SUFFIX) else filename
+    return base.replace(".", "_").replace("-", "_")
+
+
+def _repr_path(path: str) -> str:
+    return f"{path}: " if path else ""
+
+
+class SchemaCompiler:
+    """Compiles JSON Schema (the Draft 2020-12 subset used by the Notecard schemas) to Python source."""
+
+    def __init__(self, ref_functions: Dict[str, str]):
+        # Maps a schema $id to the generated function validating it.
+        self.ref_functions = ref_functions
+        self.constants: List[str] = []
+        self._constant_names: Dict[str, str] = {}
+        self._counter = itertools.count()
+
+    def _name(self, prefix: str) -> str:
+        return f"{prefix}{next(self._counter)}"
+
+    def _constant(self, prefix: str, source: str) -> str:
+        """Hoist a constant expression to module level, sharing identical constants."""
+        if source not in self._constant_names:
+            name = f"{prefix}{len(self._constant_names)}"
+            self._constant_names[source] = name
+            self.constants.append(f"{name} = {source}")
+        return self._constant_names[source]
+
+    def _check_keywords(self, schema: Dict[str, Any]) -> None:
+        supported = (
+            ANNOTATION_KEYWORDS | set(OBJECT_KEYWORDS) | set(STRING_KEYWORDS) | set(NUMBER_KEYWORDS)
+            | set(ARRAY_KEYWORDS) | {"type", "const", "enum", "allOf", "anyOf", "oneOf", "not",
+                                     "if", "then", "else", "$ref"}
+        )
+        unsupported = set(schema) - supported
+        if unsupported:
+            raise CompileError(f"Unsupported keyword(s): {sorted(unsupported)}")
+
+    def _ref_function(self, ref: str) -> str:
+        if ref not in self.ref_functions:
+            raise CompileError(f"Unresolvable $ref: {ref}")
+        return self.ref_functions[ref]
+
+    # Boolean expressions
+
+    def _type_expr(self, types_: Any, v: str) -> str:
+        names = [types_] if isinstance(types_, str) else list(types_)
+        checks = [TYPE_CHECKS[t].format(v=v) for t in names]
+        return checks[0] if len(checks) == 1 else "(" + " or ".join(checks) + ")"
+
+    def _const_expr(self, value: Any, v: str) -> str:
+        if isinstance(value, str):
+            return f"{v} == {value!r}"
+        if isinstance(value, bool):
+            return f"{v} is {value!r}"
+        if value is None:
+            return f"{v} is None"
+        if isinstance(value, (int, float)):
+            return f"({TYPE_CHECKS['number'].format(v=v)} and {v} == {value!r})"
+        return f"_equal({v}, {self._constant('_CONST', repr(value))})"
+
+    def _enum_expr(self, values: List[Any], v: str) -> str:
+        if values and all(isinstance(value, str) for value in values):
+            enum = self._constant("_ENUM", f"frozenset({sorted(set(values))!r})")
+            return f"(isinstance({v}, str) and {v} in {enum})"
+        enum = self._constant("_ENUM", repr(tuple(values)))
+        return f"any(_equal({v}, _e) for _e in {enum})"
+
+    def _allowed_keys(self, schema: Dict[str, Any]) -> str:
+        keys = sorted(schema.get("properties", {}))
+        return self._constant("_KEYS", f"frozenset({keys!r})")
+
+    def _pattern(self, pattern: str) -> str:
+        return self._constant("_RE", f"re.compile({pattern!r})")
+
+    def expr(self, schema: Any, v: str, known: Optional[str] = None) -> str:
+        """Return a Python expression that is True iff `v` is valid under schema.
+
+        `known` names a JSON type `v` has already been checked to have.
+        """
+        if schema is True or schema == {}:
+            return "True"
+        if schema is False:
+            return "False"
+        self._check_keywords(schema)
+
+        terms = []
+        if "type" in schema:
+            terms.append(self._type_expr(schema["type"], v))
+            if isinstance(schema["type"], str):
+                known = schema["type"]
+        if "const" in schema:
+            terms.append(self._const_expr(schema["const"], v))
+        if "enum" in schema:
+            terms.append(self._enum_expr(schema["enum"], v))
+
+        def guarded(kind: str, check: str, conditions: List[str]) -> None:
+            if not conditions:
+                return
+            body = " and ".join(conditions)
+            if known == kind or (kind == "number" and known == "integer"):
+                terms.append(body if len(conditions) == 1 else f"({body})")
+            else:
+                terms.append(f"(not {check.format(v=v)} or {body})")
+
+        obj = []
+        required = schema.get("required", [])
+        for key in required:
+            obj.append(f"{key!r} in {v}")
+        for key, subschema in schema.get("properties", {}).items():
+            sub = self.expr(subschema, f"{v}[{key!r}]")
+            if sub != "True":
+                # Required keys are already known to be present.
+                obj.append(sub if key in required else f"({key!r} not in {v} or {sub})")
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            obj.append(f"{self._allowed_keys(schema)}.issuperset({v})")
+        elif additional is not True:
+            keys = self._allowed_keys(schema)
+            item = self._name("_x")
+            obj.append(f"all({self.expr(additional, item)} for _k, {item} in {v}.items() if _k not in {keys})")
+        if "minProperties" in schema:
+            obj.append(f"len({v}) >= {schema['minProperties']!r}")
+        if "maxProperties" in schema:
+            obj.append(f"len({v}) <= {schema['maxProperties']!r}")
+        guarded("object", TYPE_CHECKS["object"], obj)
+
+        string = []
+        if "pattern" in schema:
+            string.append(f"{self._pattern(schema['pattern'])}.search({v}) is not None")
+        if "minLength" in schema:
+            string.append(f"len({v}) >= {schema['minLength']!r}")
+        if "maxLength" in schema:
+            string.append(f"len({v}) <= {schema['maxLength']!r}")
+        guarded("string", TYPE_CHECKS["string"], string)
+
+        number = []
+        for keyword, (op, _) in NUMBER_COMPARISONS.items():
+            if keyword in schema:
+                number.append(f"not {v} {op} {schema[keyword]!r}")
+        guarded("number", TYPE_CHECKS["number"], number)
+
+        array = []
+        if "minItems" in schema:
+            array.append(f"len({v}) >= {schema['minItems']!r}")
+        if "maxItems" in schema:
+            array.append(f"len({v}) <= {schema['maxItems']!r}")
+        if "items" in schema:
+            item = self._name("_x")
+            sub = self.expr(schema["items"], item)
+            if sub != "True":
+                array.append(f"all({sub} for {item} in {v})")
+        guarded("array", TYPE_CHECKS["array"], array)
+
+        if "$ref" in schema:
+            terms.append(f"{self._ref_function(schema['$ref'])}({v}) is None")
+        for subschema in schema.get("allOf", []):
+            terms.append(self.expr(subschema, v, known))
+        if "anyOf" in schema:
+            terms.append("(" + " or ".join(self.expr(s, v, known) for s in schema["anyOf"]) + ")")
+        if "oneOf" in schema:
+            terms.append("(" + " + ".join(f"({self.expr(s, v, known)})" for s in schema["oneOf"]) + ") == 1")
+        if "not" in schema:
+            terms.append(f"not ({self.expr(schema['not'], v, known)})")
+        if "if" in schema and ("then" in schema or "else" in schema):
+            then = self.expr(schema.get("then", True), v, known)
+            else_ = self.expr(schema.get("else", True), v, known)
+            terms.append(f"(({then}) if ({self.expr(schema['if'], v, known)}) else ({else_}))")
+
+        terms = [t for t in terms if t != "True"]
+        if not terms:
+            return "True"
+        return terms[0] if len(terms) == 1 else "(" + " and ".join(terms) + ")"
+
+    # Straight-line statements
+
+    def stmts(self, schema: Any, v: str, path: str = "", known: Optional[str] = None) -> List[str]:
+        """Return statements that `return` an error message if `v` is invalid under schema."""
+        prefix = _repr_path(path)
+        if schema is True or schema == {}:
+            return []
+        if schema is False:
+            return [f"return {prefix + 'False schema does not allow '!r} + repr({v})"]
+        self._check_keywords(schema)
+
+        lines: List[str] = []
+        if "type" in schema:
+            types_ = schema["type"]
+            lines += [
+                f"if not {self._type_expr(types_, v)}:",
+                f"    return f{prefix + '{' + v + '!r} is not of type ' + repr(types_)!r}",
+            ]
+            if isinstance(types_, str):
+                known = types_
+        if "const" in schema:
+            lines += [
+                f"if not {self._const_expr(schema['const'], v)}:",
+                f"    return {prefix + repr(schema['const']) + ' was expected'!r}",
+            ]
+        if "enum" in schema:
+            lines += [
+                f"if not {self._enum_expr(schema['enum'], v)}:",
+                f"    return f{prefix + '{' + v + '!r} is not one of ' + repr(schema['enum']).replace('{', '{{').replace('}', '}}')!r}",
+            ]
+
+        def guarded(kind: str, body: List[str]) -> None:
+            if not body:
+                return
+            if known == kind or (kind == "number" and known == "integer"):
+                lines.extend(body)
+            else:
+                lines.append(f"if {TYPE_CHECKS[kind].format(v=v)}:")
+                lines.extend("    " + line for line in body)
+
+        obj: List[str] = []
+        required = schema.get("required", [])
+        for key in required:
+            obj += [f"if {key!r} not in {v}:", f"    return {prefix + repr(key) + ' is a required property'!r}"]
+        for key, subschema in schema.get("properties", {}).items():
+            item = self._name("_v")
+            sub = self.stmts(subschema, item, f"{path}.{key}" if path else key)
+            if sub and key in required:
+                obj += [f"{item} = {v}[{key!r}]"] + sub
+            elif sub:
+                obj += [f"if {key!r} in {v}:", f"    {item} = {v}[{key!r}]"]
+                obj += ["    " + line for line in sub]
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            keys = self._allowed_keys(schema)
+            unexpected = f"_unexpected({v}, {keys})"
+            obj += [f"if not {keys}.issuperset({v}):",
+                    f"    return {prefix!r} + {unexpected}" if prefix else f"    return {unexpected}"]
+        elif additional is not True:
+            keys = self._allowed_keys(schema)
+            item = self._name("_v")
+            sub = self.stmts(additional, item, f"{path}.*" if path else "*")
+            if sub:
+                obj += [f"for _k, {item} in {v}.items():", f"    if _k not in {keys}:"]
+                obj += ["        " + line for line in sub]
+        if "minProperties" in schema:
+            obj += [f"if len({v}) < {schema['minProperties']!r}:",
+                    f"    return {prefix + 'does not have enough properties'!r}"]
+        if "maxProperties" in schema:
+            obj += [f"if len({v}) > {schema['maxProperties']!r}:",
+                    f"    return {prefix + 'has too many properties'!r}"]
+        guarded("object", obj)
+
+        string: List[str] = []
+        if "pattern" in schema:
+            pattern = schema["pattern"]
+            message = prefix + "{" + v + "!r} does not match " + repr(pattern).replace("{", "{{").replace("}", "}}")
+            string += [f"if {self._pattern(pattern)}.search({v}) is None:", f"    return f{message!r}"]
+        if "minLength" in schema:
+            string += [f"if len({v}) < {schema['minLength']!r}:",
+                       f"    return f{prefix + '{' + v + '!r} is too short'!r}"]
+        if "maxLength" in schema:
+            string += [f"if len({v}) > {schema['maxLength']!r}:",
+                       f"    return f{prefix + '{' + v + '!r} is too long'!r}"]
+        guarded("string", string)
+
+        number: List[str] = []
+        for keyword, (op, text) in NUMBER_COMPARISONS.items():
+            if keyword in schema:
+                limit = schema[keyword]
+                number += [f"if {v} {op} {limit!r}:",
+                           f"    return f{prefix + '{' + v + '!r} ' + text + ' ' + repr(limit)!r}"]
+        guarded("number", number)
+
+        array: List[str] = []
+        if "minItems" in schema:
+            array += [f"if len({v}) < {schema['minItems']!r}:",
+                      f"    return f{prefix + '{' + v + '!r} should be non-empty' if schema['minItems'] == 1 else prefix + '{' + v + '!r} is too short'!r}"]
+        if "maxItems" in schema:
+            array += [f"if len({v}) > {schema['maxItems']!r}:",
+                      f"    return f{prefix + '{' + v + '!r} is too long'!r}"]
+        if "items" in schema:
+            item = self._name("_v")
+            sub = self.stmts(schema["items"], item, f"{path}[]")
+            if sub:
+                array += [f"for {item} in {v}:"] + ["    " + line for line in sub]
+        guarded("array", array)
+
+        if "$ref" in schema:
+            error = self._name("_e")
+            lines += [f"{error} = {self._ref_function(schema['$ref'])}({v})", f"if {error} is not None:",
+                      f"    return {prefix!r} + {error}" if prefix else f"    return {error}"]
+        for subschema in schema.get("allOf", []):
+            lines += self.stmts(subschema, v, path, known)
+        if "anyOf" in schema:
+            lines += [f"if not {self.expr({'anyOf': schema['anyOf']}, v, known)}:",
+                      f"    return f{prefix + '{' + v + '!r} is not valid under any of the given schemas'!r}"]
+        if "oneOf" in schema:
+            count = self._name("_n")
+            lines.append(f"{count} = " + " + ".join(f"({self.expr(s, v, known)})" for s in schema["oneOf"]))
+            lines += [f"if {count} == 0:",
+                      f"    return f{prefix + '{' + v + '!r} is not valid under any of the given schemas'!r}",
+                      f"if {count} > 1:",
+                      f"    return f{prefix + '{' + v + '!r} is valid under each of ' + '{' + count + '} of the given schemas'!r}"]
+        if "not" in schema:
+            lines += [f"if {self.expr(schema['not'], v, known)}:",
+                      f"    return f{prefix + '{' + v + '!r} should not be valid under ' + json.dumps(schema['not']).replace('{', '{{').replace('}', '}}')!r}"]
+        if "if" in schema and ("then" in schema or "else" in schema):
+            then = self.stmts(schema.get("then", True), v, path, known)
+            else_ = self.stmts(schema.get("else", True), v, path, known)
+            lines.append(f"if {self.expr(schema['if'], v, known)}:")
+            lines += ["    " + line for line in then] or ["    pass"]
+            if else_:
+                lines.append("else:")
+                lines += ["    " + line for line in else_]
+
+        return lines
+
+
+def compile_module(schemas: Dict[str, Dict[str, Any]]) -> str:
+    """Compile all schemas into the source of a Python module."""
+    ref_functions = {}
+    for filename, schema in schemas.items():
+        ref_functions[schema.get("$id", SCHEMA_BASE_URL + filename)] = function_name(filename)
+
+    compiler = SchemaCompiler(ref_functions)
+    functions = []
+    requests = {}
+    responses = {}
+    for filename in sorted(schemas):
+        schema = schemas[filename]
+        name = function_name(filename)
+        try:
+            body = compiler.stmts(schema, "v")
+        except CompileError as e:
+            raise CompileError(f"{filename}: {e}") from None
+        lines = [f"def {name}(v):", f'    """Validate against {filename}."""']
+        lines += ["    " + line for line in body]
+        lines.append("    return None")
+        functions.append("\n".join(lines))
+        if filename.endswith(f".req{SCHEMA_SUFFIX}"):
+            requests[api_name_from_filename(filename)] = name
+        elif filename.endswith(f".rsp{SCHEMA_SUFFIX}"):
+            responses[api_name_from_filename(filename)] = name
+
+    def table(name: str, entries: Dict[str, str]) -> str:
+        items = "".join(f"    {api!r}: {fn},\n" for api, fn in sorted(entries.items()))
+        return f"{name} = {{\n{items}}}"
+
+    parts = [MODULE_HEADER, "\n".join(compiler.constants), "\n\n".join(functions),
+             table("REQUESTS", requests), table("RESPONSES", responses)]
+    return "\n\n\n".join(part.strip("\n") for part in parts) + "\n" + MODULE_FOOTER
+
+
+def load_compiled_module(schemas: Optional[Dict[str, Dict[str, Any]]] = None,
+                         name: str = "notecard_validators") -> types.ModuleType:
+    """Compile the schemas and load the generated code as an in-memory module."""
+    source = compile_module(schemas if schemas is not None else load_schema_files())
+    module = types.ModuleType(name)
+    exec(compile(source, f"<{name}>", "exec"), module.__dict__)
+    return module
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Compile the Notecard API schemas into a module of specialized Python validators",
+        epilog="Example: python scripts/compile_validators.py -o build/notecard_validators.py"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("-o", "--output", default=os.path.join(get_project_root(), "build", "notecard_validators.py"),
+                        help="Path of the generated module. Defaults to build/notecard_validators.py.")
+
+    args = parser.parse_args()
+
+    try:
+        source = compile_module(load_schema_files(args.schema_dir))
+    except CompileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        f.write(source)
+    print(f"✓ Compiled validators to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
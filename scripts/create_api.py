@@ -107,45 +107,45 @@ import json
 
 SCHEMA_FILE = "{api_name}.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {{"req": "{api_name}"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {{"cmd": "{api_name}"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_empty_object(schema):
+def test_invalid_empty_object(validator):
     """Tests invalid empty object (needs req or cmd)."""
     instance = {{}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {{"req": "{api_name}", "cmd": "{api_name}"}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_additional_property_with_req(schema):
+def test_invalid_additional_property_with_req(validator):
     """Tests invalid request with req and an additional property."""
     instance = {{"req": "{api_name}", "extra": "field"}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_invalid_additional_property_with_cmd(schema):
+def test_invalid_additional_property_with_cmd(validator):
     """Tests invalid request with cmd and an additional property."""
     instance = {{"cmd": "{api_name}", "extra": "field"}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -156,7 +156,7 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {{sample_json_str}}\\nError: {{e}}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 '''
 
 
@@ -169,29 +169,29 @@ import json
 
 SCHEMA_FILE = "{api_name}.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {{}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_status(schema):
+def test_valid_status(validator):
     """Tests valid status field."""
     instance = {{"status": "success"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_status_invalid_type(schema):
+def test_status_invalid_type(validator):
     """Tests invalid type for status."""
     instance = {{"status": 123}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {{"status": "success", "additional": "property"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -202,7 +202,7 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {{sample_json_str}}\\nError: {{e}}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 '''
 
 
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Fetch a host firmware image from the Notecard with dfu.get.
+
+An image is read as a sequence of dfu.get requests, each naming an `offset`
+and `length`, whose responses carry the bytes as a base64 `payload`. The
+image is written into one preallocated buffer, or a memory-mapped output
+file, with the MD5 of everything received so far updated chunk by chunk, so
+the final check needs no second pass over the image.
+
+A file-backed fetch records its last flushed offset in a small checkpoint
+file next to the output. Reopening the same output with the same length and
+MD5 resumes from that offset instead of starting over.
+
+DfuServer answers dfu.get and dfu.status from an image held in memory, and
+can be attached to scripts/notecard_emulator.py, so the whole pipeline can
+be benchmarked offline.
+
+Usage: python scripts/dfu_fetch.py [--size MB] [--chunk BYTES] [--window N] [--output PATH]
+Example: python scripts/dfu_fetch.py --size 4 --chunk 8192 --window 8
+"""
+
+import os
+import json
+import mmap
+import time
+import shutil
+import asyncio
+import binascii
+import hashlib
+import argparse
+import tempfile
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_CHUNK = 4096
+DEFAULT_CHECKPOINT = 256 * 1024
+CHECKPOINT_SUFFIX = ".dfu.json"
+
+
+class DfuError(Exception):
+    """Raised for an error response, a bad payload, or an image that fails its MD5."""
+
+
+def plan_fetch(length: int, chunk_size: int = DEFAULT_CHUNK, offset: int = 0) -> List[Dict[str, Any]]:
+    """Return the dfu.get requests that read bytes offset..length of an image."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    return [{"req": "dfu.get", "offset": start, "length": min(chunk_size, length - start)}
+            for start in range(offset, length, chunk_size)]
+
+
+class DfuImage:
+    """A firmware image being received in order from dfu.get responses.
+
+    With a path, the image is written through a memory map of the output file
+    and checkpointed every `checkpoint` bytes; otherwise it is kept in a
+    bytearray.
+    """
+
+    def __init__(self, length: int, path: Optional[str] = None, md5: Optional[str] = None,
+                 checkpoint: int = DEFAULT_CHECKPOINT):
+        self.length = length
+        self.path = path
+        self.md5 = md5
+        self.checkpoint = checkpoint
+        self.offset = 0
+        self._digest = hashlib.md5()
+        self._file = None
+        self._map = None
+        if path is None or length == 0:
+            self.buffer = bytearray(length)
+        else:
+            self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+            self._file.truncate(length)
+            self.buffer = self._map = mmap.mmap(self._file.fileno(), length)
+            state = self._load_checkpoint()
+            if state is not None:
+                self.offset = state["offset"]
+                self._digest.update(memoryview(self._map)[:self.offset])
+        self._view = memoryview(self.buffer)
+        self._saved = self.offset
+
+    def _checkpoint_path(self) -> str:
+        return self.path + CHECKPOINT_SUFFIX
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._checkpoint_path(), 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("length") != self.length or state.get("md5") != self.md5:
+            return None
+        if not 0 <= state.get("offset", -1) <= self.length:
+            return None
+        return state
+
+    def save(self) -> None:
+        """Flush the received bytes and record the offset to resume from."""
+        if self._map is None:
+            return
+        self._map.flush()
+        state = {"length": self.length, "md5": self.md5, "offset": self.offset}
+        temp = self._checkpoint_path() + ".tmp"
+        with open(temp, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp, self._checkpoint_path())
+        self._saved = self.offset
+
+    def requests(self, chunk_size: int = DEFAULT_CHUNK) -> List[Dict[str, Any]]:
+        """Return the dfu.get requests for the rest of the image."""
+        return plan_fetch(self.length, chunk_size, self.offset)
+
+    def feed(self, request: Dict[str, Any], response: Dict[str, Any]) -> int:
+        """Write the payload answering the next dfu.get request, returning its length."""
+        if "err" in response:
+            raise DfuError(response["err"])
+        offset = request.get("offset", 0)
+        if offset != self.offset:
+            raise DfuError(f"expected data at offset {self.offset}, not {offset}")
+        expected = min(request.get("length", 0), self.length - offset)
+        try:
+            data = binascii.a2b_base64(response.get("payload", ""))
+        except binascii.Error as e:
+            raise DfuError(f"payload at offset {offset} is not valid base64: {e}")
+        if len(data) != expected:
+            raise DfuError(f"payload at offset {offset}: expected {expected} bytes, got {len(data)}")
+        self._view[offset:offset + expected] = data
+        self._digest.update(data)
+        self.offset += expected
+        if self.offset - self._saved >= self.checkpoint:
+            self.save()
+        return expected
+
+    @property
+    def complete(self) -> bool:
+        """True when every byte of the image has been received."""
+        return self.offset == self.length
+
+    def verify(self) -> str:
+        """Check the image is complete and matches its MD5, returning the digest."""
+        if not self.complete:
+            raise DfuError(f"image is incomplete: {self.offset} of {self.length} bytes")
+        digest = self._digest.hexdigest()
+        if self.md5 is not None and digest != self.md5:
+            raise DfuError(f"image MD5 {digest} does not match {self.md5}")
+        return digest
+
+    def close(self) -> None:
+        """Release the output file, keeping a checkpoint unless the image is complete."""
+        if self._map is None:
+            return
+        if self.complete:
+            self._map.flush()
+            if os.path.exists(self._checkpoint_path()):
+                os.unlink(self._checkpoint_path())
+        else:
+            self.save()
+        self._view.release()
+        self._map.close()
+        self._file.close()
+        self._map = self._file = None
+
+    def __enter__(self) -> "DfuImage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DfuServer:
+    """Answers dfu.get and dfu.status from an in-memory firmware image."""
+
+    def __init__(self, image: bytes):
+        self.image = bytes(image)
+        self.md5 = hashlib.md5(self.image).hexdigest()
+
+    def get(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a dfu.get request; a length of 0 only checks DFU mode."""
+        offset = request.get("offset", 0)
+        length = request.get("length", 0)
+        if offset < 0 or length < 0 or offset > len(self.image):
+            return {"err": f"offset {offset} is outside the {len(self.image)}-byte image"}
+        if not length:
+            return {}
+        chunk = self.image[offset:offset + length]
+        return {"payload": binascii.b2a_base64(chunk, newline=False).decode()}
+
+    def status(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a dfu.status request, describing the image in `body`."""
+        return {"mode": "ready", "body": {"length": len(self.image), "md5": self.md5}}
+
+    def attach(self, emulator) -> None:
+        """Answer dfu.get and dfu.status for a NotecardEmulator."""
+        emulator.register("dfu.get", self.get)
+        emulator.register("dfu.status", self.status)
+
+
+def fetch(transact: Callable[[Dict[str, Any]], Dict[str, Any]], image: DfuImage,
+          chunk_size: int = DEFAULT_CHUNK) -> str:
+    """Fetch the rest of an image one request at a time, returning its verified MD5."""
+    for request in image.requests(chunk_size):
+        image.feed(request, transact(request))
+    return image.verify()
+
+
+async def fetch_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, image: DfuImage,
+                       chunk_size: int = DEFAULT_CHUNK, window: int = 8) -> str:
+    """Fetch the rest of an image over a Notecard connection, keeping `window` requests in flight."""
+    pending = deque()
+    requests = iter(image.requests(chunk_size))
+    while True:
+        while len(pending) < window:
+            request = next(requests, None)
+            if request is None:
+                break
+            writer.write(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+            pending.append(request)
+        if not pending:
+            break
+        await writer.drain()
+        line = await reader.readline()
+        if not line:
+            raise DfuError("connection closed during the transfer")
+        image.feed(pending.popleft(), json.loads(line))
+    return image.verify()
+
+
+async def _benchmark_stream(server: DfuServer, args) -> float:
+    from notecard_emulator import NotecardEmulator
+
+    emulator = NotecardEmulator()
+    server.attach(emulator)
+    directory = tempfile.mkdtemp(prefix="dfu-")
+    try:
+        path = await emulator.start_unix(os.path.join(directory, "notecard.sock"))
+        reader, writer = await asyncio.open_unix_connection(path, limit=1 << 22)
+        with DfuImage(len(server.image), args.output, server.md5) as image:
+            start = time.perf_counter()
+            await fetch_stream(reader, writer, image, args.chunk, args.window)
+            elapsed = time.perf_counter() - start
+        writer.close()
+        await emulator.close()
+    finally:
+        shutil.rmtree(directory)
+    return elapsed
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark fetching a firmware image with dfu.get from a stand-in Notecard",
+        epilog="Example: python scripts/dfu_fetch.py --size 4 --chunk 8192 --window 8"
+    )
+    parser.add_argument("--size", type=float, default=4, help="Image size in MB. Defaults to 4.")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help=f"Bytes per dfu.get. Defaults to {DEFAULT_CHUNK}.")
+    parser.add_argument("--window", type=int, default=8, help="Requests kept in flight over the socket. Defaults to 8.")
+    parser.add_argument("--output", default=None, help="Write the image to this file instead of memory.")
+
+    args = parser.parse_args()
+
+    size = int(args.size * (1 << 20))
+    server = DfuServer(os.urandom(size))
+    requests = len(plan_fetch(size, args.chunk))
+
+    with DfuImage(size, None, server.md5) as image:
+        start = time.perf_counter()
+        fetch(server.get, image, args.chunk)
+        direct = time.perf_counter() - start
+
+    stream = asyncio.run(_benchmark_stream(server, args))
+    megabytes = size / (1 << 20)
+    print(f"✓ {args.size:g} MB image in {requests:,} dfu.get requests of {args.chunk} bytes, MD5 verified")
+    print(f"  in-process  {megabytes / direct:8.1f} MB/s")
+    print(f"  emulator    {megabytes / stream:8.1f} MB/s ({requests / stream:,.0f} requests/s, window {args.window})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Generator of typed request builder classes from the Notecard request schemas.
+
+Every `*.req.notecard.api.json` schema becomes one `__slots__` class named
+after its API (`card.attn` -> `CardAttn`, `hub.set` -> `HubSet`), with one
+keyword argument per property, annotated with its JSON type. Each property is
+checked when the builder is constructed, by a function compiled from the
+property's schema with scripts/compile_validators.py. Cross-property rules
+(`allOf`, `if`/`then`/`else`, ...) are compiled the same way and checked
+once all fields are set. Builders are immutable, so a constructed builder is
+always a valid request and `to_json()` encodes it directly, field by field,
+without validating it again.
+
+Each class also carries the API's `skus` and, for enum properties whose
+values are limited to some SKUs, the SKUs of each value.
+
+Usage: python scripts/generate_builders.py [-o OUTPUT] [--benchmark N]
+Example: python scripts/generate_builders.py -o build/notecard_builders.py --benchmark 20000
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import keyword
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from notecard_validator import (
+    SCHEMA_SUFFIX,
+    NotecardValidator,
+    api_name_from_filename,
+    get_project_root,
+    load_schema_files,
+)
+from compile_validators import MODULE_HEADER, CompileError, SchemaCompiler, function_name
+
+
+COMMAND_KEYS = ("req", "cmd")
+
+# Keywords of a request schema that constrain several properties at once.
+RULE_KEYWORDS = ("allOf", "anyOf", "oneOf", "not", "if", "then", "else", "required")
+
+JSON_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "object": "Dict[str, Any]",
+    "array": "List[Any]",
+    "null": "None",
+}
+
+# Property types whose checked values are already immutable JSON values.
+FROZEN_TYPES = ("string", "integer", "boolean")
+
+ENCODERS = {
+    "string": "_str({v})",
+    "boolean": "('true' if {v} else 'false')",
+    "integer": "_int({v})",
+}
+
+BUILDERS_HEADER = '''"""
+Typed Notecard request builders.
+
+Generated by scripts/generate_builders.py from the Notecard API schemas.
+Do not edit by hand; re-run the generator instead.
+
+Every field is checked when a builder is constructed, and builders are
+immutable, so to_json() encodes a valid request without validating it.
+Object and array values are stored as frozen copies, and values JSON cannot
+encode (NaN, Infinity, non-string keys, other types) are rejected.
+"""
+
+import json
+from json.encoder import encode_basestring_ascii as _str
+from typing import Any, Dict, List, Optional, Union
+''' + MODULE_HEADER.split('"""', 2)[2] + '''
+
+_encode = json.JSONEncoder(separators=(",", ":"), allow_nan=False).encode
+_set = object.__setattr__
+_INFINITY = float("inf")
+
+
+def _int(v):
+    return int.__repr__(v) if type(v) is int else _encode(v)
+
+
+class RequestError(ValueError):
+    """Raised when a builder is given a value its request schema does not allow."""
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable; use replace() on the builder")
+
+
+class FrozenDict(dict):
+    """A JSON object value of a builder, which cannot be changed in place."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """A JSON array value of a builder, which cannot be changed in place."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def _freeze(v, where):
+    # Copies objects and arrays into frozen ones, rejecting anything JSON cannot encode.
+    if isinstance(v, float):
+        if v != v or v in (_INFINITY, -_INFINITY):
+            raise RequestError(f"{where}: {v!r} is not a finite number")
+        return v
+    if isinstance(v, dict):
+        for key in v:
+            if not isinstance(key, str):
+                raise RequestError(f"{where}: key {key!r} is not a string")
+        return FrozenDict((key, _freeze(value, where)) for key, value in v.items())
+    if isinstance(v, (list, tuple)):
+        return FrozenList(_freeze(value, where) for value in v)
+    if v is None or isinstance(v, (str, int, float)):
+        return v
+    raise RequestError(f"{where}: {v!r} is not a JSON value")
+
+
+class Request:
+    """Base class of the generated request builders."""
+
+    __slots__ = ("_command",)
+    API = ""
+    SKUS = ()
+    VALUE_SKUS = {}
+    # (attribute, property) pairs, in schema order.
+    FIELDS = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use replace()")
+
+    def to_dict(self):
+        """Return the request as a dict."""
+        request = {"cmd" if self._command else "req": self.API}
+        for attribute, name in self.FIELDS:
+            value = getattr(self, attribute)
+            if value is not None:
+                request[name] = value
+        return request
+
+    @classmethod
+    def from_dict(cls, request):
+        """Build from a request dict; a `cmd` without a `req` builds a command."""
+        names = {name: attribute for attribute, name in cls.FIELDS}
+        unknown = [name for name in request if name not in names and name not in ("req", "cmd")]
+        if unknown:
+            raise RequestError(f"{cls.API}: unknown properties {unknown}")
+        command = "cmd" in request and "req" not in request
+        return cls(command=command, **{names[name]: value for name, value in request.items() if name in names})
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed, checked like a new builder."""
+        fields = {attribute: getattr(self, attribute) for attribute, _ in self.FIELDS}
+        fields.update(changes)
+        return type(self)(command=self._command, **fields)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute, _ in self.FIELDS
+                           if getattr(self, attribute) is not None)
+        return f"{type(self).__name__}({fields})"
+'''
+
+BUILDERS_FOOTER = '''
+
+def build(request):
+    """Build the builder for a request dict, dispatching on its req/cmd name."""
+    name = request.get("req", request.get("cmd"))
+    if not isinstance(name, str) or name not in BUILDERS:
+        raise RequestError(f"unknown API {name!r}")
+    return BUILDERS[name].from_dict(request)
+'''
+
+
+def class_name(api: str) -> str:
+    """Return the builder class name for an API name, e.g. 'card.attn' -> 'CardAttn'."""
+    return "".join(part[:1].upper() + part[1:] for part in api.replace("-", ".").replace("_", ".").split("."))
+
+
+def attribute_name(name: str) -> str:
+    """Return the Python attribute for a property name, avoiding keywords."""
+    attribute = "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+    if attribute[:1].isdigit():
+        attribute = "_" + attribute
+    return attribute + "_" if keyword.iskeyword(attribute) or attribute == "command" else attribute
+
+
+def annotation(schema: Dict[str, Any]) -> str:
+    """Return the Python type annotation for a property schema."""
+    types_ = schema.get("type")
+    if isinstance(types_, list):
+        return "Union[" + ", ".join(JSON_TYPES.get(t, "Any") for t in types_) + "]"
+    if types_ == "array" and isinstance(schema.get("items"), dict) and schema["items"].get("type") in JSON_TYPES:
+        return f"List[{annotation(schema['items'])}]"
+    return JSON_TYPES.get(types_, "Any")
+
+
+def rules_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the cross-property part of a request schema, without the req/cmd oneOf."""
+    rules = {keyword_: schema[keyword_] for keyword_ in RULE_KEYWORDS if keyword_ in schema}
+    branches = rules.get("oneOf", [])
+    if branches and all(set(branch.get("required", ())) <= set(COMMAND_KEYS) for branch in branches):
+        del rules["oneOf"]
+    if "required" in rules:
+        rules["required"] = [name for name in rules["required"] if name not in COMMAND_KEYS]
+        if not rules["required"]:
+            del rules["required"]
+    return rules
+
+
+def value_skus(details: Dict[str, Any]) -> Dict[Any, Tuple[str, ...]]:
+    """Return the SKUs of each enum value described in `sub-descriptions`."""
+    return {entry["const"]: tuple(entry["skus"]) for entry in details.get("sub-descriptions", [])
+            if isinstance(entry, dict) and "const" in entry and "skus" in entry}
+
+
+def _summary(schema: Dict[str, Any]) -> str:
+    text = " ".join(schema.get("description", schema.get("title", "")).split())
+    end = text.find(". ")
+    return text[:end + 1] if end >= 0 else text
+
+
+def _builder_source(compiler: SchemaCompiler, api: str, schema: Dict[str, Any]) -> str:
+    base = function_name(api)
+    fields = [(attribute_name(name), name, details) for name, details in schema.get("properties", {}).items()
+              if name not in COMMAND_KEYS and isinstance(details, dict)]
+    functions = []
+    for attribute, name, details in fields:
+        lines = [f"def _check_{base}_{attribute}(v):"]
+        lines += ["    " + line for line in compiler.stmts(details, "v", name)]
+        lines.append("    return None")
+        functions.append("\n".join(lines))
+    rules = rules_schema(schema)
+    if rules:
+        lines = [f"def _rules_{base}(v):"]
+        lines += ["    " + line for line in compiler.stmts(rules, "v")]
+        lines.append("    return None")
+        functions.append("\n".join(lines))
+
+    name = class_name(api)
+    skus = {name_: value_skus(details) for attribute, name_, details in fields if value_skus(details)}
+    body = [
+        f"class {name}(Request):",
+        f"    {_summary(schema)!r}",
+        "",
+        f"    __slots__ = {tuple(attribute for attribute, _, _ in fields)!r}",
+        f"    API = {api!r}",
+        f"    SKUS = {tuple(schema.get('skus', ()))!r}",
+    ]
+    if skus:
+        body.append(f"    VALUE_SKUS = {skus!r}")
+    body.append(f"    FIELDS = {tuple((attribute, name_) for attribute, name_, _ in fields)!r}")
+    body.append("")
+
+    parameters = "".join(f"{attribute}: Optional[{annotation(details)}] = None, "
+                         for attribute, _, details in fields)
+    body.append(f"    def __init__(self, *, {parameters}command: bool = False):")
+    for attribute, name_, details in fields:
+        body += [
+            f"        if {attribute} is not None:",
+            f"            error = _check_{base}_{attribute}({attribute})",
+            "            if error is not None:",
+            f"                raise RequestError({api + ': '!r} + error)",
+        ]
+        # Strings, integers and booleans are immutable and checked exactly; anything else may hold a
+        # float or a mutable container.
+        if details.get("type") not in FROZEN_TYPES:
+            body.append(f"            {attribute} = _freeze({attribute}, {api + ': ' + name_!r})")
+        body.append(f"        _set(self, {attribute!r}, {attribute})")
+    body.append("        _set(self, '_command', command)")
+    if rules:
+        body += [
+            f"        error = _rules_{base}(self.to_dict())",
+            "        if error is not None:",
+            f"            raise RequestError({api + ': '!r} + error)",
+        ]
+    body += [
+        "",
+        "    def to_json(self) -> str:",
+        '        """Return the request as compact JSON."""',
+        f"        out = {'{' + json.dumps('cmd') + ':' + json.dumps(api)!r} if self._command else "
+        f"{'{' + json.dumps('req') + ':' + json.dumps(api)!r}",
+    ]
+    for attribute, property_, details in fields:
+        type_ = details.get("type")
+        encoder = ENCODERS.get(type_ if isinstance(type_, str) else None, "_encode({v})").format(v=f"self.{attribute}")
+        body += [
+            f"        if self.{attribute} is not None:",
+            f"            out += {',' + json.dumps(property_) + ':'!r} + {encoder}",
+        ]
+    body.append("        return out + '}'")
+    return "\n\n\n".join(functions + ["\n".join(body)])
+
+
+def generate_module(schemas: Dict[str, Dict[str, Any]]) -> str:
+    """Generate the source of the builders module from the request schemas."""
+    compiler = SchemaCompiler({})
+    sources = []
+    builders = {}
+    for filename in sorted(schemas):
+        if not filename.endswith(f".req{SCHEMA_SUFFIX}"):
+            continue
+        api = api_name_from_filename(filename)
+        try:
+            sources.append(_builder_source(compiler, api, schemas[filename]))
+        except CompileError as e:
+            raise CompileError(f"{filename}: {e}") from None
+        if class_name(api) in builders.values():
+            raise CompileError(f"{filename}: class name {class_name(api)} is already used")
+        builders[api] = class_name(api)
+
+    table = "BUILDERS = {\n" + "".join(f"    {api!r}: {name},\n" for api, name in builders.items()) + "}"
+    parts = [BUILDERS_HEADER, "\n".join(compiler.constants), "\n\n\n".join(sources), table]
+    return "\n\n\n".join(part.strip("\n") for part in parts if part) + "\n" + BUILDERS_FOOTER
+
+
+def load_builders_module(schemas: Optional[Dict[str, Dict[str, Any]]] = None,
+                         name: str = "notecard_builders") -> types.ModuleType:
+    """Generate the builders and load them as an in-memory module."""
+    source = generate_module(schemas if schemas is not None else load_schema_files())
+    module = types.ModuleType(name)
+    exec(compile(source, f"<{name}>", "exec"), module.__dict__)
+    return module
+
+
+def _per_request(fn, cases: List[Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for case in cases:
+            fn(case)
+    return (time.perf_counter() - start) / (iterations * len(cases)) * 1e6
+
+
+def benchmark(schemas: Dict[str, Dict[str, Any]], requests: int) -> List[Tuple[str, float]]:
+    """Time building and encoding every valid request sample, per request, in microseconds."""
+    import jsonschema
+    from compile_validators import load_compiled_module
+
+    module = load_builders_module(schemas)
+    validator = NotecardValidator(schemas)
+    compiled = load_compiled_module(schemas)
+    cases = []
+    for filename, schema in sorted(schemas.items()):
+        if not filename.endswith(f".req{SCHEMA_SUFFIX}"):
+            continue
+        for sample in schema.get("samples", []):
+            request = json.loads(sample["json"])
+            if validator.is_valid_request(request):
+                builder = module.BUILDERS[api_name_from_filename(filename)]
+                kwargs = {attribute: request[name] for attribute, name in builder.FIELDS if name in request}
+                cases.append((builder, kwargs, request, schema, validator.validator_for(filename)))
+    iterations = max(1, requests // len(cases))
+    dumps = json.dumps
+
+    def builder_path(case):
+        return case[0](**case[1]).to_json()
+
+    def prebuilt_path(case):
+        request = dict(case[2])
+        case[4].validate(request)
+        return dumps(request, separators=(",", ":"))
+
+    def compiled_path(case):
+        request = dict(case[2])
+        if compiled.validate_request(request) is not None:
+            raise ValueError(request)
+        return dumps(request, separators=(",", ":"))
+
+    def jsonschema_path(case):
+        request = dict(case[2])
+        jsonschema.validate(request, case[3])
+        return dumps(request, separators=(",", ":"))
+
+    return [
+        ("builder + to_json()", _per_request(builder_path, cases, iterations)),
+        ("dict + compiled validator", _per_request(compiled_path, cases, iterations)),
+        ("dict + prebuilt jsonschema validator", _per_request(prebuilt_path, cases, iterations)),
+        ("dict + jsonschema.validate()", _per_request(jsonschema_path, cases, max(1, iterations // 20))),
+    ]
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Generate typed request builder classes from the Notecard request schemas",
+        epilog="Example: python scripts/generate_builders.py -o build/notecard_builders.py --benchmark 20000"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("-o", "--output", default=os.path.join(get_project_root(), "build", "notecard_builders.py"),
+                        help="Path of the generated module. Defaults to build/notecard_builders.py.")
+    parser.add_argument("--benchmark", type=int, metavar="N", default=0,
+                        help="Also time N builder requests against dict + validation.")
+
+    args = parser.parse_args()
+
+    schemas = load_schema_files(args.schema_dir)
+    try:
+        source = generate_module(schemas)
+    except CompileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        f.write(source)
+    print(f"✓ Generated request builders to {args.output}")
+
+    if args.benchmark:
+        for label, micros in benchmark(schemas, args.benchmark):
+            print(f"  {label:<38} {micros:8.2f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
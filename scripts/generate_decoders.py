@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Generator of lazy typed response decoder classes from the Notecard response schemas.
+
+Every `*.rsp.notecard.api.json` schema becomes one `__slots__` class named
+after its API (`card.status` -> `CardStatusResponse`), with one typed,
+read-only property per schema property. A decoder wraps the raw response
+text (or an already parsed dict) and parses nothing when it is constructed.
+The first field read parses the response once, caches every scalar field in
+a slot and discards the rest of the parsed document; an array or object
+field is decoded again, and cached, only when it is read. A retained
+response therefore costs its raw text plus the fields that were read,
+instead of a dict of every field.
+
+Objects whose schema lists their properties, such as the `net` entries of
+card.wireless, become nested `__slots__` record classes
+(`CardWirelessNet`).
+
+The generated module also has a bulk decoder, `decode_jsonl()`, which wraps
+each line of a JSONL response log without parsing it.
+
+Usage: python scripts/generate_decoders.py [-o OUTPUT] [--benchmark N]
+Example: python scripts/generate_decoders.py -o build/notecard_decoders.py --benchmark 100000
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import random
+import argparse
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from notecard_validator import SCHEMA_SUFFIX, api_name_from_filename, get_project_root, load_schema_files
+from compile_validators import CompileError
+from generate_builders import _summary, annotation, attribute_name, class_name
+
+
+SCALAR_TYPES = ("string", "integer", "number", "boolean", "null")
+
+# Attributes of the Response and Record base classes.
+RESERVED = frozenset({"raw", "get", "to_dict", "API", "FIELDS"})
+
+DECODERS_HEADER = '''"""
+Lazy typed Notecard response decoders.
+
+Generated by scripts/generate_decoders.py from the Notecard API schemas.
+Do not edit by hand; re-run the generator instead.
+
+A decoder parses its raw response on the first field read, keeps the scalar
+fields, and decodes array and object fields only when they are read.
+Responses are not validated.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Union
+
+_decode = json.JSONDecoder().decode
+
+
+class ResponseError(ValueError):
+    """Raised when a raw response is not a JSON object."""
+
+
+class Record:
+    """Base class of the nested records of a response, decoded from a dict."""
+
+    __slots__ = ()
+    # (attribute, property) pairs, in schema order.
+    FIELDS = ()
+
+    def to_dict(self):
+        """Return the record as a dict, without the fields it does not have."""
+        return {name: _plain(getattr(self, attribute)) for attribute, name in self.FIELDS
+                if getattr(self, attribute) is not None}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute, _ in self.FIELDS
+                           if getattr(self, attribute) is not None)
+        return f"{type(self).__name__}({fields})"
+
+
+def _plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _record(cls, value):
+    return cls(value) if isinstance(value, dict) else value
+
+
+def _records(cls, values):
+    if not isinstance(values, list):
+        return values
+    return [cls(value) if isinstance(value, dict) else value for value in values]
+
+
+class Response:
+    """Base class of the generated response decoders."""
+
+    __slots__ = ("_raw",)
+    API = ""
+    # (attribute, property) pairs, in schema order.
+    FIELDS = ()
+
+    def __init__(self, raw):
+        """Wrap a raw response: JSON text, bytes, or an already parsed dict."""
+        self._raw = raw
+
+    @property
+    def raw(self):
+        """The raw response this decoder wraps."""
+        return self._raw
+
+    def _document(self):
+        raw = self._raw
+        if isinstance(raw, dict):
+            return raw
+        try:
+            document = _decode(raw.decode() if isinstance(raw, (bytes, bytearray)) else raw)
+        except ValueError as e:
+            raise ResponseError(f"{self.API}: {e}") from None
+        if not isinstance(document, dict):
+            raise ResponseError(f"{self.API}: response is not a JSON object")
+        return document
+
+    def _cache(self, document):
+        pass
+
+    def _load(self):
+        document = self._document()
+        self._cache(document)
+        return document
+
+    def get(self, name, default=None):
+        """Return any property of the response, including ones its schema does not list."""
+        return self._document().get(name, default)
+
+    def to_dict(self):
+        """Return the whole response as a new dict."""
+        return dict(self._document())
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._document() == other._document()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._raw!r})"
+'''
+
+DECODERS_FOOTER = '''
+
+def decode(api, raw):
+    """Wrap a raw response to an API in its decoder."""
+    if api not in DECODERS:
+        raise ResponseError(f"unknown API {api!r}")
+    return DECODERS[api](raw)
+
+
+def decode_lines(lines, api):
+    """Wrap each non-blank line of a response log in the API's decoder, without parsing it."""
+    if api not in DECODERS:
+        raise ResponseError(f"unknown API {api!r}")
+    cls = DECODERS[api]
+    for line in lines:
+        if line.strip():
+            yield cls(line)
+
+
+def decode_jsonl(path, api):
+    """Wrap each response line of a JSONL file, as decode_lines() does."""
+    with open(path, "rb") as f:
+        yield from decode_lines(f, api)
+'''
+
+
+def _is_scalar(details: Dict[str, Any]) -> bool:
+    types_ = details.get("type")
+    types_ = types_ if isinstance(types_, list) else [types_]
+    return all(type_ in SCALAR_TYPES for type_ in types_)
+
+
+def _record_schema(details: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the schema of the records a property holds, if they list their properties."""
+    if details.get("type") == "object" and isinstance(details.get("properties"), dict):
+        return details
+    items = details.get("items")
+    if details.get("type") == "array" and isinstance(items, dict) and isinstance(items.get("properties"), dict):
+        return items
+    return None
+
+
+def _fields(schema: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    fields = []
+    for name, details in schema.get("properties", {}).items():
+        if isinstance(details, dict):
+            attribute = attribute_name(name)
+            fields.append((attribute + "_" if attribute in RESERVED else attribute, name, details))
+    return fields
+
+
+def _decoder(details: Dict[str, Any], record: str) -> str:
+    return f"_records({record}, value)" if details.get("type") == "array" else f"_record({record}, value)"
+
+
+def _record_source(name: str, schema: Dict[str, Any], records: List[str], description: str) -> str:
+    """Generate a record class, after the classes of the records nested in it."""
+    fields = _fields(schema)
+    init = ["    def __init__(self, values):", "        get = values.get"]
+    for attribute, property_, details in fields:
+        nested = _record_schema(details)
+        if nested is None:
+            init.append(f"        self.{attribute} = get({property_!r})")
+            continue
+        record = _record_source(name + class_name(property_), nested, records, _summary(details))
+        init += [
+            f"        value = get({property_!r})",
+            f"        self.{attribute} = None if value is None else {_decoder(details, record)}",
+        ]
+    records.append("\n".join([
+        f"class {name}(Record):",
+        f"    {_summary(schema) or description or name!r}",
+        "",
+        f"    __slots__ = {tuple(attribute for attribute, _, _ in fields)!r}",
+        f"    FIELDS = {tuple((attribute, property_) for attribute, property_, _ in fields)!r}",
+        "",
+    ] + init))
+    return name
+
+
+def _annotation(details: Dict[str, Any], record: Optional[str]) -> str:
+    if record is None:
+        return annotation(details)
+    return f"List[{record}]" if details.get("type") == "array" else record
+
+
+def _decoder_source(api: str, schema: Dict[str, Any]) -> Tuple[str, str]:
+    name = class_name(api) + "Response"
+    records: List[str] = []
+    fields = _fields(schema)
+    cache = []
+    properties = []
+    for attribute, property_, details in fields:
+        slot = "_v_" + attribute
+        nested = _record_schema(details)
+        record = None
+        if nested is not None:
+            record = _record_source(class_name(api) + class_name(property_), nested, records, _summary(details))
+        lines = [
+            "    @property",
+            f"    def {attribute}(self) -> Optional[{_annotation(details, record)}]:",
+        ]
+        description = _summary(details)
+        if description:
+            lines.append(f"        {description!r}")
+        lines += [
+            "        try:",
+            f"            return self.{slot}",
+            "        except AttributeError:",
+        ]
+        if nested is None and _is_scalar(details):
+            # Scalars are all cached by the first read of any field.
+            cache.append(f"        self.{slot} = get({property_!r})")
+            lines += [
+                "            self._load()",
+                f"            return self.{slot}",
+            ]
+        else:
+            decoded = "value" if nested is None else f"None if value is None else {_decoder(details, record)}"
+            lines += [
+                f"            value = self._load().get({property_!r})",
+                f"            self.{slot} = value = {decoded}",
+                "            return value",
+            ]
+        properties.append("\n".join(lines))
+
+    body = [
+        f"class {name}(Response):",
+        f"    {_summary(schema)!r}",
+        "",
+        f"    __slots__ = {tuple('_v_' + attribute for attribute, _, _ in fields)!r}",
+        f"    API = {api!r}",
+        f"    FIELDS = {tuple((attribute, property_) for attribute, property_, _ in fields)!r}",
+    ]
+    if cache:
+        body += ["", "    def _cache(self, document):", "        get = document.get"] + cache
+    source = "\n".join(body) + ("\n\n" + "\n\n".join(properties) if properties else "")
+    return name, "\n\n\n".join(records + [source])
+
+
+def generate_module(schemas: Dict[str, Dict[str, Any]]) -> str:
+    """Generate the source of the decoders module from the response schemas."""
+    sources = []
+    decoders = {}
+    for filename in sorted(schemas):
+        if not filename.endswith(f".rsp{SCHEMA_SUFFIX}"):
+            continue
+        api = api_name_from_filename(filename)
+        name, source = _decoder_source(api, schemas[filename])
+        if name in decoders.values():
+            raise CompileError(f"{filename}: class name {name} is already used")
+        decoders[api] = name
+        sources.append(source)
+
+    table = "DECODERS = {\n" + "".join(f"    {api!r}: {name},\n" for api, name in decoders.items()) + "}"
+    parts = [DECODERS_HEADER, "\n\n\n".join(sources), table]
+    return "\n\n\n".join(part.strip("\n") for part in parts) + "\n" + DECODERS_FOOTER
+
+
+def load_decoders_module(schemas: Optional[Dict[str, Dict[str, Any]]] = None,
+                         name: str = "notecard_decoders") -> types.ModuleType:
+    """Generate the decoders and load them as an in-memory module."""
+    source = generate_module(schemas if schemas is not None else load_schema_files())
+    module = types.ModuleType(name)
+    exec(compile(source, f"<{name}>", "exec"), module.__dict__)
+    return module
+
+
+def sample_response(schema: Dict[str, Any], rng: random.Random, items: int = 8) -> Dict[str, Any]:
+    """Return a random response with every property the schema lists."""
+    def value(details: Dict[str, Any]) -> Any:
+        type_ = details.get("type")
+        type_ = type_[0] if isinstance(type_, list) else type_
+        if "enum" in details:
+            return rng.choice(details["enum"])
+        if type_ == "string":
+            return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 24)))
+        if type_ == "integer":
+            return rng.randint(0, 1 << 31)
+        if type_ == "number":
+            return round(rng.uniform(-1000, 1000), 4)
+        if type_ == "boolean":
+            return rng.random() < 0.5
+        if type_ == "array":
+            return [value(details.get("items", {"type": "string"})) for _ in range(items)]
+        if type_ == "object":
+            properties = details.get("properties") or {f"field{index}": {"type": "integer"} for index in range(4)}
+            return {name: value(sub) for name, sub in properties.items() if isinstance(sub, dict)}
+        return None
+
+    return {name: value(details) for name, details in schema.get("properties", {}).items() if isinstance(details, dict)}
+
+
+def benchmark(schemas: Dict[str, Dict[str, Any]], responses: int,
+              apis: Tuple[str, ...] = ("card.status", "card.wireless", "note.changes")) -> List[Tuple[str, str, float, float]]:
+    """Retain responses and read two fields of each, as dicts and as decoders.
+
+    Returns (api, path, µs per response, retained bytes per response) rows.
+    """
+    module = load_decoders_module(schemas)
+    rng = random.Random(0)
+    rows = []
+    for api in apis:
+        schema = schemas[f"{api}.rsp{SCHEMA_SUFFIX}"]
+        lines = [json.dumps(sample_response(schema, rng), separators=(",", ":")).encode() + b"\n"
+                 for _ in range(responses)]
+        fields = [attribute for attribute, _ in module.DECODERS[api].FIELDS[:2]]
+        names = [name for _, name in module.DECODERS[api].FIELDS[:2]]
+
+        def as_dicts():
+            kept = [json.loads(line) for line in lines]
+            for response in kept:
+                for name in names:
+                    response.get(name)
+            return kept
+
+        def as_decoders():
+            kept = list(module.decode_lines(lines, api))
+            for response in kept:
+                for field in fields:
+                    getattr(response, field)
+            return kept
+
+        for label, path in (("json.loads() dicts", as_dicts), ("lazy decoders", as_decoders)):
+            start = time.perf_counter()
+            path()
+            elapsed = time.perf_counter() - start
+            # The raw lines are shared by both paths and are not counted.
+            tracemalloc.start()
+            kept = path()
+            retained = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del kept
+            rows.append((api, label, elapsed / responses * 1e6, retained / responses))
+    return rows
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Generate lazy typed response decoder classes from the Notecard response schemas",
+        epilog="Example: python scripts/generate_decoders.py -o build/notecard_decoders.py --benchmark 100000"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("-o", "--output", default=os.path.join(get_project_root(), "build", "notecard_decoders.py"),
+                        help="Path of the generated module. Defaults to build/notecard_decoders.py.")
+    parser.add_argument("--benchmark", type=int, metavar="N", default=0,
+                        help="Also retain N responses per API and compare time and memory against dicts.")
+
+    args = parser.parse_args()
+
+    schemas = load_schema_files(args.schema_dir)
+    try:
+        source = generate_module(schemas)
+    except CompileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        f.write(source)
+    print(f"✓ Generated response decoders to {args.output}")
+
+    if args.benchmark:
+        for api, label, micros, size in benchmark(schemas, args.benchmark):
+            print(f"  {api:<14} {label:<20} {micros:8.2f} µs/response {size:8.0f} bytes retained/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 import json
-import requests
 import os
 import re
+import glob
+import time
+import hashlib
+import argparse
 
-def load_schema(path):
-    """Loads and parses JSON schema from a local file path."""
+import schema_model
+from schema_cache import load_json
+
+# Directory, next to the generated pages, of the per-group search index shards.
+SEARCH_INDEX_DIR = "search-index"
+
+def load_model(cache, path):
+    """Loads the introspection model of a local schema file from the model cache."""
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        return cache.model(path)
     except FileNotFoundError:
         print(f"Error: Schema file not found at {path}")
         return None
@@ -31,31 +39,15 @@ def get_schema_type(schema_ref):
         return 'response'
     return 'unknown'
 
-def generate_markdown_for_schema(schema, schema_type):
-    """Generates Markdown documentation for a single Notecard API schema."""
+def generate_markdown_for_schema(model, schema_type):
+    """Generates Markdown documentation for a single Notecard API schema from its introspection model."""
     md_parts = []
-
-    title = schema.get("title", "Untitled Request")
-    description = schema.get("description", "No description available.")
-
-    # Schema properties are often nested, but prioritize root level
-    properties = None
-    if 'properties' in schema: # Check root level first
-        properties = schema['properties']
-    elif 'allOf' in schema and isinstance(schema['allOf'], list): # Fallback to checking allOf
-        for item in schema['allOf']:
-            if isinstance(item, dict) and 'properties' in item:
-                properties = item['properties']
-                break
+    title = model["title"] or "Untitled Request"
+    description = model["description"] if model["description"] is not None else "No description available."
+    properties = model["properties"]
 
     # Determine request name: prefer const from req/cmd, fallback to title
-    req_name = None
-    if properties and isinstance(properties, dict):
-        if 'req' in properties and isinstance(properties['req'], dict) and 'const' in properties['req']:
-            req_name = properties['req']['const']
-        elif 'cmd' in properties and isinstance(properties['cmd'], dict) and 'const' in properties['cmd']:
-             req_name = properties['cmd']['const']
-
+    req_name = model["name"]
     if not req_name:
         req_name = title.split(' ')[0] if title else "request" # Fallback
 
@@ -63,53 +55,45 @@ def generate_markdown_for_schema(schema, schema_type):
     md_parts.append(f"#### {schema_type.title()}\n")
     md_parts.append(f"{description}\n")
 
-    if properties and isinstance(properties, dict):
+    if properties:
         # Filter out req and cmd to see if other parameters exist
-        other_props = {k: v for k, v in properties.items() if k not in ('req', 'cmd')}
+        other_props = [prop for prop in properties if prop["name"] not in ('req', 'cmd')]
 
         if other_props:
             md_parts.append("**Parameters:**\n")
             md_parts.append("| Parameter | Type | Description | Default |")
             md_parts.append("|---|---|---|---|")
 
-            for name, details in other_props.items():
-                if isinstance(details, dict):
-                    prop_type = details.get('type', '-')
-                    prop_desc = details.get('description', '-')
-                    prop_default = details.get('default', '-')
+            for prop in other_props:
+                name = prop["name"]
+                if not prop.get("invalid"):
+                    prop_type = prop.get('type', '-')
+                    prop_desc = prop.get('description', '-')
+                    prop_default = prop.get('default', '-')
 
                     # Handle sub-descriptions if they exist
-                    if 'sub-descriptions' in details and isinstance(details['sub-descriptions'], list):
+                    if 'sub_descriptions' in prop:
                         sub_descs_md = []
-                        for sub_desc in details['sub-descriptions']:
-                            if 'const' in sub_desc and 'description' in sub_desc:
-                                desc_line = f" - `{sub_desc['const']}`: {sub_desc['description']}"
-                                # Add SKU information if present
-                                if 'skus' in sub_desc and isinstance(sub_desc['skus'], list):
-                                    sku_list = ", ".join([f"`{sku}`" for sku in sub_desc['skus']])
-                                    desc_line += f" ({sku_list})"
-                                sub_descs_md.append(desc_line)
+                        for sub_desc in prop['sub_descriptions']:
+                            desc_line = f" - `{sub_desc['const']}`: {sub_desc['description']}"
+                            # Add SKU information if present
+                            if 'skus' in sub_desc:
+                                sku_list = ", ".join([f"`{sku}`" for sku in sub_desc['skus']])
+                                desc_line += f" ({sku_list})"
+                            sub_descs_md.append(desc_line)
                         if sub_descs_md:
                             prop_desc += "<br/><br/>**Allowed Values:**<br/>" + "<br/>".join(sub_descs_md)
                     # Append enum values to description if present and no sub-descriptions
-                    elif 'enum' in details and isinstance(details['enum'], list):
-                        enum_values = ", ".join([f"`{v}`" for v in details['enum']])
+                    elif 'enum' in prop:
+                        enum_values = ", ".join([f"`{v}`" for v in prop['enum']])
                         prop_desc += f". Allowed values: {enum_values}"
-                    # Else, check if pattern suggests allowed values
-                    elif 'pattern' in details and isinstance(details['pattern'], str):
-                        pattern_str = details['pattern']
-                        if pattern_str.startswith('^(?:') and pattern_str.count('|') > 0:
-                            try:
-                                inner_part = pattern_str.split('(?:')[1].split(')')[0]
-                                potential_values = sorted(list(set(val.strip() for val in inner_part.split('|') if val.strip())))
-                                if potential_values:
-                                    pattern_values = ", ".join([f"`{v}`" for v in potential_values])
-                                    # Check if description already hints at this list
-                                    if "one of the following" not in prop_desc.lower() and "must be" not in prop_desc.lower():
-                                        prop_desc += "."
-                                    prop_desc += f" Allowed values (comma separated): {pattern_values}"
-                            except IndexError: # Handle cases where split logic fails
-                                pass # Ignore if pattern doesn't match expected format
+                    # Else, list the tokens of a comma-separated token pattern
+                    elif 'tokens' in prop:
+                        pattern_values = ", ".join([f"`{v}`" for v in prop['tokens']])
+                        # Check if description already hints at this list
+                        if "one of the following" not in prop_desc.lower() and "must be" not in prop_desc.lower():
+                            prop_desc += "."
+                        prop_desc += f" Allowed values (comma separated): {pattern_values}"
 
                     # Handle cases where default is not a simple string/number
                     if isinstance(prop_default, (dict, list)):
@@ -125,26 +109,194 @@ def generate_markdown_for_schema(schema, schema_type):
         md_parts.append("No specific parameters defined.\n")
 
     # Add samples section if available
-    if 'samples' in schema and isinstance(schema['samples'], list):
+    if model["samples"] is not None:
         md_parts.append("**Examples:**\n")
-        for sample in schema['samples']:
-            if isinstance(sample, dict) and 'description' in sample and 'json' in sample:
+        for sample in model["samples"]:
+            if sample['description'] is not None:
                 md_parts.append(f"_{sample['description']}_\n")
-                try:
-                    # Pretty print the JSON
-                    json_obj = json.loads(sample['json'])
-                    formatted_json = json.dumps(json_obj, indent=2)
-                    md_parts.append("```json")
-                    md_parts.append(formatted_json)
-                    md_parts.append("```\n")
-                except json.JSONDecodeError:
-                    # If JSON is invalid, show it as is
-                    md_parts.append("```json")
-                    md_parts.append(sample['json'])
-                    md_parts.append("```\n")
+                md_parts.append("```json")
+                # Pretty printed, or shown as is if the JSON is invalid
+                md_parts.append(sample['pretty'] if sample['pretty'] is not None else sample['json'])
+                md_parts.append("```\n")
 
     return "\n".join(md_parts)
 
+def render_api(base_name, group):
+    """Renders the Markdown section of one API from its request and response (ref, model) pairs.
+
+    Returns the section, and whether it rendered without errors.
+    """
+    parts = [f"### `{base_name}`"]
+    ok = True
+
+    # Add API SKU if available
+    if group['request'] and group['request'][1]['skus'] is not None:
+        sku = group['request'][1]['skus']
+        parts.append("#### SKUs\n")
+        for each_sku in sku:
+            parts.append(f"`{each_sku}`")
+        parts.append("\n")
+
+    # Add request and response documentation if available
+    for schema_type in ('request', 'response'):
+        if group[schema_type]:
+            ref, model = group[schema_type]
+            try:
+                parts.append(generate_markdown_for_schema(model, schema_type))
+            except Exception as e:
+                print(f"Error generating markdown for {schema_type} {ref}: {e}")
+                ok = False
+
+    return "\n".join(parts), ok
+
+def renderer_fingerprint():
+    """Hashes the code that renders the Markdown and builds its models, so that changing it invalidates cached sections."""
+    digest = hashlib.sha256(schema_model.model_fingerprint().encode())
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+class SectionCache:
+    """Rendered API sections stored as <cache_dir>/<api>-<hash>.md, keyed by the hash of their inputs."""
+
+    def __init__(self, cache_dir, fingerprint):
+        self.cache_dir = cache_dir
+        self.fingerprint = fingerprint
+
+    def key(self, *contents):
+        """Hashes the renderer fingerprint and the hashes of an API's schemas (None if missing)."""
+        digest = hashlib.sha256(self.fingerprint.encode())
+        for content in contents:
+            # Length-prefixed, so that moving bytes between files changes the key.
+            digest.update(b"-" if content is None else f"{len(content)}:".encode() + content)
+        return digest.hexdigest()[:32]
+
+    def _path(self, base_name, key):
+        return os.path.join(self.cache_dir, f"{base_name}-{key}.md")
+
+    def get(self, base_name, key):
+        """Returns the cached section, or None."""
+        try:
+            with open(self._path(base_name, key), 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, base_name, key, section):
+        """Stores a section, replacing the API's older sections."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(base_name, key)
+        for old in glob.glob(os.path.join(glob.escape(self.cache_dir), glob.escape(base_name) + "-*.md")):
+            if old != path:
+                os.unlink(old)
+        temporary = path + ".tmp"
+        with open(temporary, 'w') as f:
+            f.write(section)
+        os.replace(temporary, path)
+
+def page_header(title, schema_version, api_version):
+    """Returns the front matter and "Generated from" lines that start each page."""
+    return [
+        "---",
+        "layout: default",
+        f"title: {title}",
+        "---",
+        "", # Add a blank line after front matter
+        f"_Generated from [notecard-schema](https://github.com/blues/notecard-schema) version {schema_version} (API Version: {api_version})_\n",
+    ]
+
+def api_group(base_name):
+    """Returns the group of an API, the part of its name before the first dot (e.g. 'card' for 'card.attn')."""
+    return base_name.split('.')[0]
+
+def heading_anchor(text):
+    """Returns the anchor mkdocs gives a heading, e.g. 'cardattn' for '`card.attn`'."""
+    anchor = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    return re.sub(r'[-\s]+', '-', anchor)
+
+def build_search_shard(name, apis):
+    """Builds the inverted search index of one API group from its (base_name, group) pairs.
+
+    Terms are lowercased API names (and their dotted parts after the group),
+    parameter names, and allowed parameter values. Each maps to a sorted list
+    of [api, parameter] postings, where api indexes the shard's "apis" list
+    and parameter is "" for a match on the API name itself.
+    """
+    terms = {}
+    def add(term, api, parameter=""):
+        term = str(term).strip().lower()
+        if term:
+            terms.setdefault(term, set()).add((api, parameter))
+
+    for index, (base_name, group) in enumerate(apis):
+        add(base_name, index)
+        for part in base_name.split('.')[1:]:
+            add(part, index)
+        for schema_type in ('request', 'response'):
+            if not group[schema_type] or not group[schema_type][1]["properties"]:
+                continue
+            for prop in group[schema_type][1]["properties"]:
+                if prop["name"] in ('req', 'cmd') or prop.get("invalid"):
+                    continue
+                add(prop["name"], index, prop["name"])
+                values = [sub["const"] for sub in prop.get("sub_descriptions", [])]
+                values += prop.get("enum", []) + prop.get("tokens", [])
+                for value in values:
+                    if not isinstance(value, (dict, list)):
+                        add(value, index, prop["name"])
+
+    return {
+        "group": name,
+        "page": f"{name}.md",
+        "apis": [[base_name, heading_anchor(base_name)] for base_name, group in apis],
+        "terms": {term: sorted(map(list, postings)) for term, postings in sorted(terms.items())},
+    }
+
+def write_search_index(index_dir, shards):
+    """Writes one compact JSON shard per API group and a groups.json listing them.
+
+    Unchanged files are left untouched and shards of removed groups are
+    deleted. Returns the number of files written.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    files = {f"{name}.json": shard for name, shard in shards.items()}
+    files["groups.json"] = {"shards": {name: f"{name}.json" for name in shards}}
+    written = 0
+    for filename, contents in files.items():
+        written += write_if_changed(os.path.join(index_dir, filename),
+                                    json.dumps(contents, separators=(',', ':'), sort_keys=True) + "\n")
+    for old in glob.glob(os.path.join(glob.escape(index_dir), "*.json")):
+        if os.path.basename(old) not in files:
+            os.unlink(old)
+    return written
+
+def missing_nav_pages(mkdocs_path, output_dir, pages):
+    """Returns the generated pages that mkdocs.yml does not mention, if it builds output_dir."""
+    try:
+        with open(mkdocs_path, 'r') as f:
+            config = f.read()
+    except FileNotFoundError:
+        return []
+    docs_dir = re.search(r'^docs_dir:\s*(\S+)', config, re.MULTILINE)
+    docs_dir = os.path.join(os.path.dirname(mkdocs_path), docs_dir.group(1) if docs_dir else "docs")
+    if os.path.abspath(docs_dir) != os.path.abspath(output_dir):
+        return []
+    names = [os.path.basename(path) for path in pages]
+    return [name for name in names if not re.search(rf'^\s*-.*\b{re.escape(name)}\s*$', config, re.MULTILINE)]
+
+def write_if_changed(path, text):
+    """Writes text to path unless the file already holds exactly these bytes. Returns True if written."""
+    data = text.encode()
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     workspace_root = os.path.dirname(script_dir)
@@ -153,9 +305,27 @@ def main():
     output_dir = os.path.join(workspace_root, "docs")
     output_md_path = os.path.join(output_dir, "index.md")
 
+    parser = argparse.ArgumentParser(
+        description="Generate the Markdown API reference (docs/index.md and a page per API group) from the Notecard API schemas",
+        epilog="Example: python scripts/generate_docs.py --incremental"
+    )
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-render only the APIs whose schemas changed, reusing cached sections for the rest.")
+    parser.add_argument("--cache-dir", default=os.path.join(workspace_root, "build", "docs-cache"),
+                        help="Directory of cached API sections for --incremental. Defaults to build/docs-cache.")
+    parser.add_argument("--model-cache", default=schema_model.default_cache_path(workspace_root),
+                        help="Cached schema models. Defaults to build/schema-model.json.")
+    parser.add_argument("--single-page", action="store_true",
+                        help="Write every API to the one output page instead of one page per API group.")
+    parser.add_argument("-o", "--output", default=output_md_path,
+                        help="Index page to write; API group pages and the search index are written next to it. Defaults to docs/index.md.")
+    args = parser.parse_args()
+    output_md_path = args.output
+    output_dir = os.path.dirname(os.path.abspath(output_md_path))
+    start = time.perf_counter()
+
     try:
-        with open(main_schema_path, 'r') as f:
-            main_schema = json.load(f)
+        main_schema = load_json(main_schema_path)
     except FileNotFoundError:
         print(f"Error: Main schema file not found at {main_schema_path}")
         return
@@ -186,22 +356,27 @@ def main():
     all_schema_refs = sorted(req_schema_refs + rsp_schema_refs)
 
     print(f"Found {len(all_schema_refs)} schema references. Fetching...")
-    all_schemas_data = [] # Store tuples of (ref, schema_content)
+    # Store (ref, model) pairs: schemas whose cached model is current are hashed but never parsed.
+    model_cache = schema_model.shared_cache(args.model_cache)
+    built, reused = model_cache.built, model_cache.reused
+    all_schemas_data = []
     fetched_count = 0
     failed_count = 0
 
     for ref in all_schema_refs:
         # Convert URL to local path
         local_path = os.path.join(workspace_root, ref.split('/')[-1])
-        schema_content = load_schema(local_path)
-        if schema_content:
-            all_schemas_data.append((ref, schema_content))
+        model = load_model(model_cache, local_path)
+        if model:
+            all_schemas_data.append((ref, model))
             fetched_count += 1
         else:
             failed_count += 1
             print(f"Failed to fetch or parse {ref}")
 
     print(f"\nFetching complete. Successfully fetched: {fetched_count}, Failed: {failed_count}")
+    print(f"Schema models: {model_cache.built - built} built, {model_cache.reused - reused} reused")
+    model_cache.save()
 
     if not all_schemas_data:
         print("No schemas fetched, cannot generate documentation.")
@@ -209,71 +384,99 @@ def main():
 
     # Group schemas by their base API name
     grouped_schemas = {}
-    for ref, schema in all_schemas_data:
+    for ref, model in all_schemas_data:
         base_name = get_base_api_name(ref)
         schema_type = get_schema_type(ref)
         if base_name not in grouped_schemas:
             grouped_schemas[base_name] = {'request': None, 'response': None}
-        grouped_schemas[base_name][schema_type] = (ref, schema)
+        grouped_schemas[base_name][schema_type] = (ref, model)
 
     # Generate Markdown content
     print(f"Generating Markdown for {len(grouped_schemas)} API groups...")
-    markdown_output = []
     api_version = main_schema.get("apiVersion", "Unknown")
     schema_version = main_schema.get("version", "Unknown")
 
-    markdown_output.append("---")
-    markdown_output.append("layout: default")
-    markdown_output.append("title: Notecard API Reference")
-    markdown_output.append("---")
-    markdown_output.append("") # Add a blank line after front matter
-
-    # markdown_output.append("# Notecard API Reference\n")
-    markdown_output.append(f"_Generated from [notecard-schema](https://github.com/blues/notecard-schema) version {schema_version} (API Version: {api_version})_\n")
+    markdown_output = page_header("Notecard API Reference", schema_version, api_version)
     markdown_output.append("## API Reference\n")
     markdown_output.append("The Notecard accepts requests in JSON format. Each request object must contain a `req` or `cmd` field specifying the request type. E.g. `{\"req\": \"card.status\"}` or `{\"cmd\": \"card.status\"}`\n")
     markdown_output.append("!!! warning\n")
     markdown_output.append("    If you are looking for the Notecard API Reference, please visit [blues.dev](https://dev.blues.io/api-reference/notecard-api/introduction/). This site intended for LLM agents and may lack complete documentation.\n")
 
+    cache = SectionCache(args.cache_dir, renderer_fingerprint()) if args.incremental else None
+    cached_count = 0
+    rendered_count = 0
+    sections = {}
+
     # Sort API groups alphabetically
     for base_name in sorted(grouped_schemas.keys()):
-        markdown_output.append(f"### `{base_name}`")
-
-        # Add API SKU if available
-        if grouped_schemas[base_name]['request'] and 'skus' in grouped_schemas[base_name]['request'][1]:
-            sku = grouped_schemas[base_name]['request'][1]['skus']
-            markdown_output.append("#### SKUs\n")
-            for each_sku in sku:
-                markdown_output.append(f"`{each_sku}`")
-            markdown_output.append("\n")
-
-        # Add request documentation if available
-        if grouped_schemas[base_name]['request']:
-            ref, schema = grouped_schemas[base_name]['request']
-            try:
-                markdown_output.append(generate_markdown_for_schema(schema, 'request'))
-            except Exception as e:
-                print(f"Error generating markdown for request {ref}: {e}")
-
-        # Add response documentation if available
-        if grouped_schemas[base_name]['response']:
-            ref, schema = grouped_schemas[base_name]['response']
-            try:
-                markdown_output.append(generate_markdown_for_schema(schema, 'response'))
-            except Exception as e:
-                print(f"Error generating markdown for response {ref}: {e}")
+        group = grouped_schemas[base_name]
+        key = None
+        if cache:
+            key = cache.key(*(group[schema_type][1]["hash"].encode() if group[schema_type] else None
+                              for schema_type in ('request', 'response')))
+            section = cache.get(base_name, key)
+            if section is not None:
+                sections[base_name] = section
+                cached_count += 1
+                continue
+
+        section, ok = render_api(base_name, group)
+        sections[base_name] = section
+        rendered_count += 1
+        if cache and ok:
+            cache.put(base_name, key, section)
+
+    pages = {}
+    if args.single_page:
+        markdown_output.extend(sections.values())
+        pages[output_md_path] = markdown_output
+    else:
+        api_groups = {}
+        for base_name in sections:
+            api_groups.setdefault(api_group(base_name), []).append(base_name)
+        markdown_output.append("## API Groups\n")
+        for name, members in api_groups.items():
+            apis = ", ".join(f"`{base_name}`" for base_name in members)
+            markdown_output.append(f"- [`{name}.*`]({name}.md): {apis}")
+        markdown_output.append("")
+        pages[output_md_path] = markdown_output
+        for name, members in api_groups.items():
+            page = page_header(f"{name}.* Requests", schema_version, api_version)
+            page.append(f"## `{name}.*` Requests\n")
+            page.extend(sections[base_name] for base_name in members)
+            pages[os.path.join(output_dir, f"{name}.md")] = page
 
     try:
         os.makedirs(output_dir, exist_ok=True) # Create output directory if it doesn't exist
-        with open(output_md_path, 'w') as f:
-            f.write("\n".join(markdown_output))
+        written = 0
+        for path, lines in pages.items():
+            text = "\n".join(lines)
             # Ensure newline at end of file
-            if not markdown_output[-1].endswith('\n'):
-                 f.write('\n')
-
-        print(f"\nSuccessfully generated Markdown documentation at: {output_md_path}")
+            if not lines[-1].endswith('\n'):
+                text += '\n'
+            # Leave an unchanged file untouched, so that mkdocs does not rebuild it.
+            written += write_if_changed(path, text)
+        if not args.single_page:
+            shards = {name: build_search_shard(name, [(base_name, grouped_schemas[base_name]) for base_name in members])
+                      for name, members in api_groups.items()}
+            written += write_search_index(os.path.join(output_dir, SEARCH_INDEX_DIR), shards)
+
+        elapsed = time.perf_counter() - start
+        print(f"Rendered {rendered_count} APIs, reused {cached_count} cached ({elapsed * 1000:.1f} ms)")
+        if args.single_page:
+            if written:
+                print(f"\nSuccessfully generated Markdown documentation at: {output_md_path}")
+            else:
+                print(f"\nMarkdown documentation at {output_md_path} is unchanged")
+        else:
+            for page in missing_nav_pages(os.path.join(workspace_root, "mkdocs.yml"), output_dir, pages):
+                print(f"Warning: {page} is not listed in the mkdocs.yml nav")
+            if written:
+                print(f"\nSuccessfully generated Markdown documentation for {len(api_groups)} API groups in: {output_dir} ({written} files written)")
+            else:
+                print(f"\nMarkdown documentation in {output_dir} is unchanged")
     except IOError as e:
-        print(f"Error writing Markdown file to {output_md_path}: {e}")
+        print(f"Error writing Markdown documentation to {output_md_path if args.single_page else output_dir}: {e}")
 
 if __name__ == "__main__":
     main()
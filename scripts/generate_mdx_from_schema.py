@@ -1,28 +1,35 @@
 import json
 import os
+import re
+import sys
+import time
 import argparse
+import hashlib
 import html
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-def generate_mdx_content(schema_data, api_base_name, response_schema_data=None):
-    """Generates an MDX string from the JSON schema, optionally including response info."""
+import schema_model
+from schema_cache import load_json
 
-    req_cmd_value = api_base_name
-    if schema_data.get("properties"):
-        if schema_data["properties"].get("req") and schema_data["properties"]["req"].get("const"):
-            req_cmd_value = schema_data["properties"]["req"]["const"]
-        elif schema_data["properties"].get("cmd") and schema_data["properties"].get("cmd").get("const"):
-            req_cmd_value = schema_data["properties"]["cmd"]["const"]
+# Records, per API, the hash of the inputs each MDX file was rendered from
+# and of the file written, so that --all can skip unchanged APIs.
+MANIFEST_FILE = ".mdx-manifest.json"
+
+def generate_mdx_content(model, api_base_name, response_model=None):
+    """Generates an MDX string from the request schema's introspection model, optionally including response info."""
+
+    req_cmd_value = model["name"] or api_base_name
 
     title = f"## {req_cmd_value}"
-    description = schema_data.get("description", "")
+    description = model["description"] or ""
 
-    arguments_mdx_content = generate_arguments_mdx(schema_data.get("properties", {}))
-    example_requests_block = generate_examples_mdx(schema_data.get("samples", []))
+    arguments_mdx_content = generate_arguments_mdx(model["properties"], model["required"])
+    example_requests_block = generate_examples_mdx(model["samples"])
 
-    # Prepare data for response sections, ensuring defaults if response_schema_data is None or incomplete
-    effective_response_schema_data = response_schema_data if response_schema_data is not None else {}
-    response_properties = effective_response_schema_data.get("properties", {})
-    response_samples = effective_response_schema_data.get("samples", [])
+    # Prepare data for response sections, ensuring defaults if there is no response model
+    response_properties = response_model["properties"] if response_model is not None else None
+    response_samples = response_model["samples"] if response_model is not None else None
 
     # generate_response_members_mdx always returns the block
     response_members_block = generate_response_members_mdx(response_properties)
@@ -42,26 +49,24 @@ def generate_mdx_content(schema_data, api_base_name, response_schema_data=None):
 
     return "\n\n".join(filter(None, mdx_parts))
 
-def generate_arguments_mdx(properties):
-    """Generates MDX for schema properties (arguments). Content only."""
+def generate_arguments_mdx(properties, required=()):
+    """Generates MDX for model properties (arguments). Content only."""
     if not properties:
         return ""
     args_list = []
-    top_level_required = properties.get("required", [])
-    for prop_name, prop_details in properties.items():
-        if prop_name in ["req", "cmd", "required"]:
+    for prop_details in properties:
+        prop_name = prop_details["name"]
+        if prop_name in ["req", "cmd", "required"] or prop_details.get("invalid"):
             continue
         prop_type = prop_details.get("type", "N/A")
         optional_tag = "(optional)"
-        if isinstance(top_level_required, list) and prop_name in top_level_required:
+        if prop_name in required:
              optional_tag = "(required)"
-        elif isinstance(properties.get("oneOf"), list):
-            pass
         type_display = f"_{prop_type} {optional_tag}_"
         if prop_details.get("format"):
             type_display = f"_{prop_type} (format: {prop_details.get('format')}) {optional_tag}_"
         elif "const" in prop_details:
-            type_display = f"_const (value: `{prop_details["const"]}`) {optional_tag}_"
+            type_display = f"_const (value: `{prop_details['const']}`) {optional_tag}_"
         description = prop_details.get("description", "No description.")
         args_list.append(f"### `{prop_name}`\n\n{type_display}\n\n{description}")
     return "\n\n".join(args_list)
@@ -133,22 +138,19 @@ def generate_examples_mdx(samples):
     all_individual_code_tabs_blocks_mdx = []
 
     for sample_obj in samples:
-        description = sample_obj.get("description", "Example")
-        json_sample_str = sample_obj.get("json", "{}")
+        description = sample_obj["description"] if sample_obj["description"] is not None else "Example"
 
         formatted_json_block = ""
         cpp_code_lines = []
         python_code_lines = []
 
-        try:
-            parsed_json_data = json.loads(json_sample_str)
-            formatted_json_sample = json.dumps(parsed_json_data, indent=2)
-            formatted_json_block = f"```json\n{formatted_json_sample}\n```"
-            cpp_code_lines = generate_cpp_for_sample(parsed_json_data)
-            python_code_lines = generate_python_for_sample(parsed_json_data)
-        except json.JSONDecodeError:
+        if sample_obj["pretty"] is not None:
+            formatted_json_block = f"```json\n{sample_obj['pretty']}\n```"
+            cpp_code_lines = generate_cpp_for_sample(sample_obj["data"])
+            python_code_lines = generate_python_for_sample(sample_obj["data"])
+        else:
             # If JSON is invalid, still show it as a raw string in the JSON block
-            formatted_json_block = f"```json\n{json_sample_str}\n```"
+            formatted_json_block = f"```json\n{sample_obj['json']}\n```"
             # Cannot generate C++ for invalid JSON
 
         code_tabs_inner_content_parts = [formatted_json_block]
@@ -183,10 +185,13 @@ def generate_examples_mdx(samples):
 </ExampleRequests>"""
 
 def generate_response_members_mdx(properties):
-    """Generates MDX for response schema properties, always including wrapper tags."""
+    """Generates MDX for response model properties, always including wrapper tags."""
     members_list_strings = []
     if properties:
-        for prop_name, prop_details in properties.items():
+        for prop_details in properties:
+            if prop_details.get("invalid"):
+                continue
+            prop_name = prop_details["name"]
             prop_type = prop_details.get("type", "N/A")
             type_display = f"_{prop_type}_"
             if prop_details.get("format"):
@@ -207,26 +212,175 @@ def generate_example_response_mdx(samples):
     if not samples:
         return ""
 
-    content = ""
     sample = samples[0]
-    json_sample_str = sample.get("json", "{}")
-    try:
-        parsed_json = json.loads(json_sample_str)
-        formatted_json_sample = json.dumps(parsed_json, indent=2)
-        content = f"\n```json\n{formatted_json_sample}\n```\n"
-    except json.JSONDecodeError:
-        content = f"\n```json\n{json_sample_str}\n```\n"
+    if sample["pretty"] is not None:
+        content = f"\n```json\n{sample['pretty']}\n```\n"
+    else:
+        content = f"\n```json\n{sample['json']}\n```\n"
 
     return f"""<ExampleResponse>{content}</ExampleResponse>"""
 
+def discover_apis(schema_dir):
+    """Returns the API base names referenced by the `oneOf` of notecard.api.json, in order."""
+    main_schema = load_json(os.path.join(schema_dir, "notecard.api.json"))
+    names = []
+    for item in main_schema.get("oneOf", []):
+        if isinstance(item, dict) and "$ref" in item:
+            names.append(re.sub(r"\.req\.notecard\.api\.json$", "", item["$ref"].split("/")[-1]))
+    return names
+
+def renderer_fingerprint():
+    """Hashes this script and the model code, so that changing how MDX is rendered invalidates the manifest."""
+    digest = hashlib.sha256(schema_model.model_fingerprint().encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def input_hash(fingerprint, request_model, response_model):
+    """Hashes the renderer fingerprint and the schema hashes of an API's request and response models."""
+    digest = hashlib.sha256(fingerprint.encode())
+    for model in (request_model, response_model):
+        digest.update(b"-" if model is None else model["hash"].encode())
+    return digest.hexdigest()
+
+def file_hash(path):
+    """Returns the SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def load_api_models(cache, api_base_name, schema_dir):
+    """Loads the request and response models of an API from the model cache.
+
+    Returns (request model, response model, error): the response model is
+    None if its schema is missing or invalid, and on error both are None.
+    """
+    req_schema_path = os.path.join(schema_dir, f"{api_base_name}.req.notecard.api.json")
+    rsp_schema_path = os.path.join(schema_dir, f"{api_base_name}.rsp.notecard.api.json")
+    try:
+        request_model = cache.model(req_schema_path)
+    except FileNotFoundError:
+        return None, None, f"request schema not found at {req_schema_path}"
+    except json.JSONDecodeError:
+        return None, None, f"could not parse JSON from {req_schema_path}"
+    try:
+        response_model = cache.model(rsp_schema_path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        response_model = None
+    return request_model, response_model, None
+
+def render_mdx_file(api_base_name, request_model, response_model, output_dir):
+    """Renders the MDX file of one API from its models, writing it only if its content changed.
+
+    Returns (api_base_name, status, seconds, output hash), where status is
+    'written', 'unchanged', or an error message (with no output hash).
+    """
+    start = time.perf_counter()
+    try:
+        data = (generate_mdx_content(request_model, api_base_name, response_model).strip() + "\n").encode()
+    except Exception as e:
+        return api_base_name, f"render failed: {e}", time.perf_counter() - start, None
+    digest = hashlib.sha256(data).hexdigest()
+    output_mdx_path = os.path.join(output_dir, f"{api_base_name}.mdx")
+    if file_hash(output_mdx_path) == digest:
+        return api_base_name, "unchanged", time.perf_counter() - start, digest
+    with open(output_mdx_path, "wb") as f:
+        f.write(data)
+    return api_base_name, "written", time.perf_counter() - start, digest
+
+def generate_all(schema_dir, output_dir, workers=None, model_cache=None):
+    """Renders the MDX file of every API, across a process pool.
+
+    The models of every API are loaded once, in this process, from the model
+    cache (model_cache, or build/schema-model.json in schema_dir), and handed
+    to the workers. APIs whose schemas, renderer and existing output all
+    match the manifest are skipped without rendering. Returns
+    (api_base_name, status, seconds) per API, in notecard.api.json order.
+    """
+    apis = discover_apis(schema_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    try:
+        manifest = load_json(manifest_path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+
+    cache = schema_model.shared_cache(model_cache or schema_model.default_cache_path(schema_dir))
+    fingerprint = renderer_fingerprint()
+    models = {}
+    inputs = {}
+    results = {}
+    skipped = []
+    pending = []
+    for api in apis:
+        request_model, response_model, error = load_api_models(cache, api, schema_dir)
+        if error:
+            results[api] = (api, error, 0.0)
+            continue
+        models[api] = (request_model, response_model)
+        inputs[api] = input_hash(fingerprint, request_model, response_model)
+        entry = manifest.get(api)
+        if (isinstance(entry, dict) and entry.get("inputs") == inputs[api]
+                and entry.get("output") == file_hash(os.path.join(output_dir, f"{api}.mdx"))):
+            results[api] = (api, "skipped", 0.0)
+            skipped.append(api)
+        else:
+            pending.append(api)
+    cache.save()
+
+    workers = min(workers or os.cpu_count() or 1, len(pending) or 1)
+    request_models = [models[api][0] for api in pending]
+    response_models = [models[api][1] for api in pending]
+    if workers == 1:
+        rendered = list(map(render_mdx_file, pending, request_models, response_models, repeat(output_dir)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(render_mdx_file, pending, request_models, response_models, repeat(output_dir),
+                                     chunksize=max(1, len(pending) // (workers * 4))))
+
+    updated = {api: manifest[api] for api in skipped}
+    for api, status, seconds, digest in rendered:
+        results[api] = (api, status, seconds)
+        if digest is not None:
+            updated[api] = {"inputs": inputs[api], "output": digest}
+    if updated != manifest:
+        temporary = manifest_path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(updated, f, indent=4, sort_keys=True)
+        os.replace(temporary, manifest_path)
+    return [results[api] for api in apis]
+
 def main():
     parser = argparse.ArgumentParser(description="Generate an MDX file from a Notecard API base name (e.g., card.contact).")
-    parser.add_argument("api_base_name", help="Base name of the Notecard API (e.g., card.contact, hub.set).")
+    parser.add_argument("api_base_name", nargs="?", help="Base name of the Notecard API (e.g., card.contact, hub.set).")
     parser.add_argument("--schema_dir", default=".", help="Directory where schema files are located. Defaults to current directory.")
     parser.add_argument("-o", "--output_dir", default="./.docs", help="Directory to save the generated MDX file. Defaults to './docs/'.")
 
+    parser.add_argument("--all", action="store_true", help="Generate the MDX file of every API in notecard.api.json, skipping unchanged ones.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --all; 1 renders in-process. Defaults to the CPU count.")
+    parser.add_argument("--model-cache", default=None, help="Cached schema models. Defaults to build/schema-model.json in the schema directory.")
+
     args = parser.parse_args()
 
+    if args.all == bool(args.api_base_name):
+        parser.error("give either an API base name or --all")
+
+    if args.all:
+        start = time.perf_counter()
+        results = generate_all(args.schema_dir, args.output_dir, args.workers, args.model_cache)
+        counts = {}
+        for api, status, seconds in results:
+            outcome = status if status in ("written", "unchanged", "skipped") else "failed"
+            counts[outcome] = counts.get(outcome, 0) + 1
+            print(f"  {api:<28} {status:<10} {seconds * 1000:7.1f} ms")
+        summary = ", ".join(f"{counts.get(outcome, 0)} {outcome}" for outcome in ("written", "unchanged", "skipped", "failed"))
+        print(f"MDX for {len(results)} APIs in {args.output_dir}: {summary} ({time.perf_counter() - start:.2f}s)")
+        if counts.get("failed"):
+            sys.exit(1)
+        return
+
     api_base_name = args.api_base_name
     schema_dir = args.schema_dir
     output_dir = args.output_dir
@@ -241,20 +395,19 @@ def main():
         print(f"Error: Request schema file not found at {req_schema_path}")
         return
 
-    schema_data = None
-    response_schema_data = None
+    cache = schema_model.shared_cache(args.model_cache or schema_model.default_cache_path(schema_dir))
+    request_model = None
+    response_model = None
 
     try:
-        with open(req_schema_path, "r") as f:
-            schema_data = json.load(f)
+        request_model = cache.model(req_schema_path)
     except json.JSONDecodeError:
         print(f"Error: Could not parse JSON from request schema {req_schema_path}")
         return
 
     if os.path.isfile(rsp_schema_path):
         try:
-            with open(rsp_schema_path, "r") as f:
-                response_schema_data = json.load(f)
+            response_model = cache.model(rsp_schema_path)
         except json.JSONDecodeError:
             print(f"Warning: Could not parse JSON from response schema {rsp_schema_path}. Response sections might be empty or based on defaults.")
     else:
@@ -265,7 +418,9 @@ def main():
 
     os.makedirs(os.path.dirname(output_mdx_path), exist_ok=True)
 
-    mdx_output = generate_mdx_content(schema_data, api_base_name, response_schema_data)
+    cache.save()
+
+    mdx_output = generate_mdx_content(request_model, api_base_name, response_model)
 
     with open(output_mdx_path, "w") as f:
         f.write(mdx_output.strip())
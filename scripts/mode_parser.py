@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Token parser for comma-separated Notecard `mode` strings.
+
+Schemas such as card.attn.req describe `mode` as a comma-separated list of
+known tokens, and express "mode contains <token>" conditions as one regex
+per token per `if`/`then`/`else` branch. This module reads both from the
+schema once: the token set becomes a bit per token, a mode string is
+tokenized once into a bitmask, and each conditional rule is checked against
+that bitmask.
+
+Rules match whole tokens. The schema regexes match substrings, so they also
+treat `-files` as containing `files`, and they miss `files` when trailing
+whitespace follows it. The parser does not reproduce either quirk.
+
+Usage: python scripts/mode_parser.py API MODE
+Example: python scripts/mode_parser.py card.attn "arm, files, -usb"
+"""
+
+import re
+import sys
+import json
+import argparse
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from notecard_validator import SCHEMA_SUFFIX, api_name_from_filename, load_schema_files
+
+
+MODE_PROPERTY = "mode"
+
+_LIST_PATTERN = re.compile(r"\^\(\?:([^()]+)\)\(\?:,\\s\*\(\?:\1\)\)\*\\s\*\$")
+_TOKEN = re.compile(r"[\w.-]+")
+
+
+class ModeError(ValueError):
+    """Raised when a mode string contains a token the API does not know."""
+
+
+def list_tokens(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Return the tokens of a `^(?:a|b)(?:,\\s*(?:a|b))*\\s*$` list pattern, or None."""
+    match = _LIST_PATTERN.fullmatch(pattern)
+    if not match:
+        return None
+    tokens = tuple(match.group(1).split("|"))
+    if not all(_TOKEN.fullmatch(token) for token in tokens):
+        return None
+    return tokens
+
+
+def contains_pattern(token: str) -> str:
+    """Return the regex the schemas use for "mode contains token"."""
+    return f"(^{token}$|^{token},|,*\\s*{token}\\s*,|,*\\s*{token}$)"
+
+
+class Requirement:
+    """What a `then`/`else` branch demands of the instance."""
+
+    def __init__(self, required: Iterable[str] = (), forbidden: Iterable[str] = (),
+                 minimum: Optional[Dict[str, float]] = None):
+        self.required = tuple(required)
+        self.forbidden = tuple(forbidden)
+        self.minimum = dict(minimum or {})
+
+    @classmethod
+    def from_schema(cls, schema: Dict[str, Any]) -> "Requirement":
+        """Build a requirement from a branch of `required`, `not: {required}` and `minimum` keywords."""
+        unsupported = set(schema) - {"required", "properties", "not"}
+        if unsupported:
+            raise ValueError(f"unsupported keywords in mode rule: {sorted(unsupported)}")
+        minimum = {}
+        for name, details in schema.get("properties", {}).items():
+            if set(details) != {"minimum"}:
+                raise ValueError(f"unsupported constraint on '{name}' in mode rule: {details}")
+            minimum[name] = details["minimum"]
+        forbidden = ()
+        if "not" in schema:
+            if set(schema["not"]) != {"required"}:
+                raise ValueError(f"unsupported 'not' in mode rule: {schema['not']}")
+            forbidden = schema["not"]["required"]
+        return cls(schema.get("required", ()), forbidden, minimum)
+
+    def check(self, instance: Dict[str, Any], mode: str) -> Optional[str]:
+        """Return an error message if the instance does not meet the requirement."""
+        for name in self.required:
+            if name not in instance:
+                return f"'{name}' is a required property"
+        for name in self.forbidden:
+            if name in instance:
+                return f"'{name}' is not allowed when mode is {mode!r}"
+        for name, minimum in self.minimum.items():
+            value = instance.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value < minimum:
+                return f"{value} is less than the minimum of {minimum}"
+        return None
+
+
+class ModeRule:
+    """An if/else-if/else chain over "mode contains token" conditions."""
+
+    def __init__(self, clauses: List[Tuple[int, Requirement]], default: Requirement):
+        self.clauses = clauses
+        self.default = default
+
+    def requirement(self, mask: int) -> Requirement:
+        """Return the requirement of the first clause whose token is in mask."""
+        for bit, requirement in self.clauses:
+            if mask & bit:
+                return requirement
+        return self.default
+
+
+class ModeSpec:
+    """The known tokens and conditional rules of one API's `mode` property."""
+
+    def __init__(self, api: str, tokens: Iterable[str], rules: Iterable[ModeRule] = (),
+                 property: str = MODE_PROPERTY):
+        self.api = api
+        self.property = property
+        self.tokens = tuple(tokens)
+        self.bits = {token: 1 << index for index, token in enumerate(self.tokens)}
+        self.rules = list(rules)
+
+    @classmethod
+    def from_schema(cls, schema: Dict[str, Any], api: str, property: str = MODE_PROPERTY) -> Optional["ModeSpec"]:
+        """Build the spec for a request schema, or return None if its mode is not a token list.
+
+        Raises ValueError for an `allOf` conditional on the mode that is not
+        a chain of "mode contains token" tests.
+        """
+        details = schema.get("properties", {}).get(property, {})
+        tokens = list_tokens(details.get("pattern", ""))
+        if tokens is None:
+            return None
+        spec = cls(api, tokens, property=property)
+        conditions = {contains_pattern(token): token for token in tokens}
+        for entry in schema.get("allOf", []):
+            if property in entry.get("if", {}).get("properties", {}):
+                spec.rules.append(spec._rule(entry, conditions))
+        return spec
+
+    def _rule(self, entry: Dict[str, Any], conditions: Dict[str, str]) -> ModeRule:
+        clauses = []
+        while "if" in entry:
+            test = entry["if"].get("properties", {}).get(self.property, {})
+            token = conditions.get(test.get("pattern"))
+            if token is None or set(entry["if"]) - {"properties", "required"}:
+                raise ValueError(f"{self.api}: unsupported condition on '{self.property}': {entry['if']}")
+            clauses.append((self.bits[token], Requirement.from_schema(entry.get("then", {}))))
+            entry = entry.get("else", {})
+        return ModeRule(clauses, Requirement.from_schema(entry))
+
+    def mask(self, *tokens: str) -> int:
+        """Return the bitmask of the given tokens."""
+        mask = 0
+        for token in tokens:
+            if token not in self.bits:
+                raise ModeError(f"{self.api}: unknown {self.property} '{token}'")
+            mask |= self.bits[token]
+        return mask
+
+    def parse(self, value: str) -> int:
+        """Tokenize a comma-separated mode into a bitmask.
+
+        Accepts exactly what the schema's list pattern accepts: whitespace
+        may follow each comma and the last token, nothing else.
+        """
+        parts = value.split(",")
+        last = len(parts) - 1
+        mask = 0
+        for index, part in enumerate(parts):
+            if index:
+                part = part.lstrip()
+            if index == last:
+                part = part.rstrip()
+            bit = self.bits.get(part)
+            if bit is None:
+                raise ModeError(f"{self.api}: unknown {self.property} {part!r} in {value!r}")
+            mask |= bit
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Return the tokens set in mask, in schema order."""
+        return [token for token, bit in self.bits.items() if mask & bit]
+
+    def check(self, instance: Dict[str, Any]) -> Optional[str]:
+        """Return an error message for the mode and its conditional rules, or None if they hold."""
+        value = instance.get(self.property)
+        if value is None and self.property not in instance:
+            mask, mode = 0, ""
+        elif not isinstance(value, str):
+            return f"{value!r} is not of type 'string'"
+        else:
+            try:
+                mask, mode = self.parse(value), value
+            except ModeError as e:
+                return str(e)
+        for rule in self.rules:
+            error = rule.requirement(mask).check(instance, mode)
+            if error is not None:
+                return error
+        return None
+
+    def is_valid(self, instance: Dict[str, Any]) -> bool:
+        """Return True if the mode and its conditional rules hold."""
+        return self.check(instance) is None
+
+
+def mode_specs(schemas: Dict[str, Dict[str, Any]]) -> Dict[str, ModeSpec]:
+    """Return a ModeSpec for every request schema whose mode is a token list, keyed by API name."""
+    specs = {}
+    for filename, schema in schemas.items():
+        if filename.endswith(f".req{SCHEMA_SUFFIX}"):
+            api = api_name_from_filename(filename)
+            spec = ModeSpec.from_schema(schema, api)
+            if spec is not None:
+                specs[api] = spec
+    return specs
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Tokenize a Notecard mode string and list its tokens",
+        epilog="Example: python scripts/mode_parser.py card.attn \"arm, files\""
+    )
+    parser.add_argument("api", help="API name (e.g. 'card.attn').")
+    parser.add_argument("mode", help="Comma-separated mode string.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    specs = mode_specs(load_schema_files(args.schema_dir))
+    if args.api not in specs:
+        print(f"Error: '{args.api}' has no comma-separated mode (known: {', '.join(sorted(specs))})")
+        sys.exit(2)
+    try:
+        mask = specs[args.api].parse(args.mode)
+    except ModeError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print(json.dumps({"mask": mask, "tokens": specs[args.api].names(mask)}))
+
+
+if __name__ == "__main__":
+    main()
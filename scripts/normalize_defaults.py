@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Default-filling normalizer for storing Notecard traffic.
+
+The inverse of scripts/canonicalize.py: every per-request parameter a
+request omits is filled in with the `default` its `.req` schema declares, so
+stored messages are explicit and queries need no per-API default logic. The
+same properties are filled as the canonicalizer strips (its
+PER_REQUEST_DEFAULTS), so canonicalizing a normalized message gives back its
+canonical form. Fields of APIs that persist settings are never filled: a
+logged `{"req":"card.power"}` is a query, and filling `minutes` would record
+it as a set request. Responses are never filled: response schemas declare
+no defaults, and a response field the Notecard left out is not known to
+hold one.
+
+Each API's defaults are read once into a table of (name, value) pairs. The
+input is streamed in chunks of lines, normalized in-process or across a
+process pool, and written out in order, one compact JSON object per line.
+Lines are interpreted according to --mode, as in scripts/validate_jsonl.py:
+  requests   each line is a request, named by its `req` or `cmd`
+  pairs      each line is {"request": {...}, "response": {...}}; the
+             response is written unchanged
+
+Lines that are not JSON objects, or name no known API, are written
+unchanged and counted.
+
+Usage: python scripts/normalize_defaults.py [options] <input.jsonl>
+Example: python scripts/normalize_defaults.py traffic.jsonl -o normalized.jsonl --workers 8
+"""
+
+import os
+import sys
+import json
+import copy
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from notecard_validator import api_name_from_filename, load_schema_files
+from canonicalize import strippable_defaults
+from validate_jsonl import iter_chunks
+
+
+COMPACT = (",", ":")
+
+# The validate_jsonl.py modes that carry a request to fill.
+MODES = ("requests", "pairs")
+
+# Bound once; json.loads/dumps rebuild their arguments on every call.
+_decode = json.JSONDecoder().decode
+_encode = json.JSONEncoder(separators=COMPACT).encode
+
+# Per-process default tables, built once by _init_worker().
+_tables = None
+
+
+class DefaultTables:
+    """Per-API tables of the defaults to fill into requests."""
+
+    def __init__(self, schema_dir: Optional[str] = None):
+        self.requests: Dict[str, Tuple[Tuple[str, Any, bool], ...]] = {}
+        for filename, schema in load_schema_files(schema_dir).items():
+            if ".req." not in filename:
+                continue
+            # Mutable defaults are copied into each message that receives them.
+            self.requests[api_name_from_filename(filename)] = tuple(
+                (name, default, isinstance(default, (dict, list)))
+                for name, default in strippable_defaults(schema).items())
+
+    def fill_request(self, request: Dict[str, Any]) -> bool:
+        """Fill a request's omitted defaults in place, returning False for an unknown API."""
+        api = request.get("req", request.get("cmd"))
+        table = self.requests.get(api) if isinstance(api, str) else None
+        if table is None:
+            return False
+        _fill(request, table)
+        return True
+
+
+def _fill(instance: Dict[str, Any], table) -> None:
+    for name, default, mutable in table:
+        if name not in instance:
+            instance[name] = copy.deepcopy(default) if mutable else default
+
+
+def _init_worker(schema_dir: Optional[str]) -> None:
+    global _tables
+    _tables = DefaultTables(schema_dir)
+
+
+def _normalize(tables: DefaultTables, instance: Any, mode: str) -> bool:
+    if not isinstance(instance, dict):
+        return False
+    if mode == "requests":
+        return tables.fill_request(instance)
+    request, response = instance.get("request"), instance.get("response")
+    return isinstance(request, dict) and isinstance(response, dict) and tables.fill_request(request)
+
+
+def normalize_chunk(lines: List[bytes], mode: str = "requests",
+                    tables: Optional[DefaultTables] = None) -> Tuple[bytes, int, int]:
+    """Normalize a chunk of raw lines.
+
+    Returns the normalized text and the counts of normalized and passed-through lines.
+    """
+    tables = tables or _tables
+    out = []
+    normalized = passed = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            instance = _decode(line.decode())
+        except ValueError:
+            instance = None
+        if instance is not None and _normalize(tables, instance, mode):
+            normalized += 1
+            out.append(_encode(instance).encode())
+        else:
+            passed += 1
+            out.append(line.rstrip(b"\r\n"))
+    return b"\n".join(out) + b"\n" if out else b"", normalized, passed
+
+
+def normalize_file(path: str, output_path: Optional[str] = None, mode: str = "requests",
+                   workers: Optional[int] = None, chunk_lines: int = 5000,
+                   schema_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Normalize a JSONL file and return a summary.
+
+    With workers=1 normalizing runs in-process; otherwise chunks are spread
+    over a process pool with at most 2 * workers chunks in flight.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}'; only requests are filled, so use one of {', '.join(MODES)}")
+    workers = workers or os.cpu_count() or 1
+
+    totals = [0, 0]
+    lines = 0
+    out = open(output_path, "wb") if output_path else sys.stdout.buffer
+    start = time.perf_counter()
+    try:
+        def consume(result: Tuple[bytes, int, int]) -> None:
+            text, normalized, passed = result
+            out.write(text)
+            totals[0] += normalized
+            totals[1] += passed
+
+        if workers == 1:
+            local = DefaultTables(schema_dir)
+            for first, chunk in iter_chunks(path, chunk_lines):
+                lines += len(chunk)
+                consume(normalize_chunk(chunk, mode, local))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(schema_dir,)) as pool:
+                pending = deque()
+                for first, chunk in iter_chunks(path, chunk_lines):
+                    lines += len(chunk)
+                    pending.append(pool.submit(normalize_chunk, chunk, mode))
+                    while len(pending) >= 2 * workers:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "lines": lines,
+        "normalized": totals[0],
+        "passed_through": totals[1],
+        "seconds": round(elapsed, 3),
+        "lines_per_second": round(lines / elapsed) if elapsed > 0 else None,
+    }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Fill per-request schema defaults into a JSONL file of Notecard requests",
+        epilog="Example: python scripts/normalize_defaults.py traffic.jsonl -o normalized.jsonl --workers 8"
+    )
+    parser.add_argument("input", help="JSONL file to normalize ('-' for stdin).")
+    parser.add_argument("-o", "--output", help="Write the normalized lines to this file. Defaults to stdout.")
+    parser.add_argument("--mode", choices=MODES, default="requests", help="How to interpret each line. Defaults to 'requests'.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes; 1 runs in-process. Defaults to 1.")
+    parser.add_argument("--chunk-lines", type=int, default=5000, help="Lines per chunk handed to a worker. Defaults to 5000.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    try:
+        summary = normalize_file(args.input, args.output, args.mode, args.workers,
+                                 args.chunk_lines, args.schema_dir)
+    except (ValueError, IOError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(summary, indent=4), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
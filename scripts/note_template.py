@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Fixed-length records for Notes described by a note.template body.
+
+A note.template `body` gives each field a type hint instead of a value, and
+the Notecard then stores and sends each Note as a fixed-length binary record
+rather than JSON. The hints follow the Notecard conventions:
+
+    true                 boolean, 1 byte
+    11, 12, 13, 14, 18   signed integer of 1, 2, 3, 4 or 8 bytes
+    21, 22, 23, 24       unsigned integer of 1, 2, 3 or 4 bytes
+    12.1, 14.1, 18.1     float of 2, 4 or 8 bytes
+    "42"                 string of up to 42 bytes (a numeric string)
+    "text"               string of up to len("text") bytes (older firmware)
+    {...}                nested object, laid out field by field
+
+A template is compiled once into a little-endian struct.Struct and a
+generated pack/unpack function pair, so records can be packed and unpacked
+in batches for millions of Notes. Missing fields pack as zero, false or the
+empty string, like the Notecard; fields the template does not define are an
+error.
+
+Usage: python scripts/note_template.py TEMPLATE [--notes N]
+Example: python scripts/note_template.py '{"temp": 14.1, "humid": 12.1, "alert": true, "site": "16"}' --notes 1000000
+"""
+
+import sys
+import json
+import time
+import random
+import struct
+import argparse
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# Struct codes for integer and float hints; 3-byte integers have no code and
+# are packed as 3 raw bytes.
+INTEGER_HINTS = {11: "b", 12: "h", 13: "3s", 14: "i", 18: "q", 21: "B", 22: "H", 23: "3s", 24: "I"}
+FLOAT_HINTS = {12.1: "e", 14.1: "f", 18.1: "d"}
+
+Field = namedtuple("Field", "path kind code size")
+
+
+class TemplateError(ValueError):
+    """Raised for an unsupported type hint, or a body that does not fit the template."""
+
+
+def _string_size(hint: str) -> int:
+    return int(hint) if hint.isdigit() else len(hint.encode())
+
+
+def parse_template(body: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> List[Field]:
+    """Return the fields of a template body, in record order."""
+    fields = []
+    for name, hint in body.items():
+        path = prefix + (name,)
+        if isinstance(hint, bool):
+            fields.append(Field(path, "bool", "?", 1))
+        elif isinstance(hint, int) and hint in INTEGER_HINTS:
+            code = INTEGER_HINTS[hint]
+            fields.append(Field(path, "int" if hint < 20 else "uint", code, struct.calcsize(code)))
+        elif isinstance(hint, float) and hint in FLOAT_HINTS:
+            code = FLOAT_HINTS[hint]
+            fields.append(Field(path, "float", code, struct.calcsize(code)))
+        elif isinstance(hint, str):
+            size = _string_size(hint)
+            if size <= 0:
+                raise TemplateError(f"'{'.'.join(path)}': a string field needs a length")
+            fields.append(Field(path, "string", f"{size}s", size))
+        elif isinstance(hint, dict):
+            fields += parse_template(hint, path)
+        else:
+            raise TemplateError(f"'{'.'.join(path)}': unsupported type hint {hint!r}")
+    return fields
+
+
+def _pack_string(value: Any, size: int, name: str) -> bytes:
+    if not isinstance(value, str):
+        raise TemplateError(f"'{name}': {value!r} is not a string")
+    encoded = value.encode()
+    if len(encoded) > size:
+        raise TemplateError(f"'{name}': {len(encoded)} bytes exceeds the {size}-byte field")
+    return encoded
+
+
+def _pack_int24(value: Any, signed: bool, name: str) -> bytes:
+    try:
+        return value.to_bytes(3, "little", signed=signed)
+    except (AttributeError, OverflowError):
+        raise TemplateError(f"'{name}': {value!r} does not fit a 3-byte integer")
+
+
+def _extra_fields(body: Dict[str, Any], keys: frozenset, label: str) -> TemplateError:
+    return TemplateError(f"'{label}': fields not in the template: {sorted(body.keys() - keys)}")
+
+
+def _unpack_int24(raw: bytes, signed: bool) -> int:
+    return int.from_bytes(raw, "little", signed=signed)
+
+
+def _unpack_string(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode()
+
+
+class NoteTemplate:
+    """A compiled note.template body: record layout plus pack and unpack functions."""
+
+    def __init__(self, body: Dict[str, Any]):
+        self.body = body
+        self.fields = parse_template(body)
+        self.struct = struct.Struct("<" + "".join(field.code for field in self.fields))
+        self.size = self.struct.size
+        self._pack, self._build = self._compile()
+
+    @classmethod
+    def from_request(cls, request: Dict[str, Any]) -> "NoteTemplate":
+        """Compile the body of a note.template request."""
+        if not isinstance(request.get("body"), dict):
+            raise TemplateError("note.template request has no body")
+        return cls(request["body"])
+
+    def _compile(self):
+        namespace = {
+            "_pack": self.struct.pack, "_string": _pack_string, "_int24": _pack_int24,
+            "_unint24": _unpack_int24, "_unstring": _unpack_string, "_EMPTY": {},
+            "_extra": _extra_fields,
+        }
+        lines = ["def pack(body):"]
+        objects = {(): "body"}
+        checks = []
+
+        def object_name(path):
+            if path not in objects:
+                parent = object_name(path[:-1])
+                objects[path] = f"o{len(objects)}"
+                lines.append(f"    {objects[path]} = {parent}.get({path[-1]!r}) or _EMPTY")
+            return objects[path]
+
+        def keys(template, path):
+            name = f"_KEYS{len(checks)}"
+            namespace[name] = frozenset(template)
+            checks.append((path, name))
+            for key, hint in template.items():
+                if isinstance(hint, dict):
+                    keys(hint, path + (key,))
+
+        keys(self.body, ())
+        arguments = []
+        for field in self.fields:
+            source = object_name(field.path[:-1])
+            name = ".".join(field.path)
+            if field.kind == "string":
+                arguments.append(f"_string({source}.get({field.path[-1]!r}, ''), {field.size}, {name!r})")
+            elif field.code == "3s":
+                arguments.append(f"_int24({source}.get({field.path[-1]!r}, 0), {field.kind == 'int'}, {name!r})")
+            else:
+                arguments.append(f"{source}.get({field.path[-1]!r}, {False if field.kind == 'bool' else 0})")
+        for path, name in checks:
+            source = object_name(path)
+            lines.append(f"    if not {source}.keys() <= {name}:")
+            lines.append(f"        raise _extra({source}, {name}, {'.'.join(path) or 'body'!r})")
+        lines.append(f"    return _pack({', '.join(arguments)})")
+
+        values = [f"v{index}" for index in range(len(self.fields))]
+        lines.append(f"def build({', '.join(values)}):")
+        lines.append(f"    return {self._literal(self.body, (), iter(zip(values, self.fields)))}")
+        exec(compile("\n".join(lines), "<note.template>", "exec"), namespace)
+        return namespace["pack"], namespace["build"]
+
+    def _literal(self, template: Dict[str, Any], path: Tuple[str, ...], values) -> str:
+        items = []
+        for name, hint in template.items():
+            if isinstance(hint, dict):
+                items.append(f"{name!r}: {self._literal(hint, path + (name,), values)}")
+                continue
+            value, field = next(values)
+            if field.kind == "string":
+                value = f"_unstring({value})"
+            elif field.code == "3s":
+                value = f"_unint24({value}, {field.kind == 'int'})"
+            items.append(f"{name!r}: {value}")
+        return "{" + ", ".join(items) + "}"
+
+    def pack(self, body: Dict[str, Any]) -> bytes:
+        """Pack a Note body into one record."""
+        try:
+            return self._pack(body)
+        except (struct.error, OverflowError, TypeError, AttributeError) as e:
+            raise TemplateError(f"body does not fit the template: {e}")
+
+    def unpack(self, record) -> Dict[str, Any]:
+        """Unpack one record into a Note body."""
+        return self._build(*self.struct.unpack(record))
+
+    def pack_many(self, bodies: Iterable[Dict[str, Any]]) -> bytes:
+        """Pack Note bodies into consecutive records."""
+        try:
+            return b"".join(map(self._pack, bodies))
+        except (struct.error, OverflowError, TypeError, AttributeError) as e:
+            raise TemplateError(f"body does not fit the template: {e}")
+
+    def unpack_many(self, records) -> List[Dict[str, Any]]:
+        """Unpack consecutive records into Note bodies."""
+        if len(records) % self.size:
+            raise TemplateError(f"{len(records)} bytes is not a whole number of {self.size}-byte records")
+        build = self._build
+        return [build(*values) for values in self.struct.iter_unpack(records)]
+
+
+def sample_body(template: NoteTemplate, rng: random.Random) -> Dict[str, Any]:
+    """Return a random Note body that fits the template."""
+    body: Dict[str, Any] = {}
+    for field in template.fields:
+        target = body
+        for name in field.path[:-1]:
+            target = target.setdefault(name, {})
+        if field.kind == "bool":
+            value = rng.random() < 0.5
+        elif field.kind == "float":
+            value = round(rng.uniform(-1000, 1000), 2)
+        elif field.kind == "string":
+            value = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(0, field.size)))
+        else:
+            bits = field.size * 8 - (field.kind == "int")
+            low = -(1 << bits) if field.kind == "int" else 0
+            value = rng.randint(low, (1 << bits) - 1)
+        target[field.path[-1]] = value
+    return body
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Compute the record size of a note.template body and benchmark packing Notes with it",
+        epilog="Example: python scripts/note_template.py '{\"temp\": 14.1, \"alert\": true, \"site\": \"16\"}' --notes 1000000"
+    )
+    parser.add_argument("template", help="Template body, or note.template request, as JSON text or a JSON file.")
+    parser.add_argument("--notes", type=int, default=100000, help="Notes to pack and unpack. Defaults to 100000.")
+
+    args = parser.parse_args()
+
+    try:
+        text = args.template
+        if not text.lstrip().startswith("{"):
+            with open(text, 'r') as f:
+                text = f.read()
+        template = json.loads(text)
+        template = NoteTemplate.from_request(template) if "req" in template or "cmd" in template else NoteTemplate(template)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    rng = random.Random(0)
+    bodies = [sample_body(template, rng) for _ in range(args.notes)]
+    json_size = sum(len(json.dumps(body, separators=(",", ":"))) for body in bodies) / len(bodies)
+
+    start = time.perf_counter()
+    records = template.pack_many(bodies)
+    packed = time.perf_counter() - start
+    start = time.perf_counter()
+    unpacked = template.unpack_many(records)
+    elapsed = time.perf_counter() - start
+    assert len(unpacked) == args.notes
+
+    print(f"✓ {template.size}-byte records ({len(template.fields)} fields), "
+          f"{json_size:.1f} bytes as compact JSON ({template.size / json_size:.0%})")
+    print(f"  {args.notes:,} notes: {len(records):,} bytes")
+    print(f"  pack      {args.notes / packed:12,.0f} notes/s")
+    print(f"  unpack    {args.notes / elapsed:12,.0f} notes/s")
+
+
+if __name__ == "__main__":
+    main()
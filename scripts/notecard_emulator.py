@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Local Notecard emulator speaking the newline-delimited JSON protocol.
+
+Each request line is validated against its `.req` schema. A `req` is
+answered with one `\\r\\n`-terminated JSON line: a response synthesized from
+the API's `.rsp` schema (its first sample, or the schema's properties when it
+has none), or `{"err": "..."}` when the request is invalid. A `cmd` is
+processed the same way but never answered. Responses are built and encoded
+once at startup, so the emulator sustains thousands of transactions per
+second without hardware.
+
+Requests on one connection are processed strictly in order, each after its
+API's configured latency, like a single Notecard; a host can pipeline
+requests and measure how much that hides the latency.
+
+The emulator listens on a Unix socket, a TCP port, or a pseudo-terminal that
+host code can open like the Notecard's serial port.
+
+Usage: python scripts/notecard_emulator.py (--pty [LINK] | --socket PATH | --tcp HOST:PORT) [options]
+Example: python scripts/notecard_emulator.py --pty /tmp/notecard --latency 0.005 --api-latency hub.sync=0.25
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from typing import Any, Callable, Dict, Optional
+
+import jsonschema
+
+from notecard_validator import api_name_from_filename, load_schema_files
+from validate_jsonl import ENGINES, create_engine
+
+
+COMPACT = (",", ":")
+TERMINATOR = b"\r\n"
+
+# Placeholder values for properties of each JSON type, used when a response
+# schema has no samples.
+TYPE_VALUES = {"string": "", "integer": 0, "number": 0, "boolean": False, "null": None}
+
+
+def synthesize_value(schema: Dict[str, Any]) -> Any:
+    """Return a simple value satisfying a property schema's const, enum, default or type."""
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    types_ = schema.get("type")
+    type_ = types_[0] if isinstance(types_, list) else types_
+    if type_ in ("integer", "number") and isinstance(schema.get("minimum"), (int, float)):
+        return schema["minimum"]
+    if type_ == "array":
+        return [synthesize_value(schema.get("items", {}))] * schema.get("minItems", 0)
+    if type_ == "object":
+        return synthesize_response(schema)
+    return TYPE_VALUES.get(type_)
+
+
+def synthesize_response(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a response for a `.rsp` schema: its first sample, else one value per property.
+
+    The `err` property is left out, since its presence signals failure.
+    """
+    for sample in schema.get("samples", []):
+        if "json" in sample:
+            return json.loads(sample["json"])
+    return {name: synthesize_value(details) for name, details in schema.get("properties", {}).items()
+            if name != "err" and isinstance(details, dict)}
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as one compact protocol line."""
+    return json.dumps(message, separators=COMPACT).encode() + TERMINATOR
+
+
+# Stands in for a request line that is not valid JSON.
+_UNPARSEABLE = object()
+
+
+def _parse(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return _UNPARSEABLE
+
+
+class NotecardEmulator:
+    """Answers Notecard requests with schema-conformant responses."""
+
+    def __init__(self, engine: str = "compiled", schema_dir: Optional[str] = None, latency: float = 0.0,
+                 api_latency: Optional[Dict[str, float]] = None, responses: Optional[Dict[str, Any]] = None,
+                 max_line: int = 1 << 20):
+        self.engine = create_engine(engine, schema_dir)
+        self.latency = latency
+        self.api_latency = dict(api_latency or {})
+        self.max_line = max_line
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        self._servers = []
+        self._connections = {}
+        self._pty_transports = []
+        self._pty_fds = []
+        self.transactions = 0
+        self.commands = 0
+        self.errors = 0
+        self._started = time.monotonic()
+
+        # Encoded responses, built and checked against their schemas once.
+        self._responses: Dict[str, bytes] = {}
+        responses = responses or {}
+        for filename, schema in load_schema_files(schema_dir).items():
+            if ".rsp." not in filename:
+                continue
+            api = api_name_from_filename(filename)
+            if api in responses:
+                response = responses[api]
+                error = self.engine.check_response(api, response)
+                if error is not None:
+                    raise ValueError(f"{api}: response does not match its schema: {error}")
+            else:
+                response = synthesize_response(schema)
+                if self.engine.check_response(api, response) is not None:
+                    # Keep only the synthesized values their property schemas accept.
+                    properties = schema.get("properties", {})
+                    response = {name: value for name, value in response.items()
+                                if jsonschema.Draft202012Validator(properties.get(name, {})).is_valid(value)}
+                    error = self.engine.check_response(api, response)
+                    if error is not None:
+                        raise ValueError(f"{api}: cannot synthesize a response: {error}")
+            self._responses[api] = encode(response)
+
+    def register(self, api: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """Answer requests to api with handler(request) instead of the synthesized response."""
+        self._handlers[api] = handler
+
+    def transact(self, line: bytes) -> Optional[bytes]:
+        """Process one request line, returning the encoded response or None for a `cmd`."""
+        return self.respond(_parse(line))
+
+    def respond(self, request: Any) -> Optional[bytes]:
+        """Process one parsed request, returning the encoded response or None for a `cmd`.
+
+        An exception from a registered handler is answered with an `err`
+        response, so it does not end the connection.
+        """
+        if request is _UNPARSEABLE:
+            self.errors += 1
+            return encode({"err": "cannot parse request: not valid JSON"})
+        is_command = isinstance(request, dict) and "cmd" in request and "req" not in request
+        error = self.engine.check_request(request)
+        if is_command:
+            self.commands += 1
+        else:
+            self.transactions += 1
+        if error is not None:
+            self.errors += 1
+            return None if is_command else encode({"err": error})
+        api = self.engine.request_name(request)
+        handler = self._handlers.get(api)
+        if handler is not None:
+            try:
+                response = encode(handler(request))
+            except Exception as e:
+                self.errors += 1
+                response = encode({"err": f"cannot handle {api}: {e}"})
+            return None if is_command else response
+        if is_command:
+            return None
+        return self._responses.get(api, b"{}" + TERMINATOR)
+
+    def delay(self, request: Any) -> float:
+        """Return the configured latency for the API a parsed request names."""
+        if not self.api_latency:
+            return self.latency
+        api = self.engine.request_name(request) if isinstance(request, dict) else None
+        return self.api_latency.get(api, self.latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return transaction counts and the mean rate since startup."""
+        uptime = time.monotonic() - self._started
+        return {
+            "uptime": round(uptime, 3),
+            "transactions": self.transactions,
+            "commands": self.commands,
+            "errors": self.errors,
+            "per_second": round((self.transactions + self.commands) / uptime, 1) if uptime else 0,
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection, processing requests strictly in order."""
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(encode({"err": f"request exceeds {self.max_line} bytes"}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request = _parse(line)
+                delay = self.delay(request)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                response = self.respond(request)
+                if response is not None:
+                    writer.write(response)
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            writer.close()
+
+    async def start_unix(self, path: str) -> str:
+        """Listen on a Unix domain socket, returning its path."""
+        if os.path.exists(path):
+            os.unlink(path)
+        self._servers.append(await asyncio.start_unix_server(self.handle, path=path, limit=self.max_line))
+        return path
+
+    async def start_tcp(self, host: str, port: int) -> int:
+        """Listen on a TCP port, returning the bound port (useful with port 0)."""
+        server = await asyncio.start_server(self.handle, host, port, limit=self.max_line)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def open_pty(self, link: Optional[str] = None) -> str:
+        """Serve a raw-mode pseudo-terminal, returning its device path (or link to it)."""
+        import tty
+        loop = asyncio.get_running_loop()
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        # Keeping the slave open means clients can close and reopen the
+        # device without the master seeing a hangup.
+        self._pty_fds += [master, slave]
+        reader = asyncio.StreamReader(limit=self.max_line)
+        read_transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader),
+                                                         os.fdopen(master, 'rb', buffering=0, closefd=False))
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin,
+                                                            os.fdopen(master, 'wb', buffering=0, closefd=False))
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        self._pty_transports.append(read_transport)
+        asyncio.create_task(self.handle(reader, writer))
+        path = os.ttyname(slave)
+        if link:
+            if os.path.lexists(link):
+                os.unlink(link)
+            os.symlink(path, link)
+            return link
+        return path
+
+    async def close(self) -> None:
+        """Stop every listener, connection and pseudo-terminal."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        # Closing the transports ends each connection's read loop with EOF.
+        for transport in self._pty_transports:
+            transport.close()
+        self._pty_transports = []
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        for fd in self._pty_fds:
+            os.close(fd)
+        self._pty_fds = []
+
+
+def _parse_api_latency(values) -> Dict[str, float]:
+    latency = {}
+    for value in values or []:
+        api, _, seconds = value.partition("=")
+        latency[api] = float(seconds)
+    return latency
+
+
+async def _serve(args, emulator: NotecardEmulator) -> None:
+    if args.pty is not None:
+        print(f"✓ Emulating a Notecard on {await emulator.open_pty(args.pty or None)}")
+    if args.socket:
+        await emulator.start_unix(args.socket)
+        print(f"✓ Emulating a Notecard on {args.socket}")
+    if args.tcp:
+        host, _, port = args.tcp.rpartition(":")
+        port = await emulator.start_tcp(host or "127.0.0.1", int(port))
+        print(f"✓ Emulating a Notecard on {host or '127.0.0.1'}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await emulator.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Emulate a Notecard answering requests from the response schemas",
+        epilog="Example: python scripts/notecard_emulator.py --pty /tmp/notecard --latency 0.005"
+    )
+    parser.add_argument("--pty", nargs="?", const="", metavar="LINK",
+                        help="Serve a pseudo-terminal, optionally symlinked at LINK.")
+    parser.add_argument("--socket", help="Serve on this Unix socket path.")
+    parser.add_argument("--tcp", metavar="HOST:PORT", help="Serve on this TCP address.")
+    parser.add_argument("--engine", choices=ENGINES, default="compiled", help="Validation engine. Defaults to 'compiled'.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before answering each request. Defaults to 0.")
+    parser.add_argument("--api-latency", action="append", metavar="API=SECONDS",
+                        help="Latency for one API (e.g. 'hub.sync=0.25'). May be repeated.")
+    parser.add_argument("--responses", help="JSON file mapping API names to the responses to return.")
+    parser.add_argument("--notefiles", action="store_true",
+                        help="Answer note.* and file.* requests from an in-memory Notefile store.")
+
+    args = parser.parse_args()
+
+    if args.pty is None and not args.socket and not args.tcp:
+        parser.error("one of --pty, --socket or --tcp is required")
+
+    responses = None
+    if args.responses:
+        with open(args.responses, 'r') as f:
+            responses = json.load(f)
+    try:
+        emulator = NotecardEmulator(args.engine, args.schema_dir, args.latency,
+                                    _parse_api_latency(args.api_latency), responses)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.notefiles:
+        from notefile_store import NotefileStore
+        NotefileStore().attach(emulator)
+
+    try:
+        asyncio.run(_serve(args, emulator))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n{json.dumps(emulator.stats())}")
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+        if args.pty and os.path.islink(args.pty):
+            os.unlink(args.pty)
+
+
+if __name__ == "__main__":
+    main()
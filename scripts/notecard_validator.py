@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Dispatching validator for Notecard API requests and responses.
+
+Rather than evaluating every `$ref` in the top-level `oneOf` of
+notecard.api.json, requests are routed by their `req`/`cmd` name straight
+to the matching `*.req.notecard.api.json` schema. Messages without a
+recognizable name fall back to the full `oneOf` semantics.
+
+Usage: python scripts/notecard_validator.py [--response API] [file]
+Example: echo '{"req":"card.attn","mode":"arm"}' | python scripts/notecard_validator.py
+"""
+
+import os
+import glob
+import json
+import sys
+import argparse
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import jsonschema
+from jsonschema.exceptions import best_match
+from referencing import Registry, Resource
+
+
+SCHEMA_BASE_URL = "https://raw.githubusercontent.com/blues/notecard-schema/master/"
+API_SCHEMA_FILE = "notecard.api.json"
+SCHEMA_SUFFIX = ".notecard.api.json"
+
+
+def get_project_root() -> str:
+    """Get the project root directory."""
+    return os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+
+def api_name_from_filename(filename: str) -> str:
+    """Strip the `.req`/`.rsp` and `.notecard.api.json` suffixes from a schema filename."""
+    base = os.path.basename(filename)
+    if base.endswith(SCHEMA_SUFFIX):
+        base = base[:-len(SCHEMA_SUFFIX)]
+    for kind in (".req", ".rsp"):
+        if base.endswith(kind):
+            return base[:-len(kind)]
+    return base
+
+
+def load_schema_files(schema_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Load notecard.api.json and every per-API schema in schema_dir, keyed by filename."""
+    schema_dir = schema_dir or get_project_root()
+    schemas = {}
+    paths = [os.path.join(schema_dir, API_SCHEMA_FILE)]
+    paths += sorted(glob.glob(os.path.join(schema_dir, f"*.req{SCHEMA_SUFFIX}")))
+    paths += sorted(glob.glob(os.path.join(schema_dir, f"*.rsp{SCHEMA_SUFFIX}")))
+    for path in paths:
+        with open(path, 'r') as f:
+            schemas[os.path.basename(path)] = json.load(f)
+    return schemas
+
+
+def build_registry(schemas: Dict[str, Dict[str, Any]]) -> Registry:
+    """Build a registry resolving every schema `$id` to its local contents.
+
+    The registry has no retriever, so an unknown `$ref` raises rather than
+    triggering a network fetch.
+    """
+    resources = []
+    for filename, contents in schemas.items():
+        uri = contents.get("$id", SCHEMA_BASE_URL + filename)
+        resources.append((uri, Resource.from_contents(contents)))
+    return Registry().with_resources(resources)
+
+
+def _name_error(error: jsonschema.ValidationError, filename: str) -> jsonschema.ValidationError:
+    """Prefix the error message with the schema file that rejected the instance."""
+    error.message = f"{filename}: {error.message}"
+    return error
+
+
+class NotecardValidator:
+    """Validates Notecard requests by name-dispatch and responses by API name."""
+
+    def __init__(self, schemas: Dict[str, Dict[str, Any]], registry: Optional[Registry] = None):
+        self.schemas = schemas
+        self.registry = registry if registry is not None else build_registry(schemas)
+        self.api_schema = schemas[API_SCHEMA_FILE]
+        self._api_validator = jsonschema.Draft202012Validator(self.api_schema, registry=self.registry)
+
+        # Prebuilt name -> (filename, validator) indexes.
+        self._requests: Dict[str, Tuple[str, jsonschema.Draft202012Validator]] = {}
+        for ref_obj in self.api_schema.get("oneOf", []):
+            filename = ref_obj["$ref"].split('/')[-1]
+            if not filename.endswith(SCHEMA_SUFFIX):
+                # Bundled references point at `#/$defs/<api>.req`.
+                filename += SCHEMA_SUFFIX
+            if filename in schemas:
+                self._requests[api_name_from_filename(filename)] = (filename, self.validator_for(filename))
+
+        self._responses: Dict[str, Tuple[str, jsonschema.Draft202012Validator]] = {}
+        for filename in schemas:
+            if filename.endswith(f".rsp{SCHEMA_SUFFIX}"):
+                self._responses[api_name_from_filename(filename)] = (filename, self.validator_for(filename))
+
+    @classmethod
+    def from_directory(cls, schema_dir: Optional[str] = None) -> "NotecardValidator":
+        """Create a validator from the schema files in schema_dir (default: project root)."""
+        return cls(load_schema_files(schema_dir))
+
+    @classmethod
+    def from_bundle(cls, path: Optional[str] = None) -> "NotecardValidator":
+        """Create a validator from a single-file bundle written by scripts/bundle_schemas.py."""
+        from bundle_schemas import load_bundle
+        bundle, registry = load_bundle(path)
+        schemas = {f"{key}{SCHEMA_SUFFIX}": schema for key, schema in bundle["$defs"].items()}
+        schemas[API_SCHEMA_FILE] = bundle
+        return cls(schemas, registry)
+
+    def validator_for(self, filename: str) -> jsonschema.Draft202012Validator:
+        """Build a validator for one of the loaded schema files."""
+        return jsonschema.Draft202012Validator(self.schemas[filename], registry=self.registry)
+
+    @property
+    def request_names(self):
+        """Names of all APIs with a request schema, in notecard.api.json order."""
+        return list(self._requests)
+
+    @property
+    def response_names(self):
+        """Names of all APIs with a response schema."""
+        return list(self._responses)
+
+    def request_name(self, instance: Any) -> Optional[str]:
+        """Return the API name a request dispatches to, or None if it is not recognizable.
+
+        A request is recognizable when `req` or `cmd` names a known API, and
+        the two do not name different APIs.
+        """
+        if not isinstance(instance, dict):
+            return None
+        req = instance.get("req")
+        cmd = instance.get("cmd")
+        name = req if isinstance(req, str) else cmd
+        if not isinstance(name, str) or name not in self._requests:
+            return None
+        if "req" in instance and "cmd" in instance and req != cmd:
+            return None
+        return name
+
+    def request_schema_file(self, instance: Any) -> str:
+        """Return the schema filename a request is validated against."""
+        name = self.request_name(instance)
+        return self._requests[name][0] if name else API_SCHEMA_FILE
+
+    def iter_request_errors(self, instance: Any) -> Iterator[jsonschema.ValidationError]:
+        """Yield validation errors for a request, each prefixed with the schema filename."""
+        name = self.request_name(instance)
+        if name is None:
+            filename, validator = API_SCHEMA_FILE, self._api_validator
+        else:
+            filename, validator = self._requests[name]
+        for error in validator.iter_errors(instance):
+            yield _name_error(error, filename)
+
+    def is_valid_request(self, instance: Any) -> bool:
+        """Return True if the request is valid."""
+        name = self.request_name(instance)
+        if name is None:
+            return self._api_validator.is_valid(instance)
+        return self._requests[name][1].is_valid(instance)
+
+    def validate_request(self, instance: Any) -> Optional[str]:
+        """Validate a request, raising the most relevant ValidationError on failure.
+
+        Returns the API name the request was dispatched to, or None if it
+        was validated against the full notecard.api.json `oneOf`.
+        """
+        error = best_match(self.iter_request_errors(instance))
+        if error is not None:
+            raise error
+        return self.request_name(instance)
+
+    def iter_response_errors(self, api_name: str, instance: Any) -> Iterator[jsonschema.ValidationError]:
+        """Yield validation errors for a response to the named API."""
+        if api_name not in self._responses:
+            raise KeyError(f"No response schema for '{api_name}'")
+        filename, validator = self._responses[api_name]
+        for error in validator.iter_errors(instance):
+            yield _name_error(error, filename)
+
+    def is_valid_response(self, api_name: str, instance: Any) -> bool:
+        """Return True if the response to the named API is valid."""
+        if api_name not in self._responses:
+            raise KeyError(f"No response schema for '{api_name}'")
+        return self._responses[api_name][1].is_valid(instance)
+
+    def validate_response(self, api_name: str, instance: Any) -> None:
+        """Validate a response to the named API, raising ValidationError on failure."""
+        error = best_match(self.iter_response_errors(api_name, instance))
+        if error is not None:
+            raise error
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Validate a Notecard request (or response) against the local schemas",
+        epilog="Example: echo '{\"req\":\"card.version\"}' | python scripts/notecard_validator.py"
+    )
+    parser.add_argument("file", nargs="?", help="JSON file to validate. Reads stdin when omitted.")
+    parser.add_argument("--response", metavar="API", help="Validate as a response to the named API (e.g. 'card.version').")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    try:
+        if args.file:
+            with open(args.file, 'r') as f:
+                instance = json.load(f)
+        else:
+            instance = json.load(sys.stdin)
+    except (IOError, json.JSONDecodeError) as e:
+        print(f"Error reading JSON: {e}")
+        sys.exit(2)
+
+    validator = NotecardValidator.from_directory(args.schema_dir)
+    try:
+        if args.response:
+            validator.validate_response(args.response, instance)
+            print(f"✓ Valid {args.response} response")
+        else:
+            validator.validate_request(instance)
+            print(f"✓ Valid request ({validator.request_schema_file(instance)})")
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        sys.exit(2)
+    except jsonschema.ValidationError as e:
+        print(f"✗ {e.message}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for the Notecard's Notefile storage.
+
+Implements note.add, note.get, note.update, note.delete, note.changes,
+file.changes, file.changes.pending, file.stats and file.delete, returning
+responses shaped by their `.rsp` schemas. The store can answer requests
+directly, or be attached to scripts/notecard_emulator.py.
+
+Every Notefile keeps its notes in ID order, its note count, and a
+change index: note IDs ordered by the sequence number of their latest
+change, deleted notes included. A change tracker is a cursor into that
+sequence, so note.changes walks back only over the changes since the
+cursor, and never scans the whole file.
+
+Notefile kinds follow the Notecard: `.qo`/`.qos` outbound queues, `.qi`/`.qis`
+inbound queues, and `.db`/`.dbs`/`.dbx` databases. Outbound notes and
+database changes are pending until sync() (hub.sync when attached).
+
+Usage: python scripts/notefile_store.py [--notes N] [--files N] [--trackers N]
+Example: python scripts/notefile_store.py --notes 1000000 --trackers 4
+"""
+
+import time
+import argparse
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+QUEUE_SUFFIXES = (".qo", ".qos", ".qi", ".qis")
+OUTBOUND_SUFFIXES = (".qo", ".qos")
+DATABASE_SUFFIXES = (".db", ".dbs", ".dbx")
+DEFAULT_ADD_FILE = "data.qo"
+DEFAULT_GET_FILE = "data.qi"
+
+# Internal cursor marking what has been synced to Notehub.
+_SYNC_TRACKER = ""
+
+
+class NotefileError(Exception):
+    """Raised for a request the Notecard would answer with an `err`."""
+
+
+class Notefile:
+    """One Notefile with its notes, change index and tracker cursors."""
+
+    __slots__ = ("name", "notes", "changes", "seq", "trackers", "next_id", "compact_at", "compact_blocked")
+
+    def __init__(self, name: str):
+        self.name = name
+        # note ID -> (body, payload), in ID order. An OrderedDict, because
+        # popping the oldest note of a plain dict gets slower as it drains.
+        self.notes: Dict[str, tuple] = OrderedDict()
+        # note ID -> sequence number of its latest change, in sequence order.
+        self.changes: Dict[str, int] = {}
+        self.seq = 0
+        # tracker name -> sequence number it has seen up to.
+        self.trackers: Dict[str, int] = {}
+        self.next_id = 1
+        # Size of the change index that triggers the next compaction.
+        self.compact_at = 64
+        # Whether the last compaction kept deletions some tracker had not seen yet.
+        self.compact_blocked = False
+
+    @property
+    def is_queue(self) -> bool:
+        return self.name.endswith(QUEUE_SUFFIXES)
+
+    @property
+    def is_database(self) -> bool:
+        return self.name.endswith(DATABASE_SUFFIXES)
+
+    def touch(self, note_id: str) -> None:
+        """Record a change to note_id, moving it to the end of the change index.
+
+        Compacts the index once it outgrows compact_at, so a Notefile whose
+        changes are never polled still forgets the deletes every tracker has seen.
+        """
+        self.seq += 1
+        self.changes.pop(note_id, None)
+        self.changes[note_id] = self.seq
+        if len(self.changes) > self.compact_at:
+            self.compact()
+
+    def since(self, cursor: int) -> List[str]:
+        """Return the IDs changed after cursor, oldest change first, walking back from the newest."""
+        changed = []
+        for note_id in reversed(self.changes):
+            if self.changes[note_id] <= cursor:
+                break
+            changed.append(note_id)
+        changed.reverse()
+        return changed
+
+    def count_since(self, cursor: int) -> int:
+        """Return how many notes changed after cursor."""
+        count = 0
+        for note_id in reversed(self.changes):
+            if self.changes[note_id] <= cursor:
+                break
+            count += 1
+        return count
+
+    def compact(self) -> None:
+        """Forget deleted notes every tracker has already seen.
+
+        The next compaction waits until the index has grown by as many
+        entries as there are notes, so compacting is amortized O(1) per change.
+        """
+        oldest = min(self.trackers.values(), default=self.seq)
+        # Only the prefix of the index older than every tracker is walked.
+        deleted = []
+        for note_id, seq in self.changes.items():
+            if seq > oldest:
+                break
+            if note_id not in self.notes:
+                deleted.append(note_id)
+        for note_id in deleted:
+            del self.changes[note_id]
+        self.compact_at = len(self.changes) + len(self.notes) + 64
+        self.compact_blocked = len(self.changes) > len(self.notes)
+
+
+class NotefileStore:
+    """Indexed in-memory Notefiles answering note.* and file.* requests."""
+
+    def __init__(self):
+        self.files: Dict[str, Notefile] = {}
+        self.total = 0
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "note.add": self._note_add,
+            "note.get": self._note_get,
+            "note.update": self._note_update,
+            "note.delete": self._note_delete,
+            "note.changes": self._note_changes,
+            "file.changes": self._file_changes,
+            "file.changes.pending": self._file_changes_pending,
+            "file.stats": self._file_stats,
+            "file.delete": self._file_delete,
+        }
+
+    @property
+    def apis(self) -> List[str]:
+        """Names of the APIs the store answers."""
+        return list(self._handlers)
+
+    def _file(self, name: Optional[str], create: bool = False) -> Notefile:
+        if not name:
+            raise NotefileError("no notefile specified")
+        notefile = self.files.get(name)
+        if notefile is None:
+            if not create:
+                raise NotefileError(f"notefile does not exist: {name}")
+            notefile = self.files[name] = Notefile(name)
+            notefile.trackers[_SYNC_TRACKER] = 0
+        return notefile
+
+    def add(self, file: str = DEFAULT_ADD_FILE, body: Optional[Dict[str, Any]] = None,
+            payload: Optional[str] = None) -> str:
+        """Add a note, creating the Notefile if needed, and return its ID."""
+        notefile = self._file(file, create=True)
+        note_id = str(notefile.next_id)
+        notefile.next_id += 1
+        notefile.notes[note_id] = (body, payload)
+        notefile.touch(note_id)
+        self.total += 1
+        return note_id
+
+    def get(self, file: str = DEFAULT_GET_FILE, note: Optional[str] = None, delete: bool = False) -> Dict[str, Any]:
+        """Return a note by ID, or the oldest note of a queue, optionally deleting it."""
+        notefile = self._file(file)
+        if note is None:
+            if not notefile.is_queue:
+                raise NotefileError("note ID is required for a database notefile")
+            if not notefile.notes:
+                raise NotefileError(f"no notes available in {file}")
+            note = next(iter(notefile.notes))
+        elif note not in notefile.notes:
+            raise NotefileError(f"note not found: {note}")
+        body, payload = notefile.notes[note]
+        if delete:
+            self._remove(notefile, note)
+        result: Dict[str, Any] = {"note": note}
+        if body is not None:
+            result["body"] = body
+        if payload is not None:
+            result["payload"] = payload
+        return result
+
+    def update(self, file: str, note: str, body: Optional[Dict[str, Any]] = None,
+               payload: Optional[str] = None) -> None:
+        """Replace the body and/or payload of a database note."""
+        notefile = self._file(file)
+        if not notefile.is_database:
+            raise NotefileError(f"notes can only be updated in a database notefile: {file}")
+        if note not in notefile.notes:
+            raise NotefileError(f"note not found: {note}")
+        old_body, old_payload = notefile.notes[note]
+        notefile.notes[note] = (old_body if body is None else body, old_payload if payload is None else payload)
+        notefile.touch(note)
+
+    def delete(self, file: str, notes: Iterable[str]) -> None:
+        """Delete notes by ID from a database Notefile."""
+        notefile = self._file(file)
+        if not notefile.is_database:
+            raise NotefileError(f"notes can only be deleted from a database notefile: {file}")
+        notes = list(notes)
+        missing = [note for note in notes if note not in notefile.notes]
+        if missing:
+            raise NotefileError(f"note not found: {missing[0]}")
+        for note in notes:
+            self._remove(notefile, note)
+
+    def _remove(self, notefile: Notefile, note: str) -> None:
+        del notefile.notes[note]
+        notefile.touch(note)
+        self.total -= 1
+
+    def changes(self, file: str, tracker: Optional[str] = None) -> List[str]:
+        """Return the IDs of notes changed since the tracker last looked, and advance it.
+
+        Without a tracker, every note in the file is returned. A new tracker
+        starts with every note currently in the file.
+        """
+        notefile = self._file(file)
+        if not tracker:
+            return list(notefile.notes)
+        cursor = notefile.trackers.get(tracker)
+        if cursor is None:
+            changed = list(notefile.notes)
+        else:
+            changed = notefile.since(cursor)
+        oldest = min(notefile.trackers.values())
+        notefile.trackers[tracker] = notefile.seq
+        # Also compact when this tracker held back the last compaction.
+        if len(notefile.changes) > notefile.compact_at or (
+                notefile.compact_blocked and cursor is not None and cursor <= oldest):
+            notefile.compact()
+        return changed
+
+    def pending(self, notefile: Notefile) -> int:
+        """Return how many notes in a Notefile have changed since the last sync."""
+        if notefile.name.endswith(OUTBOUND_SUFFIXES):
+            return len(notefile.notes)
+        return notefile.count_since(notefile.trackers[_SYNC_TRACKER])
+
+    def sync(self) -> int:
+        """Sync with an imaginary Notehub: outbound queues are emptied and changes marked synced.
+
+        Returns the number of notes synced.
+        """
+        synced = 0
+        for notefile in self.files.values():
+            synced += self.pending(notefile)
+            if notefile.name.endswith(OUTBOUND_SUFFIXES):
+                for note in list(notefile.notes):
+                    self._remove(notefile, note)
+            notefile.trackers[_SYNC_TRACKER] = notefile.seq
+            if len(notefile.changes) > notefile.compact_at or notefile.compact_blocked:
+                notefile.compact()
+        return synced
+
+    def delete_files(self, files: Iterable[str]) -> None:
+        """Delete Notefiles and the notes they contain."""
+        for name in files:
+            notefile = self.files.pop(name, None)
+            if notefile is not None:
+                self.total -= len(notefile.notes)
+
+    def request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one note.*/file.* request, returning its response or `{"err": ...}`."""
+        name = request.get("req") or request.get("cmd")
+        handler = self._handlers.get(name)
+        if handler is None:
+            return {"err": f"unknown request: {name}"}
+        try:
+            return handler(request)
+        except NotefileError as e:
+            return {"err": str(e)}
+
+    def attach(self, emulator) -> None:
+        """Answer the note.*/file.* APIs, and sync on hub.sync, for a NotecardEmulator."""
+        for api in self._handlers:
+            emulator.register(api, self.request)
+        emulator.register("hub.sync", lambda request: (self.sync(), {})[1])
+
+    def _note_add(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # `note` is accepted as the note's data when there is no `body`.
+        body = request.get("body", request.get("note"))
+        return {"note": self.add(request.get("file", DEFAULT_ADD_FILE), body, request.get("payload"))}
+
+    def _note_get(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.get(request.get("file", DEFAULT_GET_FILE), request.get("note"), request.get("delete", False))
+
+    def _note_update(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if "note" not in request:
+            raise NotefileError("note ID is required")
+        self.update(request.get("file"), request["note"], request.get("body"), request.get("payload"))
+        return {"success": True}
+
+    def _note_delete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        notes = request.get("notes", [request["note"]] if "note" in request else [])
+        if not notes:
+            raise NotefileError("note ID is required")
+        self.delete(request.get("file"), notes)
+        return {"success": True}
+
+    def _note_changes(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        notes = self.changes(request.get("file"), request.get("tracker"))
+        response: Dict[str, Any] = {"changes": bool(notes), "notes": notes}
+        if request.get("tracker"):
+            response["tracker"] = request["tracker"]
+        return response
+
+    def _file_changes(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Report notes and pending changes per file without advancing the tracker."""
+        tracker = request.get("tracker")
+        names = request.get("files", list(self.files))
+        info, total, changes = {}, 0, 0
+        for name in names:
+            notefile = self.files.get(name)
+            if notefile is None:
+                continue
+            cursor = notefile.trackers.get(tracker) if tracker else None
+            changed = len(notefile.notes) if cursor is None else notefile.count_since(cursor)
+            info[name] = {"total": len(notefile.notes), "changes": changed}
+            total += len(notefile.notes)
+            changes += changed
+        return {"total": total, "changes": changes, "info": info}
+
+    def _file_changes_pending(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        info, total, changes = {}, 0, 0
+        for name, notefile in self.files.items():
+            pending = self.pending(notefile)
+            if pending:
+                info[name] = {"total": len(notefile.notes), "changes": pending}
+                total += len(notefile.notes)
+                changes += pending
+        return {"total": total, "changes": changes, "pending": changes > 0, "info": info}
+
+    def _file_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if "file" in request:
+            notefiles = [self._file(request["file"])]
+            total = len(notefiles[0].notes)
+        else:
+            notefiles = list(self.files.values())
+            total = self.total
+        changes = sum(self.pending(notefile) for notefile in notefiles)
+        return {"total": total, "changes": changes, "sync": changes == 0}
+
+    def _file_delete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.delete_files(request.get("files", []))
+        return {}
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the in-memory Notefile store",
+        epilog="Example: python scripts/notefile_store.py --notes 1000000 --trackers 4"
+    )
+    parser.add_argument("--notes", type=int, default=1000000, help="Notes to add. Defaults to 1000000.")
+    parser.add_argument("--files", type=int, default=4, help="Database Notefiles to spread them over. Defaults to 4.")
+    parser.add_argument("--trackers", type=int, default=4, help="Change trackers per Notefile. Defaults to 4.")
+    parser.add_argument("--batch", type=int, default=1000, help="Notes changed between note.changes polls. Defaults to 1000.")
+
+    args = parser.parse_args()
+
+    store = NotefileStore()
+    names = [f"bench{i}.db" for i in range(args.files)]
+    body = {"temp": 21.5, "humid": 40}
+
+    start = time.perf_counter()
+    polled = 0
+    for i in range(args.notes):
+        name = names[i % args.files]
+        note = store.add(name, body)
+        if i % 3 == 0:
+            store.update(name, note, {"temp": 22.0})
+        if (i + 1) % args.batch == 0:
+            for name in names:
+                for tracker in range(args.trackers):
+                    polled += len(store.changes(name, f"t{tracker}"))
+    elapsed = time.perf_counter() - start
+    print(f"✓ {args.notes:,} notes ({store.total:,} stored) in {elapsed:.2f}s: "
+          f"{args.notes / elapsed:,.0f} notes/s, {polled:,} tracked changes polled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Unified command line for the schema scripts, served by an optional warm daemon.
+
+  nschema docs                      generate docs/index.md (generate_docs.py)
+  nschema mdx <api> [options]       generate an API's MDX page (generate_mdx_from_schema.py)
+  nschema version [options]         set `version`/`apiVersion` (update_schema_version.py)
+  nschema create <api>              create a new API's templates (create_api.py)
+  nschema validate <file> [--api]   validate a JSON/JSONL file of requests or responses
+  nschema list [--prefix P]         list the request APIs
+  nschema daemon start|stop|status|run
+
+Every command first tries the daemon's Unix socket. When a daemon answers,
+the command runs inside it, in the caller's working directory, with the
+modules it has already imported and the schemas it has already parsed, and
+the caller prints its output and exits with its status: a socket round trip
+instead of an interpreter start and a full schema reload. Without a daemon,
+or with --no-daemon, the command runs in-process the same way.
+
+The daemon runs one command at a time. Schemas are read through
+scripts/schema_cache.py, so each is reparsed only when its mtime or size
+changes. When any script under scripts/ changes, the daemon reports itself
+stale and exits, and the command runs in-process instead.
+
+Usage: python scripts/nschema.py [--socket PATH] [--no-daemon] <command> [args]
+Example: python scripts/nschema.py daemon start && python scripts/nschema.py validate requests.jsonl
+"""
+
+import io
+import os
+import sys
+import glob
+import json
+import time
+import socket
+import argparse
+import importlib
+import subprocess
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict, List, Optional, Tuple
+
+# notecard_validator and schema_cache import jsonschema, and asyncio is only
+# needed by the daemon; each takes longer to import than a daemon round trip,
+# so they are imported by the functions that need them.
+
+
+DEFAULT_SOCKET = os.environ.get("NSCHEMA_SOCKET") or f"/tmp/nschema-{os.getuid()}.sock"
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPACT = (",", ":")
+
+# Commands that run another script's main(), as (module, description).
+SCRIPT_COMMANDS = {
+    "docs": ("generate_docs", "Generate docs/index.md from the schemas"),
+    "mdx": ("generate_mdx_from_schema", "Generate the MDX page of one API"),
+    "version": ("update_schema_version", "Set `version` or `apiVersion` in the schema files"),
+    "create": ("create_api", "Create schema and test templates for a new API"),
+}
+
+# Validators built from the cached schemas, keyed by schema directory and
+# rebuilt when the cache has reloaded any file since.
+_validators: Dict[Optional[str], Tuple[int, Any]] = {}
+
+
+def _validator(schema_dir: Optional[str]):
+    from notecard_validator import NotecardValidator
+    from schema_cache import load_schemas, shared_cache
+
+    schemas = load_schemas(schema_dir)
+    generation = shared_cache().generation
+    entry = _validators.get(schema_dir)
+    if entry is None or entry[0] != generation:
+        entry = _validators[schema_dir] = (generation, NotecardValidator(schemas))
+    return entry[1]
+
+
+def _messages(text: str) -> List[Tuple[int, Any]]:
+    """Return the messages of a JSON document (an object or a list) or of JSONL text, with line numbers."""
+    try:
+        document = json.loads(text)
+    except ValueError:
+        document = None
+    if isinstance(document, dict):
+        return [(1, document)]
+    if isinstance(document, list):
+        return list(enumerate(document, 1))
+    messages = []
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.strip():
+            try:
+                messages.append((number, json.loads(line)))
+            except ValueError as e:
+                messages.append((number, e))
+    return messages
+
+
+def validate_command(argv: List[str]) -> int:
+    """Validate a JSON or JSONL file of requests, or of responses to --api."""
+    parser = argparse.ArgumentParser(prog="nschema validate", description=validate_command.__doc__)
+    parser.add_argument("input", help="JSON or JSONL file to validate.")
+    parser.add_argument("--api", help="Validate responses to this API (e.g. 'card.version') instead of requests.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    args = parser.parse_args(argv)
+
+    validator = _validator(args.schema_dir)
+    with open(args.input, 'r') as f:
+        messages = _messages(f.read())
+    invalid = 0
+    for number, message in messages:
+        try:
+            if isinstance(message, ValueError):
+                raise message
+            if args.api:
+                validator.validate_response(args.api, message)
+            else:
+                validator.validate_request(message)
+        except Exception as e:
+            invalid += 1
+            print(f"✗ {args.input}:{number}: {getattr(e, 'message', e)}")
+    print(f"{'✓' if not invalid else '✗'} {len(messages) - invalid} of {len(messages)} valid")
+    return 1 if invalid else 0
+
+
+def list_command(argv: List[str]) -> int:
+    """List the request APIs, with their response schemas."""
+    parser = argparse.ArgumentParser(prog="nschema list", description=list_command.__doc__)
+    parser.add_argument("--prefix", default="", help="Only list APIs starting with this prefix (e.g. 'card.').")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    args = parser.parse_args(argv)
+
+    from notecard_validator import api_name_from_filename
+    from schema_cache import load_schemas
+
+    schemas = load_schemas(args.schema_dir)
+    responses = {api_name_from_filename(filename) for filename in schemas if ".rsp." in filename}
+    for filename in schemas:
+        if ".req." in filename:
+            api = api_name_from_filename(filename)
+            if api.startswith(args.prefix):
+                print(api if api in responses else f"{api} (no response schema)")
+    return 0
+
+
+COMMANDS = {
+    "validate": (validate_command, validate_command.__doc__),
+    "list": (list_command, list_command.__doc__),
+}
+
+
+def dispatch(argv: List[str]) -> int:
+    """Run one command (argv[0]) with its arguments and return its exit status."""
+    if not argv:
+        raise SystemExit("Error: no command given")
+    command, arguments = argv[0], argv[1:]
+    if command in COMMANDS:
+        return COMMANDS[command][0](arguments) or 0
+    if command not in SCRIPT_COMMANDS:
+        raise SystemExit(f"Error: unknown command '{command}'")
+    module = importlib.import_module(SCRIPT_COMMANDS[command][0])
+    saved = sys.argv
+    sys.argv = [f"nschema {command}"] + arguments
+    try:
+        module.main()
+    finally:
+        sys.argv = saved
+    return 0
+
+
+def _exit_status(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_command(argv: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Run a command in this process, capturing its output.
+
+    Returns {"code", "stdout", "stderr"}; the working directory is restored afterwards.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous = os.getcwd()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                code = dispatch(argv)
+            except SystemExit as e:
+                code = _exit_status(e.code)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        os.chdir(previous)
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _script_state() -> Dict[str, Tuple[int, int]]:
+    state = {}
+    for path in glob.glob(os.path.join(SCRIPTS_DIR, "*.py")):
+        stat = os.stat(path)
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+class SchemaDaemon:
+    """Runs nschema commands for Unix socket clients, one at a time, with warm modules and schemas."""
+
+    def __init__(self, schema_dir: Optional[str] = None):
+        self.schema_dir = schema_dir
+        self.commands = 0
+        self.started = time.monotonic()
+        self._scripts = _script_state()
+        self._server = None
+        self._stopped = None
+
+    def warm(self) -> None:
+        """Import the command modules and parse the schemas ahead of the first command."""
+        from schema_cache import load_schemas
+
+        for module, _ in SCRIPT_COMMANDS.values():
+            try:
+                importlib.import_module(module)
+            except Exception:
+                # Reported by the command that needs the module.
+                pass
+        load_schemas(self.schema_dir)
+
+    @property
+    def stale(self) -> bool:
+        """True when a script has changed since the daemon started."""
+        return _script_state() != self._scripts
+
+    def status(self) -> Dict[str, Any]:
+        """Return the daemon's pid, uptime, commands served and schema cache counts."""
+        from schema_cache import shared_cache
+
+        return {
+            "pid": os.getpid(),
+            "uptime": round(time.monotonic() - self.started, 3),
+            "commands": self.commands,
+            "cache": shared_cache().stats(),
+        }
+
+    def handle(self, message: Any) -> Dict[str, Any]:
+        """Answer one client message."""
+        if not isinstance(message, dict):
+            return {"error": "message is not a JSON object"}
+        if message.get("stop"):
+            self._stopped.set()
+            return {"stopped": True}
+        if message.get("status"):
+            return self.status()
+        if self.stale:
+            self._stopped.set()
+            return {"stale": True}
+        argv = message.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            return {"error": "'argv' must be a list of strings"}
+        self.commands += 1
+        return run_command(argv, message.get("cwd"))
+
+    async def start(self, path: str) -> None:
+        """Start listening on the Unix socket at path, readable only by this user."""
+        import asyncio
+
+        if os.path.exists(path):
+            os.unlink(path)
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=path)
+        os.chmod(path, 0o600)
+
+    async def serve_until_stopped(self) -> None:
+        await self._stopped.wait()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, reader, writer) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                reply = self.handle(json.loads(line))
+            except ValueError as e:
+                reply = {"error": f"unparseable: {e}"}
+            writer.write(json.dumps(reply, separators=COMPACT).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve(path: str, schema_dir: Optional[str]) -> None:
+    daemon = SchemaDaemon(schema_dir)
+    daemon.warm()
+    await daemon.start(path)
+    print(f"✓ Serving nschema on {path} (pid {os.getpid()})")
+    await daemon.serve_until_stopped()
+
+
+def serve(path: str, schema_dir: Optional[str] = None) -> None:
+    """Run the daemon in the foreground until it is stopped."""
+    import asyncio
+
+    try:
+        asyncio.run(_serve(path, schema_dir))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def request(path: str, message: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Send one message to the daemon and return its reply, or None if no daemon is listening."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(timeout)
+        try:
+            client.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        client.sendall(json.dumps(message, separators=COMPACT).encode() + b"\n")
+        chunks = []
+        while True:
+            chunk = client.recv(1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        reply = b"".join(chunks)
+        return json.loads(reply) if reply else None
+    finally:
+        client.close()
+
+
+def start_daemon(path: str, schema_dir: Optional[str] = None, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+    """Start a background daemon unless one is already listening, and return its status."""
+    status = request(path, {"status": True})
+    if status is not None:
+        return status
+    command = [sys.executable, os.path.abspath(__file__), "--socket", path]
+    if schema_dir:
+        command += ["--schema-dir", schema_dir]
+    subprocess.Popen(command + ["daemon", "run"], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        status = request(path, {"status": True})
+        if status is not None:
+            return status
+    return None
+
+
+def run(argv: List[str], path: str = DEFAULT_SOCKET, use_daemon: bool = True) -> Dict[str, Any]:
+    """Run a command through the daemon when one is listening, otherwise in-process."""
+    if use_daemon:
+        reply = request(path, {"argv": argv, "cwd": os.getcwd()})
+        if reply is not None and "code" in reply:
+            return reply
+    return run_command(argv)
+
+
+def _daemon(action: str, args) -> int:
+    if action == "run":
+        serve(args.socket, args.schema_dir)
+        return 0
+    if action == "start":
+        status = start_daemon(args.socket, args.schema_dir)
+        if status is None:
+            print(f"Error: the daemon did not start on {args.socket}", file=sys.stderr)
+            return 1
+        print(f"✓ nschema daemon running on {args.socket} (pid {status['pid']})")
+        return 0
+    reply = request(args.socket, {action: True}, timeout=10)
+    if reply is None:
+        print(f"✗ No nschema daemon on {args.socket}")
+        return 1
+    print(json.dumps(reply, indent=4) if action == "status" else f"✓ Stopped the nschema daemon on {args.socket}")
+    return 0
+
+
+def main():
+    """Main function."""
+    commands = {name: description for name, (_, description) in SCRIPT_COMMANDS.items()}
+    commands.update({name: description for name, (_, description) in COMMANDS.items()})
+    commands["daemon"] = "Start, stop, query or run the warm daemon in the foreground"
+    parser = argparse.ArgumentParser(
+        prog="nschema",
+        description="Run the schema scripts, through a warm daemon when one is running",
+        epilog="Commands:\n" + "".join(f"  {name:<10}{description}\n" for name, description in commands.items())
+               + "\nExample: python scripts/nschema.py daemon start && python scripts/nschema.py list --prefix card.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Daemon socket path. Defaults to {DEFAULT_SOCKET}.")
+    parser.add_argument("--no-daemon", action="store_true", help="Run the command in-process even if a daemon is running.")
+    parser.add_argument("--schema-dir", default=None, help="Schema directory the daemon preloads. Defaults to the project root.")
+    parser.add_argument("command", choices=sorted(commands), metavar="command", help="Command to run (see below).")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="Arguments of the command.")
+
+    args = parser.parse_args()
+
+    if args.command == "daemon":
+        if len(args.arguments) != 1 or args.arguments[0] not in ("start", "stop", "status", "run"):
+            parser.error("daemon takes one of: start, stop, status, run")
+        sys.exit(_daemon(args.arguments[0], args))
+
+    result = run([args.command] + args.arguments, args.socket, not args.no_daemon)
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    sys.exit(result["code"])
+
+
+if __name__ == "__main__":
+    main()
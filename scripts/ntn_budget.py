@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Payload budget checker for Notes sent over a non-terrestrial network (NTN).
+
+The input is a JSONL stream of Notecard requests, such as an outbound queue
+or a host transcript, read in order:
+
+  card.transport   sets the transport method (and `allow`) for later Notes
+  note.template    defines the record layout of its Notefile's Notes
+  note.add         is measured: its template record size, or its compact
+                   JSON body when the Notefile has no template, plus the
+                   decoded length of any `payload`
+
+When the method can use NTN (`ntn`, `cell-ntn`, `wifi-ntn`, ...), each Note
+must be templated, unless `allow` is set, and must fit the per-message
+budget. Notes that fit are packed in order into messages of up to the budget,
+and messages into satellite sessions, to estimate how many sessions the
+batch needs. The NTN methods are read from the card.transport schema.
+
+The verdict file has one tab-separated line per note.add:
+  <line number> <ok|over|error> <file> <bytes> <message>
+
+Usage: python scripts/ntn_budget.py [options] <input.jsonl>
+Example: python scripts/ntn_budget.py queue.jsonl --method ntn --budget 256 --verdicts budget.tsv
+"""
+
+import sys
+import json
+import time
+import binascii
+import argparse
+from collections import namedtuple
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from notecard_validator import load_schema_files
+from note_template import NoteTemplate, TemplateError
+
+
+DEFAULT_METHOD = "ntn"
+DEFAULT_BUDGET = 256
+DEFAULT_FILE = "data.qo"
+COMPACT = (",", ":")
+TRANSPORT_SCHEMA = "card.transport.req.notecard.api.json"
+
+NoteSize = namedtuple("NoteSize", "line file size verdict message")
+
+
+def ntn_methods(schema_dir: Optional[str] = None) -> frozenset:
+    """Return the card.transport methods that can send over NTN."""
+    schema = load_schema_files(schema_dir)[TRANSPORT_SCHEMA]
+    return frozenset(method for method in schema["properties"]["method"]["enum"] if "ntn" in method.split("-"))
+
+
+def payload_length(payload: str) -> int:
+    """Return the decoded length of a base64 payload."""
+    return len(binascii.a2b_base64(payload)) if payload else 0
+
+
+class BudgetChecker:
+    """Measures note.add requests against the NTN budget of the current transport."""
+
+    def __init__(self, method: str = DEFAULT_METHOD, budget: int = DEFAULT_BUDGET, allow: bool = False,
+                 per_session: int = 1, schema_dir: Optional[str] = None):
+        self.methods = ntn_methods(schema_dir)
+        self.method = method
+        self.budget = budget
+        self.allow = allow
+        self.per_session = per_session
+        self.templates: Dict[str, NoteTemplate] = {}
+        self.notes = 0
+        self.over = 0
+        self.errors = 0
+        self.bytes = 0
+        self.messages = 0
+        self._message_bytes = 0
+
+    @property
+    def ntn(self) -> bool:
+        """True when the current transport method can send over NTN."""
+        return self.method in self.methods
+
+    def define(self, file: str, template: NoteTemplate) -> None:
+        """Use template for the Notes of a Notefile."""
+        self.templates[file] = template
+
+    def measure(self, request: Dict[str, Any]) -> Tuple[int, Optional[str]]:
+        """Return the encoded size of a note.add request, and why it cannot be sent, if so."""
+        file = request.get("file", DEFAULT_FILE)
+        if not isinstance(file, str):
+            return 0, "file must be a string"
+        payload = request.get("payload", "")
+        if not isinstance(payload, str):
+            return 0, "payload must be a base64 string"
+        template = self.templates.get(file)
+        try:
+            extra = payload_length(payload)
+        except binascii.Error as e:
+            return 0, f"payload is not valid base64: {e}"
+        if template is not None:
+            try:
+                template.pack(request.get("body") or {})
+            except TemplateError as e:
+                return template.size + extra, str(e)
+            return template.size + extra, None
+        size = len(json.dumps(request["body"], separators=COMPACT)) + extra if "body" in request else extra
+        if self.ntn and not self.allow:
+            return size, f"'{file}' has no template, and NTN only sends templated Notes"
+        return size, None
+
+    def _send(self, size: int) -> None:
+        if self._message_bytes and self._message_bytes + size > self.budget:
+            self._message_bytes = 0
+        if not self._message_bytes:
+            self.messages += 1
+        self._message_bytes += size
+
+    def feed(self, request: Any, line: int = 0) -> Optional[NoteSize]:
+        """Process one request, returning the measurement for a note.add."""
+        if not isinstance(request, dict):
+            return None
+        api = request.get("req", request.get("cmd"))
+        if api == "card.transport":
+            if isinstance(request.get("method"), str):
+                self.method = request["method"]
+            self.allow = request.get("allow", self.allow)
+        elif api == "note.template" and isinstance(request.get("file", DEFAULT_FILE), str):
+            try:
+                self.define(request.get("file", DEFAULT_FILE), NoteTemplate.from_request(request))
+            except TemplateError:
+                # Removing or breaking a template leaves its Notes untemplated.
+                self.templates.pop(request.get("file", DEFAULT_FILE), None)
+        elif api == "note.add":
+            size, message = self.measure(request)
+            file = request.get("file", DEFAULT_FILE)
+            self.notes += 1
+            if message is not None:
+                self.errors += 1
+                return NoteSize(line, file, size, "error", message)
+            self.bytes += size
+            if self.ntn:
+                if size > self.budget:
+                    self.over += 1
+                    return NoteSize(line, file, size, "over", f"{size} bytes exceeds the {self.budget}-byte NTN budget")
+                self._send(size)
+            return NoteSize(line, file, size, "ok", "")
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Return note counts, bytes and the estimated messages and sessions."""
+        return {
+            "method": self.method,
+            "budget": self.budget,
+            "notes": self.notes,
+            "ok": self.notes - self.over - self.errors,
+            "over": self.over,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "messages": self.messages,
+            "sessions": -(-self.messages // self.per_session),
+        }
+
+
+def check_lines(lines: Iterable[str], checker: BudgetChecker) -> Iterable[NoteSize]:
+    """Feed JSONL lines to the checker, yielding a measurement for every note.add."""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            checker.notes += 1
+            checker.errors += 1
+            yield NoteSize(number, "-", 0, "error", f"cannot parse line: {e}")
+            continue
+        result = checker.feed(request, number)
+        if result is not None:
+            yield result
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Check a JSONL batch of note.add requests against the NTN payload budget",
+        epilog="Example: python scripts/ntn_budget.py queue.jsonl --method ntn --budget 256"
+    )
+    parser.add_argument("input", help="JSONL file of requests ('-' for stdin).")
+    parser.add_argument("--method", default=DEFAULT_METHOD,
+                        help=f"card.transport method until the input sets one. Defaults to '{DEFAULT_METHOD}'.")
+    parser.add_argument("--allow", action="store_true", help="Allow untemplated Notes over NTN, like card.transport allow:true.")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help=f"Bytes per NTN message. Defaults to {DEFAULT_BUDGET}.")
+    parser.add_argument("--per-session", type=int, default=1, help="NTN messages sent per satellite session. Defaults to 1.")
+    parser.add_argument("--templates", help="JSONL file of note.template requests to apply first.")
+    parser.add_argument("--verdicts", help="Write per-note verdicts (TSV) to this file.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    checker = BudgetChecker(args.method, args.budget, args.allow, args.per_session, args.schema_dir)
+    start = time.perf_counter()
+    try:
+        if args.templates:
+            with open(args.templates, 'r') as f:
+                for _ in check_lines(f, checker):
+                    pass
+        source = sys.stdin if args.input == "-" else open(args.input, 'r')
+        verdicts = open(args.verdicts, 'w') if args.verdicts else None
+        try:
+            for result in check_lines(source, checker):
+                if verdicts:
+                    verdicts.write(f"{result.line}\t{result.verdict}\t{result.file}\t{result.size}\t{result.message}\n")
+                elif result.verdict != "ok":
+                    print(f"✗ line {result.line} ({result.file}, {result.size} bytes): {result.message}")
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if verdicts:
+                verdicts.close()
+    except IOError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+    elapsed = time.perf_counter() - start
+
+    summary = checker.summary()
+    print(json.dumps(summary, indent=4))
+    rate = summary["notes"] / elapsed if elapsed else 0
+    print(f"\n{summary['notes']} notes in {elapsed:.2f}s ({rate:,.0f} notes/s)", file=sys.stderr)
+    if summary["over"] or summary["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Optimizer emitting semantically equivalent, cheaper Notecard API schemas.
+
+Each schema is rewritten by a sequence of passes that never change which
+instances are accepted:
+
+  strip        drop documentation and annotation-only keywords
+  constants    turn one-value enums into const, drop types a const/enum implies
+  reqcmd       replace the req/cmd `oneOf` scaffold with `anyOf` + `not`
+  flatten      merge `allOf` entries into their parent where keywords allow
+  redundant    drop `then`/`else`/`allOf` property constraints the parent repeats
+  dedupe       drop duplicate `allOf`/`anyOf` entries, enum values and required names
+  order        put cheap, rejecting keywords first so invalid instances fail fast
+
+The optimized schemas keep their filenames and `$id`s, so they load with
+load_schema_files() and validate with any engine. `--check` proves the
+rewrite by corpus: every sample and every generated boundary instance must
+be accepted or rejected exactly as by the original schema.
+
+`format` is dropped as an annotation; validators that enable a format
+checker should keep using the original schemas.
+
+Usage: python scripts/optimize_schemas.py [-o OUTPUT_DIR] [--check]
+Example: python scripts/optimize_schemas.py --check -o build/optimized
+"""
+
+import os
+import sys
+import copy
+import json
+import argparse
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import jsonschema
+
+from bundle_schemas import map_subschemas
+from compile_validators import ANNOTATION_KEYWORDS
+from notecard_validator import (
+    API_SCHEMA_FILE,
+    api_name_from_filename,
+    build_registry,
+    get_project_root,
+    load_schema_files,
+)
+
+
+STRIPPED_KEYWORDS = ANNOTATION_KEYWORDS - {"$schema", "$id"}
+
+# Keywords evaluated first, cheapest and most often rejecting first; the
+# rest keep their original relative order.
+KEYWORD_ORDER = ("$schema", "$id", "type", "const", "enum", "required", "additionalProperties",
+                 "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "minLength", "maxLength",
+                 "minItems", "maxItems", "minProperties", "maxProperties", "not", "properties", "items",
+                 "pattern", "anyOf", "oneOf", "allOf", "if", "then", "else")
+
+# Keywords whose meaning depends on siblings; an allOf entry is only merged
+# into its parent when at most one of the two uses each group, and a branch
+# keeps a group whole unless every keyword in it repeats the parent's.
+ADJACENT_GROUPS = (
+    {"properties", "patternProperties", "additionalProperties", "unevaluatedProperties"},
+    {"prefixItems", "items", "unevaluatedItems"},
+    {"contains", "minContains", "maxContains"},
+    {"if", "then", "else"},
+)
+UNMERGEABLE = {"$id", "$anchor", "$dynamicAnchor", "$defs"}
+
+# Values substituted into every property to probe type, const, enum,
+# pattern and bound checks, alongside boundaries derived from each schema.
+PROBE_VALUES = [
+    None, True, False, 0, -1, 1, 1.5, 2.0, "", "x", [], [1], ["x"], {}, {"a": 1},
+]
+
+
+def _canonical(schema: Any) -> str:
+    return json.dumps(schema, sort_keys=True)
+
+
+def strip_annotations(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove documentation and annotation-only keywords."""
+    for keyword in STRIPPED_KEYWORDS:
+        schema.pop(keyword, None)
+    return schema
+
+
+def _conforms(value: Any, types_: Any) -> bool:
+    types_ = [types_] if isinstance(types_, str) else types_
+    checker = jsonschema.Draft202012Validator.TYPE_CHECKER
+    return all(isinstance(t, str) for t in types_) and any(checker.is_type(value, t) for t in types_)
+
+
+def simplify_constants(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a one-value enum into const and drop a type the const/enum already implies."""
+    if isinstance(schema.get("enum"), list) and len(schema["enum"]) == 1 and "const" not in schema:
+        schema["const"] = schema.pop("enum")[0]
+    if "type" in schema:
+        if "const" in schema:
+            values = [schema["const"]]
+        elif isinstance(schema.get("enum"), list):
+            values = schema["enum"]
+        else:
+            values = None
+        if values is not None and all(_conforms(value, schema["type"]) for value in values):
+            del schema["type"]
+    return schema
+
+
+def _reqcmd_branch(branch: Any, key: str, const: Any) -> bool:
+    """Return True if branch is `{required: [key], properties: {key: {const}}}` (or just the required)."""
+    if not isinstance(branch, dict) or branch.get("required") != [key]:
+        return False
+    if set(branch) == {"required"}:
+        return True
+    return set(branch) == {"required", "properties"} and branch["properties"] == {key: {"const": const}}
+
+
+def rewrite_req_cmd(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the req/cmd `oneOf` scaffold with an equivalent `anyOf` plus `not`.
+
+    The parent's `properties` already pin `req` and `cmd` to the API name, so
+    the `oneOf` only demands that exactly one of them is present: at least
+    one (`anyOf` of `required`, which stops at the first match) and not both.
+    """
+    one_of = schema.get("oneOf")
+    properties = schema.get("properties", {})
+    if not isinstance(one_of, list) or len(one_of) != 2 or "anyOf" in schema or "not" in schema:
+        return schema
+    req, cmd = properties.get("req", {}), properties.get("cmd", {})
+    if "const" not in req or req.get("const") != cmd.get("const"):
+        return schema
+    if _reqcmd_branch(one_of[0], "req", req["const"]) and _reqcmd_branch(one_of[1], "cmd", cmd["const"]):
+        del schema["oneOf"]
+        schema["anyOf"] = [{"required": ["req"]}, {"required": ["cmd"]}]
+        schema["not"] = {"required": ["req", "cmd"]}
+    return schema
+
+
+def _mergeable(parent: Dict[str, Any], entry: Dict[str, Any]) -> bool:
+    if set(parent) & set(entry) or set(entry) & UNMERGEABLE:
+        return False
+    return not any(set(parent) & group and set(entry) & group for group in ADJACENT_GROUPS)
+
+
+def flatten_allof(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Inline nested `allOf`s and merge entries into the parent where no keyword conflicts."""
+    if not isinstance(schema.get("allOf"), list):
+        return schema
+    entries = []
+    for entry in schema.pop("allOf"):
+        if isinstance(entry, dict) and set(entry) == {"allOf"} and isinstance(entry["allOf"], list):
+            entries += entry["allOf"]
+        else:
+            entries.append(entry)
+    remaining = []
+    for entry in entries:
+        if isinstance(entry, dict) and _mergeable(schema, entry):
+            schema.update(entry)
+        elif entry is not True and entry != {}:
+            remaining.append(entry)
+    if remaining:
+        schema["allOf"] = remaining
+    return schema
+
+
+def _prune_property(sub: Dict[str, Any], parent: Dict[str, Any]) -> Dict[str, Any]:
+    # A keyword repeating the parent's is dropped only if no sibling it depends on differs.
+    keep = {k for k, v in sub.items() if k not in parent or parent[k] != v}
+    for group in ADJACENT_GROUPS:
+        if keep & group:
+            keep |= group
+    return {k: v for k, v in sub.items() if k in keep}
+
+
+def _prune_branch(branch: Any, context: Dict[str, Any]) -> Any:
+    """Drop property constraints from branch that the parent's properties already apply."""
+    if not isinstance(branch, dict):
+        return branch
+    properties = branch.get("properties")
+    if isinstance(properties, dict):
+        for name in list(properties):
+            sub, parent = properties[name], context.get(name)
+            if not isinstance(sub, dict) or not isinstance(parent, dict):
+                continue
+            pruned = _prune_property(sub, parent)
+            if pruned:
+                properties[name] = pruned
+            else:
+                del properties[name]
+        if not properties:
+            del branch["properties"]
+    for keyword in ("then", "else"):
+        if keyword in branch:
+            branch[keyword] = _prune_branch(branch[keyword], context)
+    if isinstance(branch.get("allOf"), list):
+        branch["allOf"] = [_prune_branch(entry, context) for entry in branch["allOf"]]
+    return _drop_empty_conditional(branch)
+
+
+def _drop_empty_conditional(schema: Dict[str, Any]) -> Dict[str, Any]:
+    for keyword in ("then", "else"):
+        if schema.get(keyword) in ({}, True):
+            del schema[keyword]
+    if "if" in schema and "then" not in schema and "else" not in schema:
+        del schema["if"]
+    return schema
+
+
+def drop_redundant(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop constraints in `then`/`else`/`allOf` branches that repeat the parent's properties.
+
+    Those branches apply to the same instance as the parent, so a property
+    keyword with the same value in the parent's `properties` is already enforced.
+    """
+    context = schema.get("properties")
+    if not isinstance(context, dict):
+        return schema
+    for keyword in ("then", "else"):
+        if keyword in schema:
+            schema[keyword] = _prune_branch(schema[keyword], context)
+    if isinstance(schema.get("allOf"), list):
+        schema["allOf"] = [_prune_branch(entry, context) for entry in schema["allOf"]]
+    return _drop_empty_conditional(schema)
+
+
+def _unique(values: List[Any]) -> List[Any]:
+    seen, result = set(), []
+    for value in values:
+        key = _canonical(value)
+        if key not in seen:
+            seen.add(key)
+            result.append(value)
+    return result
+
+
+def dedupe(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop duplicate `allOf`/`anyOf` entries, enum values and required names."""
+    for keyword in ("allOf", "anyOf", "enum", "required"):
+        if isinstance(schema.get(keyword), list):
+            schema[keyword] = _unique(schema[keyword])
+    if schema.get("allOf") == []:
+        del schema["allOf"]
+    return schema
+
+
+def order_keywords(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Reorder keywords so the cheapest, most often rejecting ones are evaluated first."""
+    rank = {keyword: index for index, keyword in enumerate(KEYWORD_ORDER)}
+    return dict(sorted(schema.items(), key=lambda item: rank.get(item[0], len(rank))))
+
+
+PASSES: Tuple[Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]], ...] = (
+    ("strip", strip_annotations),
+    ("constants", simplify_constants),
+    ("reqcmd", rewrite_req_cmd),
+    ("flatten", flatten_allof),
+    ("redundant", drop_redundant),
+    ("dedupe", dedupe),
+    ("order", order_keywords),
+)
+
+
+def optimize_schema(schema: Dict[str, Any], passes=PASSES) -> Dict[str, Any]:
+    """Return an optimized copy of schema; the original is left untouched."""
+    result = copy.deepcopy(schema)
+    for _, fn in passes:
+        result = map_subschemas(result, fn)
+    return result
+
+
+def optimize_schemas(schemas: Dict[str, Dict[str, Any]], passes=PASSES) -> Dict[str, Dict[str, Any]]:
+    """Optimize every schema, keyed by filename."""
+    return {filename: optimize_schema(schema, passes) for filename, schema in schemas.items()}
+
+
+def boundary_values(schema: Dict[str, Any]) -> List[Any]:
+    """Collect const/enum values and each side of every numeric and size bound in schema."""
+    values = []
+
+    def collect(node: Dict[str, Any]) -> Dict[str, Any]:
+        if "const" in node:
+            values.append(node["const"])
+        if isinstance(node.get("enum"), list):
+            values.extend(node["enum"])
+        for keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+            bound = node.get(keyword)
+            if isinstance(bound, (int, float)) and not isinstance(bound, bool):
+                values.extend([bound - 1, bound, bound + 1, bound - 0.5, bound + 0.5])
+        for keyword in ("minLength", "maxLength"):
+            if isinstance(node.get(keyword), int):
+                values.extend("x" * max(0, node[keyword] + delta) for delta in (-1, 0, 1))
+        for keyword in ("minItems", "maxItems"):
+            if isinstance(node.get(keyword), int):
+                values.extend(["x"] * max(0, node[keyword] + delta) for delta in (-1, 0, 1))
+        return node
+
+    map_subschemas(schema, collect)
+    return _unique(values)
+
+
+def boundary_instances(filename: str, schema: Dict[str, Any]) -> Iterator[Any]:
+    """Yield the schema's samples, minimal instances, and single-property boundary mutations of each."""
+    bases = [json.loads(sample["json"]) for sample in schema.get("samples", []) if "json" in sample]
+    if ".req." in filename:
+        name = api_name_from_filename(filename)
+        bases += [{"req": name}, {"cmd": name}, {"req": name, "cmd": name}]
+    else:
+        bases.append({})
+    # Each property is probed with its own boundaries plus those of the
+    # conditionals and combinators around it.
+    properties = schema.get("properties", {})
+    shared = PROBE_VALUES + boundary_values({k: v for k, v in schema.items() if k != "properties"})
+    probes = {key: _unique(shared + boundary_values(properties.get(key, {}))) for key in list(properties) + ["extra"]}
+    for base in bases:
+        yield base
+        yield [base]
+        if not isinstance(base, dict):
+            continue
+        for key in list(base):
+            yield {k: v for k, v in base.items() if k != key}
+        for key, values in probes.items():
+            for value in values:
+                yield dict(base, **{key: copy.deepcopy(value)})
+
+
+def find_differences(schemas: Dict[str, Dict[str, Any]], optimized: Dict[str, Dict[str, Any]],
+                     limit: int = 20) -> Tuple[int, List[str]]:
+    """Compare accept/reject verdicts of both schema sets over the boundary corpus.
+
+    Returns the number of instances checked and a description of up to
+    `limit` instances whose verdicts differ.
+    """
+    registry, optimized_registry = build_registry(schemas), build_registry(optimized)
+    request_bases = []
+    for filename, schema in schemas.items():
+        if ".req." in filename:
+            request_bases += list(boundary_instances(filename, schema))[:1]
+            request_bases += [{"req": api_name_from_filename(filename), "extra": 1}]
+
+    checked, differences = 0, []
+    for filename, schema in schemas.items():
+        original = jsonschema.Draft202012Validator(schema, registry=registry)
+        rewritten = jsonschema.Draft202012Validator(optimized[filename], registry=optimized_registry)
+        if filename == API_SCHEMA_FILE:
+            corpus = request_bases + [{}, [], {"req": "card.nope"}, {"req": "card.attn", "cmd": "hub.set"}]
+        else:
+            corpus = boundary_instances(filename, schema)
+        for instance in corpus:
+            checked += 1
+            expected = original.is_valid(instance)
+            if rewritten.is_valid(instance) != expected and len(differences) < limit:
+                verdict = "accepted" if expected else "rejected"
+                differences.append(f"{filename}: original {verdict} {json.dumps(instance)}")
+    return checked, differences
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Emit semantically equivalent, cheaper variants of the Notecard API schemas",
+        epilog="Example: python scripts/optimize_schemas.py --check -o build/optimized"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("-o", "--output", default=os.path.join(get_project_root(), "build", "optimized"),
+                        help="Directory for the optimized schemas. Defaults to build/optimized.")
+    parser.add_argument("--check", action="store_true",
+                        help="Prove accept/reject equivalence over samples and generated boundary instances.")
+
+    args = parser.parse_args()
+
+    schemas = load_schema_files(args.schema_dir)
+    optimized = optimize_schemas(schemas)
+
+    if args.check:
+        checked, differences = find_differences(schemas, optimized)
+        if differences:
+            print(f"✗ Optimized schemas disagree with the originals:")
+            for difference in differences:
+                print(f"  {difference}")
+            sys.exit(1)
+        print(f"✓ {checked} instances accepted/rejected identically")
+
+    os.makedirs(args.output, exist_ok=True)
+    before = after = 0
+    for filename, schema in optimized.items():
+        before += len(json.dumps(schemas[filename], separators=(",", ":")))
+        text = json.dumps(schema, separators=(",", ":"))
+        after += len(text)
+        with open(os.path.join(args.output, filename), 'w') as f:
+            f.write(text + "\n")
+    print(f"✓ Wrote {len(optimized)} optimized schemas to {args.output} ({before:,} -> {after:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+In-process cache of parsed schema files, invalidated by file mtime and size.
+
+Every read stats the file and reparses it only when its modification time or
+size has changed since it was cached, so a long-lived process (such as the
+`nschema` daemon) parses each schema once and a one-shot script pays one
+`stat` per file over a plain `json.load`.
+
+Cached schemas are shared between callers and must not be modified; copy a
+schema before changing it.
+
+Usage: python scripts/schema_cache.py [--schema-dir DIR]
+Example: python scripts/schema_cache.py --schema-dir .
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, Optional, Tuple
+
+from notecard_validator import API_SCHEMA_FILE, SCHEMA_SUFFIX, get_project_root
+
+
+class SchemaCache:
+    """Parsed JSON files keyed by path, reloaded when their mtime or size changes."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        # Incremented whenever a cached file is (re)loaded or dropped.
+        self.generation = 0
+
+    def load(self, path: str) -> Any:
+        """Return the parsed contents of a JSON file, reparsing it only if it changed."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        with open(path, 'r') as f:
+            contents = json.load(f)
+        self._entries[path] = (key, contents)
+        self.misses += 1
+        self.generation += 1
+        return contents
+
+    def load_dir(self, schema_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Load notecard.api.json and every per-API schema in schema_dir, keyed by filename.
+
+        Returns the same schemas as notecard_validator.load_schema_files().
+        """
+        schema_dir = os.path.abspath(schema_dir or get_project_root())
+        names = sorted(os.listdir(schema_dir))
+        schemas = {API_SCHEMA_FILE: self.load(os.path.join(schema_dir, API_SCHEMA_FILE))}
+        for kind in ("req", "rsp"):
+            for name in names:
+                if name.endswith(f".{kind}{SCHEMA_SUFFIX}"):
+                    schemas[name] = self.load(os.path.join(schema_dir, name))
+        self._forget_missing(schema_dir, names)
+        return schemas
+
+    def _forget_missing(self, schema_dir: str, names) -> None:
+        present = set(names)
+        for path in [path for path in self._entries if os.path.dirname(path) == schema_dir]:
+            if os.path.basename(path) not in present:
+                del self._entries[path]
+                self.generation += 1
+
+    def clear(self) -> None:
+        """Drop every cached file."""
+        self._entries.clear()
+        self.generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of cached files, hits and misses."""
+        return {"files": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by the scripts that read schemas through load_json().
+_cache = SchemaCache()
+
+
+def load_json(path: str) -> Any:
+    """Return the parsed contents of a JSON file from the process-wide cache."""
+    return _cache.load(path)
+
+
+def load_schemas(schema_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return every schema in schema_dir from the process-wide cache."""
+    return _cache.load_dir(schema_dir)
+
+
+def shared_cache() -> SchemaCache:
+    """Return the process-wide cache."""
+    return _cache
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Time loading the schemas cold and from the mtime/size cache",
+        epilog="Example: python scripts/schema_cache.py --schema-dir ."
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    cache = SchemaCache()
+    try:
+        start = time.perf_counter()
+        schemas = cache.load_dir(args.schema_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        cache.load_dir(args.schema_dir)
+        warm = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"✓ {len(schemas)} schemas: {cold * 1000:.1f} ms cold, {warm * 1000:.1f} ms cached")
+
+
+if __name__ == "__main__":
+    main()
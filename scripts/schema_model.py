@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Precomputed introspection model of the schemas, shared by the doc generators.
+
+The facts the documentation generators need from a `.req`/`.rsp` schema are
+derived here once: the `req`/`cmd` name, the properties with their allowed
+values (from `sub-descriptions`, `enum`, or the tokens of a comma-separated
+list `pattern`), the top-level `required` list, `skus`, the samples parsed and
+pretty-printed, and the annotations in one shape. scripts/generate_docs.py
+(and through docs/index.md the mkdocs site and its llms.txt) and
+scripts/generate_mdx_from_schema.py render from these models rather than from
+the raw schemas.
+
+Models are cached in one JSON file (build/schema-model.json under the schema
+directory by default), keyed by each schema's absolute path, so one cache
+can serve several schema directories, and checked against the SHA-256 of
+the schema's bytes and a
+fingerprint of this module and scripts/mode_parser.py. A cached model is
+reused without parsing its schema; a changed schema, or changed model code,
+rebuilds it. shared_cache() keeps each cache in memory for the life of the
+process and skips hashing schemas whose mtime and size are unchanged, so a
+long-lived process (such as the `nschema` daemon) reads the cache file once
+and then pays one `stat` per schema.
+
+Usage: python scripts/schema_model.py [--schema-dir DIR] [--cache PATH] [--show API]
+Example: python scripts/schema_model.py --show card.attn
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+
+import mode_parser
+from mode_parser import list_tokens
+from notecard_validator import SCHEMA_SUFFIX, api_name_from_filename, get_project_root
+
+
+MODEL_CACHE_FILE = os.path.join("build", "schema-model.json")
+
+# Property keywords copied into the model as-is, when the schema sets them.
+PROPERTY_KEYWORDS = ("type", "description", "default", "format", "const")
+
+
+@functools.lru_cache(maxsize=None)
+def model_fingerprint() -> str:
+    """Hash the code that builds the models, so that changing it invalidates cached models."""
+    digest = hashlib.sha256()
+    for path in (os.path.abspath(__file__), os.path.abspath(mode_parser.__file__)):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _properties(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # Prefer the root properties, falling back to the first allOf branch that has some.
+    if 'properties' in schema:
+        return schema['properties']
+    for item in schema.get('allOf', []) if isinstance(schema.get('allOf'), list) else []:
+        if isinstance(item, dict) and 'properties' in item:
+            return item['properties']
+    return None
+
+
+def _property(name: str, details: Any) -> Dict[str, Any]:
+    if not isinstance(details, dict):
+        return {"name": name, "invalid": True}
+    model = {"name": name}
+    for keyword in PROPERTY_KEYWORDS:
+        if keyword in details:
+            model[keyword] = details[keyword]
+    if isinstance(details.get('sub-descriptions'), list):
+        model["sub_descriptions"] = [
+            {key: sub[key] for key in ('const', 'description', 'skus')
+             if key in sub and (key != 'skus' or isinstance(sub[key], list))}
+            for sub in details['sub-descriptions']
+            if isinstance(sub, dict) and 'const' in sub and 'description' in sub]
+    if isinstance(details.get('enum'), list):
+        model["enum"] = details['enum']
+    if isinstance(details.get('pattern'), str):
+        tokens = list_tokens(details['pattern'])
+        if tokens:
+            model["tokens"] = sorted(tokens)
+    return model
+
+
+def _sample(sample: Dict[str, Any]) -> Dict[str, Any]:
+    model = {"description": sample.get('description'), "json": sample['json'], "data": None, "pretty": None}
+    try:
+        model["data"] = json.loads(sample['json'])
+        model["pretty"] = json.dumps(model["data"], indent=2)
+    except json.JSONDecodeError:
+        pass
+    return model
+
+
+def _annotations(annotations: Any) -> List[Dict[str, str]]:
+    # Schemas write annotations either as [{title, description}] or as {kind: [text]}.
+    if isinstance(annotations, list):
+        return [{"kind": item.get('title', 'note'), "text": item['description']}
+                for item in annotations if isinstance(item, dict) and 'description' in item]
+    if isinstance(annotations, dict):
+        return [{"kind": kind, "text": text}
+                for kind, texts in annotations.items() if isinstance(texts, list) for text in texts]
+    return []
+
+
+def build_model(filename: str, schema: Dict[str, Any], digest: Optional[str] = None) -> Dict[str, Any]:
+    """Build the introspection model of one parsed schema.
+
+    properties and samples are None when the schema defines none. Each
+    property carries the keywords in PROPERTY_KEYWORDS it sets, plus
+    `sub_descriptions`, `enum` and sorted pattern `tokens` where they apply.
+    Samples without a `json` string are dropped; `pretty` is None for samples
+    that are not JSON.
+    """
+    properties = _properties(schema)
+    name = None
+    if isinstance(properties, dict):
+        for key in ('req', 'cmd'):
+            if isinstance(properties.get(key), dict) and 'const' in properties[key]:
+                name = properties[key]['const']
+                break
+    return {
+        "file": filename,
+        "api": api_name_from_filename(filename),
+        "kind": "rsp" if f".rsp{SCHEMA_SUFFIX}" in filename else "req",
+        "hash": digest,
+        "name": name,
+        "title": schema.get('title'),
+        "description": schema.get('description'),
+        "properties": ([_property(key, details) for key, details in properties.items()]
+                       if isinstance(properties, dict) else None),
+        "required": schema.get('required') if isinstance(schema.get('required'), list) else [],
+        "skus": schema.get('skus') if isinstance(schema.get('skus'), list) else None,
+        "samples": ([_sample(sample) for sample in schema['samples']
+                     if isinstance(sample, dict) and isinstance(sample.get('json'), str)]
+                    if isinstance(schema.get('samples'), list) else None),
+        "annotations": _annotations(schema.get('annotations')),
+    }
+
+
+class ModelCache:
+    """Schema models stored in one JSON file, reused while their schema hashes the same."""
+
+    def __init__(self, path: str, fingerprint: Optional[str] = None):
+        self.path = path
+        self.fingerprint = fingerprint or model_fingerprint()
+        self.built = 0
+        self.reused = 0
+        # Models keyed by the absolute path of their schema.
+        self._models: Dict[str, Dict[str, Any]] = {}
+        # (mtime_ns, size) of each schema path when its model was last checked against its bytes.
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._dirty = False
+        try:
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            if stored.get("fingerprint") == self.fingerprint and isinstance(stored.get("models"), dict):
+                self._models = stored["models"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def model(self, path: str) -> Dict[str, Any]:
+        """Return the model of the schema at path, building it only if the schema's bytes changed.
+
+        A schema whose mtime and size are unchanged since it was last checked
+        is not read again. Raises FileNotFoundError for a missing schema and
+        json.JSONDecodeError for an unparsable one.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        model = self._models.get(path)
+        if model is not None and self._stats.get(path) == key:
+            self.reused += 1
+            return model
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if model is None or model.get("hash") != digest:
+            model = build_model(os.path.basename(path), json.loads(data), digest)
+            self._models[path] = model
+            self._dirty = True
+            self.built += 1
+        else:
+            self.reused += 1
+        self._stats[path] = key
+        return model
+
+    def load_dir(self, schema_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Return the model of every `.req`/`.rsp` schema in schema_dir, keyed by filename.
+
+        Models of schemas no longer in schema_dir are dropped from the cache.
+        """
+        schema_dir = os.path.abspath(schema_dir or get_project_root())
+        models = {}
+        for kind in ("req", "rsp"):
+            for name in sorted(os.listdir(schema_dir)):
+                if name.endswith(f".{kind}{SCHEMA_SUFFIX}"):
+                    models[name] = self.model(os.path.join(schema_dir, name))
+        for path in [path for path in self._models if os.path.dirname(path) == schema_dir]:
+            if os.path.basename(path) not in models:
+                del self._models[path]
+                self._dirty = True
+        return models
+
+    def save(self) -> bool:
+        """Write the cache file if any model changed. Returns True if written."""
+        if not self._dirty:
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump({"fingerprint": self.fingerprint, "models": self._models}, f, indent=1)
+        os.replace(temporary, self.path)
+        self._dirty = False
+        return True
+
+
+# Model caches of this process, keyed by the absolute path of their cache file.
+_caches: Dict[str, ModelCache] = {}
+
+
+def default_cache_path(schema_dir: Optional[str] = None) -> str:
+    """Return the model cache file of a schema directory."""
+    return os.path.join(schema_dir or get_project_root(), MODEL_CACHE_FILE)
+
+
+def shared_cache(path: str) -> ModelCache:
+    """Return the process-wide model cache stored at path, reading the cache file on first use only."""
+    path = os.path.abspath(path)
+    if path not in _caches:
+        _caches[path] = ModelCache(path)
+    return _caches[path]
+
+
+def load_models(schema_dir: Optional[str] = None, cache_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Return the model of every schema in schema_dir, updating the cache file."""
+    cache = shared_cache(cache_path or default_cache_path(schema_dir))
+    models = cache.load_dir(schema_dir)
+    cache.save()
+    return models
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Build or refresh the cached introspection model of the schemas",
+        epilog="Example: python scripts/schema_model.py --show card.attn"
+    )
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("--cache", default=None, help="Model cache file. Defaults to build/schema-model.json in the schema directory.")
+    parser.add_argument("--show", metavar="API", help="Print the request and response models of an API (e.g. 'card.attn').")
+
+    args = parser.parse_args()
+
+    cache = ModelCache(args.cache or default_cache_path(args.schema_dir))
+    try:
+        start = time.perf_counter()
+        models = cache.load_dir(args.schema_dir)
+        cache.save()
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.show:
+        shown = [model for model in models.values() if model["api"] == args.show]
+        if not shown:
+            print(f"✗ Unknown API '{args.show}'")
+            sys.exit(1)
+        print(json.dumps(shown, indent=4))
+        return
+    print(f"✓ {len(models)} schema models: {cache.built} built, {cache.reused} reused ({elapsed * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 import json
-import os
 import argparse
 import re
 from pathlib import Path
 
+from schema_cache import load_json
+
 def is_valid_semver(version_str):
     """Checks if a string is a valid semantic version (X.Y.Z)."""
     return re.match(r"^\d+\.\d+\.\d+$", version_str) is not None
@@ -27,37 +28,31 @@ def main():
     for filepath in schema_dir.glob(args.pattern):
         if filepath.is_file() and filepath.parent.name != "scripts":
             try:
-                with open(filepath, "r+") as f:
-                    try:
-                        data = json.load(f)
-                    except json.JSONDecodeError:
-                        print(f"Skipping invalid JSON: {filepath}")
+                # Read through the mtime/size cache, so that files already at the
+                # target version are skipped without being reparsed by a warm process.
+                try:
+                    data = load_json(str(filepath))
+                except json.JSONDecodeError:
+                    print(f"Skipping invalid JSON: {filepath}")
+                    continue
+
+                if isinstance(data, dict) and args.property in data:
+                    current_version = data[args.property]
+                    if current_version == args.target_version:
+                        print(f"Skipping {filepath}: Property '{args.property}' is already '{args.target_version}'.")
                         continue
 
-                    if args.property in data:
-                        current_version = data[args.property]
-                        if current_version == args.target_version:
-                            print(f"Skipping {filepath}: Property '{args.property}' is already '{args.target_version}'.")
-                            continue
-
-                        new_version = args.target_version
-                        data[args.property] = new_version
+                    new_version = args.target_version
+                    # Cached schemas are shared, so update a copy.
+                    data = dict(data, **{args.property: new_version})
 
-                        f.seek(0)
+                    with open(filepath, "w") as f:
                         json.dump(data, f, indent=4)
-                        f.truncate()
                         # Ensure trailing newline
-                        f.seek(0, os.SEEK_END)
-                        if f.tell() > 0:
-                            f.seek(f.tell() - 1)
-                            last_char = f.read(1)
-                            if last_char != '\n':
-                                f.write('\n')
+                        f.write('\n')
 
-                        print(f"Updated {args.property} in {filepath} from '{current_version}' to '{new_version}'")
-                        updated_files += 1
-                    else:
-                        pass
+                    print(f"Updated {args.property} in {filepath} from '{current_version}' to '{new_version}'")
+                    updated_files += 1
 
             except Exception as e:
                 print(f"Error processing file {filepath}: {e}")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Batch validator for newline-delimited JSON transcripts of Notecard traffic.
+
+The input is streamed in chunks of lines that are validated across a process
+pool, with a bounded number of chunks in flight so memory stays flat
+regardless of input size. Each worker builds its validators once.
+
+Lines are interpreted according to --mode:
+  requests   each line is a request, validated against notecard.api.json
+  responses  each line is a response to the API given by --api
+  pairs      each line is {"request": {...}, "response": {...}}, and the
+             response is validated against the request's paired .rsp schema
+
+The optional verdict file has one tab-separated line per input line:
+  <line number> <ok|invalid|unparseable> <api or -> <message>
+
+Usage: python scripts/validate_jsonl.py [options] <input.jsonl>
+Example: python scripts/validate_jsonl.py traffic.jsonl --verdicts verdicts.tsv --workers 8
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jsonschema.exceptions import best_match
+
+from notecard_validator import NotecardValidator, load_schema_files
+
+
+MODES = ("requests", "responses", "pairs")
+ENGINES = ("compiled", "jsonschema")
+UNKNOWN_API = "-"
+
+# Per-process validation engine, built once by _init_worker().
+_engine = None
+
+
+class _JsonschemaEngine:
+    """Validates through NotecardValidator (interpretive jsonschema)."""
+
+    def __init__(self, schema_dir: Optional[str]):
+        self.validator = NotecardValidator.from_directory(schema_dir)
+
+    def request_name(self, instance: Any) -> Optional[str]:
+        return self.validator.request_name(instance)
+
+    def check_request(self, instance: Any) -> Optional[str]:
+        error = best_match(self.validator.iter_request_errors(instance))
+        return None if error is None else error.message
+
+    def check_response(self, api_name: str, instance: Any) -> Optional[str]:
+        error = best_match(self.validator.iter_response_errors(api_name, instance))
+        return None if error is None else error.message
+
+
+class _CompiledEngine:
+    """Validates through the generated code of scripts/compile_validators.py."""
+
+    def __init__(self, schema_dir: Optional[str]):
+        from compile_validators import load_compiled_module
+        self.module = load_compiled_module(load_schema_files(schema_dir))
+
+    def request_name(self, instance: Any) -> Optional[str]:
+        return self.module.request_name(instance)
+
+    def check_request(self, instance: Any) -> Optional[str]:
+        return self.module.validate_request(instance)
+
+    def check_response(self, api_name: str, instance: Any) -> Optional[str]:
+        if api_name not in self.module.RESPONSES:
+            raise KeyError(f"No response schema for '{api_name}'")
+        return self.module.RESPONSES[api_name](instance)
+
+
+def create_engine(engine: str, schema_dir: Optional[str] = None):
+    """Create a validation engine by name ('compiled' or 'jsonschema')."""
+    if engine == "compiled":
+        return _CompiledEngine(schema_dir)
+    if engine == "jsonschema":
+        return _JsonschemaEngine(schema_dir)
+    raise ValueError(f"Unknown engine '{engine}'")
+
+
+def _init_worker(engine: str, schema_dir: Optional[str]) -> None:
+    global _engine
+    _engine = create_engine(engine, schema_dir)
+
+
+def _verdict(engine, instance: Any, mode: str, api: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Return (api name, error message or None) for one parsed line."""
+    if mode == "requests":
+        return engine.request_name(instance) or UNKNOWN_API, engine.check_request(instance)
+    if mode == "responses":
+        return api, engine.check_response(api, instance)
+
+    if not isinstance(instance, dict) or "request" not in instance or "response" not in instance:
+        return UNKNOWN_API, "line must be an object with 'request' and 'response' members"
+    name = engine.request_name(instance["request"])
+    error = engine.check_request(instance["request"])
+    if error is not None:
+        return name or UNKNOWN_API, f"request: {error}"
+    try:
+        error = engine.check_response(name, instance["response"])
+    except KeyError as e:
+        return name, f"response: {e.args[0]}"
+    return name, None if error is None else f"response: {error}"
+
+
+def validate_chunk(first_line: int, lines: List[bytes], mode: str = "requests",
+                   api: Optional[str] = None, engine=None) -> Tuple[str, Dict[str, List[int]]]:
+    """Validate a chunk of raw lines.
+
+    Returns the chunk's verdict text and per-API counts of
+    [valid, invalid, unparseable] lines.
+    """
+    engine = engine or _engine
+    out = []
+    counts: Dict[str, List[int]] = {}
+    for line_no, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            instance = json.loads(line)
+        except ValueError as e:
+            counts.setdefault(UNKNOWN_API, [0, 0, 0])[2] += 1
+            out.append(f"{line_no}\tunparseable\t{UNKNOWN_API}\t{e}\n")
+            continue
+        name, error = _verdict(engine, instance, mode, api)
+        tally = counts.setdefault(name, [0, 0, 0])
+        if error is None:
+            tally[0] += 1
+            out.append(f"{line_no}\tok\t{name}\t\n")
+        else:
+            tally[1] += 1
+            out.append(f"{line_no}\tinvalid\t{name}\t{' '.join(error.split())}\n")
+    return "".join(out), counts
+
+
+def iter_chunks(path: str, chunk_lines: int) -> Iterator[Tuple[int, List[bytes]]]:
+    """Stream (first line number, lines) chunks from a file, or stdin for '-'."""
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        chunk: List[bytes] = []
+        first = 1
+        for line_no, line in enumerate(f, 1):
+            chunk.append(line)
+            if len(chunk) >= chunk_lines:
+                yield first, chunk
+                chunk, first = [], line_no + 1
+        if chunk:
+            yield first, chunk
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+def _merge(total: Dict[str, List[int]], counts: Dict[str, List[int]]) -> None:
+    for name, tally in counts.items():
+        acc = total.setdefault(name, [0, 0, 0])
+        for i, n in enumerate(tally):
+            acc[i] += n
+
+
+def validate_file(path: str, verdicts_path: Optional[str] = None, mode: str = "requests",
+                  api: Optional[str] = None, workers: Optional[int] = None, chunk_lines: int = 5000,
+                  engine: str = "compiled", schema_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Validate a JSONL file and return a summary.
+
+    With workers=1 validation runs in-process; otherwise chunks are spread
+    over a process pool with at most 2 * workers chunks in flight.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}'")
+    if mode == "responses" and not api:
+        raise ValueError("mode 'responses' requires an API name")
+    workers = workers or os.cpu_count() or 1
+
+    totals: Dict[str, List[int]] = {}
+    lines = 0
+    out = open(verdicts_path, "w") if verdicts_path else None
+    start = time.perf_counter()
+    try:
+        def consume(result: Tuple[str, Dict[str, List[int]]]) -> None:
+            text, counts = result
+            if out:
+                out.write(text)
+            _merge(totals, counts)
+
+        if workers == 1:
+            local = create_engine(engine, schema_dir)
+            for first, chunk in iter_chunks(path, chunk_lines):
+                lines += len(chunk)
+                consume(validate_chunk(first, chunk, mode, api, local))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(engine, schema_dir)) as pool:
+                pending = deque()
+                for first, chunk in iter_chunks(path, chunk_lines):
+                    lines += len(chunk)
+                    pending.append(pool.submit(validate_chunk, first, chunk, mode, api))
+                    # Results are consumed in order; bounding the queue bounds memory.
+                    while len(pending) >= 2 * workers:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    valid = sum(t[0] for t in totals.values())
+    invalid = sum(t[1] for t in totals.values())
+    unparseable = sum(t[2] for t in totals.values())
+    return {
+        "lines": lines,
+        "valid": valid,
+        "invalid": invalid,
+        "unparseable": unparseable,
+        "seconds": round(elapsed, 3),
+        "lines_per_second": round(lines / elapsed) if elapsed > 0 else None,
+        "apis": {name: {"valid": t[0], "invalid": t[1], "unparseable": t[2]} for name, t in sorted(totals.items())},
+    }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Validate a JSONL transcript of Notecard requests/responses across a process pool",
+        epilog="Example: python scripts/validate_jsonl.py traffic.jsonl --verdicts verdicts.tsv"
+    )
+    parser.add_argument("input", help="JSONL file to validate ('-' for stdin).")
+    parser.add_argument("--mode", choices=MODES, default="requests", help="How to interpret each line. Defaults to 'requests'.")
+    parser.add_argument("--api", help="API name for --mode responses (e.g. 'card.version').")
+    parser.add_argument("--verdicts", help="Write per-line verdicts (TSV) to this file.")
+    parser.add_argument("--summary", help="Write the JSON summary to this file as well as stdout.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes. Defaults to the CPU count; 1 runs in-process.")
+    parser.add_argument("--chunk-lines", type=int, default=5000, help="Lines per chunk handed to a worker. Defaults to 5000.")
+    parser.add_argument("--engine", choices=ENGINES, default="compiled", help="Validation engine. Defaults to 'compiled'.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+
+    args = parser.parse_args()
+
+    try:
+        summary = validate_file(args.input, args.verdicts, args.mode, args.api, args.workers,
+                                args.chunk_lines, args.engine, args.schema_dir)
+    except (ValueError, KeyError, IOError) as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    text = json.dumps(summary, indent=4)
+    print(text)
+    if args.summary:
+        with open(args.summary, "w") as f:
+            f.write(text + "\n")
+    print(f"\n{summary['lines']} lines in {summary['seconds']}s ({summary['lines_per_second']} lines/s)", file=sys.stderr)
+    if summary["invalid"] or summary["unparseable"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
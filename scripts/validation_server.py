@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Asyncio validation sidecar served over a Unix domain socket.
+
+The schemas are loaded once at startup. Clients write newline-framed JSON
+messages and read one compact newline-framed verdict per message, in order:
+
+  {"req": "card.attn", ...}                           a bare request
+  {"id": 1, "request": {...}}                         a request, with an id echoed back
+  {"id": 2, "api": "card.version", "response": {...}} a response to the named API
+  {"stats": true}                                     per-API counts and latency percentiles
+
+  {"id": 1, "ok": true, "api": "card.attn"}
+  {"id": 2, "ok": false, "api": "card.version", "error": "..."}
+
+Messages from all connections share one bounded queue that a single task
+drains, validating everything that has arrived since the last event-loop
+tick as one batch. When the queue is full, connections stop reading from
+their sockets, pushing backpressure onto the clients.
+
+Usage: python scripts/validation_server.py [--socket PATH] [options]
+Example: python scripts/validation_server.py --socket /tmp/notecard-validate.sock
+"""
+
+import os
+import json
+import time
+import asyncio
+import argparse
+from collections import deque
+from typing import Any, Dict, Optional
+
+from validate_jsonl import ENGINES, create_engine
+
+
+DEFAULT_SOCKET = "/tmp/notecard-validate.sock"
+COMPACT = (",", ":")
+
+# Queued in place of a message to answer with stats once everything queued
+# before it has been validated.
+_STATS = object()
+
+
+def percentiles(samples, points=(50, 90, 99)) -> Dict[str, float]:
+    """Return nearest-rank percentiles (and the maximum) of samples, in microseconds."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    result = {}
+    for point in points:
+        index = max(0, min(len(ordered) - 1, -(-point * len(ordered) // 100) - 1))
+        result[f"p{point}"] = round(ordered[index] * 1e6, 1)
+    result["max"] = round(ordered[-1] * 1e6, 1)
+    return result
+
+
+async def _offer(queue: asyncio.Queue, item: Any, consumer: asyncio.Task) -> bool:
+    """Put item on queue, waiting for room only while consumer is running. Returns False if it stopped."""
+    try:
+        queue.put_nowait(item)
+        return True
+    except asyncio.QueueFull:
+        pass
+    put = asyncio.ensure_future(queue.put(item))
+    await asyncio.wait((put, consumer), return_when=asyncio.FIRST_COMPLETED)
+    if put.done():
+        return True
+    put.cancel()
+    return False
+
+
+class ValidationServer:
+    """Validates newline-framed JSON messages from Unix socket clients in batches."""
+
+    def __init__(self, engine: str = "compiled", schema_dir: Optional[str] = None, queue_size: int = 1024,
+                 batch_size: int = 256, latency_window: int = 10000, max_line: int = 1 << 20):
+        self.engine = create_engine(engine, schema_dir)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.latency_window = latency_window
+        self.max_line = max_line
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._apis: Dict[str, Dict[str, Any]] = {}
+        self._batches = 0
+        self._messages = 0
+        self._started = time.monotonic()
+
+    async def start(self, path: str) -> None:
+        """Start listening on the Unix socket at path."""
+        if os.path.exists(path):
+            os.unlink(path)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker = asyncio.create_task(self._validate_batches())
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=path, limit=self.max_line)
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and stop the validation task."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    def _check(self, message: Any) -> Dict[str, Any]:
+        """Validate one message and return its verdict."""
+        verdict: Dict[str, Any] = {}
+        if isinstance(message, dict) and "id" in message:
+            verdict["id"] = message["id"]
+        try:
+            if isinstance(message, dict) and "response" in message:
+                api = message.get("api")
+                if not isinstance(api, str):
+                    raise KeyError("'api' must be a string naming the API of the response")
+                verdict["api"] = api
+                error = self.engine.check_response(api, message["response"])
+            else:
+                request = message["request"] if isinstance(message, dict) and "request" in message else message
+                verdict["api"] = self.engine.request_name(request)
+                error = self.engine.check_request(request)
+        except KeyError as e:
+            error = e.args[0]
+        except Exception as e:
+            # A message the engine cannot handle gets an error verdict rather
+            # than stopping the batch task, which every client depends on.
+            error = f"cannot validate message: {e}"
+        verdict["ok"] = error is None
+        if error is not None:
+            verdict["error"] = error
+        return verdict
+
+    def _record(self, verdict: Dict[str, Any], latency: float) -> None:
+        api = verdict.get("api") or "-"
+        entry = self._apis.get(api)
+        if entry is None:
+            entry = self._apis[api] = {"valid": 0, "invalid": 0, "latency": deque(maxlen=self.latency_window)}
+        entry["valid" if verdict["ok"] else "invalid"] += 1
+        entry["latency"].append(latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return message/batch counts and per-API latency percentiles (microseconds)."""
+        return {
+            "uptime": round(time.monotonic() - self._started, 3),
+            "messages": self._messages,
+            "batches": self._batches,
+            "mean_batch": round(self._messages / self._batches, 2) if self._batches else 0,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "apis": {
+                api: {"valid": entry["valid"], "invalid": entry["invalid"], "latency_us": percentiles(entry["latency"])}
+                for api, entry in sorted(self._apis.items())
+            },
+        }
+
+    async def _validate_batches(self) -> None:
+        """Drain the shared queue, validating everything available per tick as one batch."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._batches += 1
+            for message, received, future in batch:
+                if message is _STATS:
+                    result = self.stats()
+                else:
+                    result = self._check(message)
+                    self._record(result, time.perf_counter() - received)
+                    self._messages += 1
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        # Verdict futures in arrival order, bounded so a slow reader of
+        # verdicts also stops us reading more messages.
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        writer_task = asyncio.create_task(self._write_verdicts(pending, writer))
+        try:
+            # Once the writer stops (the client stopped reading verdicts), so does reading.
+            while not writer_task.done():
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line longer than max_line; the stream cannot be resynchronized.
+                    future = loop.create_future()
+                    future.set_result({"ok": False, "error": f"message exceeds {self.max_line} bytes"})
+                    await _offer(pending, future, writer_task)
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                received = time.perf_counter()
+                future = loop.create_future()
+                try:
+                    message = json.loads(line)
+                except ValueError as e:
+                    future.set_result({"ok": False, "error": f"unparseable: {e}"})
+                else:
+                    if message == {"stats": True} and message["stats"] is True:
+                        message = _STATS
+                    await self._queue.put((message, received, future))
+                if not await _offer(pending, future, writer_task):
+                    break
+            await _offer(pending, None, writer_task)
+            await writer_task
+        finally:
+            writer_task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _write_verdicts(self, pending: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            verdict = await future
+            writer.write(json.dumps(verdict, separators=COMPACT).encode() + b"\n")
+            if pending.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+
+
+async def _serve(args) -> None:
+    server = ValidationServer(args.engine, args.schema_dir, args.queue_size, args.batch_size)
+    await server.start(args.socket)
+    print(f"✓ Validating on {args.socket} ({args.engine} engine)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Serve Notecard request/response validation over a Unix domain socket",
+        epilog=f"Example: python scripts/validation_server.py --socket {DEFAULT_SOCKET}"
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Unix socket path. Defaults to {DEFAULT_SOCKET}.")
+    parser.add_argument("--engine", choices=ENGINES, default="compiled", help="Validation engine. Defaults to 'compiled'.")
+    parser.add_argument("--schema-dir", default=None, help="Directory containing the schema files. Defaults to the project root.")
+    parser.add_argument("--queue-size", type=int, default=1024, help="Maximum queued messages before backpressure. Defaults to 1024.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Maximum messages validated per batch. Defaults to 256.")
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
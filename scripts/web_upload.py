@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Plan a large web.post or web.put body as a sequence of payload fragments.
+
+Notehub reassembles a binary body sent as several requests, each carrying a
+base64 `payload` fragment with its byte `offset` into the body, the body's
+`total` size and the fragment's MD5 `status`. The planner reads the body
+from a byte string or a binary file a fragment at a time and yields one
+schema-valid request per fragment, so the whole body, or its base64
+encoding, is never held in memory.
+
+Fragments are sized so that every request line, JSON framing included,
+fits in a target frame size. upload_stats() reports the round trips and
+bytes on the wire a body of a given size will cost, without encoding it.
+
+Usage: python scripts/web_upload.py [--size MB | --file PATH] [--frame BYTES] [--api web.post|web.put] [-o OUTPUT]
+Example: python scripts/web_upload.py --file firmware.bin --frame 8192 --route upload --name /images
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import binascii
+import argparse
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+
+APIS = ("web.post", "web.put")
+DEFAULT_FRAME = 8192
+COMPACT = (",", ":")
+TERMINATOR = b"\n"
+# Placeholder MD5 used when measuring a request's size.
+_STATUS = "0" * 32
+
+
+def encode_request(request: Dict[str, Any]) -> bytes:
+    """Encode a request as one compact, newline-terminated line."""
+    return json.dumps(request, separators=COMPACT).encode() + TERMINATOR
+
+
+def base64_length(size: int) -> int:
+    """Return the length of the base64 encoding of `size` bytes."""
+    return (size + 2) // 3 * 4
+
+
+def _template(api: str, total: int, route: Optional[str], name: Optional[str], extra: Dict[str, Any]) -> Dict[str, Any]:
+    if api not in APIS:
+        raise ValueError(f"api must be one of {', '.join(APIS)}")
+    if "body" in extra:
+        raise ValueError("a payload upload cannot also have a body")
+    request = {"req": api}
+    if route is not None:
+        request["route"] = route
+    if name is not None:
+        request["name"] = name
+    request.update(extra)
+    request["total"] = total
+    return request
+
+
+def _fragment_request(template: Dict[str, Any], offset: int, payload: str, status: Optional[str]) -> Dict[str, Any]:
+    request = dict(template)
+    request["offset"] = offset
+    request["payload"] = payload
+    if status is not None:
+        request["status"] = status
+    return request
+
+
+def fragment_size(frame_size: int, api: str = "web.post", total: int = 0, route: Optional[str] = None,
+                  name: Optional[str] = None, verify: bool = True, **extra) -> int:
+    """Return the most body bytes per fragment whose request line fits in frame_size."""
+    template = _template(api, total, route, name, extra)
+    # The largest offset a fragment can have is below total.
+    overhead = len(encode_request(_fragment_request(template, max(total - 1, 0), "", _STATUS if verify else None)))
+    size = (frame_size - overhead) // 4 * 3
+    if size <= 0:
+        raise ValueError(f"a {frame_size}-byte frame cannot hold a fragment after {overhead} bytes of framing")
+    return size
+
+
+def plan_upload(source: Union[bytes, bytearray, memoryview, BinaryIO], total: Optional[int] = None,
+                api: str = "web.post", route: Optional[str] = None, name: Optional[str] = None,
+                frame_size: int = DEFAULT_FRAME, verify: bool = True, **extra) -> Iterator[Dict[str, Any]]:
+    """Yield the fragment requests that upload a body, reading it one fragment at a time.
+
+    source is a bytes-like object or a binary file; total defaults to the
+    length of a bytes-like source and is required for a file. Extra keyword
+    arguments (`content`, `max`, `seconds`, ...) are copied into every
+    request. With verify, each fragment carries its MD5 `status`.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        total = len(view) if total is None else total
+        read = lambda offset, length: view[offset:offset + length]
+    elif total is None:
+        raise ValueError("total is required when uploading from a file")
+    else:
+        read = lambda offset, length: source.read(length)
+    template = _template(api, total, route, name, extra)
+    size = fragment_size(frame_size, api, total, route, name, verify, **extra)
+    offset = 0
+    while offset < total:
+        fragment = read(offset, min(size, total - offset))
+        if not fragment:
+            raise ValueError(f"body ended after {offset} of {total} bytes")
+        status = hashlib.md5(fragment).hexdigest() if verify else None
+        yield _fragment_request(template, offset, binascii.b2a_base64(fragment, newline=False).decode(), status)
+        offset += len(fragment)
+
+
+def upload_stats(total: int, api: str = "web.post", route: Optional[str] = None, name: Optional[str] = None,
+                 frame_size: int = DEFAULT_FRAME, verify: bool = True, **extra) -> Dict[str, Any]:
+    """Return the round trips and bytes on the wire needed to upload total bytes."""
+    template = _template(api, total, route, name, extra)
+    size = fragment_size(frame_size, api, total, route, name, verify, **extra)
+    fragments = (total + size - 1) // size
+    wire = 0
+    for index in range(fragments):
+        offset = index * size
+        length = min(size, total - offset)
+        framing = encode_request(_fragment_request(template, offset, "", _STATUS if verify else None))
+        wire += len(framing) + base64_length(length)
+    return {
+        "total": total,
+        "fragment_size": size,
+        "round_trips": fragments,
+        "wire_bytes": wire,
+        "overhead": round(wire / total - 1, 4) if total else 0,
+    }
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Plan a large web.post or web.put body as payload fragments",
+        epilog="Example: python scripts/web_upload.py --file firmware.bin --frame 8192 --route upload --name /images"
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--size", type=float, default=4, help="Plan a body of this many MB of random data. Defaults to 4.")
+    source.add_argument("--file", help="Plan the upload of this file.")
+    parser.add_argument("--api", choices=APIS, default="web.post", help="Request to use. Defaults to web.post.")
+    parser.add_argument("--route", default=None, help="Proxy Route alias.")
+    parser.add_argument("--name", default=None, help="URL relative to the Proxy Route.")
+    parser.add_argument("--frame", type=int, default=DEFAULT_FRAME, help=f"Largest request line in bytes. Defaults to {DEFAULT_FRAME}.")
+    parser.add_argument("--no-verify", action="store_true", help="Leave out the per-fragment MD5 status.")
+    parser.add_argument("-o", "--output", help="Write the requests to this JSONL file.")
+
+    args = parser.parse_args()
+
+    if args.file:
+        total = os.path.getsize(args.file)
+        body = open(args.file, 'rb')
+    else:
+        total = int(args.size * (1 << 20))
+        body = io.BytesIO(os.urandom(total))
+
+    try:
+        stats = upload_stats(total, args.api, args.route, args.name, args.frame, not args.no_verify)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    output = open(args.output, 'wb') if args.output else None
+    start = time.perf_counter()
+    wire = 0
+    try:
+        for request in plan_upload(body, total, args.api, args.route, args.name, args.frame, not args.no_verify):
+            line = encode_request(request)
+            wire += len(line)
+            if output:
+                output.write(line)
+    finally:
+        body.close()
+        if output:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ {total:,} bytes in {stats['round_trips']:,} {args.api} round trips of up to "
+          f"{stats['fragment_size']:,} bytes, {wire:,} bytes on the wire ({stats['overhead']:.1%} overhead)")
+    print(f"  planned at {total / (1 << 20) / elapsed:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,86 +1,116 @@
 import pytest
 import json
 import os
-from referencing import Registry, Resource
-import urllib.request
+import sys
+import jsonschema
+from jsonschema.exceptions import best_match
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
-@pytest.fixture(scope='module')
-def schema(request):
-    """Loads the JSON schema specified by the test module's SCHEMA_FILE.
-    If the schema is 'notecard.api.json', its remote $refs are also fetched
-    and added to a registry. Returns a tuple (schema_dict, registry).
+# Make the tooling in scripts/ importable from the test suite.
+sys.path.insert(0, os.path.join(project_root, 'scripts'))
+
+from notecard_validator import NotecardValidator, build_registry, load_schema_files
+
+
+class CachedValidator:
+    """A prebuilt Draft202012Validator whose validate() raises the best match.
+
+    Draft202012Validator.validate() raises the first error it finds, whereas
+    jsonschema.validate() raises the most relevant one; reporting the best
+    match keeps assertions on error messages unchanged.
     """
+
+    def __init__(self, validator):
+        self.validator = validator
+
+    def validate(self, instance):
+        error = best_match(self.validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def __getattr__(self, name):
+        return getattr(self.validator, name)
+
+
+class SchemaStore:
+    """Session-wide cache of parsed schemas, their registry and prebuilt validators.
+
+    Every schema is read and parsed once per session, and every validator is
+    built (and its schema checked) once, no matter how many modules use it.
+    """
+
+    def __init__(self, schema_dir):
+        self.schema_dir = schema_dir
+        self.schemas = load_schema_files(schema_dir)
+        # The registry resolves every $id to its local file, so notecard.api.json
+        # $refs never trigger live HTTP requests or DeprecationWarnings.
+        self.registry = build_registry(self.schemas)
+        self._validators = {}
+
+    def get(self, schema_filename):
+        if schema_filename not in self.schemas:
+            schema_file_path = os.path.join(self.schema_dir, schema_filename)
+            if not os.path.exists(schema_file_path):
+                pytest.fail(f"Schema file not found at: {schema_file_path}")
+            with open(schema_file_path, 'r') as f:
+                self.schemas[schema_filename] = json.load(f)
+        return self.schemas[schema_filename]
+
+    def validator(self, schema_filename):
+        if schema_filename not in self._validators:
+            schema = self.get(schema_filename)
+            jsonschema.Draft202012Validator.check_schema(schema)
+            self._validators[schema_filename] = CachedValidator(
+                jsonschema.Draft202012Validator(schema, registry=self.registry))
+        return self._validators[schema_filename]
+
+
+def _schema_filename(request, fixture_name):
     schema_filename = getattr(request.module, "SCHEMA_FILE", None)
     if not schema_filename:
-        pytest.fail(f"Test module {request.module.__name__} must define SCHEMA_FILE")
-
-    schema_file_path = os.path.join(project_root, schema_filename)
-
-    if not os.path.exists(schema_file_path):
-        pytest.fail(f"Schema file not found at: {schema_file_path}")
-
-    with open(schema_file_path, 'r') as f:
-        main_schema_content = json.load(f)
-
-    main_resource = Resource.from_contents(main_schema_content)
-    # Initialize registry using the @ operator with the main resource.
-    # This assumes main_resource has an $id.
-    registry = main_resource @ Registry()
-
-    # If this is notecard.api.json, load its remote $refs from local files
-    # and add them to the registry to prevent live HTTP requests during validation
-    # and to avoid DeprecationWarnings from jsonschema.
-    if schema_filename == "notecard.api.json" and "oneOf" in main_schema_content:
-        for ref_obj in main_schema_content.get("oneOf", []):
-            if "$ref" in ref_obj:
-                ref_url = ref_obj["$ref"]
-                if ref_url.startswith(("http://", "https://")):
-                    # Extract filename from URL and look for it locally
-                    filename = ref_url.split('/')[-1]
-                    local_file_path = os.path.join(project_root, filename)
-                    
-                    try:
-                        # Check if registry already has this specific URL resolved
-                        registry.contents(ref_url)
-                        # If above doesn't raise, it means something is at ref_url URI in registry
-                    except KeyError:
-                        # Load the local file instead of fetching remote
-                        if os.path.exists(local_file_path):
-                            try:
-                                with open(local_file_path, 'r') as f:
-                                    ref_content_dict = json.load(f)
-                                ref_resource = Resource.from_contents(ref_content_dict)
-                                registry = ref_resource @ registry
-                            except (json.JSONDecodeError, IOError) as e:
-                                pytest.fail(f"Error loading local file {filename}: {e}")
-                        else:
-                            # If local file doesn't exist, skip it instead of failing
-                            # This allows tests to run even if some referenced schemas are missing
-                            continue
+        pytest.fail(f"Test module {request.module.__name__} must define SCHEMA_FILE to use {fixture_name}")
+    return schema_filename
+
+@pytest.fixture(scope='session')
+def schema_store():
+    """Loads every schema once per session, with a shared registry."""
+    return SchemaStore(project_root)
+
+@pytest.fixture(scope='session')
+def notecard_validator(schema_store):
+    """Returns a NotecardValidator over every schema, built once per session from the shared registry."""
+    return NotecardValidator(schema_store.schemas, schema_store.registry)
+
+@pytest.fixture(scope='module')
+def schema(request, schema_store):
+    """Returns the JSON schema specified by the test module's SCHEMA_FILE.
+    For 'notecard.api.json', returns a tuple (schema_dict, registry) where the
+    registry resolves its $refs to the local schema files.
+    """
+    schema_filename = _schema_filename(request, "schema")
+    main_schema_content = schema_store.get(schema_filename)
 
     if schema_filename == "notecard.api.json":
-        return main_schema_content, registry
+        return main_schema_content, schema_store.registry
     else:
         # For all other schema files, return only the schema content
         # and do not pass a registry, as they do not need it or expect it.
         return main_schema_content
 
 @pytest.fixture(scope='module')
-def schema_samples(request):
-    """Loads samples from the JSON schema specified by the test module's SCHEMA_FILE."""
-    schema_filename = getattr(request.module, "SCHEMA_FILE", None)
-    if not schema_filename:
-        pytest.fail(f"Test module {request.module.__name__} must define SCHEMA_FILE to use schema_samples")
-
-    schema_file_path = os.path.join(project_root, schema_filename)
+def validator(request, schema_store):
+    """Returns a prebuilt validator for the test module's SCHEMA_FILE.
 
-    if not os.path.exists(schema_file_path):
-        pytest.fail(f"Schema file not found at: {schema_file_path} for schema_samples")
+    The schema is checked once when the validator is first built, so tests
+    validating many instances do not pay check_schema costs per call.
+    """
+    return schema_store.validator(_schema_filename(request, "validator"))
 
-    with open(schema_file_path, 'r') as f:
-        schema_data = json.load(f)
+@pytest.fixture(scope='module')
+def schema_samples(request, schema_store):
+    """Loads samples from the JSON schema specified by the test module's SCHEMA_FILE."""
+    schema_data = schema_store.get(_schema_filename(request, "schema_samples"))
 
     samples = schema_data.get("samples", [])
     if not samples:
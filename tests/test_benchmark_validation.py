@@ -0,0 +1,37 @@
+import pytest
+
+from notecard_validator import load_schema_files
+from benchmark_validation import benchmark_schemas, find_regressions, invalid_instances, valid_instances
+
+@pytest.fixture(scope='module')
+def schemas():
+    return load_schema_files()
+
+@pytest.mark.parametrize("engine", ["jsonschema", "compiled"])
+def test_benchmark_covers_requests_and_responses(schemas, engine):
+    """Tests that matching request and response schemas are measured for valid and invalid instances."""
+    results = benchmark_schemas(schemas, engine, pattern="card.attn*", min_time=0.0001, repeat=1)
+    assert results["engine"] == engine
+    assert set(results["results"]) == {"card.attn.req", "card.attn.rsp"}
+    for entry in results["results"].values():
+        assert entry["valid"]["ops"] > 0
+        assert entry["invalid"]["ops"] > 0
+
+def test_derived_instances(schemas):
+    """Tests that valid instances come from samples and invalid ones are derived from them."""
+    schema = schemas["card.attn.req.notecard.api.json"]
+    valid = valid_instances("card.attn.req.notecard.api.json", schema)
+    assert len(valid) == len(schema["samples"])
+    invalid = invalid_instances(schema, valid)
+    assert all("__benchmark__" in instance for instance in invalid)
+
+    schema = schemas["card.restore.rsp.notecard.api.json"]
+    assert valid_instances("card.restore.rsp.notecard.api.json", schema) == [{}]
+    assert invalid_instances(schema, [{}]) == [[{}]]
+
+def test_find_regressions():
+    """Tests that only drops beyond the threshold are reported."""
+    baseline = {"results": {"a.req": {"valid": {"ops": 1000.0}, "invalid": {"ops": 1000.0}}}}
+    current = {"results": {"a.req": {"valid": {"ops": 800.0}, "invalid": {"ops": 700.0}}, "b.req": {"valid": {"ops": 1.0}}}}
+    regressions = find_regressions(baseline, current, threshold=25)
+    assert regressions == ["a.req (invalid): 1000 -> 700 ops/s (-30.0%)"]
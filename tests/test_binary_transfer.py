@@ -0,0 +1,142 @@
+import hashlib
+import os
+import random
+import pytest
+
+from binary_transfer import (
+    EOP,
+    BinaryReassembler,
+    BinaryTransferError,
+    CobsDecoder,
+    CobsEncoder,
+    cobs_decode,
+    cobs_encode,
+    max_encoded_length,
+    plan_get,
+    plan_put,
+)
+
+CASES = [
+    b"", b"\x00", b"\x00\x00", b"\x11\x22\x00\x33", b"\x11\x22\x33\x44", b"\x11\x00\x00\x00",
+    bytes(range(1, 254)), bytes(range(1, 255)), bytes(range(1, 256)), bytes(range(1, 255)) + b"\x00",
+    b"\x00" + bytes(range(1, 255)), bytes(range(1, 255)) * 2, b"\x0a\x0a\x00\x0a",
+]
+
+def _reference_encode(data, eop):
+    """A byte-at-a-time port of note-c's _cobsEncode()."""
+    out, block = bytearray(), bytearray()
+    for byte in data:
+        if byte:
+            block.append(byte)
+        if not byte or len(block) == 254:
+            out += bytes([len(block) + 1]) + block
+            block = bytearray()
+    out += bytes([len(block) + 1]) + block
+    return bytes(b ^ eop for b in out)
+
+def _random_data(size, seed=1):
+    rng = random.Random(seed)
+    data = bytearray(os.urandom(size))
+    for _ in range(size // 50):
+        data[rng.randrange(size)] = 0
+    return bytes(data)
+
+@pytest.mark.parametrize("eop", [0, EOP])
+@pytest.mark.parametrize("data", CASES + [_random_data(5000)], ids=range(len(CASES) + 1))
+def test_encode_matches_note_c_and_round_trips(data, eop):
+    """Tests encoding against a byte-wise reference, and decoding back."""
+    encoded = cobs_encode(data, eop)
+    assert encoded == _reference_encode(data, eop)
+    assert eop not in encoded
+    assert len(encoded) <= max_encoded_length(len(data))
+    assert cobs_decode(encoded, eop) == data
+
+def test_known_vectors():
+    """Tests published COBS vectors, with note-c's closing code after a full block."""
+    assert cobs_encode(b"\x00", 0) == b"\x01\x01"
+    assert cobs_encode(b"\x11\x22\x00\x33", 0) == b"\x03\x11\x22\x02\x33"
+    assert cobs_encode(bytes(range(1, 255)), 0) == b"\xff" + bytes(range(1, 255)) + b"\x01"
+    # A full block without the closing code decodes the same.
+    assert cobs_decode(b"\xff" + bytes(range(1, 255)), 0) == bytes(range(1, 255))
+
+def test_streaming_matches_one_shot():
+    """Tests that feeding arbitrary pieces gives the one-shot encoding and decoding."""
+    data = _random_data(20000, seed=2) + bytes(range(1, 255)) * 3 + b"\x00" * 10
+    rng = random.Random(3)
+    encoder, pieces, i = CobsEncoder(), [], 0
+    while i < len(data):
+        step = rng.choice([1, 2, 253, 254, 255, 1000])
+        pieces.append(encoder.update(data[i:i + step]))
+        i += step
+    encoded = b"".join(pieces) + encoder.finish()
+    assert encoded == cobs_encode(data)
+    decoder, pieces, i = CobsDecoder(), [], 0
+    while i < len(encoded):
+        step = rng.choice([1, 2, 255, 777])
+        pieces.append(decoder.update(memoryview(encoded)[i:i + step]))
+        i += step
+    assert b"".join(pieces) + decoder.finish() == data
+
+def test_malformed_frames():
+    """Tests that truncated frames and stray terminators are rejected."""
+    encoded = cobs_encode(b"\x01\x02\x03")
+    with pytest.raises(BinaryTransferError):
+        cobs_decode(encoded[:-1])
+    with pytest.raises(BinaryTransferError):
+        cobs_decode(encoded + bytes([EOP]))
+    with pytest.raises(BinaryTransferError):
+        cobs_decode(b"")
+    decoder = CobsDecoder()
+    decoder.update(encoded[:-1])
+    with pytest.raises(BinaryTransferError):
+        decoder.finish()
+
+def test_put_plan_is_schema_valid(notecard_validator):
+    """Tests that planned card.binary.put requests validate and describe their frames."""
+    data = _random_data(100000, seed=4)
+    plan = list(plan_put(data, chunk_size=30000))
+    assert [request["offset"] for request, frame in plan] == [0, 30000, 60000, 90000]
+    for request, frame in plan:
+        notecard_validator.validate_request(request)
+        assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+        assert request["cobs"] == len(frame) - 1
+        chunk = data[request["offset"]:request["offset"] + 30000]
+        assert request["status"] == hashlib.md5(chunk).hexdigest()
+        assert cobs_decode(frame[:-1]) == chunk
+
+def test_round_trip_through_binary_area(notecard_validator):
+    """Tests put, then get in different-sized chunks, reassembling the original data."""
+    data = _random_data(3 * 1024 * 1024 + 17, seed=5)
+    area = bytearray()
+    for request, frame in plan_put(data, chunk_size=64 * 1024):
+        assert request["offset"] == len(area)
+        area += cobs_decode(frame[:-1])
+    assert area == data
+
+    reassembler = BinaryReassembler(len(data))
+    for request in reversed(reassembler.requests(chunk_size=100000)):
+        notecard_validator.validate_request(request)
+        chunk = area[request["offset"]:request["offset"] + request["length"]]
+        response = {"status": hashlib.md5(chunk).hexdigest()}
+        notecard_validator.validate_response("card.binary.get", response)
+        assert not reassembler.complete
+        assert reassembler.feed(request, response, cobs_encode(chunk) + b"\n") == len(chunk)
+    assert reassembler.complete and reassembler.requests() == []
+    assert reassembler.result() == data
+
+def test_reassembler_rejects_bad_chunks():
+    """Tests error responses, MD5 mismatches, short chunks and incomplete results."""
+    data = bytes(range(256)) * 4
+    reassembler = BinaryReassembler(len(data))
+    first, second = plan_get(len(data), chunk_size=512)
+    frame = cobs_encode(data[:512])
+    with pytest.raises(BinaryTransferError):
+        reassembler.feed(first, {"err": "binary area is empty"}, frame)
+    with pytest.raises(BinaryTransferError):
+        reassembler.feed(first, {"status": hashlib.md5(b"other").hexdigest()}, frame)
+    with pytest.raises(BinaryTransferError):
+        reassembler.feed(first, {}, cobs_encode(data[:100]))
+    reassembler.feed(first, {"status": hashlib.md5(data[:512]).hexdigest()}, frame)
+    assert reassembler.requests(chunk_size=512) == [second]
+    with pytest.raises(BinaryTransferError):
+        reassembler.result()
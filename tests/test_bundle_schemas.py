@@ -0,0 +1,81 @@
+import json
+import pytest
+import jsonschema
+from referencing.exceptions import Unresolvable
+
+from notecard_validator import NotecardValidator, load_schema_files
+from bundle_schemas import BUNDLE_ID, bundle_schemas, load_bundle, map_subschemas
+
+@pytest.fixture(scope='module')
+def schemas():
+    return load_schema_files()
+
+@pytest.fixture(scope='module', params=[False, True], ids=["full", "minified"])
+def bundle_path(request, schemas, tmp_path_factory):
+    path = tmp_path_factory.mktemp("bundle") / "notecard.bundle.json"
+    path.write_text(json.dumps(bundle_schemas(schemas, minify=request.param)))
+    return str(path)
+
+def _refs(schema):
+    refs = []
+    def collect(node):
+        if "$ref" in node:
+            refs.append(node["$ref"])
+        return node
+    map_subschemas(schema, collect)
+    return refs
+
+def test_bundle_is_valid_2020_12_schema(bundle_path):
+    """Tests that the bundle is itself a valid Draft 2020-12 schema."""
+    bundle, registry = load_bundle(bundle_path)
+    jsonschema.Draft202012Validator.check_schema(bundle)
+    assert bundle["$id"] == BUNDLE_ID
+
+def test_bundle_contains_every_schema(schemas, bundle_path):
+    """Tests that every request and response schema is embedded under $defs."""
+    bundle, registry = load_bundle(bundle_path)
+    assert len(bundle["$defs"]) == len(schemas) - 1
+    assert "card.attn.req" in bundle["$defs"]
+    assert "card.attn.rsp" in bundle["$defs"]
+    assert "$id" not in bundle["$defs"]["card.attn.req"]
+
+def test_bundle_refs_are_local(bundle_path):
+    """Tests that every $ref is rewritten to a local $defs pointer."""
+    bundle, registry = load_bundle(bundle_path)
+    refs = _refs(bundle)
+    assert len(refs) == len(bundle["oneOf"])
+    assert all(ref.startswith("#/$defs/") for ref in refs)
+
+def test_bundle_validates_like_directory(schemas, bundle_path):
+    """Tests that a bundle-backed validator agrees with the per-file schemas."""
+    from_files = NotecardValidator(schemas)
+    from_bundle = NotecardValidator.from_bundle(bundle_path)
+    assert from_bundle.request_names == from_files.request_names
+
+    instances = [{}, {"req": "card.nope"}, {"req": "card.attn", "mode": "watchdog"}, {"req": "card.attn", "extra": 1}]
+    for filename, schema in schemas.items():
+        if ".req." in filename:
+            instances += [json.loads(sample["json"]) for sample in schema.get("samples", [])]
+    for instance in instances:
+        assert from_bundle.is_valid_request(instance) == from_files.is_valid_request(instance), instance
+        full = jsonschema.Draft202012Validator(from_bundle.api_schema, registry=from_bundle.registry)
+        assert full.is_valid(instance) == from_files.is_valid_request(instance), instance
+
+    assert from_bundle.is_valid_response("card.version", {"version": "notecard-9.1.1"})
+    assert not from_bundle.is_valid_response("card.version", {"version": 1})
+
+def test_bundle_never_resolves_remote_refs(bundle_path):
+    """Tests that the bundle registry cannot fetch anything beyond the bundle."""
+    bundle, registry = load_bundle(bundle_path)
+    validator = jsonschema.Draft202012Validator(
+        {"$ref": "https://raw.githubusercontent.com/blues/notecard-schema/master/card.attn.req.notecard.api.json"},
+        registry=registry,
+    )
+    with pytest.raises(Unresolvable):
+        validator.is_valid({"req": "card.attn"})
+
+def test_minify_keeps_property_names(schemas):
+    """Tests that minifying strips documentation keywords but not like-named properties."""
+    schema = {"properties": {"description": {"type": "string", "description": "x"}}, "description": "y"}
+    bundle = bundle_schemas({"notecard.api.json": {"oneOf": []}, "a.req.notecard.api.json": schema}, minify=True)
+    assert bundle["$defs"]["a.req"] == {"properties": {"description": {"type": "string"}}}
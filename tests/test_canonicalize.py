@@ -0,0 +1,94 @@
+import json
+import pytest
+
+from canonicalize import Canonicalizer, compile_transform, referenced_properties, strippable_defaults
+
+@pytest.fixture(scope='module')
+def canonicalizer():
+    return Canonicalizer()
+
+def test_defaults_are_stripped_and_keys_ordered(canonicalizer):
+    """Tests stripping per-request defaults, schema key order and compact encoding."""
+    request = {"max": 90, "seconds": 90, "route": "r", "req": "web.put", "content": "application/json"}
+    assert canonicalizer.encode(request) == b'{"req":"web.put","route":"r"}\n'
+    assert canonicalizer.encode({"cmd": "web.post", "seconds": 30, "content": "application/json"}) == (
+        b'{"cmd":"web.post","seconds":30}\n')
+    assert canonicalizer.canonicalize({"req": "card.usage.get", "mode": "total"}) == {"req": "card.usage.get"}
+    assert canonicalizer.canonicalize({"req": "card.usage.test", "megabytes": 1024.0}) == {"req": "card.usage.test"}
+    # Values equal to a default in Python but not in JSON are kept.
+    assert canonicalizer.canonicalize({"req": "card.usage.test", "megabytes": True}) == {
+        "req": "card.usage.test", "megabytes": True}
+
+def test_settings_are_never_stripped(canonicalizer):
+    """Tests that APIs persisting settings keep every field, since omitting one means "leave unchanged"."""
+    for request in (
+        {"req": "card.wireless.penalty", "rate": 1.25, "add": 15, "max": 4320, "min": 15},
+        {"req": "card.power", "minutes": 720},
+        {"req": "card.aux", "mode": "gpio", "rate": 115200},
+        {"req": "card.transport", "method": "ntn", "seconds": 3600, "allow": False, "umin": False},
+        {"req": "card.monitor", "usb": False},
+        {"req": "card.location.track", "start": True, "file": "track.qo"},
+    ):
+        assert canonicalizer.canonicalize(request) == request
+    request = {"seconds": 3600, "umin": True, "req": "card.transport", "allow": False, "method": "ntn"}
+    assert canonicalizer.encode(request) == (
+        b'{"req":"card.transport","method":"ntn","seconds":3600,"allow":false,"umin":true}\n')
+
+def test_unknown_apis_and_keys_are_sorted(canonicalizer):
+    """Tests the stable order of keys no schema describes."""
+    assert list(canonicalizer.canonicalize({"z": 1, "req": "card.monitor", "a": 2, "usb": True})) == [
+        "req", "usb", "a", "z"]
+    assert list(canonicalizer.canonicalize({"b": 1, "req": "no.such.api", "a": 2})) == ["req", "a", "b"]
+
+def test_canonical_form_is_idempotent_and_order_independent(canonicalizer, schema_store):
+    """Tests that canonicalizing twice, or after reordering keys, gives the same bytes."""
+    for filename, schema in schema_store.schemas.items():
+        for sample in schema.get("samples", []) if ".req." in filename else []:
+            request = json.loads(sample["json"])
+            encoded = canonicalizer.encode(request)
+            assert canonicalizer.encode(json.loads(encoded)) == encoded
+            assert canonicalizer.encode(dict(reversed(list(request.items())))) == encoded
+
+def test_samples_stay_valid(canonicalizer, notecard_validator, schema_store):
+    """Tests that every request sample, with all defaults filled in, validates after canonicalizing."""
+    checked = 0
+    for filename, schema in schema_store.schemas.items():
+        if ".req." not in filename:
+            continue
+        defaults = {name: details["default"] for name, details in schema.get("properties", {}).items()
+                    if isinstance(details, dict) and "default" in details}
+        for sample in schema.get("samples", []):
+            request = json.loads(sample["json"])
+            filled = dict(defaults, **request)
+            if notecard_validator.is_valid_request(filled):
+                canonical = canonicalizer.canonicalize(filled)
+                notecard_validator.validate_request(canonical)
+                assert dict(strippable_defaults(schema), **canonical) == filled
+                checked += 1
+    assert checked > 20
+
+def test_conditional_properties_are_kept():
+    """Tests that a defaulted property used by a conditional is never stripped."""
+    schema = {
+        "properties": {"req": {"const": "x.y"}, "mode": {"default": "on"}, "rate": {"default": 1},
+                       "size": {"default": 0}, "keep": {"default": 2}},
+        "allOf": [{"if": {"properties": {"mode": {"const": "on"}}}, "then": {"required": ["rate"]}}],
+        "dependentRequired": {"keep": ["size"]},
+    }
+    assert referenced_properties(schema) >= {"mode", "rate", "keep", "size"}
+    assert strippable_defaults(schema, ("mode", "rate", "size", "keep")) == {}
+    assert strippable_defaults(dict(schema, allOf=[], dependentRequired={}), ("rate",)) == {"rate": 1}
+    request = {"req": "x.y", "mode": "on", "rate": 1, "size": 0}
+    assert compile_transform(schema)(request) == request
+
+def test_bytes_saved():
+    """Tests the byte counts of canonicalized lines."""
+    canonicalizer = Canonicalizer()
+    line = b'{"req": "web.get", "route": "r"}\r\n'
+    assert canonicalizer.canonicalize_line(line) == b'{"req":"web.get","route":"r"}\n'
+    canonicalizer.canonicalize_line(b'{"req":"web.post","route":"r","seconds":90}')
+    summary = canonicalizer.summary()
+    assert summary["requests"] == 2
+    assert summary["bytes_in"] == 33 + 44 and summary["bytes_out"] == 30 + 31
+    with pytest.raises(ValueError):
+        canonicalizer.canonicalize_line(b"[1]")
@@ -3,47 +3,47 @@ import jsonschema
 
 SCHEMA_FILE = "card.attn.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request."""
     instance = {
         "req": "card.attn"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid command."""
     instance = {
         "cmd": "card.attn"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_mode_watchdog_valid(schema):
+def test_mode_watchdog_valid(validator):
     """Tests valid request with mode=watchdog and required seconds >= 60."""
     instance = {
         "req": "card.attn",
         "mode": "watchdog",
         "seconds": 60
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     instance = {
         "req": "card.attn",
         "mode": "watchdog,motion",
         "seconds": 120
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_mode_watchdog_invalid_missing_seconds(schema):
+def test_mode_watchdog_invalid_missing_seconds(validator):
     """Tests invalid request with mode=watchdog missing seconds."""
     instance = {
         "req": "card.attn",
         "mode": "watchdog"
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'seconds' is a required property" in str(excinfo.value)
 
-def test_mode_watchdog_invalid_seconds_too_low(schema):
+def test_mode_watchdog_invalid_seconds_too_low(validator):
     """Tests invalid request with mode=watchdog and seconds < 60."""
     instance = {
         "req": "card.attn",
@@ -51,17 +51,17 @@ def test_mode_watchdog_invalid_seconds_too_low(schema):
         "seconds": 59
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "59 is less than the minimum of 60" in str(excinfo.value)
 
-def test_mode_sleep_valid(schema):
+def test_mode_sleep_valid(validator):
     """Tests valid request with mode=sleep and required seconds >= 0."""
     instance = {
         "req": "card.attn",
         "mode": "sleep",
         "seconds": 0
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     instance = {
         "req": "card.attn",
@@ -69,19 +69,19 @@ def test_mode_sleep_valid(schema):
         "seconds": 10,
         "files": ["data.qo"]
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_mode_sleep_invalid_missing_seconds(schema):
+def test_mode_sleep_invalid_missing_seconds(validator):
     """Tests invalid request with mode=sleep missing seconds."""
     instance = {
         "req": "card.attn",
         "mode": "sleep"
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'seconds' is a required property" in str(excinfo.value)
 
-def test_mode_other_invalid_with_seconds(schema):
+def test_mode_other_invalid_with_seconds(validator):
     """Tests invalid request with mode other than watchdog/sleep having seconds."""
     instance = {
         "req": "card.attn",
@@ -89,7 +89,7 @@ def test_mode_other_invalid_with_seconds(schema):
         "seconds": 30
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     error_string = str(excinfo.value)
     assert "should not be valid under" in error_string
     assert "'required': ['seconds']" in error_string
@@ -99,19 +99,19 @@ def test_mode_other_invalid_with_seconds(schema):
         "seconds": 30
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     error_string = str(excinfo.value)
     assert "should not be valid under" in error_string
     assert "'required': ['seconds']" in error_string
 
-def test_mode_files_valid(schema):
+def test_mode_files_valid(validator):
     """Tests valid request with mode including 'files' and the files field."""
     instance = {
         "req": "card.attn",
         "mode": "files",
         "files": ["data.qo", "_track.qi"]
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     instance = {
         "req": "card.attn",
@@ -119,19 +119,19 @@ def test_mode_files_valid(schema):
         "files": ["events.db"],
         "seconds": 10
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_mode_files_invalid_missing_files(schema):
+def test_mode_files_invalid_missing_files(validator):
     """Tests invalid request with mode including 'files' but missing files field."""
     instance = {
         "req": "card.attn",
         "mode": "files"
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'files' is a required property" in str(excinfo.value)
 
-def test_mode_other_invalid_with_files(schema):
+def test_mode_other_invalid_with_files(validator):
     """Tests invalid request with mode NOT including 'files' but providing files field."""
     instance = {
         "req": "card.attn",
@@ -139,7 +139,7 @@ def test_mode_other_invalid_with_files(schema):
         "files": ["data.qo"]
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     # Check for the error related to the 'else'/'not' condition for 'files'
     error_string = str(excinfo.value)
     assert "should not be valid under" in error_string
@@ -150,12 +150,12 @@ def test_mode_other_invalid_with_files(schema):
         "files": ["data.qo"]
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     error_string = str(excinfo.value)
     assert "should not be valid under" in error_string
     assert "'required': ['files']" in error_string
 
-def test_files_field_valid(schema):
+def test_files_field_valid(validator):
     """Tests valid contents of the files field."""
     valid_files = [
         ["data.qo"],
@@ -170,9 +170,9 @@ def test_files_field_valid(schema):
             "mode": "files",
             "files": files_list
         }
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_files_field_invalid_type(schema):
+def test_files_field_invalid_type(validator):
     """Tests invalid type for the files field (must be array)."""
     instance = {
         "req": "card.attn",
@@ -180,10 +180,10 @@ def test_files_field_invalid_type(schema):
         "files": "data.qo" # Should be an array
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'data.qo' is not of type 'array'" in str(excinfo.value)
 
-def test_files_field_invalid_item_type(schema):
+def test_files_field_invalid_item_type(validator):
     """Tests invalid item type within the files array (must be string)."""
     instance = {
         "req": "card.attn",
@@ -191,10 +191,10 @@ def test_files_field_invalid_item_type(schema):
         "files": ["data.qo", 123] # 123 is not a string
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_files_field_invalid_item_pattern(schema):
+def test_files_field_invalid_item_pattern(validator):
     """Tests invalid item pattern within the files array."""
     invalid_filenames = [
         ["data.txt"],
@@ -212,14 +212,14 @@ def test_files_field_invalid_item_pattern(schema):
             "files": filename
         }
         try:
-            jsonschema.validate(instance=instance, schema=schema)
+            validator.validate(instance)
             pytest.fail(f"Schema unexpectedly validated invalid filename(s): {filename}")
         except jsonschema.ValidationError as excinfo:
             error_str = str(excinfo)
             assert "does not match" in error_str
             assert excinfo.instance in filename
 
-def test_files_field_invalid_minitems(schema):
+def test_files_field_invalid_minitems(validator):
     """Tests invalid files array with zero items (minItems is 1)."""
     instance = {
         "req": "card.attn",
@@ -227,81 +227,81 @@ def test_files_field_invalid_minitems(schema):
         "files": []
     }
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     # Adjust assertion to match the current jsonschema error message
     assert "should be non-empty" in str(excinfo.value)
 
-def test_on_field(schema):
+def test_on_field(validator):
     """Tests the 'on' field type validation."""
     # Valid
     instance = {"req": "card.attn", "on": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.attn", "on": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"req": "card.attn", "on": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo)
 
-def test_off_field(schema):
+def test_off_field(validator):
     """Tests the 'off' field type validation."""
     # Valid
     instance = {"req": "card.attn", "off": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.attn", "off": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"req": "card.attn", "off": 0}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "0 is not of type 'boolean'" in str(excinfo)
 
-def test_payload_field(schema):
+def test_payload_field(validator):
     """Tests the 'payload' field type validation."""
     # Valid (string type, format 'binary' is informational)
     # Note: Standard jsonschema doesn't validate content for 'binary' format.
     # We test with a base64 encoded string representation as an example.
     instance = {"req": "card.attn", "payload": "aGVsbG8="} # base64 for 'hello'
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"req": "card.attn", "payload": [1, 2, 3]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "[1, 2, 3] is not of type 'string'" in str(excinfo)
 
-def test_start_field(schema):
+def test_start_field(validator):
     """Tests the 'start' field type validation."""
     # Valid
     instance = {"req": "card.attn", "start": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.attn", "start": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"req": "card.attn", "start": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'boolean'" in str(excinfo)
 
-def test_verify_field(schema):
+def test_verify_field(validator):
     """Tests the 'verify' field type validation."""
     # Valid
     instance = {"req": "card.attn", "verify": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.attn", "verify": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"req": "card.attn", "verify": "yes"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'yes' is not of type 'boolean'" in str(excinfo)
 
-def test_all_optional_fields_valid(schema):
+def test_all_optional_fields_valid(validator):
     """Tests a request with all optional fields set to valid values."""
     # Note: 'files' and 'seconds' require specific modes, excluded here.
     instance = {
@@ -312,4 +312,4 @@ def test_all_optional_fields_valid(schema):
         "start": True,
         "verify": True
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
@@ -3,29 +3,29 @@ import jsonschema
 
 SCHEMA_FILE = "card.aux.serial.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request."""
     instance = {"req": "card.aux.serial"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid command."""
     instance = {"cmd": "card.aux.serial"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"mode": "gps"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.aux.serial", "cmd": "card.aux.serial"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_valid(schema):
+def test_mode_valid(validator):
     """Tests valid mode enum values."""
     valid_modes = [
         "req", "gps", "notify", "notify,accel", "notify,signals",
@@ -33,23 +33,23 @@ def test_mode_valid(schema):
     ]
     for mode in valid_modes:
         instance = {"req": "card.aux.serial", "mode": mode}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"req": "card.aux.serial", "mode": "invalid_mode"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'invalid_mode' is not one of ['req'," in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"req": "card.aux.serial", "mode": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_with_mode(schema):
+def test_valid_with_mode(validator):
     """Tests a valid request including the mode field."""
     instance = {"req": "card.aux.serial", "mode": "notify,signals"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
@@ -3,18 +3,18 @@ import jsonschema
 
 SCHEMA_FILE = "card.aux.serial.rsp.notecard.api.json"
 
-def test_valid_empty_response(schema):
+def test_valid_empty_response(validator):
     """Tests the minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_properties(schema):
+def test_valid_additional_properties(validator):
     """Tests that additional properties are allowed as per schema default."""
     instance = {"some_field": 123, "another": "value"}
     # This should be valid because additionalProperties is not set to false
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_type(schema):
+def test_invalid_type(validator):
     """Tests that non-object types are invalid."""
     invalid_instances = [
         None,       # null
@@ -25,5 +25,5 @@ def test_invalid_type(schema):
     ]
     for instance in invalid_instances:
         with pytest.raises(jsonschema.ValidationError) as excinfo:
-            jsonschema.validate(instance=instance, schema=schema)
+            validator.validate(instance)
         assert "is not of type 'object'" in str(excinfo.value)
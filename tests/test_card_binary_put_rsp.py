@@ -3,24 +3,24 @@ import jsonschema
 
 SCHEMA_FILE = "card.binary.put.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_rsp_with_err(schema):
+def test_valid_rsp_with_err(validator):
     """Tests a valid response with the err field."""
     instance = {"err": "{error-description}"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_err_invalid_type(schema):
+def test_err_invalid_type(validator):
     """Tests invalid type for err."""
     instance = {"err": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property (allowed by default)."""
     instance = {"err": "{error}", "extra": "allowed"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
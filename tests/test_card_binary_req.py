@@ -3,74 +3,74 @@ import jsonschema
 
 SCHEMA_FILE = "card.binary.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.binary"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.binary"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_delete_true(schema):
+def test_valid_req_with_delete_true(validator):
     """Tests a valid request with delete=True."""
     instance = {"req": "card.binary", "delete": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_delete_false(schema):
+def test_valid_req_with_delete_false(validator):
     """Tests a valid request with delete=False."""
     instance = {"req": "card.binary", "delete": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd_with_delete_true(schema):
+def test_valid_cmd_with_delete_true(validator):
     """Tests a valid command with delete=True."""
     instance = {"cmd": "card.binary", "delete": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd_with_delete_false(schema):
+def test_valid_cmd_with_delete_false(validator):
     """Tests a valid command with delete=False."""
     instance = {"cmd": "card.binary", "delete": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"delete": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     # Check that the error is about failing the oneOf constraint
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.binary", "cmd": "card.binary"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     # Check that the error is about failing the oneOf constraint
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_req_value(schema):
+def test_invalid_req_value(validator):
     """Tests invalid value for req."""
     instance = {"req": "invalid.request"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_cmd_value(schema):
+def test_invalid_cmd_value(validator):
     """Tests invalid value for cmd."""
     instance = {"cmd": "invalid.command"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_delete_type(schema):
+def test_invalid_delete_type(validator):
     """Tests invalid type for delete."""
     instance = {"req": "card.binary", "delete": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.binary", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
@@ -4,79 +4,79 @@ import json
 
 SCHEMA_FILE = "card.carrier.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.carrier"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.carrier"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"mode": "charging"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.carrier", "cmd": "card.carrier"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_req_value(schema):
+def test_invalid_req_value(validator):
     """Tests invalid value for req."""
     instance = {"req": "invalid.req"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_cmd_value(schema):
+def test_invalid_cmd_value(validator):
     """Tests invalid value for cmd."""
     instance = {"cmd": "invalid.cmd"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_valid_mode_charging(schema):
+def test_valid_mode_charging(validator):
     """Tests valid mode 'charging'."""
     instance = {"req": "card.carrier", "mode": "charging"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_mode_hyphen(schema):
+def test_valid_mode_hyphen(validator):
     """Tests valid mode '-'."""
     instance = {"req": "card.carrier", "mode": "-"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_mode_off(schema):
+def test_valid_mode_off(validator):
     """Tests valid mode 'off'."""
     instance = {"req": "card.carrier", "mode": "off"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"req": "card.carrier", "mode": "invalid_mode"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'invalid_mode' is not one of ['charging', '-', 'off']" in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"req": "card.carrier", "mode": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.carrier", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -87,4 +87,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
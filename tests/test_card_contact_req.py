@@ -4,91 +4,91 @@ import json
 
 SCHEMA_FILE = "card.contact.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.contact"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.contact"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"name": "test"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.contact", "cmd": "card.contact"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_req_value(schema):
+def test_invalid_req_value(validator):
     """Tests invalid value for req."""
     instance = {"req": "invalid.req"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_cmd_value(schema):
+def test_invalid_cmd_value(validator):
     """Tests invalid value for cmd."""
     instance = {"cmd": "invalid.cmd"}
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_valid_name(schema):
+def test_valid_name(validator):
     """Tests valid name field."""
     instance = {"req": "card.contact", "name": "John Doe"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_name_invalid_type(schema):
+def test_name_invalid_type(validator):
     """Tests invalid type for name."""
     instance = {"req": "card.contact", "name": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_org(schema):
+def test_valid_org(validator):
     """Tests valid org field."""
     instance = {"req": "card.contact", "org": "Blues Wireless"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_org_invalid_type(schema):
+def test_org_invalid_type(validator):
     """Tests invalid type for org."""
     instance = {"req": "card.contact", "org": False}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "False is not of type 'string'" in str(excinfo.value)
 
-def test_valid_role(schema):
+def test_valid_role(validator):
     """Tests valid role field."""
     instance = {"req": "card.contact", "role": "Developer"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_role_invalid_type(schema):
+def test_role_invalid_type(validator):
     """Tests invalid type for role."""
     instance = {"req": "card.contact", "role": ["Admin"]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "['Admin'] is not of type 'string'" in str(excinfo.value)
 
-def test_valid_email(schema):
+def test_valid_email(validator):
     """Tests valid email field."""
     instance = {"req": "card.contact", "email": "test@example.com"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_email_invalid_type(schema):
+def test_email_invalid_type(validator):
     """Tests invalid type for email."""
     instance = {"req": "card.contact", "email": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all optional fields."""
     instance = {
         "req": "card.contact",
@@ -97,16 +97,16 @@ def test_valid_all_fields(schema):
         "role": "Manager",
         "email": "jane.doe@example.com"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.contact", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -117,4 +117,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
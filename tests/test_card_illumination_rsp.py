@@ -4,29 +4,29 @@ import json
 
 SCHEMA_FILE = "card.illumination.rsp.notecard.api.json"
 
-def test_valid_value(schema):
+def test_valid_value(validator):
     """Tests a valid response with the 'value' field."""
     instance = {"value": 100.5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_value_invalid_type(schema):
+def test_value_invalid_type(validator):
     """Tests an invalid type for the 'value' field."""
     instance = {"value": "high"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'high' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests a valid response with an additional property."""
     instance = {"value": 50, "status": "ok"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_empty_object_valid(schema):
+def test_empty_object_valid(validator):
     """Tests that an empty object is a valid response (lux is not required)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -37,4 +37,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -4,45 +4,45 @@ import json
 
 SCHEMA_FILE = "card.io.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.io"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.io"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"i2c": 0x18}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.io", "cmd": "card.io"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_valid_i2c(schema):
+def test_valid_i2c(validator):
     """Tests valid i2c field values."""
     instance = {"req": "card.io", "i2c": 0x18} # Set alternate address
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.io", "i2c": -1} # Reset to default
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_i2c_invalid_type(schema):
+def test_i2c_invalid_type(validator):
     """Tests invalid type for i2c."""
     instance = {"req": "card.io", "i2c": "0x18"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'0x18' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_mode_enums(schema):
+def test_valid_mode_enums(validator):
     """Tests valid mode enum values."""
     valid_modes = [
         "-usb", "usb", "+usb", "+busy", "-busy",
@@ -50,35 +50,35 @@ def test_valid_mode_enums(schema):
     ]
     for mode in valid_modes:
         instance = {"req": "card.io", "mode": mode}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"req": "card.io", "mode": "invalid"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'invalid' is not one of ['-" in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"req": "card.io", "mode": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "True is not of type 'string'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all optional fields."""
     instance = {"req": "card.io", "i2c": 0x19, "mode": "+usb"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.io", "extra": "property"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -89,4 +89,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
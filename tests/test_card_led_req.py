@@ -3,31 +3,31 @@ import jsonschema
 
 SCHEMA_FILE = "card.led.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.led"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.led"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"mode": "red"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.led", "cmd": "card.led"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_valid_mode_enums(schema):
+def test_valid_mode_enums(validator):
     """Tests valid mode enum values."""
     valid_modes = [
         "red", "green", "yellow", "blue", "cyan", "magenta",
@@ -35,68 +35,68 @@ def test_valid_mode_enums(schema):
     ]
     for mode in valid_modes:
         instance = {"req": "card.led", "mode": mode}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"req": "card.led", "mode": "purple"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'purple' is not one of ['red'," in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"req": "card.led", "mode": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_on(schema):
+def test_valid_on(validator):
     """Tests valid on field values."""
     instance = {"req": "card.led", "on": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.led", "on": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_on_invalid_type(schema):
+def test_on_invalid_type(validator):
     """Tests invalid type for on."""
     instance = {"req": "card.led", "on": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_off(schema):
+def test_valid_off(validator):
     """Tests valid off field values."""
     instance = {"req": "card.led", "off": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.led", "off": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_off_invalid_type(schema):
+def test_off_invalid_type(validator):
     """Tests invalid type for off."""
     instance = {"req": "card.led", "off": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_mode_and_on(schema):
+def test_valid_mode_and_on(validator):
     """Tests valid request with mode and on."""
     instance = {"req": "card.led", "mode": "blue", "on": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_mode_and_off(schema):
+def test_valid_mode_and_off(validator):
     """Tests valid request with mode and off."""
     instance = {"req": "card.led", "mode": "green", "off": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all optional fields."""
     instance = {"req": "card.led", "mode": "white", "on": True, "off": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.led", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
@@ -1,14 +1,11 @@
-import pytest
-import jsonschema
-
 SCHEMA_FILE = "card.led.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"status": "ok"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
@@ -3,96 +3,96 @@ import jsonschema
 
 SCHEMA_FILE = "card.location.mode.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_mode_enums(schema):
+def test_valid_mode_enums(validator):
     """Tests valid mode enum values."""
     valid_modes = ["continuous", "periodic", "off", "fixed"]
     for mode in valid_modes:
         instance = {"mode": mode}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"mode": "invalid"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'invalid' is not one of ['continuous'," in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"mode": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_seconds(schema):
+def test_valid_seconds(validator):
     """Tests valid seconds field."""
     instance = {"seconds": 3600}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"seconds": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_seconds_invalid_type(schema):
+def test_seconds_invalid_type(validator):
     """Tests invalid type for seconds."""
     instance = {"seconds": "3600"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'3600' is not of type 'integer'" in str(excinfo.value)
 
-def test_seconds_invalid_minimum(schema):
+def test_seconds_invalid_minimum(validator):
     """Tests invalid minimum for seconds."""
     instance = {"seconds": -10}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "-10 is less than the minimum of 0" in str(excinfo.value)
 
-def test_valid_lat(schema):
+def test_valid_lat(validator):
     """Tests valid lat field."""
     instance = {"lat": 42.12345}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"lat": -90}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lat_invalid_type(schema):
+def test_lat_invalid_type(validator):
     """Tests invalid type for lat."""
     instance = {"lat": "42.123"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'42.123' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_lon(schema):
+def test_valid_lon(validator):
     """Tests valid lon field."""
     instance = {"lon": -71.54321}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"lon": 180}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lon_invalid_type(schema):
+def test_lon_invalid_type(validator):
     """Tests invalid type for lon."""
     instance = {"lon": "-71.5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'-71.5' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_max(schema):
+def test_valid_max(validator):
     """Tests valid max field."""
     instance = {"max": 600}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"max": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_max_invalid_type(schema):
+def test_max_invalid_type(validator):
     """Tests invalid type for max."""
     instance = {"max": 600.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "600.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "mode": "fixed",
@@ -101,9 +101,9 @@ def test_valid_all_fields(schema):
         "lon": -74.0060,
         "max": 120
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"mode": "off", "reason": "user_request"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
@@ -3,101 +3,101 @@ import jsonschema
 
 SCHEMA_FILE = "card.location.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_status(schema):
+def test_valid_status(validator):
     """Tests valid status field."""
     instance = {"status": "{gps-status}"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_status_invalid_type(schema):
+def test_status_invalid_type(validator):
     """Tests invalid type for status."""
     instance = {"status": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_mode_enums(schema):
+def test_valid_mode_enums(validator):
     """Tests valid mode enum values."""
     valid_modes = ["continuous", "periodic", "off"]
     for mode in valid_modes:
         instance = {"mode": mode}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_mode_invalid_enum(schema):
+def test_mode_invalid_enum(validator):
     """Tests invalid mode enum value."""
     instance = {"mode": "always_on"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'always_on' is not one of ['continuous', 'periodic', 'off']" in str(excinfo.value)
 
-def test_mode_invalid_type(schema):
+def test_mode_invalid_type(validator):
     """Tests invalid type for mode."""
     instance = {"mode": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_lat(schema):
+def test_valid_lat(validator):
     """Tests valid lat field."""
     instance = {"lat": 42.12345}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"lat": -30}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lat_invalid_type(schema):
+def test_lat_invalid_type(validator):
     """Tests invalid type for lat."""
     instance = {"lat": "42.123"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'42.123' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_lon(schema):
+def test_valid_lon(validator):
     """Tests valid lon field."""
     instance = {"lon": -71.54321}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"lon": 180}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lon_invalid_type(schema):
+def test_lon_invalid_type(validator):
     """Tests invalid type for lon."""
     instance = {"lon": "-71.5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'-71.5' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_time(schema):
+def test_valid_time(validator):
     """Tests valid time field."""
     instance = {"time": 1678886400}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"time": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_time_invalid_type(schema):
+def test_time_invalid_type(validator):
     """Tests invalid type for time."""
     instance = {"time": 1678886400.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1678886400.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_max(schema):
+def test_valid_max(validator):
     """Tests valid max field."""
     instance = {"max": 3600}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"max": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_max_invalid_type(schema):
+def test_max_invalid_type(validator):
     """Tests invalid type for max."""
     instance = {"max": "unlimited"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'unlimited' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "status": "Located",
@@ -107,9 +107,9 @@ def test_valid_all_fields(schema):
         "time": 1700000000,
         "max": 1800
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"status": "ok", "accuracy": 10.5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
@@ -3,127 +3,127 @@ import jsonschema
 
 SCHEMA_FILE = "card.location.track.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.location.track"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.location.track"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"start": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.location.track", "cmd": "card.location.track"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_valid_start(schema):
+def test_valid_start(validator):
     """Tests valid start field."""
     instance = {"req": "card.location.track", "start": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "start": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_start_invalid_type(schema):
+def test_start_invalid_type(validator):
     """Tests invalid type for start."""
     instance = {"req": "card.location.track", "start": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_heartbeat(schema):
+def test_valid_heartbeat(validator):
     """Tests valid heartbeat field."""
     instance = {"req": "card.location.track", "heartbeat": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "heartbeat": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_heartbeat_invalid_type(schema):
+def test_heartbeat_invalid_type(validator):
     """Tests invalid type for heartbeat."""
     instance = {"req": "card.location.track", "heartbeat": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_hours(schema):
+def test_valid_hours(validator):
     """Tests valid hours field."""
     instance = {"req": "card.location.track", "hours": 24}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "hours": -60} # minutes
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "hours": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_hours_invalid_type(schema):
+def test_hours_invalid_type(validator):
     """Tests invalid type for hours."""
     instance = {"req": "card.location.track", "hours": "12"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'12' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_sync(schema):
+def test_valid_sync(validator):
     """Tests valid sync field."""
     instance = {"req": "card.location.track", "sync": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "sync": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_sync_invalid_type(schema):
+def test_sync_invalid_type(validator):
     """Tests invalid type for sync."""
     instance = {"req": "card.location.track", "sync": "maybe"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'maybe' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_stop(schema):
+def test_valid_stop(validator):
     """Tests valid stop field."""
     instance = {"req": "card.location.track", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "stop": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_stop_invalid_type(schema):
+def test_stop_invalid_type(validator):
     """Tests invalid type for stop."""
     instance = {"req": "card.location.track", "stop": 0}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "0 is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_file(schema):
+def test_valid_file(validator):
     """Tests valid file field."""
     instance = {"req": "card.location.track", "file": "mylogs.qo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.location.track", "file": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_file_invalid_type(schema):
+def test_file_invalid_type(validator):
     """Tests invalid type for file."""
     instance = {"req": "card.location.track", "file": False}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "False is not of type 'string'" in str(excinfo.value)
 
-def test_valid_start_heartbeat_hours(schema):
+def test_valid_start_heartbeat_hours(validator):
     """Tests valid combination: start, heartbeat, hours."""
     instance = {"req": "card.location.track", "start": True, "heartbeat": True, "hours": 1}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_stop_request(schema):
+def test_valid_stop_request(validator):
     """Tests valid stop request."""
     instance = {"req": "card.location.track", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all fields."""
     instance = {
         "req": "card.location.track",
@@ -134,11 +134,11 @@ def test_valid_all_fields(schema):
         "stop": False,
         "file": "custom_track.qo"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.location.track", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
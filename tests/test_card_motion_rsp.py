@@ -3,94 +3,94 @@ import jsonschema
 
 SCHEMA_FILE = "card.motion.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_count(schema):
+def test_valid_count(validator):
     """Tests valid count field."""
     instance = {"count": 10}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"count": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_count_invalid_type(schema):
+def test_count_invalid_type(validator):
     """Tests invalid type for count."""
     instance = {"count": "10"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'10' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_status(schema):
+def test_valid_status(validator):
     """Tests valid status field."""
     instance = {"status": "{motion-status-string}"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_status_invalid_type(schema):
+def test_status_invalid_type(validator):
     """Tests invalid type for status."""
     instance = {"status": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "True is not of type 'string'" in str(excinfo.value)
 
-def test_valid_alert(schema):
+def test_valid_alert(validator):
     """Tests valid alert field."""
     instance = {"alert": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"alert": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_alert_invalid_type(schema):
+def test_alert_invalid_type(validator):
     """Tests invalid type for alert."""
     instance = {"alert": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_motion(schema):
+def test_valid_motion(validator):
     """Tests valid motion field."""
     instance = {"motion": 1700000000}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"motion": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_motion_invalid_type(schema):
+def test_motion_invalid_type(validator):
     """Tests invalid type for motion."""
     instance = {"motion": 1700000000.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1700000000.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_seconds(schema):
+def test_valid_seconds(validator):
     """Tests valid seconds field."""
     instance = {"seconds": 300}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"seconds": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_seconds_invalid_type(schema):
+def test_seconds_invalid_type(validator):
     """Tests invalid type for seconds."""
     instance = {"seconds": "300"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'300' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_movements(schema):
+def test_valid_movements(validator):
     """Tests valid movements field."""
     instance = {"movements": "0,1,2,3,4,5"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"movements": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_movements_invalid_type(schema):
+def test_movements_invalid_type(validator):
     """Tests invalid type for movements."""
     instance = {"movements": 123456}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123456 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid response with all fields."""
     instance = {
         "count": 5,
@@ -100,9 +100,9 @@ def test_valid_all_fields(schema):
         "seconds": 12,
         "movements": "0,0,1,2,1,1"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"status": "ok", "orientation": "flat"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
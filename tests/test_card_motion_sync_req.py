@@ -3,117 +3,117 @@ import jsonschema
 
 SCHEMA_FILE = "card.motion.sync.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.motion.sync"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.motion.sync"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"start": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.motion.sync", "cmd": "card.motion.sync"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_valid_start(schema):
+def test_valid_start(validator):
     """Tests valid start field."""
     instance = {"req": "card.motion.sync", "start": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "start": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_start_invalid_type(schema):
+def test_start_invalid_type(validator):
     """Tests invalid type for start."""
     instance = {"req": "card.motion.sync", "start": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_stop(schema):
+def test_valid_stop(validator):
     """Tests valid stop field."""
     instance = {"req": "card.motion.sync", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "stop": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_stop_invalid_type(schema):
+def test_stop_invalid_type(validator):
     """Tests invalid type for stop."""
     instance = {"req": "card.motion.sync", "stop": 0}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "0 is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_minutes(schema):
+def test_valid_minutes(validator):
     """Tests valid minutes field."""
     instance = {"req": "card.motion.sync", "minutes": 15}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "minutes": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "minutes": -10} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_minutes_invalid_type(schema):
+def test_minutes_invalid_type(validator):
     """Tests invalid type for minutes."""
     instance = {"req": "card.motion.sync", "minutes": "15"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'15' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_count(schema):
+def test_valid_count(validator):
     """Tests valid count field."""
     instance = {"req": "card.motion.sync", "count": 5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "count": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "count": -1} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_count_invalid_type(schema):
+def test_count_invalid_type(validator):
     """Tests invalid type for count."""
     instance = {"req": "card.motion.sync", "count": "5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'5' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_threshold(schema):
+def test_valid_threshold(validator):
     """Tests valid threshold field."""
     instance = {"req": "card.motion.sync", "threshold": 3}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "threshold": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.sync", "threshold": -2} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_threshold_invalid_type(schema):
+def test_threshold_invalid_type(validator):
     """Tests invalid type for threshold."""
     instance = {"req": "card.motion.sync", "threshold": "3"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'3' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_start_with_params(schema):
+def test_valid_start_with_params(validator):
     """Tests valid start request with parameters."""
     instance = {"req": "card.motion.sync", "start": True, "minutes": 10, "count": 5, "threshold": 3}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_stop_request(schema):
+def test_valid_stop_request(validator):
     """Tests valid stop request."""
     instance = {"req": "card.motion.sync", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all fields."""
     instance = {
         "req": "card.motion.sync",
@@ -123,11 +123,11 @@ def test_valid_all_fields(schema):
         "count": 10,
         "threshold": 2
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.motion.sync", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
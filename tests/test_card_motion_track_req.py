@@ -3,150 +3,150 @@ import jsonschema
 
 SCHEMA_FILE = "card.motion.track.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.motion.track"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.motion.track"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"start": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.motion.track", "cmd": "card.motion.track"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_valid_start(schema):
+def test_valid_start(validator):
     """Tests valid start field."""
     instance = {"req": "card.motion.track", "start": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "start": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_start_invalid_type(schema):
+def test_start_invalid_type(validator):
     """Tests invalid type for start."""
     instance = {"req": "card.motion.track", "start": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_stop(schema):
+def test_valid_stop(validator):
     """Tests valid stop field."""
     instance = {"req": "card.motion.track", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "stop": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_stop_invalid_type(schema):
+def test_stop_invalid_type(validator):
     """Tests invalid type for stop."""
     instance = {"req": "card.motion.track", "stop": 0}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "0 is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_minutes(schema):
+def test_valid_minutes(validator):
     """Tests valid minutes field."""
     instance = {"req": "card.motion.track", "minutes": 15}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "minutes": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "minutes": -10} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_minutes_invalid_type(schema):
+def test_minutes_invalid_type(validator):
     """Tests invalid type for minutes."""
     instance = {"req": "card.motion.track", "minutes": "15"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'15' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_count(schema):
+def test_valid_count(validator):
     """Tests valid count field."""
     instance = {"req": "card.motion.track", "count": 5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "count": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "count": -1} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_count_invalid_type(schema):
+def test_count_invalid_type(validator):
     """Tests invalid type for count."""
     instance = {"req": "card.motion.track", "count": "5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'5' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_threshold(schema):
+def test_valid_threshold(validator):
     """Tests valid threshold field."""
     instance = {"req": "card.motion.track", "threshold": 3}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "threshold": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "threshold": -2} # Allows negative?
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_threshold_invalid_type(schema):
+def test_threshold_invalid_type(validator):
     """Tests invalid type for threshold."""
     instance = {"req": "card.motion.track", "threshold": "3"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'3' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_file(schema):
+def test_valid_file(validator):
     """Tests valid file field."""
     instance = {"req": "card.motion.track", "file": "motion_logs.qo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "file": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_file_invalid_type(schema):
+def test_file_invalid_type(validator):
     """Tests invalid type for file."""
     instance = {"req": "card.motion.track", "file": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_now(schema):
+def test_valid_now(validator):
     """Tests valid now field."""
     instance = {"req": "card.motion.track", "now": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.motion.track", "now": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_now_invalid_type(schema):
+def test_now_invalid_type(validator):
     """Tests invalid type for now."""
     instance = {"req": "card.motion.track", "now": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_start_with_params(schema):
+def test_valid_start_with_params(validator):
     """Tests valid start request with parameters."""
     instance = {"req": "card.motion.track", "start": True, "minutes": 10, "count": 5, "threshold": 3, "file": "_motion.qo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_stop_request(schema):
+def test_valid_stop_request(validator):
     """Tests valid stop request."""
     instance = {"req": "card.motion.track", "stop": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_now_request(schema):
+def test_valid_now_request(validator):
     """Tests valid now request."""
     instance = {"req": "card.motion.track", "now": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests valid request with all fields."""
     instance = {
         "req": "card.motion.track",
@@ -158,11 +158,11 @@ def test_valid_all_fields(schema):
         "file": "custom_motion.qo",
         "now": True
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "card.motion.track", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
@@ -4,81 +4,81 @@ import json
 
 SCHEMA_FILE = "card.status.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_status(schema):
+def test_valid_status(validator):
     """Tests valid status field."""
     instance = {"status": "{normal}"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_status_invalid_type(schema):
+def test_status_invalid_type(validator):
     """Tests invalid type for status."""
     instance = {"status": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
 @pytest.mark.parametrize(
     "field_name",
     ["usb", "connected", "cell", "sync", "gps", "wifi"]
 )
-def test_valid_boolean_field(schema, field_name):
+def test_valid_boolean_field(validator, field_name):
     """Tests valid boolean type for various fields."""
     instance = {field_name: True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {field_name: False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
 @pytest.mark.parametrize(
     "field_name",
     ["usb", "connected", "cell", "sync", "gps", "wifi"]
 )
-def test_invalid_type_for_boolean_field(schema, field_name):
+def test_invalid_type_for_boolean_field(validator, field_name):
     """Tests invalid type for various boolean fields."""
     instance = {field_name: "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
 @pytest.mark.parametrize(
     "field_name",
     ["storage", "time", "inbound", "outbound"]
 )
-def test_valid_integer_field(schema, field_name):
+def test_valid_integer_field(validator, field_name):
     """Tests valid integer type for various fields."""
     instance = {field_name: 10}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {field_name: 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {field_name: -5} # Check if negative allowed
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
 @pytest.mark.parametrize(
     "field_name",
     ["storage", "time", "inbound", "outbound"]
 )
-def test_invalid_type_for_integer_field(schema, field_name):
+def test_invalid_type_for_integer_field(validator, field_name):
     """Tests invalid (string) type for various integer fields."""
     instance = {field_name: "10"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'10' is not of type 'integer'" in str(excinfo.value)
 
 @pytest.mark.parametrize(
     "field_name",
     ["storage", "time", "inbound", "outbound"]
 )
-def test_invalid_float_type_for_integer_field(schema, field_name):
+def test_invalid_float_type_for_integer_field(validator, field_name):
     """Tests invalid (float) type for various integer fields."""
     instance = {field_name: 10.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "10.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "status": "{normal}",
@@ -93,14 +93,14 @@ def test_valid_all_fields(schema):
         "inbound": 0,
         "outbound": 2
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"status": "{normal}", "extra": "info"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -111,4 +111,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
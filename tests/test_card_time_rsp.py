@@ -4,98 +4,98 @@ import json
 
 SCHEMA_FILE = "card.time.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_time(schema):
+def test_valid_time(validator):
     """Tests valid time field."""
     instance = {"time": 1678886400}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_time_invalid_type(schema):
+def test_time_invalid_type(validator):
     """Tests invalid type for time."""
     instance = {"time": "1678886400"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'1678886400' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_area(schema):
+def test_valid_area(validator):
     """Tests valid area field."""
     instance = {"area": "Greater Boston"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_area_invalid_type(schema):
+def test_area_invalid_type(validator):
     """Tests invalid type for area."""
     instance = {"area": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_zone(schema):
+def test_valid_zone(validator):
     """Tests valid zone field."""
     instance = {"zone": "America/New_York"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_zone_invalid_type(schema):
+def test_zone_invalid_type(validator):
     """Tests invalid type for zone."""
     instance = {"zone": True}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "True is not of type 'string'" in str(excinfo.value)
 
-def test_valid_minutes(schema):
+def test_valid_minutes(validator):
     """Tests valid minutes field."""
     instance = {"minutes": -240} # EST offset
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"minutes": 0} # UTC
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_minutes_invalid_type(schema):
+def test_minutes_invalid_type(validator):
     """Tests invalid type for minutes."""
     instance = {"minutes": "-240"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'-240' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_lat(schema):
+def test_valid_lat(validator):
     """Tests valid lat field."""
     instance = {"lat": 42.3601}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lat_invalid_type(schema):
+def test_lat_invalid_type(validator):
     """Tests invalid type for lat."""
     instance = {"lat": "42.3601"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'42.3601' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_lon(schema):
+def test_valid_lon(validator):
     """Tests valid lon field."""
     instance = {"lon": -71.0589}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_lon_invalid_type(schema):
+def test_lon_invalid_type(validator):
     """Tests invalid type for lon."""
     instance = {"lon": "-71.0589"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'-71.0589' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_country(schema):
+def test_valid_country(validator):
     """Tests valid country field."""
     instance = {"country": "US"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_country_invalid_type(schema):
+def test_country_invalid_type(validator):
     """Tests invalid type for country."""
     instance = {"country": 1}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "1 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "time": 1678886400,
@@ -106,14 +106,14 @@ def test_valid_all_fields(schema):
         "lon": -122.0575,
         "country": "US"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"time": 1700000000, "source": "gps"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -124,4 +124,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -4,10 +4,10 @@ import json
 
 SCHEMA_FILE = "card.usage.get.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
 # Test integer fields
 @pytest.mark.parametrize(
@@ -17,14 +17,14 @@ def test_minimal_valid_rsp(schema):
         "notes_sent", "notes_received", "sessions_standard", "sessions_secure"
     ]
 )
-def test_valid_integer_field(schema, field_name):
+def test_valid_integer_field(validator, field_name):
     """Tests valid integer type for various fields."""
     instance = {field_name: 123}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {field_name: 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {field_name: -10} # Check if negative allowed
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
 @pytest.mark.parametrize(
     "field_name",
@@ -33,11 +33,11 @@ def test_valid_integer_field(schema, field_name):
         "notes_sent", "notes_received", "sessions_standard", "sessions_secure"
     ]
 )
-def test_invalid_type_for_integer_field(schema, field_name):
+def test_invalid_type_for_integer_field(validator, field_name):
     """Tests invalid (string) type for various integer fields."""
     instance = {field_name: "123"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'123' is not of type 'integer'" in str(excinfo.value)
 
 @pytest.mark.parametrize(
@@ -47,14 +47,14 @@ def test_invalid_type_for_integer_field(schema, field_name):
         "notes_sent", "notes_received", "sessions_standard", "sessions_secure"
     ]
 )
-def test_invalid_float_type_for_integer_field(schema, field_name):
+def test_invalid_float_type_for_integer_field(validator, field_name):
     """Tests invalid (float) type for various integer fields."""
     instance = {field_name: 123.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields populated."""
     instance = {
         "seconds": 3600,
@@ -66,14 +66,14 @@ def test_valid_all_fields(schema):
         "sessions_standard": 2,
         "sessions_secure": 1
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"seconds": 60, "source": "live"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -84,4 +84,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
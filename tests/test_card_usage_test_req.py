@@ -4,120 +4,120 @@ import json
 
 SCHEMA_FILE = "card.usage.test.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.usage.test"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.usage.test"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_days(schema):
+def test_valid_req_with_days(validator):
     """Tests valid request with req and days parameter."""
     instance = {"req": "card.usage.test", "days": 7}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_hours(schema):
+def test_valid_req_with_hours(validator):
     """Tests valid request with req and hours parameter."""
     instance = {"req": "card.usage.test", "hours": 12}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_megabytes(schema):
+def test_valid_req_with_megabytes(validator):
     """Tests valid request with req and megabytes parameter."""
     instance = {"req": "card.usage.test", "megabytes": 500}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd_with_all_params(schema):
+def test_valid_cmd_with_all_params(validator):
     """Tests valid request with cmd and all parameters."""
     instance = {"cmd": "card.usage.test", "days": 30, "megabytes": 1024}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_req_with_days_and_megabytes(schema):
+def test_valid_req_with_days_and_megabytes(validator):
     """Tests valid request with req, days, and megabytes."""
     instance = {"req": "card.usage.test", "days": 14, "megabytes": 2048}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_days_invalid_type(schema):
+def test_days_invalid_type(validator):
     """Tests invalid type for days parameter."""
     instance = {"req": "card.usage.test", "days": "seven"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'seven' is not of type 'integer'" in str(excinfo.value)
 
-def test_hours_invalid_type(schema):
+def test_hours_invalid_type(validator):
     """Tests invalid type for hours parameter."""
     instance = {"req": "card.usage.test", "hours": 12.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "12.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_megabytes_invalid_type(schema):
+def test_megabytes_invalid_type(validator):
     """Tests invalid type for megabytes parameter."""
     instance = {"req": "card.usage.test", "megabytes": "1024"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'1024' is not of type 'integer'" in str(excinfo.value)
 
-def test_days_negative_value(schema):
+def test_days_negative_value(validator):
     """Tests negative value for days parameter."""
     instance = {"req": "card.usage.test", "days": -5}
-    jsonschema.validate(instance=instance, schema=schema)  # Schema doesn't restrict negative values
+    validator.validate(instance)  # Schema doesn't restrict negative values
 
-def test_hours_zero_value(schema):
+def test_hours_zero_value(validator):
     """Tests zero value for hours parameter."""
     instance = {"req": "card.usage.test", "hours": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_megabytes_large_value(schema):
+def test_megabytes_large_value(validator):
     """Tests large value for megabytes parameter."""
     instance = {"req": "card.usage.test", "megabytes": 999999}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_req_invalid_value(schema):
+def test_req_invalid_value(validator):
     """Tests invalid req value."""
     instance = {"req": "invalid.command"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'card.usage.test' was expected" in str(excinfo.value)
 
-def test_cmd_invalid_value(schema):
+def test_cmd_invalid_value(validator):
     """Tests invalid cmd value."""
     instance = {"cmd": "invalid.command"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'card.usage.test' was expected" in str(excinfo.value)
 
-def test_invalid_empty_object(schema):
+def test_invalid_empty_object(validator):
     """Tests invalid empty object (needs req or cmd)."""
     instance = {}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.usage.test", "cmd": "card.usage.test"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_additional_property_with_req(schema):
+def test_invalid_additional_property_with_req(validator):
     """Tests invalid request with req and an additional property."""
     instance = {"req": "card.usage.test", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_invalid_additional_property_with_cmd(schema):
+def test_invalid_additional_property_with_cmd(validator):
     """Tests invalid request with cmd and an additional property."""
     instance = {"cmd": "card.usage.test", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -128,4 +128,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
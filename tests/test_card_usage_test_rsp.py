@@ -4,67 +4,67 @@ import json
 
 SCHEMA_FILE = "card.usage.test.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_max_response(schema):
+def test_valid_max_response(validator):
     """Tests valid response with max field."""
     instance = {"max": 12730}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_days_response(schema):
+def test_valid_days_response(validator):
     """Tests valid response with days field."""
     instance = {"days": 7}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_bytes_per_day_response(schema):
+def test_valid_bytes_per_day_response(validator):
     """Tests valid response with bytes_per_day field."""
     instance = {"bytes_per_day": 41136}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_seconds_response(schema):
+def test_valid_seconds_response(validator):
     """Tests valid response with seconds field."""
     instance = {"seconds": 1291377}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_time_response(schema):
+def test_valid_time_response(validator):
     """Tests valid response with time field (UNIX timestamp)."""
     instance = {"time": 1598479763}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_bytes_sent_response(schema):
+def test_valid_bytes_sent_response(validator):
     """Tests valid response with bytes_sent field."""
     instance = {"bytes_sent": 163577}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_bytes_received_response(schema):
+def test_valid_bytes_received_response(validator):
     """Tests valid response with bytes_received field."""
     instance = {"bytes_received": 454565}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_notes_sent_response(schema):
+def test_valid_notes_sent_response(validator):
     """Tests valid response with notes_sent field."""
     instance = {"notes_sent": 114}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_notes_received_response(schema):
+def test_valid_notes_received_response(validator):
     """Tests valid response with notes_received field."""
     instance = {"notes_received": 26}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_sessions_standard_response(schema):
+def test_valid_sessions_standard_response(validator):
     """Tests valid response with sessions_standard field."""
     instance = {"sessions_standard": 143}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_sessions_secure_response(schema):
+def test_valid_sessions_secure_response(validator):
     """Tests valid response with sessions_secure field."""
     instance = {"sessions_secure": 31}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_complete_response(schema):
+def test_valid_complete_response(validator):
     """Tests valid response with all fields."""
     instance = {
         "max": 12730,
@@ -79,86 +79,86 @@ def test_valid_complete_response(schema):
         "sessions_standard": 143,
         "sessions_secure": 31
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_max_invalid_type(schema):
+def test_max_invalid_type(validator):
     """Tests invalid type for max field."""
     instance = {"max": "12730"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'12730' is not of type 'integer'" in str(excinfo.value)
 
-def test_days_invalid_type(schema):
+def test_days_invalid_type(validator):
     """Tests invalid type for days field."""
     instance = {"days": 7.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "7.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_bytes_per_day_invalid_type(schema):
+def test_bytes_per_day_invalid_type(validator):
     """Tests invalid type for bytes_per_day field."""
     instance = {"bytes_per_day": "41136"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'41136' is not of type 'integer'" in str(excinfo.value)
 
-def test_seconds_invalid_type(schema):
+def test_seconds_invalid_type(validator):
     """Tests invalid type for seconds field."""
     instance = {"seconds": [1291377]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "[1291377] is not of type 'integer'" in str(excinfo.value)
 
-def test_time_invalid_type(schema):
+def test_time_invalid_type(validator):
     """Tests invalid type for time field."""
     instance = {"time": "1598479763"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'1598479763' is not of type 'integer'" in str(excinfo.value)
 
-def test_bytes_sent_invalid_type(schema):
+def test_bytes_sent_invalid_type(validator):
     """Tests invalid type for bytes_sent field."""
     instance = {"bytes_sent": "163577"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'163577' is not of type 'integer'" in str(excinfo.value)
 
-def test_bytes_received_invalid_type(schema):
+def test_bytes_received_invalid_type(validator):
     """Tests invalid type for bytes_received field."""
     instance = {"bytes_received": None}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "None is not of type 'integer'" in str(excinfo.value)
 
-def test_notes_sent_invalid_type(schema):
+def test_notes_sent_invalid_type(validator):
     """Tests invalid type for notes_sent field."""
     instance = {"notes_sent": "114"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'114' is not of type 'integer'" in str(excinfo.value)
 
-def test_notes_received_invalid_type(schema):
+def test_notes_received_invalid_type(validator):
     """Tests invalid type for notes_received field."""
     instance = {"notes_received": {"value": 26}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "{'value': 26} is not of type 'integer'" in str(excinfo.value)
 
-def test_sessions_standard_invalid_type(schema):
+def test_sessions_standard_invalid_type(validator):
     """Tests invalid type for sessions_standard field."""
     instance = {"sessions_standard": "143"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'143' is not of type 'integer'" in str(excinfo.value)
 
-def test_sessions_secure_invalid_type(schema):
+def test_sessions_secure_invalid_type(validator):
     """Tests invalid type for sessions_secure field."""
     instance = {"sessions_secure": 31.5}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "31.5 is not of type 'integer'" in str(excinfo.value)
 
-def test_zero_values_valid(schema):
+def test_zero_values_valid(validator):
     """Tests that zero values are valid for all integer fields."""
     instance = {
         "max": 0,
@@ -173,27 +173,27 @@ def test_zero_values_valid(schema):
         "sessions_standard": 0,
         "sessions_secure": 0
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_negative_values_valid(schema):
+def test_negative_values_valid(validator):
     """Tests that negative values are valid (schema doesn't restrict them)."""
     instance = {
         "max": -1,
         "days": -5,
         "bytes_per_day": -100
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_large_values_valid(schema):
+def test_large_values_valid(validator):
     """Tests that large integer values are valid."""
     instance = {
         "max": 999999999,
         "bytes_sent": 2147483647,
         "time": 9999999999
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -204,4 +204,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -4,78 +4,78 @@ import json
 
 SCHEMA_FILE = "card.wifi.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_rsp_with_secure(schema):
+def test_valid_rsp_with_secure(validator):
     """Tests a valid response with the secure field."""
     instance = {"secure": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"secure": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_secure_invalid_type(schema):
+def test_secure_invalid_type(validator):
     """Tests invalid type for secure."""
     instance = {"secure": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_rsp_with_version(schema):
+def test_valid_rsp_with_version(validator):
     """Tests a valid response with the version field."""
     instance = {"version": "3.12.3"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"version": "1.0.0"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"version": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_version_invalid_type(schema):
+def test_version_invalid_type(validator):
     """Tests invalid type for version."""
     instance = {"version": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_rsp_with_ssid(schema):
+def test_valid_rsp_with_ssid(validator):
     """Tests a valid response with the ssid field."""
     instance = {"ssid": "MyHomeNetwork"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"ssid": "WiFi-Guest"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"ssid": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_ssid_invalid_type(schema):
+def test_ssid_invalid_type(validator):
     """Tests invalid type for ssid."""
     instance = {"ssid": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_rsp_with_security(schema):
+def test_valid_rsp_with_security(validator):
     """Tests a valid response with the security field."""
     instance = {"security": "wpa2-psk"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"security": "wpa3"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"security": "open"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"security": "wep"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"security": ""}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_security_invalid_type(schema):
+def test_security_invalid_type(validator):
     """Tests invalid type for security."""
     instance = {"security": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_rsp_all_fields(schema):
+def test_valid_rsp_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "secure": True,
@@ -83,25 +83,25 @@ def test_valid_rsp_all_fields(schema):
         "ssid": "MyHomeNetwork",
         "security": "wpa2-psk"
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_rsp_partial_fields(schema):
+def test_valid_rsp_partial_fields(validator):
     """Tests valid responses with various field combinations."""
     instance = {"secure": True, "ssid": "MyNetwork"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     instance = {"version": "3.12.3", "security": "open"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     instance = {"secure": False, "version": "2.1.0", "ssid": "TestNetwork"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property (allowed by default)."""
     instance = {"secure": True, "extra": 123}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -112,4 +112,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
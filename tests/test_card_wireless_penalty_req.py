@@ -4,129 +4,129 @@ import json
 
 SCHEMA_FILE = "card.wireless.penalty.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "card.wireless.penalty"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "card.wireless.penalty"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_empty_object(schema):
+def test_invalid_empty_object(validator):
     """Tests invalid empty object (needs req or cmd)."""
     instance = {}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "card.wireless.penalty", "cmd": "card.wireless.penalty"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_additional_property_with_req(schema):
+def test_invalid_additional_property_with_req(validator):
     """Tests invalid request with req and an additional property."""
     instance = {"req": "card.wireless.penalty", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_invalid_additional_property_with_cmd(schema):
+def test_invalid_additional_property_with_cmd(validator):
     """Tests invalid request with cmd and an additional property."""
     instance = {"cmd": "card.wireless.penalty", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(excinfo.value)
 
-def test_valid_reset(schema):
+def test_valid_reset(validator):
     """Tests valid reset field."""
     instance = {"req": "card.wireless.penalty", "reset": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "reset": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_reset_invalid_type(schema):
+def test_reset_invalid_type(validator):
     """Tests invalid type for reset."""
     instance = {"req": "card.wireless.penalty", "reset": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_set(schema):
+def test_valid_set(validator):
     """Tests valid set field."""
     instance = {"req": "card.wireless.penalty", "set": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "set": False}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_set_invalid_type(schema):
+def test_set_invalid_type(validator):
     """Tests invalid type for set."""
     instance = {"req": "card.wireless.penalty", "set": "true"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'true' is not of type 'boolean'" in str(excinfo.value)
 
-def test_valid_rate(schema):
+def test_valid_rate(validator):
     """Tests valid rate field."""
     instance = {"req": "card.wireless.penalty", "rate": 2.0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "rate": 1.25}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_rate_invalid_type(schema):
+def test_rate_invalid_type(validator):
     """Tests invalid type for rate."""
     instance = {"req": "card.wireless.penalty", "rate": "2.0"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'2.0' is not of type 'number'" in str(excinfo.value)
 
-def test_valid_add(schema):
+def test_valid_add(validator):
     """Tests valid add field."""
     instance = {"req": "card.wireless.penalty", "add": 10}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "add": 15}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_add_invalid_type(schema):
+def test_add_invalid_type(validator):
     """Tests invalid type for add."""
     instance = {"req": "card.wireless.penalty", "add": "10"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'10' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_max(schema):
+def test_valid_max(validator):
     """Tests valid max field."""
     instance = {"req": "card.wireless.penalty", "max": 720}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "max": 4320}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_max_invalid_type(schema):
+def test_max_invalid_type(validator):
     """Tests invalid type for max."""
     instance = {"req": "card.wireless.penalty", "max": "720"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'720' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_min(schema):
+def test_valid_min(validator):
     """Tests valid min field."""
     instance = {"req": "card.wireless.penalty", "min": 5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"req": "card.wireless.penalty", "min": 15}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_min_invalid_type(schema):
+def test_min_invalid_type(validator):
     """Tests invalid type for min."""
     instance = {"req": "card.wireless.penalty", "min": "5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'5' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_set_with_override_fields(schema):
+def test_valid_set_with_override_fields(validator):
     """Tests valid request with set and override fields."""
     instance = {
         "req": "card.wireless.penalty", 
@@ -136,14 +136,14 @@ def test_valid_set_with_override_fields(schema):
         "max": 720, 
         "min": 5
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_reset_only(schema):
+def test_valid_reset_only(validator):
     """Tests valid request with only reset field."""
     instance = {"req": "card.wireless.penalty", "reset": True}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -154,4 +154,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
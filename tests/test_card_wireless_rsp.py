@@ -3,60 +3,60 @@ import jsonschema
 
 SCHEMA_FILE = "card.wireless.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_status(schema):
+def test_valid_status(validator):
     """Tests valid status field."""
     instance = {"status": "{modem-status}"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_status_invalid_type(schema):
+def test_status_invalid_type(validator):
     """Tests invalid type for status."""
     instance = {"status": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_count(schema):
+def test_valid_count(validator):
     """Tests valid count field."""
     instance = {"count": 5}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"count": 0}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_count_invalid_type(schema):
+def test_count_invalid_type(validator):
     """Tests invalid type for count."""
     instance = {"count": "5"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'5' is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_net_empty_array(schema):
+def test_valid_net_empty_array(validator):
     """Tests valid net field with an empty array."""
     instance = {"net": []}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_net_invalid_type(schema):
+def test_net_invalid_type(validator):
     """Tests invalid type for net (must be array)."""
     instance = {"net": {}}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "{} is not of type 'array'" in str(excinfo.value)
 
-def test_net_invalid_item_type(schema):
+def test_net_invalid_item_type(validator):
     """Tests invalid item type within net array (must be object)."""
     instance = {"net": ["invalid"]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'invalid' is not of type 'object'" in str(excinfo.value)
 
-def test_valid_net_item_empty_object(schema):
+def test_valid_net_item_empty_object(validator):
     """Tests valid net array with an empty object item."""
     instance = {"net": [{}]}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
 # Parametrized tests for net item sub-properties (string)
 @pytest.mark.parametrize(
@@ -66,16 +66,16 @@ def test_valid_net_item_empty_object(schema):
         ("band", "20", True)
     ]
 )
-def test_net_item_string_sub_properties(schema, sub_field, valid_value, invalid_value):
+def test_net_item_string_sub_properties(validator, sub_field, valid_value, invalid_value):
     """Tests valid and invalid types for net item string sub-properties."""
     # Valid type
     instance = {"net": [{sub_field: valid_value}]}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"net": [{sub_field: invalid_value}]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert f"is not of type 'string'" in str(excinfo.value)
 
 # Parametrized tests for net item sub-properties (integer)
@@ -89,19 +89,19 @@ def test_net_item_string_sub_properties(schema, sub_field, valid_value, invalid_
         ("cid", 54321, 54321.5)
     ]
 )
-def test_net_item_integer_sub_properties(schema, sub_field, valid_value, invalid_value):
+def test_net_item_integer_sub_properties(validator, sub_field, valid_value, invalid_value):
     """Tests valid and invalid types for net item integer sub-properties."""
     # Valid type
     instance = {"net": [{sub_field: valid_value}]}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
     # Invalid type
     instance = {"net": [{sub_field: invalid_value}]}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert f"is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_net_item_all_fields(schema):
+def test_valid_net_item_all_fields(validator):
     """Tests valid net array with item having all sub-properties."""
     instance = {"net": [{
         "rat": "nbiot",
@@ -112,9 +112,9 @@ def test_valid_net_item_all_fields(schema):
         "lac": 5432,
         "cid": 98765
     }]}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_all_top_level_fields(schema):
+def test_valid_all_top_level_fields(validator):
     """Tests valid response with all top-level fields."""
     instance = {
         "status": "connected",
@@ -124,9 +124,9 @@ def test_valid_all_top_level_fields(schema):
             "rssi": -85
         }]
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property."""
     instance = {"status": "ok", "imei": "123456789012345"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
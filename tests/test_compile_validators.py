@@ -0,0 +1,98 @@
+import copy
+import json
+import pytest
+import jsonschema
+
+from notecard_validator import API_SCHEMA_FILE, build_registry, load_schema_files
+from compile_validators import CompileError, SchemaCompiler, compile_module, function_name, load_compiled_module
+
+# Values substituted into every property of every sample to probe type,
+# const, enum, pattern and bound checks on both sides of each boundary.
+PROBE_VALUES = [
+    None, True, False, 0, -1, -2, 1, 59, 60, 1.5, 2.0, "", "x", "arm", "arm,files",
+    "watchdog", "sleep", "files", "-all", "data.qi", "green", [], ["data.qi"], [1], {}, {"a": 1},
+]
+
+@pytest.fixture(scope='module')
+def schemas():
+    return load_schema_files()
+
+@pytest.fixture(scope='module')
+def compiled(schemas):
+    return load_compiled_module(schemas)
+
+def _corpus(filename, schema):
+    """Yields sample instances plus boundary mutations of each of them."""
+    bases = [json.loads(sample["json"]) for sample in schema.get("samples", [])]
+    name = filename.split(".req.")[0]
+    if ".req." in filename:
+        bases += [{"req": name}, {"cmd": name}]
+    else:
+        bases.append({})
+    properties = list(schema.get("properties", {})) + ["extra"]
+    for base in bases:
+        yield base
+        yield [base]
+        for key in list(base):
+            mutated = dict(base)
+            del mutated[key]
+            yield mutated
+        for key in properties:
+            for value in PROBE_VALUES:
+                mutated = copy.deepcopy(base)
+                mutated[key] = value
+                yield mutated
+        if "req" in base:
+            yield dict(base, cmd=base["req"])
+
+def test_compiled_module_matches_jsonschema(schemas, compiled):
+    """Tests that every compiled validator accepts/rejects exactly what Draft202012Validator does."""
+    registry = build_registry(schemas)
+    for filename, schema in schemas.items():
+        if filename == API_SCHEMA_FILE:
+            continue
+        reference = jsonschema.Draft202012Validator(schema, registry=registry)
+        function = getattr(compiled, function_name(filename))
+        for instance in _corpus(filename, schema):
+            expected = reference.is_valid(instance)
+            actual = function(instance) is None
+            assert actual == expected, f"{filename}: {instance!r} -> {function(instance)}"
+
+def test_compiled_dispatch_matches_oneof(schemas, compiled):
+    """Tests that dispatched and full-oneOf compiled validation agree with notecard.api.json."""
+    registry = build_registry(schemas)
+    reference = jsonschema.Draft202012Validator(schemas[API_SCHEMA_FILE], registry=registry)
+    instances = [{}, {"req": "card.nope"}, {"req": "card.attn", "cmd": "hub.set"}, []]
+    for filename, schema in schemas.items():
+        if ".req." in filename:
+            instances += [json.loads(sample["json"]) for sample in schema.get("samples", [])]
+    for instance in instances:
+        expected = reference.is_valid(instance)
+        assert (compiled.validate_request(instance) is None) == expected, instance
+        assert (compiled.notecard_api(instance) is None) == expected, instance
+
+def test_compiled_error_messages(compiled):
+    """Tests that compiled validators describe the first failure."""
+    assert compiled.validate_request({"req": "card.attn", "mode": "arm"}) is None
+    assert compiled.validate_request({"req": "card.attn", "mode": "watchdog", "seconds": 59}) == \
+        "seconds: 59 is less than the minimum of 60"
+    assert compiled.validate_request({"req": "card.attn", "extra": 1}) == \
+        "Additional properties are not allowed ('extra' was unexpected)"
+    assert compiled.validate_response("card.version", {"version": 1}) is not None
+
+def test_unsupported_keyword_raises():
+    """Tests that schemas using unsupported keywords fail to compile."""
+    compiler = SchemaCompiler({})
+    with pytest.raises(CompileError):
+        compiler.stmts({"patternProperties": {"^x": {"type": "string"}}}, "v")
+    with pytest.raises(CompileError):
+        compiler.stmts({"$ref": "https://example.com/missing.json"}, "v")
+
+def test_generated_source_is_importable(schemas, tmp_path):
+    """Tests that the generated module source is valid, standalone Python."""
+    path = tmp_path / "notecard_validators.py"
+    path.write_text(compile_module(schemas))
+    namespace = {}
+    exec(compile(path.read_text(), str(path), "exec"), namespace)
+    assert "card.attn" in namespace["REQUESTS"]
+    assert "card.attn" in namespace["RESPONSES"]
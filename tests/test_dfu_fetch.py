@@ -0,0 +1,102 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import pytest
+
+from notecard_emulator import NotecardEmulator
+from dfu_fetch import CHECKPOINT_SUFFIX, DfuError, DfuImage, DfuServer, fetch, fetch_stream, plan_fetch
+
+IMAGE = os.urandom(100000)
+
+@pytest.fixture(scope='module')
+def server():
+    return DfuServer(IMAGE)
+
+def test_plan_is_schema_valid(notecard_validator):
+    """Tests that planned dfu.get requests validate and cover the image exactly once."""
+    plan = plan_fetch(10000, chunk_size=4096)
+    assert [(r["offset"], r["length"]) for r in plan] == [(0, 4096), (4096, 4096), (8192, 1808)]
+    for request in plan:
+        notecard_validator.validate_request(request)
+    assert plan_fetch(10000, 4096, offset=8192) == plan[2:]
+
+def test_server_responses_are_schema_valid(server, notecard_validator):
+    """Tests that the stand-in server's dfu.get and dfu.status responses validate."""
+    notecard_validator.validate_response("dfu.get", server.get({"req": "dfu.get", "offset": 32, "length": 32}))
+    notecard_validator.validate_response("dfu.get", server.get({"req": "dfu.get", "length": 0}))
+    notecard_validator.validate_response("dfu.status", server.status({"req": "dfu.status"}))
+
+@pytest.mark.parametrize("chunk_size", [1, 4096, 65536, len(IMAGE) * 2])
+def test_fetch_into_memory(server, chunk_size):
+    """Tests fetching the image in chunks of various sizes."""
+    image = DfuImage(len(IMAGE), md5=server.md5)
+    assert fetch(server.get, image, chunk_size) == server.md5
+    assert image.buffer == IMAGE
+
+def test_bad_responses(server):
+    """Tests error responses, bad base64, short payloads, reordering and a wrong MD5."""
+    image = DfuImage(len(IMAGE), md5=hashlib.md5(b"other").hexdigest())
+    first, second = plan_fetch(len(IMAGE), 4096)[:2]
+    with pytest.raises(DfuError):
+        image.feed(first, {"err": "not in DFU mode"})
+    with pytest.raises(DfuError):
+        image.feed(first, {"payload": "not base64!"})
+    with pytest.raises(DfuError):
+        image.feed(first, server.get(dict(first, length=100)))
+    with pytest.raises(DfuError):
+        image.feed(second, server.get(second))
+    with pytest.raises(DfuError):
+        image.verify()
+    fetch(server.get, DfuImage(len(IMAGE)), 4096)
+    with pytest.raises(DfuError):
+        fetch(server.get, image, 4096)
+
+def test_resume_from_checkpoint(server, tmp_path):
+    """Tests that an interrupted file-backed fetch resumes from its last checkpoint."""
+    path = str(tmp_path / "firmware.bin")
+    with DfuImage(len(IMAGE), path, server.md5, checkpoint=8192) as image:
+        for request in image.requests(4096)[:7]:
+            image.feed(request, server.get(request))
+    assert os.path.exists(path + CHECKPOINT_SUFFIX)
+
+    calls = []
+    def transact(request):
+        calls.append(request["offset"])
+        return server.get(request)
+    with DfuImage(len(IMAGE), path, server.md5) as image:
+        assert image.offset == 7 * 4096
+        assert fetch(transact, image, 4096) == server.md5
+    assert calls[0] == 7 * 4096
+    with open(path, 'rb') as f:
+        assert f.read() == IMAGE
+    assert not os.path.exists(path + CHECKPOINT_SUFFIX)
+
+    # A checkpoint for a different image is ignored.
+    with DfuImage(len(IMAGE), path, server.md5, checkpoint=1) as image:
+        image.feed(image.requests()[0], server.get(image.requests()[0]))
+    with DfuImage(len(IMAGE), path, hashlib.md5(b"other").hexdigest()) as image:
+        assert image.offset == 0
+
+def test_fetch_through_emulator(server):
+    """Tests a pipelined fetch over the emulator's Unix socket."""
+    directory = tempfile.mkdtemp(prefix="dfu-")
+    emulator = NotecardEmulator()
+    server.attach(emulator)
+
+    async def run():
+        path = await emulator.start_unix(os.path.join(directory, "notecard.sock"))
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            image = DfuImage(len(IMAGE), md5=server.md5)
+            digest = await fetch_stream(reader, writer, image, chunk_size=8192, window=4)
+            writer.close()
+            return image, digest
+        finally:
+            await emulator.close()
+    try:
+        image, digest = asyncio.run(run())
+    finally:
+        shutil.rmtree(directory)
+    assert digest == server.md5 and image.buffer == IMAGE
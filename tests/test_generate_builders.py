@@ -0,0 +1,90 @@
+import json
+import pytest
+
+from optimize_schemas import boundary_instances
+from generate_builders import attribute_name, class_name, load_builders_module
+
+@pytest.fixture(scope='module')
+def builders(schema_store):
+    return load_builders_module(schema_store.schemas)
+
+def test_names():
+    """Tests class and attribute naming."""
+    assert class_name("card.attn") == "CardAttn"
+    assert class_name("hub.set") == "HubSet"
+    assert class_name("card.location.mode") == "CardLocationMode"
+    assert attribute_name("async") == "async_"
+    assert attribute_name("in") == "in_"
+    assert attribute_name("mode") == "mode"
+
+def test_every_request_schema_has_a_builder(builders, notecard_validator):
+    """Tests that each API has one builder class carrying its metadata."""
+    assert set(builders.BUILDERS) == set(notecard_validator.request_names)
+    assert builders.CardAttn.API == "card.attn" and "LORA" in builders.CardAttn.SKUS
+    assert builders.CardTransport.VALUE_SKUS["method"]["wifi"] == ("CELL+WIFI", "WIFI")
+    assert [name for _, name in builders.WebPost.FIELDS].count("async") == 1
+
+def test_builders_accept_exactly_what_the_schemas_accept(builders, notecard_validator, schema_store):
+    """Tests builder construction against validation for samples and boundary mutations."""
+    checked = 0
+    for filename, schema in sorted(schema_store.schemas.items()):
+        if ".req." not in filename:
+            continue
+        validator = notecard_validator.validator_for(filename)
+        for instance in boundary_instances(filename, schema):
+            if not isinstance(instance, dict) or ("req" in instance) == ("cmd" in instance):
+                continue
+            if any(value is None for value in instance.values()):
+                continue
+            try:
+                builder = builders.build(instance)
+            except builders.RequestError:
+                assert not validator.is_valid(instance), instance
+            else:
+                assert validator.is_valid(instance), instance
+                encoded = builder.to_json()
+                assert json.loads(encoded) == instance
+                assert builder.to_dict() == instance
+            checked += 1
+    assert checked > 1000
+
+def test_cross_property_rules(builders):
+    """Tests that card.attn's conditional rules are enforced when a builder is constructed."""
+    with pytest.raises(builders.RequestError, match="'seconds' is a required property"):
+        builders.CardAttn(mode="watchdog")
+    with pytest.raises(builders.RequestError, match="less than the minimum"):
+        builders.CardAttn(mode="watchdog", seconds=10)
+    attn = builders.CardAttn(mode="watchdog", seconds=60)
+    assert attn.to_json() == '{"req":"card.attn","mode":"watchdog","seconds":60}'
+    with pytest.raises(builders.RequestError):
+        attn.replace(seconds=1)
+
+def test_builders_are_immutable_and_typed(builders):
+    """Tests immutability, commands, keyword attributes, and encoding of each JSON type."""
+    post = builders.WebPost(route="r", async_=True, body={"a": [1, "é"]}, seconds=30, command=True)
+    assert json.loads(post.to_json()) == {"cmd": "web.post", "route": "r", "body": {"a": [1, "é"]}, "async": True, "seconds": 30}
+    with pytest.raises(AttributeError):
+        post.route = "other"
+    with pytest.raises(AttributeError):
+        post.extra = 1
+    assert post.replace(route="s").route == "s" and post.route == "r"
+    assert post == builders.build(post.to_dict())
+    with pytest.raises(builders.RequestError):
+        builders.build({"req": "no.such.api"})
+    with pytest.raises(builders.RequestError):
+        builders.HubSet(mode=5)
+
+def test_object_and_array_values_are_frozen_copies(builders):
+    """Tests that object and array values cannot change after construction and must be encodable JSON."""
+    body = {"a": [1]}
+    add = builders.NoteAdd(file="data.qo", body=body)
+    body["x"] = float("nan")
+    with pytest.raises(TypeError):
+        add.body["x"] = float("nan")
+    with pytest.raises(TypeError):
+        add.body["a"].append(2)
+    assert add.to_json() == '{"req":"note.add","file":"data.qo","body":{"a":[1]}}'
+    assert add.replace(file="b.qo").body == {"a": [1]}
+    for value in (float("nan"), float("inf"), {1: "a"}, {1, 2}):
+        with pytest.raises(builders.RequestError):
+            builders.NoteAdd(body={"t": value})
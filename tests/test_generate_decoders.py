@@ -0,0 +1,71 @@
+import json
+import random
+import pytest
+
+from generate_decoders import load_decoders_module, sample_response
+
+@pytest.fixture(scope='module')
+def decoders(schema_store):
+    return load_decoders_module(schema_store.schemas)
+
+def test_every_response_schema_has_a_decoder(decoders, schema_store):
+    """Tests that each response schema has one decoder class with a property per schema property."""
+    responses = [filename for filename in schema_store.schemas if ".rsp." in filename]
+    assert len(decoders.DECODERS) == len(responses)
+    for filename in responses:
+        api = filename.split(".rsp.")[0]
+        cls = decoders.DECODERS[api]
+        assert cls.API == api
+        assert [name for _, name in cls.FIELDS] == list(schema_store.get(filename).get("properties", {}))
+
+def test_decoders_read_every_field(decoders, schema_store):
+    """Tests that decoded fields equal the parsed response, from text, bytes and dicts."""
+    rng = random.Random(1)
+    for filename, schema in schema_store.schemas.items():
+        if ".rsp." not in filename:
+            continue
+        cls = decoders.DECODERS[filename.split(".rsp.")[0]]
+        instances = [json.loads(sample["json"]) for sample in schema.get("samples", [])]
+        instances += [sample_response(schema, rng), {}]
+        for instance in instances:
+            text = json.dumps(instance)
+            for raw in (text, text.encode() + b"\n", instance):
+                response = cls(raw)
+                for attribute, name in reversed(cls.FIELDS):
+                    value = getattr(response, attribute)
+                    plain = [decoders._plain(item) for item in value] if isinstance(value, list) else decoders._plain(value)
+                    assert plain == instance.get(name), (filename, name)
+                assert response.to_dict() == instance
+
+def test_fields_are_decoded_lazily(decoders):
+    """Tests that nothing is parsed until a field is read, and containers only when read."""
+    response = decoders.decode("card.wireless", b'{"status":"{modem-on}","count":2,"net":[{"rat":"lte","rssi":-70},{"rat":"nbiot"}]}')
+    assert all(not hasattr(response, slot) for slot in type(response).__slots__)
+    assert response.count == 2
+    assert hasattr(response, "_v_status") and not hasattr(response, "_v_net")
+    net = response.net
+    assert isinstance(net[0], decoders.CardWirelessNet)
+    assert (net[0].rat, net[0].rssi, net[1].rssi) == ("lte", -70, None)
+    assert response.net is net
+    assert net[1].to_dict() == {"rat": "nbiot"}
+    assert response.get("unknown", 5) == 5
+
+    version = decoders.CardVersionResponse({"body": {"org": "Blues Wireless"}})
+    assert isinstance(version.body, decoders.CardVersionBody)
+    assert version.body.org == "Blues Wireless"
+
+    with pytest.raises(decoders.ResponseError):
+        decoders.decode("card.status", b"[1]").status
+    with pytest.raises(decoders.ResponseError):
+        decoders.decode("card.status", b"{").status
+    with pytest.raises(decoders.ResponseError):
+        decoders.decode("no.such.api", b"{}")
+
+def test_decode_jsonl(decoders, tmp_path):
+    """Tests that the bulk decoder wraps each non-blank line of a response log."""
+    path = tmp_path / "responses.jsonl"
+    path.write_text('{"changes":true,"notes":["a","b"]}\n\n{"tracker":"t"}\n')
+    responses = list(decoders.decode_jsonl(str(path), "note.changes"))
+    assert [type(response).__name__ for response in responses] == ["NoteChangesResponse"] * 2
+    assert responses[0].notes == ["a", "b"] and responses[0].changes is True
+    assert responses[1].notes is None and responses[1].tracker == "t"
@@ -0,0 +1,90 @@
+import os
+import sys
+import json
+
+import generate_docs
+from generate_docs import SectionCache, missing_nav_pages, write_if_changed
+
+def _run(monkeypatch, capsys, tmp_path, *args):
+    model_cache = str(tmp_path / "model.json")
+    monkeypatch.setattr(sys, "argv", ["generate_docs.py", "--model-cache", model_cache, *args])
+    generate_docs.main()
+    return capsys.readouterr().out
+
+def test_incremental_build_matches_full_build(tmp_path, monkeypatch, capsys):
+    """Tests that incremental builds render changed APIs only and produce the same bytes."""
+    full, incremental, cache_dir = tmp_path / "full.md", tmp_path / "incremental.md", tmp_path / "cache"
+    out = _run(monkeypatch, capsys, tmp_path, "--single-page", "-o", str(full))
+    assert "Rendered 70 APIs, reused 0 cached" in out and "Successfully generated" in out and "Schema models: 140 built" in out
+
+    out = _run(monkeypatch, capsys, tmp_path, "--single-page", "-o", str(incremental), "--incremental", "--cache-dir", str(cache_dir))
+    assert "Rendered 70 APIs, reused 0 cached" in out and "Schema models: 0 built, 140 reused" in out
+    assert incremental.read_bytes() == full.read_bytes()
+    assert len(os.listdir(cache_dir)) == 70
+
+    mtime = incremental.stat().st_mtime_ns
+    out = _run(monkeypatch, capsys, tmp_path, "--single-page", "-o", str(incremental), "--incremental", "--cache-dir", str(cache_dir))
+    assert "Rendered 0 APIs, reused 70 cached" in out and "is unchanged" in out
+    assert incremental.stat().st_mtime_ns == mtime
+
+    # A changed renderer invalidates every cached section.
+    monkeypatch.setattr(generate_docs, "renderer_fingerprint", lambda: "changed")
+    out = _run(monkeypatch, capsys, tmp_path, "--single-page", "-o", str(incremental), "--incremental", "--cache-dir", str(cache_dir))
+    assert "Rendered 70 APIs, reused 0 cached" in out and "is unchanged" in out
+    assert len(os.listdir(cache_dir)) == 70
+
+def test_split_build_writes_group_pages_and_search_shards(tmp_path, monkeypatch, capsys):
+    """Tests that the default build writes a page and a search index shard per API group."""
+    single, docs = tmp_path / "single.md", tmp_path / "docs"
+    _run(monkeypatch, capsys, tmp_path, "--single-page", "-o", str(single))
+    out = _run(monkeypatch, capsys, tmp_path, "-o", str(docs / "index.md"))
+    assert "for 9 API groups" in out and "(20 files written)" in out
+
+    groups = ["card", "dfu", "env", "file", "hub", "note", "ntn", "var", "web"]
+    assert sorted(os.listdir(docs)) == sorted([f"{group}.md" for group in groups] + ["index.md", "search-index"])
+    index = (docs / "index.md").read_text()
+    assert "- [`hub.*`](hub.md): `hub.get`, `hub.log`" in index and "### `" not in index
+    for group in groups:
+        sections = (docs / f"{group}.md").read_text().split(f"## `{group}.*` Requests\n\n", 1)[1]
+        assert sections.rstrip("\n") in single.read_text()
+
+    shard = json.loads((docs / "search-index" / "card.json").read_text())
+    attn = [api for api, anchor in shard["apis"]].index("card.attn")
+    assert shard["apis"][attn] == ["card.attn", "cardattn"]
+    assert [attn, ""] in shard["terms"]["attn"] and [attn, "mode"] in shard["terms"]["arm"]
+    assert json.loads((docs / "search-index" / "groups.json").read_text())["shards"]["web"] == "web.json"
+
+    (docs / "search-index" / "old.json").write_text("{}")
+    out = _run(monkeypatch, capsys, tmp_path, "-o", str(docs / "index.md"))
+    assert "is unchanged" in out
+    assert not (docs / "search-index" / "old.json").exists()
+
+def test_missing_nav_pages(tmp_path):
+    """Tests that group pages missing from the mkdocs.yml nav are reported for its docs directory only."""
+    mkdocs = tmp_path / "mkdocs.yml"
+    mkdocs.write_text("nav:\n  - Home: index.md\n  - card.*: card.md\n")
+    pages = [str(tmp_path / "docs" / name) for name in ("index.md", "card.md", "hub.md")]
+    assert missing_nav_pages(str(mkdocs), str(tmp_path / "docs"), pages) == ["hub.md"]
+    assert missing_nav_pages(str(mkdocs), str(tmp_path / "site"), pages) == []
+    assert missing_nav_pages(str(tmp_path / "none.yml"), str(tmp_path / "docs"), pages) == []
+
+def test_section_cache_keys_and_replacement(tmp_path):
+    """Tests that section keys cover every input and that older sections of an API are removed."""
+    cache = SectionCache(str(tmp_path), "fingerprint")
+    keys = {cache.key(b"ab", b"c"), cache.key(b"a", b"bc"), cache.key(b"ab", None), cache.key(None, b"ab"),
+            SectionCache(str(tmp_path), "other").key(b"ab", b"c")}
+    assert len(keys) == 5
+
+    cache.put("card.aux", "k1", "one")
+    cache.put("card.aux.serial", "k1", "serial")
+    cache.put("card.aux", "k2", "two")
+    assert cache.get("card.aux", "k1") is None
+    assert cache.get("card.aux", "k2") == "two"
+    assert cache.get("card.aux.serial", "k1") == "serial"
+
+def test_write_if_changed(tmp_path):
+    """Tests that an output file is only rewritten when its bytes change."""
+    path = str(tmp_path / "index.md")
+    assert write_if_changed(path, "a\n")
+    assert not write_if_changed(path, "a\n")
+    assert write_if_changed(path, "b\n")
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+import glob
+import shutil
+
+import pytest
+
+import generate_mdx_from_schema
+from generate_mdx_from_schema import MANIFEST_FILE, generate_all
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """A copy of the schemas, so that tests can edit them."""
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    for path in glob.glob(os.path.join(project_root, "*.json")):
+        shutil.copy(path, schema_dir)
+    return schema_dir
+
+def _statuses(results):
+    statuses = {}
+    for api, status, seconds in results:
+        statuses.setdefault(status, []).append(api)
+    return statuses
+
+def test_all_skips_unchanged_apis(schema_dir, tmp_path):
+    """Tests that --all renders every API once and then only the APIs whose schema or output changed."""
+    output_dir = tmp_path / "mdx"
+    statuses = _statuses(generate_all(str(schema_dir), str(output_dir), workers=1))
+    assert list(statuses) == ["written"] and len(statuses["written"]) == 70
+    assert len(glob.glob(str(output_dir / "*.mdx"))) == 70
+    assert len(json.loads((output_dir / MANIFEST_FILE).read_text())) == 70
+
+    statuses = _statuses(generate_all(str(schema_dir), str(output_dir), workers=1))
+    assert list(statuses) == ["skipped"] and len(statuses["skipped"]) == 70
+
+    # An edited output file is rendered again.
+    attn = output_dir / "card.attn.mdx"
+    expected = attn.read_bytes()
+    attn.write_text("edited\n")
+    statuses = _statuses(generate_all(str(schema_dir), str(output_dir), workers=1))
+    assert statuses["written"] == ["card.attn"] and len(statuses["skipped"]) == 69
+    assert attn.read_bytes() == expected
+
+    # So is the API of an edited schema.
+    path = schema_dir / "hub.get.req.notecard.api.json"
+    schema = json.loads(path.read_text())
+    schema["description"] = "An edited description."
+    path.write_text(json.dumps(schema, indent=4))
+    statuses = _statuses(generate_all(str(schema_dir), str(output_dir), workers=1))
+    assert statuses["written"] == ["hub.get"] and len(statuses["skipped"]) == 69
+    assert "An edited description." in (output_dir / "hub.get.mdx").read_text()
+
+def test_process_pool_matches_in_process_output(schema_dir, tmp_path):
+    """Tests that rendering across a process pool writes the same bytes as rendering in-process."""
+    serial, pooled = tmp_path / "serial", tmp_path / "pooled"
+    generate_all(str(schema_dir), str(serial), workers=1)
+    statuses = _statuses(generate_all(str(schema_dir), str(pooled), workers=2))
+    assert list(statuses) == ["written"] and len(statuses["written"]) == 70
+    assert sorted(os.listdir(pooled)) == sorted(os.listdir(serial))
+    for name in os.listdir(serial):
+        assert (pooled / name).read_bytes() == (serial / name).read_bytes(), name
+
+@pytest.mark.parametrize("args", [[], ["card.attn", "--all"]])
+def test_api_name_and_all_are_exclusive(args, tmp_path, monkeypatch, capsys):
+    """Tests that exactly one of an API base name and --all must be given."""
+    monkeypatch.setattr(sys, "argv", ["generate_mdx_from_schema.py", "-o", str(tmp_path), *args])
+    with pytest.raises(SystemExit) as excinfo:
+        generate_mdx_from_schema.main()
+    assert excinfo.value.code == 2
+    assert "give either an API base name or --all" in capsys.readouterr().err
+    assert os.listdir(tmp_path) == []
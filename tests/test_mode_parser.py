@@ -0,0 +1,101 @@
+import itertools
+import json
+import pytest
+import jsonschema
+
+from notecard_validator import load_schema_files
+from mode_parser import ModeError, ModeSpec, contains_pattern, list_tokens, mode_specs
+
+SCHEMA_FILE = "card.attn.req.notecard.api.json"
+
+MODES = ["arm", "files", "sleep", "watchdog", "-usb", "motion,files", "watchdog, motion",
+         "arm,\tsleep", "sleep,files,watchdog", "usb ", "disarm,-all", "motionchange"]
+INVALID_MODES = ["", " arm", "arm ,files", "arm,,files", "bogus", "arm,", "ARM", "files,-file"]
+SECONDS = [None, -2, -1, 0, 59, 60, 3600]
+FILES = [None, ["data.qo"]]
+
+@pytest.fixture(scope='module')
+def spec(schema_store):
+    return mode_specs(schema_store.schemas)["card.attn"]
+
+@pytest.fixture(scope='module')
+def mode_validator(schema_store):
+    """A validator for just the mode pattern and the conditional rules of card.attn."""
+    schema = schema_store.get(SCHEMA_FILE)
+    subset = {"properties": {"mode": schema["properties"]["mode"]}, "allOf": schema["allOf"]}
+    return jsonschema.Draft202012Validator(subset)
+
+def _instances(modes):
+    for mode, seconds, files in itertools.product([None] + modes, SECONDS, FILES):
+        instance = {"req": "card.attn"}
+        for name, value in (("mode", mode), ("seconds", seconds), ("files", files)):
+            if value is not None:
+                instance[name] = value
+        yield instance
+
+def test_list_tokens():
+    """Tests token extraction from comma-separated list patterns only."""
+    assert list_tokens(r"^(?:a|-b|c.d)(?:,\s*(?:a|-b|c.d))*\s*$") == ("a", "-b", "c.d")
+    assert list_tokens(r"^(?:a|b)(?:,\s*(?:a|c))*\s*$") is None
+    assert list_tokens(r"^(?:a|b)$") is None
+    assert list_tokens(r"^\d+(\.\d+)*$") is None
+
+def test_only_card_attn_has_a_mode_token_list(spec):
+    """Tests that card.attn is found with all of its tokens and both conditional rules."""
+    specs = mode_specs(load_schema_files())
+    assert list(specs) == ["card.attn"]
+    assert {"arm", "disarm", "files", "sleep", "watchdog", "-all"} <= set(spec.tokens)
+    assert len(spec.rules) == 2
+
+def test_parse_round_trip(spec):
+    """Tests that parsing yields a bitmask naming exactly the given tokens."""
+    mask = spec.parse("arm, files,\t-usb  ")
+    assert mask == spec.mask("arm", "files", "-usb")
+    assert spec.names(mask) == [t for t in spec.tokens if t in ("arm", "files", "-usb")]
+    assert spec.parse("files,files") == spec.mask("files")
+
+@pytest.mark.parametrize("mode", INVALID_MODES)
+def test_parse_rejects_what_the_pattern_rejects(spec, mode_validator, mode):
+    """Tests that the parser and the schema pattern reject the same mode strings."""
+    with pytest.raises(ModeError):
+        spec.parse(mode)
+    assert not mode_validator.is_valid({"mode": mode})
+
+def test_rules_agree_with_schema(spec, mode_validator):
+    """Tests the bitmask rules against jsonschema over modes, seconds and files."""
+    for instance in _instances(MODES + INVALID_MODES):
+        assert spec.is_valid(instance) == mode_validator.is_valid(instance), instance
+
+def test_rules_agree_with_schema_samples(spec, validator, schema_store):
+    """Tests that every card.attn sample passes the mode rules."""
+    for sample in schema_store.get(SCHEMA_FILE)["samples"]:
+        instance = json.loads(sample["json"])
+        assert validator.is_valid(instance)
+        assert spec.check(instance) is None
+
+def test_rule_messages(spec):
+    """Tests the messages reported for each conditional rule."""
+    assert spec.check({"mode": "watchdog"}) == "'seconds' is a required property"
+    assert spec.check({"mode": "watchdog", "seconds": 59}) == "59 is less than the minimum of 60"
+    assert spec.check({"mode": "files"}) == "'files' is a required property"
+    assert spec.check({"mode": "arm", "files": ["a.qo"]}) == "'files' is not allowed when mode is 'arm'"
+    assert spec.check({"mode": 1}) == "1 is not of type 'string'"
+
+def test_tokens_are_matched_whole(spec, mode_validator):
+    """Tests the two places the schema's substring regexes differ from whole tokens."""
+    # The regex for "contains files" also matches "-files".
+    assert spec.is_valid({"mode": "-files"})
+    assert not mode_validator.is_valid({"mode": "-files"})
+    # ...and misses "files" followed by trailing whitespace.
+    assert not spec.is_valid({"mode": "files "})
+    assert mode_validator.is_valid({"mode": "files "})
+
+def test_unsupported_condition_raises():
+    """Tests that a mode conditional other than a token test is rejected."""
+    pattern = r"^(?:a|b)(?:,\s*(?:a|b))*\s*$"
+    schema = {"properties": {"mode": {"type": "string", "pattern": pattern}},
+              "allOf": [{"if": {"properties": {"mode": {"const": "a"}}}, "then": {"required": ["x"]}}]}
+    with pytest.raises(ValueError):
+        ModeSpec.from_schema(schema, "x.y")
+    schema["allOf"][0]["if"]["properties"]["mode"] = {"pattern": contains_pattern("a")}
+    assert ModeSpec.from_schema(schema, "x.y").check({"mode": "a"}) == "'x' is a required property"
@@ -0,0 +1,71 @@
+import json
+import pytest
+
+from canonicalize import Canonicalizer
+from normalize_defaults import DefaultTables, normalize_chunk, normalize_file
+
+@pytest.fixture(scope='module')
+def tables():
+    return DefaultTables()
+
+def test_defaults_are_filled(tables):
+    """Tests filling omitted per-request defaults without overriding values that are present."""
+    request = {"req": "web.put", "route": "r", "seconds": 60}
+    assert tables.fill_request(request)
+    assert request == {"req": "web.put", "route": "r", "seconds": 60, "content": "application/json", "max": 90}
+    command = {"cmd": "web.post", "route": "r"}
+    tables.fill_request(command)
+    assert command["content"] == "application/json" and command["seconds"] == 90
+    assert not tables.fill_request({"req": "no.such.api"})
+
+def test_settings_are_never_filled(tables):
+    """Tests that a logged query of an API that persists settings is not turned into a set request."""
+    for request in ({"req": "card.power"}, {"req": "card.wireless.penalty"}, {"req": "card.aux", "mode": "gpio"},
+                    {"req": "card.transport", "method": "ntn"}, {"req": "card.monitor"}):
+        filled = dict(request)
+        assert tables.fill_request(filled)
+        assert filled == request
+
+def test_normalizing_inverts_canonicalizing(tables, schema_store):
+    """Tests that canonicalize(normalize(x)) == canonicalize(x) for every request sample."""
+    canonicalizer = Canonicalizer()
+    for filename, schema in schema_store.schemas.items():
+        for sample in schema.get("samples", []) if ".req." in filename else []:
+            request = json.loads(sample["json"])
+            filled = dict(request)
+            tables.fill_request(filled)
+            assert canonicalizer.encode(filled) == canonicalizer.encode(request)
+
+def test_chunk_modes(tables):
+    """Tests the request and pair line modes, and lines passed through unchanged."""
+    lines = [b'{"req": "card.power"}\n', b"not json\n", b"\n", b'{"req": "no.such.api"}\r\n', b"\xff\n"]
+    text, normalized, passed = normalize_chunk(lines, tables=tables)
+    assert text.splitlines() == [b'{"req":"card.power"}', b"not json", b'{"req": "no.such.api"}', b"\xff"]
+    assert (normalized, passed) == (1, 3)
+    pair = b'{"request": {"req": "web.get", "route": "r"}, "response": {"result": 200}}'
+    text, normalized, _ = normalize_chunk([pair], "pairs", tables=tables)
+    assert json.loads(text)["request"] == {"req": "web.get", "route": "r"} and normalized == 1
+    pair = b'{"request": {"req": "card.usage.get"}, "response": {"seconds": 60}}'
+    text, normalized, _ = normalize_chunk([pair], "pairs", tables=tables)
+    assert json.loads(text) == {"request": {"req": "card.usage.get", "mode": "total"}, "response": {"seconds": 60}}
+    assert normalized == 1
+
+def test_responses_are_not_filled(tmp_path):
+    """Tests that a responses-mode run is refused rather than reporting unfilled lines as normalized."""
+    source = tmp_path / "in.jsonl"
+    source.write_text('{"temperature": 20}\n')
+    with pytest.raises(ValueError, match="only requests are filled"):
+        normalize_file(str(source), str(tmp_path / "out.jsonl"), "responses", workers=1)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_normalize_file(tmp_path, workers):
+    """Tests that in-process and pooled runs write the same lines in order."""
+    source = tmp_path / "in.jsonl"
+    requests = [{"req": "card.usage.get"}, {"req": "card.version"}, {"req": "web.get", "route": "r"}] * 50
+    source.write_text("".join(json.dumps(request) + "\n" for request in requests))
+    output = tmp_path / "out.jsonl"
+    summary = normalize_file(str(source), str(output), workers=workers, chunk_lines=7)
+    assert summary["lines"] == 150 and summary["normalized"] == 150
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert lines[0] == {"req": "card.usage.get", "mode": "total"} and lines[1:3] == requests[1:3]
+    assert len(lines) == 150
@@ -0,0 +1,78 @@
+import random
+import struct
+import pytest
+
+from note_template import NoteTemplate, TemplateError, parse_template, sample_body
+
+TEMPLATE = {
+    "temp": 14.1, "humid": 12.1, "pressure": 18.1, "alert": True, "site": "16", "tag": "abc",
+    "count": 11, "short": 12, "mid": 13, "long": 14, "huge": 18,
+    "ucount": 21, "ushort": 22, "umid": 23, "ulong": 24,
+    "loc": {"lat": 18.1, "lon": 18.1, "fix": {"sats": 21}},
+}
+
+@pytest.fixture(scope='module')
+def template():
+    return NoteTemplate(TEMPLATE)
+
+def test_record_size(template):
+    """Tests field sizes for every type hint."""
+    sizes = {".".join(field.path): field.size for field in template.fields}
+    assert sizes == {"temp": 4, "humid": 2, "pressure": 8, "alert": 1, "site": 16, "tag": 3,
+                     "count": 1, "short": 2, "mid": 3, "long": 4, "huge": 8,
+                     "ucount": 1, "ushort": 2, "umid": 3, "ulong": 4,
+                     "loc.lat": 8, "loc.lon": 8, "loc.fix.sats": 1}
+    assert template.size == sum(sizes.values()) == 79
+
+def test_round_trip(template):
+    """Tests that random bodies survive pack and unpack, singly and in batches."""
+    rng = random.Random(0)
+    bodies = [sample_body(template, rng) for _ in range(500)]
+    records = template.pack_many(bodies)
+    assert len(records) == 500 * template.size
+    for body, unpacked in zip(bodies, template.unpack_many(records)):
+        assert unpacked.keys() == body.keys() and unpacked["loc"]["fix"] == body["loc"]["fix"]
+        for name in ("site", "tag", "alert", "count", "mid", "huge", "umid", "ulong"):
+            assert unpacked[name] == body[name]
+        assert unpacked["pressure"] == body["pressure"]
+        assert unpacked["temp"] == pytest.approx(body["temp"], rel=1e-6)
+        assert unpacked["humid"] == pytest.approx(body["humid"], rel=1e-3)
+    assert template.unpack(template.pack(bodies[0])) == template.unpack_many(records[:template.size])[0]
+
+def test_missing_fields_pack_as_zero(template):
+    """Tests that absent fields, and absent nested objects, pack as zero values."""
+    body = template.unpack(template.pack({"temp": 1.5}))
+    assert body["temp"] == 1.5 and body["site"] == "" and body["alert"] is False
+    assert body["loc"] == {"lat": 0.0, "lon": 0.0, "fix": {"sats": 0}}
+
+def test_layout_is_little_endian_without_padding():
+    """Tests the exact bytes of a small record."""
+    template = NoteTemplate({"a": 11, "b": 14, "c": "3", "d": 23})
+    assert template.pack({"a": -1, "b": 258, "c": "hi", "d": 65536}) == (
+        b"\xff" + struct.pack("<i", 258) + b"hi\0" + b"\x00\x00\x01")
+
+@pytest.mark.parametrize("body", [
+    {"site": "x" * 17}, {"tag": "é" * 2}, {"count": 128}, {"ucount": -1}, {"mid": 1 << 23},
+    {"umid": 1 << 24}, {"long": 1.5}, {"site": 5}, {"bogus": 1}, {"loc": {"alt": 1}}, {"humid": 1e6},
+])
+def test_bodies_that_do_not_fit(template, body):
+    """Tests that over-long strings, out-of-range numbers and unknown fields are rejected."""
+    with pytest.raises(TemplateError):
+        template.pack(body)
+    with pytest.raises(TemplateError):
+        template.pack_many([{}, body])
+
+@pytest.mark.parametrize("hint", [15, 10.5, [11], None, "", "0"])
+def test_unsupported_hints(hint):
+    """Tests that hints without a Notecard type are rejected."""
+    with pytest.raises(TemplateError):
+        parse_template({"field": hint})
+
+def test_from_request():
+    """Tests compiling a note.template request, and partial record buffers."""
+    template = NoteTemplate.from_request({"req": "note.template", "file": "data.qo", "body": {"v": 12}})
+    assert template.size == 2
+    with pytest.raises(TemplateError):
+        template.unpack_many(b"\0\0\0")
+    with pytest.raises(TemplateError):
+        NoteTemplate.from_request({"req": "note.template", "file": "data.qo"})
@@ -56,16 +56,15 @@ def test_referenced_schemas_are_valid(schema):
         except jsonschema.exceptions.SchemaError as e:
             pytest.fail(f"Referenced schema {schema_filename} is not a valid schema: {e}")
 
-def test_invalid_generic_request_fails(schema):
+def test_invalid_generic_request_fails(validator):
     """
     Tests that a generic, invalid request fails validation against
     the main notecard.api.json schema.
     An empty object should not be valid under any of the schemas in 'oneOf'.
     """
-    schema_dict, registry = schema
     instance = {}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema_dict, registry=registry)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
 def test_all_request_schemas_are_included_in_oneof(schema):
@@ -116,3 +115,16 @@ def test_all_request_schemas_are_included_in_oneof(schema):
         file_path = os.path.join(project_root, filename)
         if not os.path.exists(file_path):
             pytest.fail(f"Referenced file {filename} does not exist at {file_path}")
+
+def test_oneof_has_no_duplicate_references(schema):
+    """
+    Validates that each request schema is referenced only once in the
+    'oneOf' array of notecard.api.json. A duplicate reference makes every
+    request for that API match more than one subschema, and so fail 'oneOf'.
+    """
+    main_schema_dict, registry = schema
+
+    refs = [ref_obj["$ref"] for ref_obj in main_schema_dict["oneOf"]]
+    duplicates = sorted({ref for ref in refs if refs.count(ref) > 1})
+    if duplicates:
+        pytest.fail(f"The following schemas are referenced more than once in 'oneOf': {duplicates}")
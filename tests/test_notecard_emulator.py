@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+import pytest
+
+from notecard_emulator import NotecardEmulator, synthesize_response
+
+@pytest.fixture(scope='module')
+def emulator():
+    return NotecardEmulator(api_latency={"hub.sync": 0.05})
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's deep tmp_path.
+    directory = tempfile.mkdtemp(prefix="ne-")
+    yield os.path.join(directory, "notecard.sock")
+    shutil.rmtree(directory)
+
+def _run(emulator, start, exchange):
+    async def run():
+        address = await start()
+        try:
+            return await exchange(address)
+        finally:
+            await emulator.close()
+    return asyncio.run(run())
+
+async def _pipeline(reader, writer, lines):
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+    return [json.loads(await reader.readline()) for line in lines if '"req"' in line or not line.startswith("{")]
+
+def test_every_response_matches_its_schema(emulator, notecard_validator):
+    """Tests that every synthesized response validates against its .rsp schema."""
+    for api in notecard_validator.response_names:
+        if api in notecard_validator.request_names:
+            response = emulator.transact(json.dumps({"req": api}).encode())
+            assert response.endswith(b"\r\n")
+            notecard_validator.validate_response(api, json.loads(response))
+
+def test_samples_are_preferred(emulator, schema_store):
+    """Tests that a response schema's first sample is used when it has samples."""
+    schema = schema_store.get("card.temp.rsp.notecard.api.json")
+    expected = synthesize_response(schema)
+    assert json.loads(emulator.transact(b'{"req":"card.temp"}')) == expected
+    if schema.get("samples"):
+        assert expected == json.loads(schema["samples"][0]["json"])
+
+def test_req_and_cmd_semantics(emulator):
+    """Tests that commands are never answered and invalid requests get an err."""
+    assert emulator.transact(b'{"cmd":"card.attn","mode":"arm"}') is None
+    assert emulator.transact(b'{"cmd":"card.attn","mode":"watchdog"}') is None
+    assert json.loads(emulator.transact(b'{"req":"card.attn","mode":"watchdog"}')) == \
+        {"err": "'seconds' is a required property"}
+    assert "err" in json.loads(emulator.transact(b'{"req":"card.nope"}'))
+    assert "err" in json.loads(emulator.transact(b'not json'))
+
+def test_custom_responses_and_handlers(notecard_validator):
+    """Tests per-API response overrides, their validation, and handlers."""
+    emulator = NotecardEmulator(responses={"card.version": {"version": "notecard-9.1.1"}})
+    assert json.loads(emulator.transact(b'{"req":"card.version"}')) == {"version": "notecard-9.1.1"}
+    emulator.register("card.random", lambda request: {"count": request.get("count", 0) * 2})
+    assert json.loads(emulator.transact(b'{"req":"card.random","count":21}')) == {"count": 42}
+    with pytest.raises(ValueError):
+        NotecardEmulator(responses={"card.version": {"version": 1}})
+
+def test_failing_handler_answers_an_error(socket_path):
+    """Tests that an exception from a handler is answered with err and the connection keeps serving."""
+    emulator = NotecardEmulator()
+    emulator.register("card.random", lambda request: 1 / request["count"])
+
+    async def exchange(path):
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b'{"req":"card.random","count":0}\n{"cmd":"card.random","count":0}\n{"req":"card.version"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        return responses
+
+    failed, version = _run(emulator, lambda: emulator.start_unix(socket_path), exchange)
+    assert failed == {"err": "cannot handle card.random: division by zero"}
+    assert "version" in version and emulator.errors == 2
+
+def test_unix_socket_pipelining(emulator, socket_path):
+    """Tests pipelined requests over a Unix socket are answered in order, skipping commands."""
+    lines = ['{"req":"card.version"}', '{"cmd":"card.attn","mode":"arm"}', '{"req":"card.attn","mode":"arm"}',
+             '{"req":"card.temp"}']
+
+    async def exchange(path):
+        reader, writer = await asyncio.open_unix_connection(path)
+        responses = await _pipeline(reader, writer, lines)
+        writer.close()
+        return responses
+
+    responses = _run(emulator, lambda: emulator.start_unix(socket_path), exchange)
+    assert len(responses) == 3
+    assert "version" in responses[0] and "temperature" in responses[2]
+    assert responses[1] == json.loads(emulator.transact(lines[2].encode()))
+
+def test_tcp_per_api_latency(emulator):
+    """Tests that per-API latency delays only that API and requests stay in order."""
+    lines = ['{"req":"hub.sync"}', '{"req":"card.temp"}']
+
+    async def exchange(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        start = time.perf_counter()
+        responses = await _pipeline(reader, writer, lines)
+        writer.close()
+        return responses, time.perf_counter() - start
+
+    (responses, elapsed) = _run(emulator, lambda: emulator.start_tcp("127.0.0.1", 0), exchange)
+    assert "temperature" in responses[1]
+    assert elapsed >= 0.05
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="pseudo-terminals are not available")
+def test_pty(emulator, tmp_path):
+    """Tests the emulator behind a raw pseudo-terminal, through a symlink."""
+    link = str(tmp_path / "notecard")
+
+    async def exchange(path):
+        loop = asyncio.get_running_loop()
+        fd = os.open(path, os.O_RDWR | os.O_NOCTTY)
+        try:
+            os.write(fd, b'{"req":"card.temp"}\n')
+            data = b""
+            while not data.endswith(b"\r\n"):
+                data += await loop.run_in_executor(None, os.read, fd, 4096)
+            return data
+        finally:
+            os.close(fd)
+
+    data = _run(emulator, lambda: emulator.open_pty(link), exchange)
+    assert "temperature" in json.loads(data)
@@ -0,0 +1,77 @@
+import glob
+import json
+import os
+import pytest
+import jsonschema
+
+from notecard_validator import NotecardValidator, API_SCHEMA_FILE
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+@pytest.fixture(scope='module')
+def validator():
+    return NotecardValidator.from_directory(project_root)
+
+def _samples(pattern):
+    for path in sorted(glob.glob(os.path.join(project_root, pattern))):
+        with open(path, 'r') as f:
+            schema = json.load(f)
+        for sample in schema.get("samples", []):
+            yield os.path.basename(path), json.loads(sample["json"])
+
+def test_request_index_covers_oneof(validator):
+    """Tests that every request schema in notecard.api.json is indexed by name."""
+    assert len(validator.request_names) == len(validator.api_schema["oneOf"])
+    assert "card.attn" in validator.request_names
+
+def test_dispatch_by_req_and_cmd(validator):
+    """Tests that 'req' and 'cmd' both dispatch to the named schema."""
+    assert validator.validate_request({"req": "card.attn", "mode": "arm"}) == "card.attn"
+    assert validator.validate_request({"cmd": "hub.set", "mode": "periodic"}) == "hub.set"
+    assert validator.request_schema_file({"req": "card.attn"}) == "card.attn.req.notecard.api.json"
+
+def test_dispatch_error_names_schema(validator):
+    """Tests that a dispatched failure names the one schema that failed."""
+    instance = {"req": "card.attn", "mode": "watchdog", "seconds": 59}
+    with pytest.raises(jsonschema.ValidationError) as excinfo:
+        validator.validate_request(instance)
+    assert "card.attn.req.notecard.api.json: 59 is less than the minimum of 60" in str(excinfo.value)
+
+def test_unknown_name_falls_back_to_oneof(validator):
+    """Tests that unrecognizable requests use the full oneOf semantics."""
+    for instance in ({}, {"req": "card.nope"}, {"req": "card.attn", "cmd": "hub.set"}):
+        assert validator.request_name(instance) is None
+        with pytest.raises(jsonschema.ValidationError) as excinfo:
+            validator.validate_request(instance)
+        assert f"{API_SCHEMA_FILE}: " in str(excinfo.value)
+        assert "is not valid under any of the given schemas" in str(excinfo.value)
+
+def test_dispatch_agrees_with_oneof(validator):
+    """Tests that dispatch accepts/rejects exactly what the full oneOf does."""
+    full = jsonschema.Draft202012Validator(validator.api_schema, registry=validator.registry)
+    instances = [instance for _, instance in _samples("*.req.notecard.api.json")]
+    instances += [
+        {"req": "card.attn", "cmd": "card.attn"},
+        {"req": "card.attn", "extra": True},
+        {"cmd": "card.version", "req": 1},
+        {"req": "hub.set", "mode": 7},
+    ]
+    for instance in instances:
+        assert validator.is_valid_request(instance) == full.is_valid(instance), instance
+
+def test_response_samples_are_valid(validator):
+    """Tests that every response sample validates against its paired schema."""
+    for filename, instance in _samples("*.rsp.notecard.api.json"):
+        api_name = filename.replace(".rsp.notecard.api.json", "")
+        validator.validate_response(api_name, instance)
+
+def test_response_error_names_schema(validator):
+    """Tests that response failures name the response schema."""
+    with pytest.raises(jsonschema.ValidationError) as excinfo:
+        validator.validate_response("card.version", {"version": 1})
+    assert "card.version.rsp.notecard.api.json: " in str(excinfo.value)
+
+def test_unknown_response_api(validator):
+    """Tests that an unknown response API raises KeyError."""
+    with pytest.raises(KeyError):
+        validator.validate_response("card.nope", {})
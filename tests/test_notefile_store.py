@@ -0,0 +1,143 @@
+import json
+import pytest
+
+from notecard_emulator import NotecardEmulator
+from notefile_store import NotefileError, NotefileStore
+
+@pytest.fixture
+def store():
+    return NotefileStore()
+
+def _request(store, notecard_validator, request):
+    """Answers a request, checking both it and its response against the schemas."""
+    notecard_validator.validate_request(request)
+    response = store.request(request)
+    if "err" not in response:
+        notecard_validator.validate_response(request["req"], response)
+    return response
+
+def test_queue_semantics(store, notecard_validator):
+    """Tests adding to and draining an inbound queue in order."""
+    assert _request(store, notecard_validator, {"req": "note.add", "file": "data.qi", "body": {"n": 1}}) == {"note": "1"}
+    _request(store, notecard_validator, {"req": "note.add", "file": "data.qi", "payload": "AQID"})
+    assert _request(store, notecard_validator, {"req": "note.get", "delete": True}) == {"note": "1", "body": {"n": 1}}
+    assert _request(store, notecard_validator, {"req": "note.get", "delete": True}) == {"note": "2", "payload": "AQID"}
+    assert "err" in _request(store, notecard_validator, {"req": "note.get"})
+
+def test_database_semantics(store, notecard_validator):
+    """Tests get, update and delete by ID, which only databases allow."""
+    note = _request(store, notecard_validator, {"req": "note.add", "file": "my.db", "body": {"v": 1}})["note"]
+    assert _request(store, notecard_validator, {"req": "note.update", "file": "my.db", "note": note, "body": {"v": 2}}) == {"success": True}
+    assert _request(store, notecard_validator, {"req": "note.get", "file": "my.db", "note": note})["body"] == {"v": 2}
+    assert "err" in _request(store, notecard_validator, {"req": "note.get", "file": "my.db"})
+    assert _request(store, notecard_validator, {"req": "note.delete", "file": "my.db", "note": note}) == {"success": True}
+    assert "err" in _request(store, notecard_validator, {"req": "note.get", "file": "my.db", "note": note})
+    _request(store, notecard_validator, {"req": "note.add", "file": "data.qo"})
+    assert "err" in _request(store, notecard_validator, {"req": "note.update", "file": "data.qo", "note": "1", "body": {}})
+    assert "err" in _request(store, notecard_validator, {"req": "note.delete", "file": "nope.db", "note": "1"})
+
+def test_trackers_are_cursors(store, notecard_validator):
+    """Tests that trackers see each change once, including deletions, independently."""
+    for i in range(5):
+        store.add("t.db", {"i": i})
+    first = _request(store, notecard_validator, {"req": "note.changes", "file": "t.db", "tracker": "a"})
+    assert first == {"changes": True, "notes": ["1", "2", "3", "4", "5"], "tracker": "a"}
+    assert _request(store, notecard_validator, {"req": "note.changes", "file": "t.db", "tracker": "a"})["notes"] == []
+    store.update("t.db", "2", {"i": 20})
+    store.delete("t.db", ["4"])
+    store.update("t.db", "2", {"i": 21})
+    assert store.changes("t.db", "a") == ["4", "2"]
+    assert store.changes("t.db", "b") == ["1", "2", "3", "5"]
+    assert _request(store, notecard_validator, {"req": "note.changes", "file": "t.db"})["notes"] == ["1", "2", "3", "5"]
+
+def test_changes_walk_only_new_entries(store):
+    """Tests that note.changes with a tracker does not scan unchanged notes."""
+    for i in range(10000):
+        store.add("big.db")
+    store.changes("big.db", "a")
+    store.update("big.db", "17", {"x": 1})
+    notefile = store.files["big.db"]
+    visited = []
+    original = notefile.changes
+    class Recording(dict):
+        def __reversed__(self):
+            for key in reversed(original):
+                visited.append(key)
+                yield key
+    notefile.changes = Recording(original)
+    assert store.changes("big.db", "a") == ["17"]
+    assert len(visited) == 2
+
+def test_compaction_forgets_seen_deletions(store):
+    """Tests that deleted notes are dropped from the change index once every tracker saw them."""
+    for i in range(500):
+        store.add("c.db")
+    store.changes("c.db", "a")
+    store.delete("c.db", [str(i) for i in range(1, 401)])
+    store.sync()
+    for i in range(600):
+        store.add("c.db")
+    assert len(store.files["c.db"].changes) == 1100
+    assert len(store.changes("c.db", "a")) == 1000
+    assert len(store.files["c.db"].changes) == 700
+    assert store.changes("c.db", "b") == [str(i) for i in range(401, 1101)]
+
+def test_change_index_stays_bounded_without_polling(store):
+    """Tests that the change index is compacted on writes and syncs when note.changes is never called."""
+    largest = 0
+    for i in range(100_000):
+        note = store.add("data.qi")
+        store.get("data.qi", note, delete=True)
+        if i % 1000 == 999:
+            store.sync()
+        largest = max(largest, len(store.files["data.qi"].changes))
+    assert largest < 2500
+    store.sync()
+    assert len(store.files["data.qi"].changes) == 0
+
+def test_sync_without_changes_does_not_compact(store, monkeypatch):
+    """Tests that syncing an unchanged Notefile leaves its change index alone."""
+    for i in range(1000):
+        store.add("data.db")
+    store.sync()
+    notefile = store.files["data.db"]
+    compacted = []
+    monkeypatch.setattr(type(notefile), "compact", lambda self: compacted.append(self))
+    assert store.sync() == 0
+    assert not compacted and len(notefile.changes) == 1000
+
+def test_file_requests(store, notecard_validator):
+    """Tests file.changes, file.changes.pending, file.stats and file.delete totals."""
+    for i in range(3):
+        store.add("a.db")
+    store.add("data.qo")
+    store.changes("a.db", "t")
+    store.update("a.db", "1", {"x": 1})
+    changes = _request(store, notecard_validator, {"req": "file.changes", "tracker": "t"})
+    assert changes == {"total": 4, "changes": 2, "info": {"a.db": {"total": 3, "changes": 1},
+                                                         "data.qo": {"total": 1, "changes": 1}}}
+    pending = _request(store, notecard_validator, {"req": "file.changes.pending"})
+    assert pending["pending"] and pending["changes"] == 4
+    assert _request(store, notecard_validator, {"req": "file.stats", "file": "a.db"}) == {"total": 3, "changes": 3, "sync": False}
+    assert store.sync() == 4
+    assert _request(store, notecard_validator, {"req": "file.stats"}) == {"total": 3, "changes": 0, "sync": True}
+    assert not _request(store, notecard_validator, {"req": "file.changes.pending"})["pending"]
+    assert _request(store, notecard_validator, {"req": "file.delete", "files": ["a.db"]}) == {}
+    assert store.total == 0 and "err" in _request(store, notecard_validator, {"req": "file.stats", "file": "a.db"})
+
+def test_direct_api_errors(store):
+    """Tests that the Python API raises NotefileError for what the Notecard rejects."""
+    with pytest.raises(NotefileError):
+        store.changes("missing.db")
+    with pytest.raises(NotefileError):
+        store.get("missing.qi")
+
+def test_attach_to_emulator(store):
+    """Tests the store answering note.* and file.* through the emulator, with hub.sync syncing."""
+    emulator = NotecardEmulator()
+    store.attach(emulator)
+    assert json.loads(emulator.transact(b'{"req":"note.add","file":"x.qo","body":{"a":1}}')) == {"note": "1"}
+    assert emulator.transact(b'{"cmd":"note.add","file":"x.qo"}') is None
+    assert store.total == 2
+    assert json.loads(emulator.transact(b'{"req":"hub.sync"}')) == {}
+    assert store.total == 0
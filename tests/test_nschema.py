@@ -0,0 +1,60 @@
+import os
+import json
+import time
+
+import nschema
+
+def test_run_command_in_process(tmp_path):
+    """Tests that commands run in-process with captured output and exit status."""
+    result = nschema.run_command(["list", "--prefix", "card.wireless"])
+    assert result["code"] == 0
+    assert result["stdout"].split("\n") == ["card.wireless.penalty", "card.wireless", ""]
+
+    path = tmp_path / "requests.jsonl"
+    path.write_text('{"req":"card.attn","mode":"arm"}\n{"req":"card.attn","mode":"bogus"}\nnot json\n')
+    result = nschema.run_command(["validate", str(path)])
+    assert result["code"] == 1
+    assert result["stdout"].count("✗") == 3 and "1 of 3 valid" in result["stdout"]
+
+    path.write_text('{"version": "1.2.3"}')
+    assert nschema.run_command(["validate", str(path), "--api", "card.version"])["code"] == 0
+    assert nschema.run_command(["validate", "--bogus"])["code"] == 2
+    assert nschema.run_command(["frobnicate"])["code"] == 1
+
+def test_script_commands_use_the_callers_directory(tmp_path):
+    """Tests that script commands get their arguments and run in the given working directory."""
+    schema = tmp_path / "x.req.notecard.api.json"
+    schema.write_text(json.dumps({"version": "0.1.0"}))
+    cwd = os.getcwd()
+    result = nschema.run_command(["version", "--property", "version", "--target-version", "0.2.0",
+                                  "--pattern", "*.req.notecard.api.json"], cwd=str(tmp_path))
+    assert os.getcwd() == cwd
+    assert result["code"] == 0, result
+    assert "Updated 1 files" in result["stdout"]
+    assert json.loads(schema.read_text()) == {"version": "0.2.0"}
+    assert schema.read_text().endswith("}\n")
+
+    result = nschema.run_command(["version", "--property", "version", "--target-version", "bad"], cwd=str(tmp_path))
+    assert "not a valid semantic version" in result["stdout"]
+
+def test_daemon_round_trip(tmp_path):
+    """Tests starting a daemon, running commands through it, and stopping it."""
+    path = str(tmp_path / "nschema.sock")
+    assert nschema.request(path, {"status": True}) is None
+    status = nschema.start_daemon(path)
+    assert status is not None and status["pid"] != os.getpid()
+    try:
+        reply = nschema.run(["list", "--prefix", "hub."], path)
+        assert reply["code"] == 0 and "hub.set" in reply["stdout"]
+        status = nschema.request(path, {"status": True})
+        assert status["commands"] == 1
+        assert status["cache"]["misses"] == status["cache"]["files"]
+        assert nschema.request(path, {"argv": "list"}) == {"error": "'argv' must be a list of strings"}
+    finally:
+        assert nschema.request(path, {"stop": True}) == {"stopped": True}
+    deadline = time.monotonic() + 5
+    while os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not os.path.exists(path)
+    # Without a daemon the command runs in-process.
+    assert nschema.run(["list", "--prefix", "hub."], path)["code"] == 0
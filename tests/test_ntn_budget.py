@@ -0,0 +1,76 @@
+import base64
+import json
+
+from ntn_budget import BudgetChecker, check_lines, ntn_methods
+
+TEMPLATE = {"req": "note.template", "file": "sensors.qo", "body": {"temp": 14.1, "site": "16", "count": 12}}
+
+def _add(file="sensors.qo", **fields):
+    return dict({"req": "note.add", "file": file}, **fields)
+
+def _lines(*requests):
+    return [json.dumps(request) + "\n" for request in requests]
+
+def test_ntn_methods_come_from_the_schema():
+    """Tests that every card.transport method with an 'ntn' part, and no other, can use NTN."""
+    assert ntn_methods() == {"ntn", "cell-ntn", "wifi-ntn", "wifi-cell-ntn"}
+
+def test_templated_notes_are_sized_by_their_record():
+    """Tests record sizes, including payloads, and templates that do not fit the body."""
+    checker = BudgetChecker()
+    results = list(check_lines(_lines(
+        TEMPLATE,
+        _add(body={"temp": 1.5, "site": "abc"}),
+        _add(body={"temp": 1.5}, payload=base64.b64encode(b"x" * 10).decode()),
+        _add(body={"site": "x" * 17}),
+        _add(body={"humid": 5}),
+    ), checker))
+    assert [(r.line, r.size, r.verdict) for r in results] == [(2, 22, "ok"), (3, 32, "ok"), (4, 22, "error"), (5, 22, "error")]
+    assert checker.summary()["bytes"] == 54
+
+def test_untemplated_notes_need_allow_over_ntn():
+    """Tests that untemplated Notes are errors over NTN unless allowed, and measured as compact JSON."""
+    note = _add("raw.qo", body={"a": 1})
+    lines = _lines(note)
+    assert next(check_lines(lines, BudgetChecker())).verdict == "error"
+    assert next(check_lines(lines, BudgetChecker(allow=True)))[2:4] == (7, "ok")
+    assert next(check_lines(lines, BudgetChecker(method="cell")))[2:4] == (7, "ok")
+    checker = BudgetChecker(method="cell")
+    results = list(check_lines(_lines({"req": "card.transport", "method": "cell-ntn"}, note,
+                                      {"req": "card.transport", "method": "cell-ntn", "allow": True}, note), checker))
+    assert [r.verdict for r in results] == ["error", "ok"]
+
+def test_budget_and_sessions():
+    """Tests over-budget Notes and how Notes are packed into messages and sessions."""
+    checker = BudgetChecker(budget=50, per_session=2, allow=True)
+    sizes = [20, 20, 20, 45, 60, 5]
+    requests = [_add("raw.qo", payload=base64.b64encode(b"x" * size).decode()) for size in sizes]
+    results = list(check_lines(_lines(*requests), checker))
+    assert [r.verdict for r in results] == ["ok", "ok", "ok", "ok", "over", "ok"]
+    summary = checker.summary()
+    # [20, 20] [20] [45, 5]: the 60-byte Note is not sent.
+    assert summary["messages"] == 3 and summary["sessions"] == 2
+    assert (summary["ok"], summary["over"], summary["errors"]) == (5, 1, 0)
+
+def test_unparseable_lines_and_other_requests():
+    """Tests that bad JSON is an error and requests other than note.add are not measured."""
+    checker = BudgetChecker()
+    results = list(check_lines(["{not json\n", "\n", '{"req": "card.version"}\n', "[1]\n"], checker))
+    assert [(r.line, r.verdict) for r in results] == [(1, "error")]
+    assert checker.summary()["notes"] == 1
+
+def test_malformed_fields_are_errors():
+    """Tests that a non-string payload or file is an error verdict, and a bad transport method is ignored."""
+    checker = BudgetChecker(allow=True)
+    results = list(check_lines(_lines(
+        _add(payload=12), _add(payload={"a": 1}), _add(file=["x"]),
+        {"req": "card.transport", "method": ["ntn"]}, {"req": "note.template", "file": ["x"], "body": {}},
+        _add(payload=base64.b64encode(b"x").decode()),
+    ), checker))
+    assert [(r.line, r.verdict, r.message) for r in results[:3]] == [
+        (1, "error", "payload must be a base64 string"),
+        (2, "error", "payload must be a base64 string"),
+        (3, "error", "file must be a string"),
+    ]
+    assert results[3][1:4] == ("sensors.qo", 1, "ok")
+    assert checker.method == "ntn"
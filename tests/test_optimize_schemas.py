@@ -0,0 +1,112 @@
+import json
+import pytest
+import jsonschema
+
+from notecard_validator import NotecardValidator, load_schema_files
+from compile_validators import compile_module
+from optimize_schemas import (
+    PASSES,
+    drop_redundant,
+    find_differences,
+    flatten_allof,
+    optimize_schema,
+    optimize_schemas,
+    rewrite_req_cmd,
+    simplify_constants,
+)
+
+@pytest.fixture(scope='module')
+def schemas():
+    return load_schema_files()
+
+@pytest.fixture(scope='module')
+def optimized(schemas):
+    return optimize_schemas(schemas)
+
+def test_optimized_schemas_accept_and_reject_identically(schemas, optimized):
+    """Tests equivalence over every sample and generated boundary instance."""
+    checked, differences = find_differences(schemas, optimized)
+    assert differences == []
+    assert checked > 10000
+
+def test_broken_pass_is_detected(schemas):
+    """Tests that the corpus check catches a rewrite that changes behaviour."""
+    def drop_required(schema):
+        schema.pop("required", None)
+        return schema
+    subset = {f: s for f, s in schemas.items() if f.startswith("card.attn.req")}
+    broken = optimize_schemas(subset, PASSES + (("broken", drop_required),))
+    checked, differences = find_differences(subset, broken)
+    assert differences
+
+def test_optimized_schemas_are_valid_and_smaller(schemas, optimized):
+    """Tests that optimized schemas are valid 2020-12 schemas that keep their $id."""
+    for filename, schema in optimized.items():
+        jsonschema.Draft202012Validator.check_schema(schema)
+        assert schema["$id"] == schemas[filename]["$id"]
+        assert "samples" not in schema and "description" not in schema
+        assert len(json.dumps(schema)) < len(json.dumps(schemas[filename]))
+
+def test_original_schema_is_not_modified(schemas):
+    """Tests that optimizing works on a copy."""
+    before = json.dumps(schemas["card.attn.req.notecard.api.json"])
+    optimize_schema(schemas["card.attn.req.notecard.api.json"])
+    assert json.dumps(schemas["card.attn.req.notecard.api.json"]) == before
+
+def test_req_cmd_scaffold_is_rewritten(optimized):
+    """Tests the req/cmd oneOf becomes anyOf plus not."""
+    schema = optimized["card.random.req.notecard.api.json"]
+    assert "oneOf" not in schema
+    assert schema["anyOf"] == [{"required": ["req"]}, {"required": ["cmd"]}]
+    assert schema["not"] == {"required": ["req", "cmd"]}
+
+def test_req_cmd_rewrite_requires_matching_consts():
+    """Tests the scaffold is kept when the parent does not pin req and cmd."""
+    one_of = [{"required": ["req"], "properties": {"req": {"const": "a"}}},
+              {"required": ["cmd"], "properties": {"cmd": {"const": "a"}}}]
+    schema = {"properties": {"req": {"const": "a"}}, "oneOf": one_of}
+    assert rewrite_req_cmd(dict(schema)) == schema
+
+def test_simplify_constants():
+    """Tests one-value enums and implied types."""
+    assert simplify_constants({"type": "string", "enum": ["a"]}) == {"const": "a"}
+    assert simplify_constants({"type": "integer", "enum": [1, 2]}) == {"enum": [1, 2]}
+    assert simplify_constants({"type": "integer", "enum": [1, "2"]}) == {"type": "integer", "enum": [1, "2"]}
+
+def test_flatten_allof():
+    """Tests allOf merging, keeping entries whose keywords conflict with the parent."""
+    schema = {"type": "object", "allOf": [{"allOf": [{"if": {}, "then": {}}]}, {"if": {}, "else": {}}, {}]}
+    assert flatten_allof(schema) == {"type": "object", "if": {}, "then": {}, "allOf": [{"if": {}, "else": {}}]}
+    schema = {"additionalProperties": False, "allOf": [{"properties": {"a": {}}}]}
+    assert flatten_allof(dict(schema)) == schema
+
+def test_drop_redundant(optimized):
+    """Tests that the sleep branch no longer repeats the seconds minimum."""
+    schema = optimized["card.attn.req.notecard.api.json"]
+    assert schema["then"] == {"required": ["seconds"], "properties": {"seconds": {"minimum": 60}}}
+    assert schema["else"]["then"] == {"required": ["seconds"]}
+    assert drop_redundant({"properties": {"a": {"type": "string"}}, "if": {}, "then": {"properties": {"a": {"type": "string"}}}}) == \
+        {"properties": {"a": {"type": "string"}}}
+
+@pytest.mark.parametrize("parent, branch, instance", [
+    ({"properties": {"a": {}, "b": {}}, "additionalProperties": False},
+     {"properties": {"a": {}}, "additionalProperties": False}, {"a": 1, "b": 2}),
+    ({"contains": {"type": "string"}, "minContains": 2},
+     {"contains": {"type": "integer"}, "minContains": 2}, ["x", "y", 1]),
+    ({"if": {"type": "string"}, "then": {"maxLength": 5}},
+     {"if": {"type": "string"}, "then": {"minLength": 2}}, "x"),
+])
+def test_drop_redundant_keeps_adjacent_keywords(parent, branch, instance):
+    """Tests that a branch keeps a whole keyword group when any keyword of it differs from the parent's."""
+    schema = {"properties": {"p": parent}, "if": {}, "then": {"properties": {"p": branch}}}
+    optimized = drop_redundant(json.loads(json.dumps(schema)))
+    assert optimized["then"]["properties"]["p"] == branch
+    assert not jsonschema.Draft202012Validator(schema).is_valid({"p": instance})
+    assert not jsonschema.Draft202012Validator(optimized).is_valid({"p": instance})
+
+def test_optimized_schemas_work_with_every_engine(optimized):
+    """Tests that the optimized set dispatches and compiles like the originals."""
+    validator = NotecardValidator(optimized)
+    assert validator.validate_request({"req": "card.attn", "mode": "arm"}) == "card.attn"
+    assert not validator.is_valid_request({"req": "card.attn", "cmd": "card.attn"})
+    assert "def card_attn_req(v):" in compile_module(optimized)
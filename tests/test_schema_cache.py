@@ -0,0 +1,44 @@
+import os
+import json
+
+from notecard_validator import load_schema_files
+from schema_cache import SchemaCache
+
+def _write(path, contents, mtime_ns):
+    with open(path, 'w') as f:
+        json.dump(contents, f)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_reloads_only_changed_files(tmp_path):
+    """Tests that a file is reparsed only when its mtime or size changes."""
+    path = str(tmp_path / "a.json")
+    _write(path, {"version": "1.0.0"}, 1_000_000_000)
+    cache = SchemaCache()
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert cache.stats() == {"files": 1, "hits": 1, "misses": 1}
+
+    # Same size and mtime: still served from the cache.
+    _write(path, {"version": "2.0.0"}, 1_000_000_000)
+    assert cache.load(path)["version"] == "1.0.0"
+    _write(path, {"version": "2.0.0"}, 2_000_000_000)
+    assert cache.load(path)["version"] == "2.0.0"
+    _write(path, {"version": "10.0.0"}, 2_000_000_000)
+    assert cache.load(path)["version"] == "10.0.0"
+    assert cache.misses == 3
+
+def test_load_dir_matches_load_schema_files(tmp_path):
+    """Tests that a cached directory load matches load_schema_files and tracks removed files."""
+    cache = SchemaCache()
+    assert cache.load_dir() == load_schema_files()
+    generation = cache.generation
+    assert cache.load_dir() == load_schema_files()
+    assert cache.generation == generation
+
+    for name in ("notecard.api.json", "x.a.req.notecard.api.json", "x.a.rsp.notecard.api.json"):
+        (tmp_path / name).write_text("{}")
+    assert list(cache.load_dir(str(tmp_path))) == [
+        "notecard.api.json", "x.a.req.notecard.api.json", "x.a.rsp.notecard.api.json"]
+    os.unlink(tmp_path / "x.a.rsp.notecard.api.json")
+    assert list(cache.load_dir(str(tmp_path))) == ["notecard.api.json", "x.a.req.notecard.api.json"]
+    assert cache.generation > generation
@@ -0,0 +1,111 @@
+import os
+import json
+
+from notecard_validator import load_schema_files
+import schema_model
+from schema_model import ModelCache, build_model, load_models, shared_cache
+
+def test_build_model_derives_allowed_values_and_samples():
+    """Tests that a model carries the name, allowed values, samples and normalized annotations."""
+    schemas = load_schema_files()
+    attn = build_model("card.attn.req.notecard.api.json", schemas["card.attn.req.notecard.api.json"])
+    assert (attn["api"], attn["kind"], attn["name"]) == ("card.attn", "req", "card.attn")
+    mode = next(prop for prop in attn["properties"] if prop["name"] == "mode")
+    assert "arm" in [sub["const"] for sub in mode["sub_descriptions"]]
+    for sample in attn["samples"]:
+        assert sample["pretty"] == json.dumps(json.loads(sample["json"]), indent=2)
+
+    web = build_model("web.get.req.notecard.api.json", schemas["web.get.req.notecard.api.json"])
+    assert [note["kind"] for note in web["annotations"]] == ["note", "warning"]
+    status = build_model("card.status.rsp.notecard.api.json", schemas["card.status.rsp.notecard.api.json"])
+    assert [note["kind"] for note in status["annotations"]] == ["info"]
+
+    model = build_model("x.req.notecard.api.json", {
+        "properties": {"mode": {"type": "string", "pattern": r"^(?:b|a)(?:,\s*(?:b|a))*\s*$"}, "bad": 1},
+        "samples": [{"description": "broken", "json": "{"}, {"description": "no json"}],
+    })
+    assert model["properties"] == [{"name": "mode", "type": "string", "tokens": ["a", "b"]},
+                                   {"name": "bad", "invalid": True}]
+    assert model["samples"] == [{"description": "broken", "json": "{", "data": None, "pretty": None}]
+    assert model["name"] is None and model["skus"] is None
+
+def test_cached_models_match_fresh_models(tmp_path):
+    """Tests that models read back from the cache file are identical to freshly built ones."""
+    cache_path = str(tmp_path / "model.json")
+    fresh = load_models(cache_path=cache_path)
+    assert len(fresh) == 140
+    cache = ModelCache(cache_path)
+    cached = cache.load_dir()
+    assert (cache.built, cache.reused) == (0, 140)
+    assert json.dumps(cached) == json.dumps(fresh)
+    assert not cache.save()
+
+def test_cache_rebuilds_changed_schemas_only(tmp_path):
+    """Tests that the cache rebuilds a model when its schema or the model code changes."""
+    schema_dir, cache_path = str(tmp_path), str(tmp_path / "model.json")
+    for api in ("x.a", "x.b"):
+        (tmp_path / f"{api}.req.notecard.api.json").write_text(json.dumps({"description": api}))
+    load_models(schema_dir, cache_path)
+
+    (tmp_path / "x.b.req.notecard.api.json").write_text(json.dumps({"description": "changed"}))
+    cache = ModelCache(cache_path)
+    models = cache.load_dir(schema_dir)
+    assert (cache.built, cache.reused) == (1, 1)
+    assert models["x.b.req.notecard.api.json"]["description"] == "changed"
+    assert cache.save()
+
+    os.unlink(tmp_path / "x.a.req.notecard.api.json")
+    cache = ModelCache(cache_path)
+    assert list(cache.load_dir(schema_dir)) == ["x.b.req.notecard.api.json"]
+    assert cache.save()
+    with open(cache_path) as f:
+        assert list(json.load(f)["models"]) == [str(tmp_path / "x.b.req.notecard.api.json")]
+
+    cache = ModelCache(cache_path, fingerprint="changed")
+    cache.load_dir(schema_dir)
+    assert (cache.built, cache.reused) == (1, 0)
+
+def test_shared_cache_checks_stat_before_hashing(tmp_path, monkeypatch):
+    """Tests that the process-wide cache is kept in memory and only hashes schemas whose mtime or size changed."""
+    schema_dir, cache_path = str(tmp_path), str(tmp_path / "model.json")
+    for api in ("x.a", "x.b"):
+        (tmp_path / f"{api}.req.notecard.api.json").write_text(json.dumps({"description": api}))
+    cache = shared_cache(cache_path)
+    cache.load_dir(schema_dir)
+    assert cache.save() and shared_cache(cache_path) is cache
+
+    hashed = []
+    sha256 = schema_model.hashlib.sha256
+    monkeypatch.setattr(schema_model.hashlib, "sha256", lambda data: hashed.append(data) or sha256(data))
+    cache.load_dir(schema_dir)
+    assert (cache.built, cache.reused, hashed) == (2, 2, [])
+
+    # A touched schema is hashed again but, with the same bytes, not rebuilt.
+    path = tmp_path / "x.a.req.notecard.api.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.load_dir(schema_dir)
+    assert (cache.built, cache.reused, len(hashed)) == (2, 4, 1)
+
+    path.write_text(json.dumps({"description": "changed"}))
+    assert cache.load_dir(schema_dir)[path.name]["description"] == "changed"
+    assert (cache.built, cache.reused, len(hashed)) == (3, 5, 2)
+
+def test_one_cache_serves_several_schema_directories(tmp_path):
+    """Tests that schemas with the same filename in different directories keep their own models."""
+    cache = ModelCache(str(tmp_path / "model.json"))
+    first, second = tmp_path / "a", tmp_path / "b"
+    for directory in (first, second):
+        directory.mkdir()
+        (directory / "x.req.notecard.api.json").write_text(json.dumps({"description": directory.name}))
+    # Identical stats must not let one directory's model answer for the other.
+    stat = (first / "x.req.notecard.api.json").stat()
+    os.utime(second / "x.req.notecard.api.json", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    for _ in range(2):
+        assert cache.load_dir(str(first))["x.req.notecard.api.json"]["description"] == "a"
+        assert cache.load_dir(str(second))["x.req.notecard.api.json"]["description"] == "b"
+    assert (cache.built, cache.reused) == (2, 2)
+    assert cache.save()
+    reloaded = ModelCache(str(tmp_path / "model.json"))
+    assert reloaded.load_dir(str(second))["x.req.notecard.api.json"]["description"] == "b"
+    assert (reloaded.built, reloaded.reused) == (0, 1)
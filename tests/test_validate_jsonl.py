@@ -0,0 +1,67 @@
+import json
+import pytest
+
+from validate_jsonl import validate_file
+
+LINES = [
+    '{"req":"card.attn","mode":"arm"}',
+    '{"cmd":"hub.set","mode":"periodic"}',
+    '{"req":"card.attn","mode":"watchdog"}',
+    '',
+    'not json',
+    '{}',
+]
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    path.write_text("\n".join(LINES) + "\n")
+    return path
+
+@pytest.mark.parametrize("engine", ["compiled", "jsonschema"])
+def test_request_transcript_summary(transcript, tmp_path, engine):
+    """Tests per-API counts and the per-line verdict file."""
+    verdicts = tmp_path / "verdicts.tsv"
+    summary = validate_file(str(transcript), str(verdicts), workers=1, engine=engine)
+    assert summary["lines"] == 6
+    assert (summary["valid"], summary["invalid"], summary["unparseable"]) == (2, 2, 1)
+    assert summary["apis"]["card.attn"] == {"valid": 1, "invalid": 1, "unparseable": 0}
+    assert summary["apis"]["hub.set"] == {"valid": 1, "invalid": 0, "unparseable": 0}
+
+    rows = [line.split("\t") for line in verdicts.read_text().splitlines()]
+    assert [row[0] for row in rows] == ["1", "2", "3", "5", "6"]
+    assert rows[0][1:3] == ["ok", "card.attn"]
+    assert rows[2][1:3] == ["invalid", "card.attn"]
+    assert "'seconds' is a required property" in rows[2][3]
+    assert rows[3][1] == "unparseable"
+    assert rows[4][1:3] == ["invalid", "-"]
+
+def test_process_pool_matches_in_process(transcript, tmp_path):
+    """Tests that sharding across a process pool preserves verdicts and order."""
+    single, pooled = tmp_path / "single.tsv", tmp_path / "pooled.tsv"
+    a = validate_file(str(transcript), str(single), workers=1)
+    b = validate_file(str(transcript), str(pooled), workers=2, chunk_lines=2)
+    assert a["apis"] == b["apis"]
+    assert single.read_text() == pooled.read_text()
+
+def test_response_and_pair_modes(tmp_path):
+    """Tests response-only and request/response pair transcripts."""
+    responses = tmp_path / "responses.jsonl"
+    responses.write_text('{"version":"notecard-9.1.1"}\n{"version":1}\n')
+    summary = validate_file(str(responses), mode="responses", api="card.version", workers=1)
+    assert summary["apis"]["card.version"] == {"valid": 1, "invalid": 1, "unparseable": 0}
+
+    pairs = tmp_path / "pairs.jsonl"
+    pairs.write_text("\n".join(json.dumps(pair) for pair in [
+        {"request": {"req": "card.version"}, "response": {"version": "notecard-9.1.1"}},
+        {"request": {"req": "card.version"}, "response": {"version": 1}},
+        {"request": {"req": "card.nope"}, "response": {}},
+    ]) + "\n")
+    summary = validate_file(str(pairs), mode="pairs", workers=1)
+    assert summary["apis"]["card.version"] == {"valid": 1, "invalid": 1, "unparseable": 0}
+    assert summary["apis"]["-"]["invalid"] == 1
+
+def test_responses_mode_requires_api(transcript):
+    """Tests that response mode needs an API name."""
+    with pytest.raises(ValueError):
+        validate_file(str(transcript), mode="responses", workers=1)
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import pytest
+
+from validation_server import ValidationServer, percentiles
+
+@pytest.fixture(scope='module')
+def server():
+    return ValidationServer(queue_size=4, batch_size=8)
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's deep tmp_path.
+    directory = tempfile.mkdtemp(prefix="nv-")
+    yield os.path.join(directory, "validate.sock")
+    shutil.rmtree(directory)
+
+def _exchange(server, path, lines, connections=1):
+    async def client():
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write("".join(line + "\n" for line in lines).encode())
+        await writer.drain()
+        writer.write_eof()
+        verdicts = [json.loads(line) async for line in reader]
+        writer.close()
+        return verdicts
+
+    async def run():
+        await server.start(path)
+        try:
+            return await asyncio.gather(*(client() for _ in range(connections)))
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+def test_verdicts_in_order(server, socket_path):
+    """Tests requests, responses, ids and unparseable lines, answered in order."""
+    lines = [
+        '{"req":"card.attn","mode":"arm"}',
+        '{"id":1,"request":{"req":"card.attn","mode":"watchdog"}}',
+        '{"id":2,"api":"card.version","response":{"version":1}}',
+        '{"id":3,"api":"card.nope","response":{}}',
+        'not json',
+        '',
+        '{"req":"card.version","stats":true}',
+        '{"stats":true}',
+    ]
+    verdicts, = _exchange(server, socket_path, lines)
+    assert verdicts[0] == {"api": "card.attn", "ok": True}
+    assert verdicts[1]["id"] == 1 and not verdicts[1]["ok"]
+    assert "'seconds' is a required property" in verdicts[1]["error"]
+    assert verdicts[2]["id"] == 2 and verdicts[2]["api"] == "card.version" and not verdicts[2]["ok"]
+    assert verdicts[3] == {"id": 3, "api": "card.nope", "ok": False, "error": "No response schema for 'card.nope'"}
+    assert verdicts[4]["error"].startswith("unparseable")
+    # Only an exact {"stats": true} asks for stats; a request with a stats field is validated.
+    assert verdicts[5]["api"] == "card.version" and "messages" not in verdicts[5]
+    # Stats are answered after every message queued before them; unparseable lines are not queued.
+    assert verdicts[6]["messages"] == 5
+    assert verdicts[6]["apis"]["card.attn"]["valid"] == 1
+    assert verdicts[6]["apis"]["card.attn"]["invalid"] == 1
+    assert set(verdicts[6]["apis"]["card.attn"]["latency_us"]) == {"p50", "p90", "p99", "max"}
+
+def test_concurrent_connections_are_batched(server, socket_path):
+    """Tests that many concurrent messages are validated in shared batches despite a small queue."""
+    before = server.stats()
+    lines = [json.dumps({"id": i, "request": {"req": "card.version"}}) for i in range(50)]
+    results = _exchange(server, socket_path, lines, connections=4)
+    for verdicts in results:
+        assert [v["id"] for v in verdicts] == list(range(50))
+        assert all(v["ok"] for v in verdicts)
+    after = server.stats()
+    assert after["messages"] - before["messages"] == 200
+    assert after["batches"] - before["batches"] < 200
+
+def test_malformed_message_does_not_stop_validation(server, socket_path, monkeypatch):
+    """Tests that a message the engine cannot handle gets an error verdict and later messages are still answered."""
+    lines = [
+        '{"id":1,"api":["x"],"response":{}}',
+        '{"id":2,"request":{"req":"card.version"}}',
+    ]
+    verdicts, = _exchange(server, socket_path, lines)
+    assert verdicts[0]["id"] == 1 and not verdicts[0]["ok"] and "'api' must be a string" in verdicts[0]["error"]
+    assert verdicts[1] == {"id": 2, "api": "card.version", "ok": True}
+
+    check_request = server.engine.check_request
+    def failing(request):
+        if request.get("fail"):
+            raise TypeError("unexpected value")
+        return check_request(request)
+    monkeypatch.setattr(server.engine, "check_request", failing)
+    lines = ['{"id":3,"request":{"req":"card.version","fail":true}}', '{"id":4,"request":{"req":"card.version"}}']
+    verdicts, = _exchange(server, socket_path, lines)
+    assert verdicts[0]["id"] == 3 and verdicts[0]["error"] == "cannot validate message: unexpected value"
+    assert verdicts[1]["id"] == 4 and verdicts[1]["ok"]
+
+def test_connection_ends_when_client_stops_reading(server, socket_path):
+    """Tests that a connection whose verdicts cannot be written stops reading and closes."""
+    async def run():
+        await server.start(path=socket_path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(b'{"req":"card.version"}\n' * 2000)
+            await writer.drain()
+            writer.transport.abort()
+            for _ in range(200):
+                handlers = [task for task in asyncio.all_tasks()
+                            if task is not asyncio.current_task() and task is not server._worker]
+                if not handlers:
+                    return True
+                await asyncio.sleep(0.01)
+            return False
+        finally:
+            await server.close()
+
+    assert asyncio.run(run())
+
+def test_percentiles():
+    """Tests nearest-rank percentiles reported in microseconds."""
+    samples = [i / 1e6 for i in range(1, 101)]
+    assert percentiles(samples) == {"p50": 50.0, "p90": 90.0, "p99": 99.0, "max": 100.0}
+    assert percentiles([]) == {}
@@ -4,32 +4,32 @@ import json
 
 SCHEMA_FILE = "web.post.rsp.notecard.api.json"
 
-def test_valid_minimal(schema):
+def test_valid_minimal(validator):
     """Tests a minimal valid response with just result."""
     instance = {"result": 200}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_with_body(schema):
+def test_valid_with_body(validator):
     """Tests a valid response with a body object."""
     instance = {"result": 200, "body": {"message": "Reading added successfully"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_with_payload(schema):
+def test_valid_with_payload(validator):
     """Tests a valid response with base64 payload."""
     instance = {"result": 200, "payload": "SGVsbG8gV29ybGQ="}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_with_status(schema):
+def test_valid_with_status(validator):
     """Tests a valid response with status (MD5 sum)."""
     instance = {"result": 200, "status": "5d41402abc4b2a76b9719d911017c592"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_with_cobs_and_length(schema):
+def test_valid_with_cobs_and_length(validator):
     """Tests a valid response with cobs and length for binary payload."""
     instance = {"result": 200, "cobs": 8, "length": 6}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_complete_response(schema):
+def test_valid_complete_response(validator):
     """Tests a complete response with all possible fields."""
     instance = {
         "result": 200,
@@ -39,62 +39,62 @@ def test_valid_complete_response(schema):
         "cobs": 8,
         "length": 6
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_result_type(schema):
+def test_invalid_result_type(validator):
     """Tests invalid type for result (should be integer)."""
     instance = {"result": "200"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_invalid_body_type(schema):
+def test_invalid_body_type(validator):
     """Tests invalid type for body (should be object)."""
     instance = {"result": 200, "body": "not-an-object"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'object'" in str(excinfo.value)
 
-def test_invalid_payload_type(schema):
+def test_invalid_payload_type(validator):
     """Tests invalid type for payload (should be string)."""
     instance = {"result": 200, "payload": 12345}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'string'" in str(excinfo.value)
 
-def test_invalid_status_type(schema):
+def test_invalid_status_type(validator):
     """Tests invalid type for status (should be string)."""
     instance = {"result": 200, "status": 12345}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'string'" in str(excinfo.value)
 
-def test_invalid_cobs_type(schema):
+def test_invalid_cobs_type(validator):
     """Tests invalid type for cobs (should be integer)."""
     instance = {"result": 200, "cobs": "8"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_invalid_length_type(schema):
+def test_invalid_length_type(validator):
     """Tests invalid type for length (should be integer)."""
     instance = {"result": 200, "length": "6"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_http_status_codes(schema):
+def test_valid_http_status_codes(validator):
     """Tests valid HTTP status codes."""
     for status_code in [200, 201, 204, 400, 401, 404, 500, 502, 503]:
         instance = {"result": status_code}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_valid_empty_body(schema):
+def test_valid_empty_body(validator):
     """Tests valid response with empty body object."""
     instance = {"result": 200, "body": {}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_complex_body(schema):
+def test_valid_complex_body(validator):
     """Tests valid response with complex body object."""
     instance = {
         "result": 200,
@@ -113,14 +113,14 @@ def test_valid_complex_body(schema):
             }
         }
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_additional_property(schema):
+def test_valid_additional_property(validator):
     """Tests valid response with an additional property (schema allows them)."""
     instance = {"result": 200, "extra": "field"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -130,4 +130,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
             instance = json.loads(sample_json_str)
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -4,73 +4,73 @@ import json
 
 SCHEMA_FILE = "web.req.notecard.api.json"
 
-def test_valid_req(schema):
+def test_valid_req(validator):
     """Tests a minimal valid request using 'req'."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_cmd(schema):
+def test_valid_cmd(validator):
     """Tests a minimal valid request using 'cmd'."""
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_no_req_or_cmd(schema):
+def test_invalid_no_req_or_cmd(validator):
     """Tests invalid request missing req/cmd."""
     instance = {"method": "GET", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_invalid_both_req_and_cmd(schema):
+def test_invalid_both_req_and_cmd(validator):
     """Tests invalid request having both req and cmd."""
     instance = {"req": "web", "cmd": "web", "method": "GET", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is valid under each of" in str(excinfo.value)
 
-def test_invalid_req_value(schema):
+def test_invalid_req_value(validator):
     """Tests invalid value for req."""
     instance = {"req": "invalid.req", "method": "GET", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'web' was expected" in str(excinfo.value)
 
-def test_invalid_cmd_value(schema):
+def test_invalid_cmd_value(validator):
     """Tests invalid value for cmd."""
     instance = {"cmd": "invalid.cmd", "method": "GET", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "'web' was expected" in str(excinfo.value)
 
-def test_missing_required_method_with_req(schema):
+def test_missing_required_method_with_req(validator):
     """Tests that method field is required when using req."""
     instance = {"req": "web", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_missing_required_method_with_cmd(schema):
+def test_missing_required_method_with_cmd(validator):
     """Tests that method field is required when using cmd."""
     instance = {"cmd": "web", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_missing_required_route_with_req(schema):
+def test_missing_required_route_with_req(validator):
     """Tests that route field is required when using req."""
     instance = {"req": "web", "method": "GET"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_missing_required_route_with_cmd(schema):
+def test_missing_required_route_with_cmd(validator):
     """Tests that route field is required when using cmd."""
     instance = {"cmd": "web", "method": "GET"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_valid_methods(schema):
+def test_valid_methods(validator):
     """Tests all valid HTTP methods."""
     valid_methods = [
         "CONNECT",
@@ -85,87 +85,87 @@ def test_valid_methods(schema):
     ]
     for method in valid_methods:
         instance = {"req": "web", "method": method, "route": "weatherInfo"}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
         instance = {"cmd": "web", "method": method, "route": "weatherInfo"}
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
 
-def test_invalid_method(schema):
+def test_invalid_method(validator):
     """Tests invalid HTTP method."""
     instance = {"req": "web", "method": "INVALID", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
     instance = {"cmd": "web", "method": "INVALID", "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_method_invalid_type(schema):
+def test_method_invalid_type(validator):
     """Tests invalid type for method."""
     instance = {"req": "web", "method": 123, "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
     instance = {"cmd": "web", "method": 123, "route": "weatherInfo"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_valid_route(schema):
+def test_valid_route(validator):
     """Tests valid route field."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_route_invalid_type(schema):
+def test_route_invalid_type(validator):
     """Tests invalid type for route."""
     instance = {"req": "web", "method": "GET", "route": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
     instance = {"cmd": "web", "method": "GET", "route": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not valid under any of the given schemas" in str(excinfo.value)
 
-def test_valid_name(schema):
+def test_valid_name(validator):
     """Tests valid name field."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo", "name": "/getLatest"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo", "name": "/getLatest"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_name_invalid_type(schema):
+def test_name_invalid_type(validator):
     """Tests invalid type for name."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo", "name": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo", "name": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_content(schema):
+def test_valid_content(validator):
     """Tests valid content field."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo", "content": "application/json"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo", "content": "application/json"}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_content_invalid_type(schema):
+def test_content_invalid_type(validator):
     """Tests invalid type for content."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo", "content": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo", "content": 123}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "123 is not of type 'string'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid request with all fields."""
     instance = {
         "req": "web",
@@ -174,7 +174,7 @@ def test_valid_all_fields(schema):
         "name": "/getLatest",
         "content": "application/json",
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
     instance = {
         "cmd": "web",
         "method": "GET",
@@ -182,24 +182,24 @@ def test_valid_all_fields(schema):
         "name": "/getLatest",
         "content": "application/json",
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_invalid_additional_property(schema):
+def test_invalid_additional_property(validator):
     """Tests invalid request with an additional property."""
     instance = {"req": "web", "method": "GET", "route": "weatherInfo", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(
         excinfo.value
     )
     instance = {"cmd": "web", "method": "GET", "route": "weatherInfo", "extra": "field"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "Additional properties are not allowed ('extra' was unexpected)" in str(
         excinfo.value
     )
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -212,4 +212,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
 
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -4,72 +4,72 @@ import json
 
 SCHEMA_FILE = "web.rsp.notecard.api.json"
 
-def test_minimal_valid_rsp(schema):
+def test_minimal_valid_rsp(validator):
     """Tests a minimal valid response (empty object)."""
     instance = {}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_valid_result(schema):
+def test_valid_result(validator):
     """Tests valid result field."""
     instance = {"result": 200}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_result_invalid_type(schema):
+def test_result_invalid_type(validator):
     """Tests invalid type for result."""
     instance = {"result": "200"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_body(schema):
+def test_valid_body(validator):
     """Tests valid body field."""
     instance = {"body": {"foo": "bar"}}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_body_invalid_type(schema):
+def test_body_invalid_type(validator):
     """Tests invalid type for body."""
     instance = {"body": "not-an-object"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'object'" in str(excinfo.value)
 
-def test_valid_payload(schema):
+def test_valid_payload(validator):
     """Tests valid payload field."""
     instance = {"payload": "SGVsbG8sIFdvcmxkIQ=="}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_payload_invalid_type(schema):
+def test_payload_invalid_type(validator):
     """Tests invalid type for payload."""
     instance = {"payload": 12345}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'string'" in str(excinfo.value)
 
-def test_valid_length(schema):
+def test_valid_length(validator):
     """Tests valid length field."""
     instance = {"length": 42}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_length_invalid_type(schema):
+def test_length_invalid_type(validator):
     """Tests invalid type for length."""
     instance = {"length": "42"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_cobs(schema):
+def test_valid_cobs(validator):
     """Tests valid cobs field."""
     instance = {"cobs": 100}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_cobs_invalid_type(schema):
+def test_cobs_invalid_type(validator):
     """Tests invalid type for cobs."""
     instance = {"cobs": "100"}
     with pytest.raises(jsonschema.ValidationError) as excinfo:
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
     assert "is not of type 'integer'" in str(excinfo.value)
 
-def test_valid_all_fields(schema):
+def test_valid_all_fields(validator):
     """Tests a valid response with all fields."""
     instance = {
         "result": 200,
@@ -78,14 +78,14 @@ def test_valid_all_fields(schema):
         "length": 12,
         "cobs": 12
     }
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_additional_property(schema):
+def test_additional_property(validator):
     """Tests response with an additional property (should be allowed)."""
     instance = {"result": 200, "extra": 123}
-    jsonschema.validate(instance=instance, schema=schema)
+    validator.validate(instance)
 
-def test_validate_samples_from_schema(schema, schema_samples):
+def test_validate_samples_from_schema(validator, schema_samples):
     """Tests that samples in the schema definition are valid."""
     for sample in schema_samples:
         sample_json_str = sample.get("json")
@@ -95,4 +95,4 @@ def test_validate_samples_from_schema(schema, schema_samples):
             instance = json.loads(sample_json_str)
         except json.JSONDecodeError as e:
             pytest.fail(f"Failed to parse sample JSON: {sample_json_str}\nError: {e}")
-        jsonschema.validate(instance=instance, schema=schema)
+        validator.validate(instance)
@@ -0,0 +1,58 @@
+import base64
+import hashlib
+import io
+import os
+import pytest
+
+from web_upload import encode_request, fragment_size, plan_upload, upload_stats
+
+BODY = os.urandom(50000)
+
+def _reassemble(requests):
+    body = bytearray()
+    for request in requests:
+        assert request["offset"] == len(body)
+        fragment = base64.b64decode(request["payload"])
+        assert request["status"] == hashlib.md5(fragment).hexdigest()
+        body += fragment
+    return bytes(body)
+
+@pytest.mark.parametrize("api", ["web.post", "web.put"])
+def test_fragments_are_schema_valid_and_reassemble(notecard_validator, api):
+    """Tests that every fragment validates, fits its frame and the body reassembles."""
+    requests = list(plan_upload(BODY, api=api, route="upload", name="/images", frame_size=2048,
+                                content="application/octet-stream", max=1024))
+    for request in requests:
+        notecard_validator.validate_request(request)
+        assert len(encode_request(request)) <= 2048
+        assert request["total"] == len(BODY) and request["max"] == 1024
+    assert _reassemble(requests) == BODY
+
+@pytest.mark.parametrize("frame_size", [200, 2048, 8192, 100000])
+def test_stats_match_the_plan(frame_size):
+    """Tests that the predicted round trips and wire bytes match the planned requests."""
+    requests = list(plan_upload(io.BytesIO(BODY), len(BODY), route="r", frame_size=frame_size))
+    stats = upload_stats(len(BODY), route="r", frame_size=frame_size)
+    assert stats["round_trips"] == len(requests)
+    assert stats["wire_bytes"] == sum(len(encode_request(r)) for r in requests)
+    assert all(len(encode_request(r)) <= frame_size for r in requests)
+
+def test_fragment_size_uses_the_whole_frame():
+    """Tests that one more base64 quantum would overflow the frame."""
+    size = fragment_size(1000, total=len(BODY), route="r")
+    request = next(plan_upload(BODY, route="r", frame_size=1000))
+    assert len(request["payload"]) == size // 3 * 4
+    # Sized for the longest offset, which has more digits than 0.
+    assert len(encode_request(request)) + len(str(len(BODY) - 1)) - 1 + 4 > 1000
+
+def test_invalid_uploads():
+    """Tests tiny frames, bodies, missing totals and short files."""
+    with pytest.raises(ValueError):
+        fragment_size(100)
+    with pytest.raises(ValueError):
+        list(plan_upload(BODY, body={"a": 1}))
+    with pytest.raises(ValueError):
+        list(plan_upload(io.BytesIO(BODY)))
+    with pytest.raises(ValueError):
+        list(plan_upload(io.BytesIO(BODY[:10]), total=100))
+    assert list(plan_upload(b"")) == []